@@ -26,11 +26,13 @@ import * as THREE        from 'three';
 import { OrbitControls } from 'three/addons/controls/OrbitControls.js';
 import { GLTFLoader }    from 'three/addons/loaders/GLTFLoader.js';
 import { DRACOLoader }   from 'three/addons/loaders/DRACOLoader.js';
+import { KTX2Loader }    from 'three/addons/loaders/KTX2Loader.js';
 import { EffectComposer }   from 'three/addons/postprocessing/EffectComposer.js';
 import { RenderPass }        from 'three/addons/postprocessing/RenderPass.js';
 import { GTAOPass }          from 'three/addons/postprocessing/GTAOPass.js';
 import { UnrealBloomPass }   from 'three/addons/postprocessing/UnrealBloomPass.js';
 import { OutputPass }        from 'three/addons/postprocessing/OutputPass.js';
+import { MeshBVH, acceleratedRaycast } from 'three-mesh-bvh';
 
 console.log('[brain-3d-v3] Engine loaded, Three.js r' + THREE.REVISION);
 
@@ -39,7 +41,7 @@ console.log('[brain-3d-v3] Engine loaded, Three.js r' + THREE.REVISION);
 // CONSTANTS
 // ═══════════════════════════════════════════════════════════════════════════════
 
-var ASSET_VERSION = '20260304q';
+var ASSET_VERSION = '20261019a';
 var MIDLINE_X = 0.118;
 
 var OVERLAY_COLORS = {
@@ -303,6 +305,7 @@ var corticalMeshes    = [];  // cortical overlays only
 var subcorticalMeshes = [];  // subcortical overlays only
 
 var regionCentroids   = {};  // regionId → Vector3 centroid
+var cortexRegionNames = null;  // face-region index → regionId (cortex_regions.json)
 var regionCameraPos   = {};  // regionId → Vector3 camera position
 
 var selectedRegionId  = null;
@@ -315,28 +318,188 @@ var cerebellumVisible = true;
 var brainstemVisible  = true;
 var quizMode          = false;
 
+// BVH-accelerated raycasting: meshes whose geometry carries a boundsTree
+// (precomputed by mesh_bvh.py) pick in O(log n); others keep the brute-force path.
+THREE.Mesh.prototype.raycast = acceleratedRaycast;
+
+// Client-side BVH builds are only a fallback for small meshes without a sidecar;
+// the cortex without one stays brute force rather than stall startup.
+var BVH_BUILD_MAX_FACES = 100000;
+
+function _triCount(geom) {
+  return (geom.index ? geom.index.count : geom.attributes.position.count) / 3;
+}
+
+// {glb stem}.bvh.bin → [{ nodes: ArrayBuffer, indirect: Uint32Array, tris }] per mesh
+function _parseBvhSidecar(buf) {
+  var dv = new DataView(buf);
+  if (dv.getUint32(0, true) !== 0x31485642) return null;  // 'BVH1'
+  var n = dv.getUint32(4, true);
+  var off = 8 + 8 * n;
+  var trees = [];
+  for (var i = 0; i < n; i++) {
+    var nodeBytes = dv.getUint32(8 + 8 * i, true);
+    var tris      = dv.getUint32(12 + 8 * i, true);
+    trees.push({
+      nodes:    buf.slice(off, off + nodeBytes),
+      indirect: new Uint32Array(buf, off + nodeBytes, tris),
+      tris:     tris,
+    });
+    off += nodeBytes + 4 * tris;
+  }
+  return trees;
+}
+
+// Wrap a precomputed tree ({ nodes, indirect, tris }, or null) as g.boundsTree,
+// building one on the client for small meshes when it is missing or rejected.
+// Trees are indirect, so geometry.index and hit.faceIndex keep the source face order.
+function _applyBvh(g, tree, label) {
+  if (tree && tree.tris === _triCount(g) && g.index) {
+    try {
+      g.boundsTree = MeshBVH.deserialize(
+        { roots: [tree.nodes], index: g.index.array, indirectBuffer: tree.indirect },
+        g, { setIndex: false, indirect: true });
+      return;
+    } catch (err) {
+      console.warn('[brain-3d-v3] Precomputed BVH rejected (' + label + '):', err);
+    }
+  }
+  if (_triCount(g) <= BVH_BUILD_MAX_FACES) {
+    g.boundsTree = new MeshBVH(g, { indirect: true });
+  } else {
+    console.warn('[brain-3d-v3] No BVH for ' + label + ' — run: python mesh_bvh.py');
+  }
+}
+
+// Attach a BVH to each geometry loaded from `file` (GLB path, traversal order)
+// from its {stem}.bvh.bin sidecar.  Scene-pack geometry carries its own tree.
+function _attachBvh(file, geometries) {
+  var url = file.replace(/\.glb$/, '.bvh.bin') + '?v=' + ASSET_VERSION;
+  return fetch(url)
+    .then(function(r) { return r.ok ? r.arrayBuffer() : null; })
+    .catch(function() { return null; })
+    .then(function(buf) {
+      var trees = buf ? _parseBvhSidecar(buf) : null;
+      if (trees && trees.length !== geometries.length) trees = null;
+      geometries.forEach(function(g, i) {
+        _applyBvh(g, trees && trees[i], file);
+      });
+    });
+}
+
 var dracoLoader = new DRACOLoader();
 dracoLoader.setDecoderPath('./vendor/three/examples/jsm/libs/draco/gltf/');
 var loader = new GLTFLoader();
 loader.setDRACOLoader(dracoLoader);
 
+// ═══════════════════════════════════════════════════════════════════════════════
+// TEXTURES — KTX2 (GPU-compressed, mipmapped) with PNG fallback
+// ═══════════════════════════════════════════════════════════════════════════════
+
+// Built by texture_pack.py; the Basis transcoder is vendored next to Draco.
+var ktx2Loader = new KTX2Loader();
+ktx2Loader.setTranscoderPath('./vendor/three/examples/jsm/libs/basis/');
+ktx2Loader.detectSupport(renderer);
+loader.setKTX2Loader(ktx2Loader);
+
+var _textureIndex = null;
+
+function _getTextureIndex() {
+  if (!_textureIndex) {
+    _textureIndex = fetch('data/brain_meshes/textures/textures.json?v=' + ASSET_VERSION)
+      .then(function(r) { return r.ok ? r.json() : {}; })
+      .catch(function() { return {}; });
+  }
+  return _textureIndex;
+}
+
+// Load packed texture `name` (KTX2 → packed PNG → legacyUrl) and call
+// onLoad(tex, packed) with its colour space set; packed is false for the
+// legacy PNG.  KTX2 data is stored pre-flipped, so every path ends up with
+// the same UV orientation.
+function _loadBrainTexture(name, legacyUrl, onLoad, onError) {
+  var texLoader = new THREE.TextureLoader();
+  function fromPng(url, colorSpace, packed) {
+    texLoader.load(url, function(tex) {
+      tex.colorSpace = colorSpace;
+      onLoad(tex, packed);
+    }, undefined, onError);
+  }
+  _getTextureIndex().then(function(index) {
+    var entry = index[name];
+    if (!entry) {
+      fromPng(legacyUrl, name === 'brainstem_albedo' ? THREE.SRGBColorSpace : THREE.LinearSRGBColorSpace, false);
+      return;
+    }
+    var colorSpace = entry.colorSpace === 'srgb' ? THREE.SRGBColorSpace : THREE.LinearSRGBColorSpace;
+    var png = entry.png + '?v=' + ASSET_VERSION;
+    if (!entry.ktx2) { fromPng(png, colorSpace, true); return; }
+    ktx2Loader.load(entry.ktx2 + '?v=' + ASSET_VERSION, function(tex) {
+      tex.colorSpace = colorSpace;
+      onLoad(tex, true);
+    }, undefined, function(err) {
+      console.warn('[brain-3d-v3] KTX2 ' + name + ' unavailable, using PNG:', err);
+      fromPng(png, colorSpace, true);
+    });
+  });
+}
+
 
 // ═══════════════════════════════════════════════════════════════════════════════
 // HIRES CORTEX LOADER — MeshPhysicalMaterial
 // ═══════════════════════════════════════════════════════════════════════════════
 
+// Per-face region IDs baked by cortex_regions.py, in the face order of the
+// loaded cortex GLB.  Each hires mesh gets userData.faceRegions (a view into
+// one typed array) so a cortex raycast hit resolves in O(1).  Missing files
+// or a face-count mismatch leave picking on the centroid search.
+function _loadCortexFaceRegions(glbName) {
+  var meta;
+  return fetch('data/brain_meshes/cortex_regions.json?v=' + ASSET_VERSION)
+    .then(function(r) { if (!r.ok) throw new Error(r.status); return r.json(); })
+    .then(function(idx) {
+      meta = idx.files && idx.files[glbName];
+      if (!meta) throw new Error('no entry for ' + glbName);
+      cortexRegionNames = idx.regions;
+      return fetch('data/brain_meshes/' + meta.bin + '?v=' + ASSET_VERSION);
+    })
+    .then(function(r) { if (!r.ok) throw new Error(r.status); return r.arrayBuffer(); })
+    .then(function(buf) {
+      var ids = meta.dtype === 'uint16' ? new Uint16Array(buf) : new Uint8Array(buf);
+      if (meta.faces.length !== hiresMeshes.length) throw new Error('mesh count mismatch');
+      var offset = 0;
+      var views = hiresMeshes.map(function(m, i) {
+        var g = m.geometry;
+        var n = (g.index ? g.index.count : g.attributes.position.count) / 3;
+        if (n !== meta.faces[i]) throw new Error('face count mismatch (' + n + ' vs ' + meta.faces[i] + ')');
+        var view = ids.subarray(offset, offset + n);
+        offset += n;
+        return view;
+      });
+      hiresMeshes.forEach(function(m, i) { m.userData.faceRegions = views[i]; });
+      console.log('[brain-3d-v3] Cortex face regions loaded (' + ids.length + ' faces)');
+    })
+    .catch(function(err) {
+      console.warn('[brain-3d-v3] Cortex face regions unavailable, using centroid picking:', err.message);
+    });
+}
+
+
+// ═══════════════════════════════════════════════════════════════════════════════
+
 function loadHiresBrain() {
   return new Promise(function(resolve) {
     // Draco-compressed hires cortex (655k faces, ~2.6MB) — best quality, smallest download
     var cortexPath = 'data/brain_meshes/full_brain_draco.glb?v=' + ASSET_VERSION;
 
     // Pre-load normal map + AO map textures in parallel with GLB
-    var texLoader = new THREE.TextureLoader();
+    // (texture_pack.py: KTX2 when available; the ORM texture packs AO in R
+    // and a curvature-based roughness scale in G)
     var normalMapTex = null;
     var aoMapTex = null;
+    var roughnessMapTex = null;
 
-    texLoader.load('data/brain_meshes/cortex_normal_map.png', function(tex) {
-      tex.colorSpace = THREE.LinearSRGBColorSpace;  // normal maps use linear
+    _loadBrainTexture('cortex_normal', 'data/brain_meshes/cortex_normal_map.png', function(tex) {
       normalMapTex = tex;
       console.log('[brain-3d-v3] Normal map loaded:', tex.image.width + 'x' + tex.image.height);
       // If GLB already loaded (race condition), apply normal map retroactively
@@ -348,25 +511,26 @@ function loadHiresBrain() {
           console.log('[brain-3d-v3] Normal map applied retroactively');
         }
       });
-    }, undefined, function(err) {
+    }, function(err) {
       console.warn('[brain-3d-v3] Normal map failed to load:', err);
     });
 
-    texLoader.load('data/brain_meshes/cortex_ao_map.png', function(tex) {
-      tex.colorSpace = THREE.LinearSRGBColorSpace;  // AO is linear data
+    _loadBrainTexture('cortex_orm', 'data/brain_meshes/cortex_ao_map.png', function(tex, packed) {
       tex.channel = 0;  // reuse UV0 (avoids needing UV2)
       aoMapTex = tex;
+      roughnessMapTex = packed ? tex : null;
       console.log('[brain-3d-v3] AO map loaded:', tex.image.width + 'x' + tex.image.height);
       // If GLB already loaded, apply AO retroactively
       hiresMeshes.forEach(function(m) {
         if (m.material && m.material._isHiresMat && !m.material.aoMap) {
           m.material.aoMap = aoMapTex;
           m.material.aoMapIntensity = 0.7;
+          m.material.roughnessMap = roughnessMapTex;
           m.material.needsUpdate = true;
           console.log('[brain-3d-v3] AO map applied retroactively');
         }
       });
-    }, undefined, function(err) {
+    }, function(err) {
       console.warn('[brain-3d-v3] AO map failed to load:', err);
     });
 
@@ -393,6 +557,7 @@ function loadHiresBrain() {
             normalScale:        new THREE.Vector2(1.2, 1.2),
             aoMap:              aoMapTex,
             aoMapIntensity:     0.7,
+            roughnessMap:       roughnessMapTex,
             envMap:             _envMap,
             envMapIntensity:    0.12,
             roughness:          0.75,
@@ -419,6 +584,9 @@ function loadHiresBrain() {
           hiresMeshes.push(child);
         });
         brainGroup.add(gltf.scene);
+        _loadCortexFaceRegions('full_brain_draco.glb');
+        _attachBvh('data/brain_meshes/full_brain_draco.glb',
+                   hiresMeshes.map(function(m) { return m.geometry; }));
         _progress(72, 'Applying textures\u2026');
         console.log('[brain-3d-v3] Draco hires cortex loaded (' + hiresMeshes.length + ' mesh, 655k faces)');
         resolve();
@@ -459,6 +627,9 @@ function loadHiresBrain() {
               hiresMeshes.push(child);
             });
             brainGroup.add(gltf.scene);
+            _loadCortexFaceRegions('full_brain_optimized.glb');
+            _attachBvh('data/brain_meshes/full_brain_optimized.glb',
+                       hiresMeshes.map(function(m) { return m.geometry; }));
             console.log('[brain-3d-v3] Hires cortex loaded (fallback)');
             resolve();
           },
@@ -478,10 +649,11 @@ function loadHiresBrain() {
 // ANATOMICAL BRAINSTEM + CEREBELLUM  (JSON mesh + procedural texture PNG)
 // ═══════════════════════════════════════════════════════════════════════════════
 
-function _loadAtlasMesh(regionId, jsonUrl, textureUrl) {
+function _loadAtlasMesh(regionId, jsonUrl, textureName, textureUrl) {
   /**
    * Load an atlas-derived mesh from JSON (positions, indices, normals, uvs)
-   * and apply a procedural texture PNG. Returns a Promise that resolves
+   * and apply a procedural texture (texture_pack.py entry `textureName`,
+   * falling back to the PNG at textureUrl). Returns a Promise that resolves
    * when the mesh is added to the scene.
    */
   return new Promise(function(resolve) {
@@ -498,9 +670,7 @@ function _loadAtlasMesh(regionId, jsonUrl, textureUrl) {
         geo.setIndex(new THREE.Uint32BufferAttribute(new Uint32Array(data.indices), 1));
 
         // Load the procedural texture
-        var texLoader = new THREE.TextureLoader();
-        texLoader.load(textureUrl, function(tex) {
-          tex.colorSpace = THREE.SRGBColorSpace;
+        _loadBrainTexture(textureName, textureUrl, function(tex) {
           tex.wrapS = THREE.ClampToEdgeWrapping;
           tex.wrapT = THREE.ClampToEdgeWrapping;
           tex.minFilter = THREE.LinearMipmapLinearFilter;
@@ -573,7 +743,7 @@ function _loadAtlasMesh(regionId, jsonUrl, textureUrl) {
             center.x.toFixed(3), center.y.toFixed(3), center.z.toFixed(3));
 
           resolve(mesh);
-        }, undefined, function(err) {
+        }, function(err) {
           // Texture load failed -- fall back to solid color
           console.warn('[brain-3d-v3] Texture load failed for ' + regionId + ', using solid color');
           var baseColor = new THREE.Color(TISSUE_COLOR);
@@ -634,6 +804,7 @@ function _loadAtlasMesh(regionId, jsonUrl, textureUrl) {
 function loadAtlasBrainstem() {
   return _loadAtlasMesh('brainstem',
     'data/brain_meshes/brainstem_mesh.json?v=' + ASSET_VERSION,
+    'brainstem_albedo',
     'data/brain_meshes/brainstem_texture.png?v=' + ASSET_VERSION);
 }
 
@@ -815,8 +986,7 @@ function _inflateGeomByNormal(geom) {
 // The mirror shares the same material so colour/opacity stay in sync automatically.
 // In split view the hardware clip plane (x > MIDLINE_X) removes it entirely — no
 // special-case code needed.
-function _createMirrorMesh(sourceMesh) {
-  var origGeom   = sourceMesh.geometry;
+function _mirrorGeometry(origGeom) {
   var mirrorGeom = origGeom.clone();
 
   var pos = mirrorGeom.attributes.position;
@@ -842,6 +1012,11 @@ function _createMirrorMesh(sourceMesh) {
     }
     mirrorGeom.index.needsUpdate = true;
   }
+  return mirrorGeom;
+}
+
+function _createMirrorMesh(sourceMesh) {
+  var mirrorGeom = _mirrorGeometry(sourceMesh.geometry);
 
   var mirror         = new THREE.Mesh(mirrorGeom, sourceMesh.material);
   mirror.castShadow    = false;
@@ -873,135 +1048,319 @@ function _createMirrorMesh(sourceMesh) {
 // REGION OVERLAY LOADER
 // ═══════════════════════════════════════════════════════════════════════════════
 
-function loadRegion(regionId, entry, permanent) {
+// Manifest entries may carry a "lods" chain (fine → coarse, see mesh_lod.py).
+// Overlays load their coarsest level first so the scene is interactive quickly;
+// _refineRegion later swaps LOD 0 geometry into the existing meshes in place.
+function _coarsestLodFile(entry) {
+  if (entry.lods && entry.lods.length > 1) return entry.lods[entry.lods.length - 1].file;
+  return entry.file;
+}
+
+// Material, outline, registries, mirror and centroid for a region's meshes
+// (everything under `root`), whether they came from a GLB or the scene pack.
+function _setupRegion(regionId, entry, permanent, root) {
+  var baseColor = permanent
+    ? new THREE.Color(TISSUE_COLOR)
+    : new THREE.Color(OVERLAY_COLORS[regionId] || 0x8888AA);
+
+  var mat = new THREE.MeshPhysicalMaterial({
+    color:              baseColor,
+    envMap:             _envMap,
+    envMapIntensity:    permanent ? 0.08 : 0.09,
+    roughness:          permanent ? 0.68 : 0.58,
+    metalness:          0.0,
+    emissive:           baseColor,
+    emissiveIntensity:  permanent ? 0.04 : 0.18,
+    clearcoat:          permanent ? 0.10 : 0.14,
+    clearcoatRoughness: permanent ? 0.38 : 0.32,
+    sheen:              permanent ? 0.09 : 0.15,
+    sheenRoughness:     0.52,
+    sheenColor:         new THREE.Color(0xFFBBAA),
+    transparent:        !permanent,
+    opacity:            1.0,
+    side:               THREE.FrontSide,
+    depthWrite:         true,
+    // Pull non-permanent overlays slightly forward so they don't z-fight
+    // with the cortex surface they sit flush against (important for medial
+    // structures like cingulate gyrus viewed in split mode).
+    polygonOffset:      !permanent,
+    polygonOffsetFactor: -2,
+    polygonOffsetUnits: -4,
+  });
+  mat._origColor     = baseColor.clone();
+  mat._origEmissive  = baseColor.clone();
+  mat._origRoughness = mat.roughness;
+
+  // Collect meshes iteratively to avoid stack overflow on deeply nested GLBs
+  var meshList = [];
+  var stack = [root];
+  while (stack.length > 0) {
+    var node = stack.pop();
+    if (node.isMesh) meshList.push(node);
+    if (node.children) {
+      for (var si = 0; si < node.children.length; si++) {
+        stack.push(node.children[si]);
+      }
+    }
+  }
+
+  meshList.forEach(function(child) {
+    child.geometry.computeVertexNormals();
+    child.material      = mat;
+    child.name          = regionId;
+    child.castShadow    = false;
+    child.receiveShadow = false;
+    child.visible       = permanent;
+
+    child.userData = {
+      regionId:   regionId,
+      label:      regionId,
+      type:       entry.type,
+      permanent:  permanent,
+      overlayMat: mat,
+    };
+
+    // Gold selection outline — vertices displaced outward along normals by a
+    // fixed distance (OUTLINE_INFLATE) so the border width is uniform for
+    // all regions including thin medial structures like cingulate gyrus.
+    var selMat = new THREE.MeshBasicMaterial({
+      color:       0xFFD060,
+      side:        THREE.BackSide,
+      transparent: true,
+      opacity:     0.0,
+      depthWrite:  false,
+    });
+    var selOutline = new THREE.Mesh(_inflateGeomByNormal(child.geometry), selMat);
+    selOutline.renderOrder = 3;
+    selOutline.visible = false;
+    selOutline.userData = { isOutline: true };
+    child.userData.selOutline = selOutline;
+    child.add(selOutline);
+
+    // Track in registries
+    if (permanent) {
+      permanentMeshes.push(child);
+      if (regionId === 'cerebellum') cerebellumMeshes.push(child);
+      if (regionId === 'brainstem')  brainstemMeshes.push(child);
+    }
+    regionMeshes.push(child);
+    if (entry.type === 'subcortical') {
+      subcorticalMeshes.push(child);
+    } else {
+      corticalMeshes.push(child);
+    }
+  });
+
+  var geometries = meshList.map(function(m) { return m.geometry; });
+  if (!geometries.every(function(g) { return g.boundsTree; })) {
+    _attachBvh(_coarsestLodFile(entry), geometries);
+  }
+
+  // Bilateral mirror: for symmetric regions, reflect each mesh across
+  // x = MIDLINE_X so BOTH hemispheres light up when the region is selected.
+  if (!permanent && BILATERAL_REGIONS.has(regionId)) {
+    meshList.forEach(function(child) {
+      var mirror = _createMirrorMesh(child);
+      child.userData.mirrorMesh = mirror;
+      brainGroup.add(mirror);
+    });
+  }
+
+  brainGroup.add(root);
+
+  // Compute centroid for camera auto-focus
+  var box = new THREE.Box3().setFromObject(root);
+  var center = new THREE.Vector3();
+  box.getCenter(center);
+  regionCentroids[regionId] = center.clone();
+
+  // Compute ideal camera position — offset from centroid toward viewer
+  var camPos = computeRegionCameraPos(center, regionId, entry.type);
+  regionCameraPos[regionId] = camPos;
+}
+
+// geometry: optional prebuilt BufferGeometry (scene pack); otherwise the
+// region's coarsest GLB is loaded.
+function loadRegion(regionId, entry, permanent, geometry) {
+  if (geometry) {
+    var root = new THREE.Group();
+    root.add(new THREE.Mesh(geometry));
+    _setupRegion(regionId, entry, permanent, root);
+    return Promise.resolve();
+  }
   return new Promise(function(resolve) {
-    loader.load(entry.file + '?v=' + ASSET_VERSION,
+    loader.load(_coarsestLodFile(entry) + '?v=' + ASSET_VERSION,
       function(gltf) {
-        var baseColor = permanent
-          ? new THREE.Color(TISSUE_COLOR)
-          : new THREE.Color(OVERLAY_COLORS[regionId] || 0x8888AA);
+        _setupRegion(regionId, entry, permanent, gltf.scene);
+        resolve();
+      },
+      undefined,
+      function(err) {
+        console.warn('[brain-3d-v3] Region load failed (' + regionId + '):', err);
+        resolve();
+      }
+    );
+  });
+}
 
-        var mat = new THREE.MeshPhysicalMaterial({
-          color:              baseColor,
-          envMap:             _envMap,
-          envMapIntensity:    permanent ? 0.08 : 0.09,
-          roughness:          permanent ? 0.68 : 0.58,
-          metalness:          0.0,
-          emissive:           baseColor,
-          emissiveIntensity:  permanent ? 0.04 : 0.18,
-          clearcoat:          permanent ? 0.10 : 0.14,
-          clearcoatRoughness: permanent ? 0.38 : 0.32,
-          sheen:              permanent ? 0.09 : 0.15,
-          sheenRoughness:     0.52,
-          sheenColor:         new THREE.Color(0xFFBBAA),
-          transparent:        !permanent,
-          opacity:            1.0,
-          side:               THREE.FrontSide,
-          depthWrite:         true,
-          // Pull non-permanent overlays slightly forward so they don't z-fight
-          // with the cortex surface they sit flush against (important for medial
-          // structures like cingulate gyrus viewed in split mode).
-          polygonOffset:      !permanent,
-          polygonOffsetFactor: -2,
-          polygonOffsetUnits: -4,
-        });
-        mat._origColor     = baseColor.clone();
-        mat._origEmissive  = baseColor.clone();
-        mat._origRoughness = mat.roughness;
+var _refinedRegions = {};  // regionId → true once LOD 0 is loaded or in flight
 
-        // Collect meshes iteratively to avoid stack overflow on deeply nested GLBs
-        var meshList = [];
-        var stack = [gltf.scene];
-        while (stack.length > 0) {
-          var node = stack.pop();
-          if (node.isMesh) meshList.push(node);
-          if (node.children) {
-            for (var si = 0; si < node.children.length; si++) {
-              stack.push(node.children[si]);
-            }
-          }
-        }
+function _refineRegion(regionId, entry) {
+  if (!entry.lods || entry.lods.length < 2 || _refinedRegions[regionId]) {
+    return Promise.resolve();
+  }
+  _refinedRegions[regionId] = true;
 
-        meshList.forEach(function(child) {
-          child.geometry.computeVertexNormals();
-          child.material      = mat;
-          child.name          = regionId;
-          child.castShadow    = false;
-          child.receiveShadow = false;
-          child.visible       = permanent;
-
-          child.userData = {
-            regionId:   regionId,
-            label:      regionId,
-            type:       entry.type,
-            permanent:  permanent,
-            overlayMat: mat,
-          };
+  function applyFine(fine) {
+    fine.computeVertexNormals();
+    if (!fine.boundsTree) _attachBvh(entry.lods[0].file, [fine]);
 
-          // Gold selection outline — vertices displaced outward along normals by a
-          // fixed distance (OUTLINE_INFLATE) so the border width is uniform for
-          // all regions including thin medial structures like cingulate gyrus.
-          var selMat = new THREE.MeshBasicMaterial({
-            color:       0xFFD060,
-            side:        THREE.BackSide,
-            transparent: true,
-            opacity:     0.0,
-            depthWrite:  false,
-          });
-          var selOutline = new THREE.Mesh(_inflateGeomByNormal(child.geometry), selMat);
-          selOutline.renderOrder = 3;
-          selOutline.visible = false;
-          selOutline.userData = { isOutline: true };
-          child.userData.selOutline = selOutline;
-          child.add(selOutline);
-
-          // Track in registries
-          if (permanent) {
-            permanentMeshes.push(child);
-            if (regionId === 'cerebellum') cerebellumMeshes.push(child);
-            if (regionId === 'brainstem')  brainstemMeshes.push(child);
-          }
-          regionMeshes.push(child);
-          if (entry.type === 'subcortical') {
-            subcorticalMeshes.push(child);
-          } else {
-            corticalMeshes.push(child);
-          }
-        });
+    regionMeshes.forEach(function(child) {
+      if (child.userData.regionId !== regionId) return;
+      var coarse = child.geometry;
+      child.geometry = fine;
+      coarse.dispose();
 
-        // Bilateral mirror: for symmetric regions, reflect each mesh across
-        // x = MIDLINE_X so BOTH hemispheres light up when the region is selected.
-        if (!permanent && BILATERAL_REGIONS.has(regionId)) {
-          meshList.forEach(function(child) {
-            var mirror = _createMirrorMesh(child);
-            child.userData.mirrorMesh = mirror;
-            brainGroup.add(mirror);
-          });
+      var sel = child.userData.selOutline;
+      if (sel) {
+        sel.geometry.dispose();
+        sel.geometry = _inflateGeomByNormal(fine);
+      }
+      var mirror = child.userData.mirrorMesh;
+      if (mirror) {
+        mirror.geometry.dispose();
+        mirror.geometry = _mirrorGeometry(fine);
+        var mirrorSel = mirror.userData.selOutline;
+        if (mirrorSel) {
+          mirrorSel.geometry.dispose();
+          mirrorSel.geometry = _inflateGeomByNormal(mirror.geometry);
         }
+      }
+    });
+    _visibleCacheDirty = true;
+  }
 
-        brainGroup.add(gltf.scene);
-
-        // Compute centroid for camera auto-focus
-        var box = new THREE.Box3().setFromObject(gltf.scene);
-        var center = new THREE.Vector3();
-        box.getCenter(center);
-        regionCentroids[regionId] = center.clone();
-
-        // Compute ideal camera position — offset from centroid toward viewer
-        var camPos = computeRegionCameraPos(center, regionId, entry.type);
-        regionCameraPos[regionId] = camPos;
+  function failed(err) {
+    console.warn('[brain-3d-v3] LOD refine failed (' + regionId + '):', err);
+    _refinedRegions[regionId] = false;
+  }
 
+  if (_packHas(regionId)) {
+    return _packGeometry(regionId, 0).then(applyFine, failed);
+  }
+  return new Promise(function(resolve) {
+    loader.load(entry.lods[0].file + '?v=' + ASSET_VERSION,
+      function(gltf) {
+        var fine = null;
+        gltf.scene.traverse(function(node) {
+          if (!fine && node.isMesh) fine = node.geometry;
+        });
+        if (fine) applyFine(fine);
         resolve();
       },
       undefined,
       function(err) {
-        console.warn('[brain-3d-v3] Region load failed (' + regionId + '):', err);
+        failed(err);
         resolve();
       }
     );
   });
 }
 
+
+// ═══════════════════════════════════════════════════════════════════════════════
+// SCENE PACK — every region mesh in one range-indexed binary (scene_pack.py)
+// ═══════════════════════════════════════════════════════════════════════════════
+
+// Startup fetches the coarse section (all coarsest LODs) in one request;
+// anything else is range-requested on demand.  Each chunk remembers the byte
+// offset it starts at, so a server that ignores Range (200 + whole file)
+// just yields one chunk covering everything.
+var _scenePack = null;  // { index, url, chunks: [{ start, end, buf }] }
+
+function _fetchPackRange(start, end) {
+  return fetch(_scenePack.url, { headers: { Range: 'bytes=' + start + '-' + (end - 1) } })
+    .then(function(r) {
+      if (!r.ok) throw new Error('scene pack HTTP ' + r.status);
+      var base = r.status === 206 ? start : 0;
+      return r.arrayBuffer().then(function(buf) {
+        var chunk = { start: base, end: base + buf.byteLength, buf: buf };
+        _scenePack.chunks.push(chunk);
+        return chunk;
+      });
+    });
+}
+
+function _loadScenePack() {
+  return fetch('data/brain_meshes/scene_pack.json?v=' + ASSET_VERSION)
+    .then(function(r) { if (!r.ok) throw new Error(r.status); return r.json(); })
+    .then(function(index) {
+      _scenePack = { index: index, url: index.file + '?v=' + ASSET_VERSION, chunks: [] };
+      return index.coarseBytes > 0 ? _fetchPackRange(0, index.coarseBytes) : null;
+    })
+    .then(function() {
+      console.log('[brain-3d-v3] Scene pack: ' + Object.keys(_scenePack.index.regions).length
+        + ' regions in one request');
+      return _scenePack;
+    })
+    .catch(function(err) {
+      console.warn('[brain-3d-v3] Scene pack unavailable, loading region GLBs:', err.message || err);
+      _scenePack = null;
+      return null;
+    });
+}
+
+function _packHas(regionId) {
+  return !!(_scenePack && _scenePack.index.regions[regionId]);
+}
+
+// Quantized positions + indices → BufferGeometry (normals computed by callers),
+// with the BVH stored after them as its boundsTree
+function _decodePackMesh(lod, buf, at, label) {
+  var n = lod.vertexCount;
+  var q = new Uint16Array(buf, at, n * 3);
+  var pos = new Float32Array(n * 3);
+  for (var a = 0; a < 3; a++) {
+    var lo = lod.min[a];
+    var step = (lod.max[a] > lo ? lod.max[a] - lo : 1) / 65535;
+    for (var k = a; k < n * 3; k += 3) pos[k] = lo + q[k] * step;
+  }
+  var idxAt = at + Math.ceil(n * 6 / 4) * 4;
+  var count = lod.faceCount * 3;
+  var idxBytes = lod.indexType === 'uint32' ? 4 : 2;
+  var idx = idxBytes === 4
+    ? new Uint32Array(buf, idxAt, count)
+    : new Uint16Array(buf, idxAt, count);
+  var geo = new THREE.BufferGeometry();
+  geo.setAttribute('position', new THREE.BufferAttribute(pos, 3));
+  geo.setIndex(new THREE.BufferAttribute(idx, 1));
+  if (lod.bvhBytes) {
+    var bvhAt = idxAt + Math.ceil(count * idxBytes / 4) * 4;
+    _applyBvh(geo, {
+      nodes:    buf.slice(bvhAt, bvhAt + lod.bvhBytes),
+      indirect: new Uint32Array(buf, bvhAt + lod.bvhBytes, lod.faceCount),
+      tris:     lod.faceCount,
+    }, label);
+  }
+  return geo;
+}
+
+// Geometry for LOD `level` of a packed region (0 = finest, -1 = coarsest)
+function _packGeometry(regionId, level) {
+  var lods = _scenePack.index.regions[regionId].lods;
+  var lod = lods[level < 0 ? lods.length + level : level];
+  var end = lod.offset + lod.length;
+  for (var c = 0; c < _scenePack.chunks.length; c++) {
+    var chunk = _scenePack.chunks[c];
+    if (chunk.start <= lod.offset && end <= chunk.end) {
+      return Promise.resolve(_decodePackMesh(lod, chunk.buf, lod.offset - chunk.start, regionId));
+    }
+  }
+  return _fetchPackRange(lod.offset, end).then(function(chunk) {
+    return _decodePackMesh(lod, chunk.buf, lod.offset - chunk.start, regionId);
+  });
+}
+
 function computeRegionCameraPos(center, regionId, type) {
   // Direction from brain center to region centroid
   var dir = center.clone().sub(CAM_ORIGIN);
@@ -1177,6 +1536,7 @@ function computeRegionCameraPos(center, regionId, type) {
 // LOAD ORCHESTRATION
 // ═══════════════════════════════════════════════════════════════════════════════
 
+var _manifest = null;  // set once regions are loaded; used for on-demand LOD refine
 var _readyResolve = null;
 var _readyPromise = new Promise(function(res) { _readyResolve = res; });
 
@@ -1197,8 +1557,10 @@ async function loadBrain() {
     var results = await Promise.allSettled([
       fetch('data/brain_regions_manifest.json?v=' + ASSET_VERSION).then(function(r) { return r.json(); }),
       loadHiresBrain(),   // emits pct 5–72 internally via onProgress
+      _loadScenePack(),   // index + every coarse region mesh, one request
     ]);
     if (results[0].status === 'fulfilled') manifest = results[0].value;
+    _manifest = manifest;
   } catch (e) {
     console.warn('[brain-3d-v3] Init error:', e);
   }
@@ -1231,7 +1593,12 @@ async function loadBrain() {
   for (var bi = 0; bi < regionIds.length; bi += BATCH) {
     var batch = regionIds.slice(bi, bi + BATCH);
     await Promise.allSettled(batch.map(function(id) {
-      return loadRegion(id, manifest[id], false).then(function() {
+      var geometry = _packHas(id)
+        ? _packGeometry(id, -1).catch(function() { return null; })
+        : Promise.resolve(null);
+      return geometry.then(function(geo) {
+        return loadRegion(id, manifest[id], false, geo);
+      }).then(function() {
         loadedCount++;
         var pct = 80 + Math.round((loadedCount / totalRegions) * 14);  // 80–94%
         _progress(pct, 'Loading regions\u2026 ' + loadedCount + '\u202f/\u202f' + totalRegions);
@@ -1245,6 +1612,27 @@ async function loadBrain() {
 
   _progress(100, 'Ready');
   _readyResolve();
+
+  // Refine coarse LOD overlays to full resolution in the background —
+  // the selected region first so the user sees its detail soonest.
+  var refineOrder = regionIds.slice();
+  if (selectedRegionId && refineOrder.indexOf(selectedRegionId) > 0) {
+    refineOrder.splice(refineOrder.indexOf(selectedRegionId), 1);
+    refineOrder.unshift(selectedRegionId);
+  }
+  // Packed fine levels arrive in one range request rather than one per region
+  if (_scenePack && _scenePack.index.bytes > _scenePack.index.coarseBytes) {
+    try {
+      await _fetchPackRange(_scenePack.index.coarseBytes, _scenePack.index.bytes);
+    } catch (e) {
+      console.warn('[brain-3d-v3] Scene pack refine range failed:', e);
+    }
+  }
+  for (var ri = 0; ri < refineOrder.length; ri += BATCH) {
+    await Promise.allSettled(refineOrder.slice(ri, ri + BATCH).map(function(id) {
+      return _refineRegion(id, manifest[id]);
+    }));
+  }
 }
 
 loadBrain();
@@ -1430,6 +1818,9 @@ function _dimHires(on) {
 // ═══════════════════════════════════════════════════════════════════════════════
 
 function highlightRegion(regionId) {
+  // Selecting a region still on its coarse LOD jumps it to the front of the queue.
+  if (_manifest && _manifest[regionId]) _refineRegion(regionId, _manifest[regionId]);
+
   // Restore cerebellum from any previous region's auto-glass before applying
   // the new region's state (avoids permanently glassed cerebellum on switch).
   _setCerebellumGlass(false);
@@ -1876,6 +2267,7 @@ function setSubcorticalVisible(show) {
 // ═══════════════════════════════════════════════════════════════════════════════
 
 var raycaster = new THREE.Raycaster();
+raycaster.firstHitOnly = true;  // BVH meshes stop at their nearest hit
 var mouse     = new THREE.Vector2(-10, -10);
 var downPos   = null;
 
@@ -1895,6 +2287,14 @@ function _findNearestRegion(point) {
   return (bestId && bestDist < 1.5) ? bestId : null;
 }
 
+function _cortexFaceRegion(hit) {
+  // Exact region for a cortex hit from the baked per-face buffer, or null
+  var ids = hit.object.userData.faceRegions;
+  if (!ids || hit.faceIndex == null || !cortexRegionNames) return null;
+  var id = cortexRegionNames[ids[hit.faceIndex]];
+  return (id && regionCentroids[id]) ? id : null;
+}
+
 var _visibleCache = [];
 var _visibleCacheDirty = true;
 
@@ -1914,12 +2314,12 @@ function _rayHitRegion() {
     }
   }
 
-  // 2. If no overlay hit, check hires cortex mesh and find nearest region
+  // 2. If no overlay hit, check hires cortex mesh: per-face region lookup,
+  //    nearest centroid for unlabelled faces or when no buffer is loaded
   if (hiresMeshes.length) {
     var cortexHits = raycaster.intersectObjects(hiresMeshes, false);
     if (cortexHits.length > 0) {
-      var hitPoint = cortexHits[0].point;
-      var nearestId = _findNearestRegion(hitPoint);
+      var nearestId = _cortexFaceRegion(cortexHits[0]) || _findNearestRegion(cortexHits[0].point);
       if (nearestId) {
         // Return a synthetic "hit object" so callers can read .userData.regionId
         return { userData: { regionId: nearestId, _cortexHit: true } };
@@ -0,0 +1,93 @@
+"""
+build_brain_bundle.py
+
+Bundles brain-3d-v3.js with three.js and three-mesh-bvh into
+brain-3d-v3.bundle.js (esbuild, ES module) and re-stamps the `?v=` on the
+bundle import in the pages that load it.  serve.py caches `?v=` requests
+as immutable for a year, so the stamp is the bundle's content hash: a
+rebuilt bundle always gets a new URL, an identical one keeps its old URL.
+
+brain-3d-v3.js carries its own ASSET_VERSION for the meshes, textures and
+sidecars it fetches — bump that by hand whenever those files change, then
+rebuild.  A bundle whose ASSET_VERSION differs from the source's is stale
+(the page still runs the old viewer): the build refuses to stamp one, and
+--check reports it without building.
+
+Needs node_modules (npm install) and esbuild (on PATH, or fetched by npx);
+--check needs neither.
+
+Run after any change to brain-3d-v3.js:
+  python build_brain_bundle.py
+  python build_brain_bundle.py --check    # exit 1 if the bundle or a page stamp is stale
+"""
+
+import argparse, hashlib, pathlib, re, shutil, subprocess, sys
+
+ENTRY  = pathlib.Path("brain-3d-v3.js")
+BUNDLE = pathlib.Path("brain-3d-v3.bundle.js")
+PAGES  = [pathlib.Path("brain-exercise-30.html")]
+
+_ASSET_VERSION = re.compile(r"""ASSET_VERSION\s*=\s*['"]([^'"]+)['"]""")
+_STAMP = re.compile(re.escape(BUNDLE.name) + r"\?v=([\w.-]+)")
+
+
+def asset_version(path):
+    m = _ASSET_VERSION.search(path.read_text(encoding="utf-8"))
+    return m.group(1) if m else None
+
+
+def bundle_stamp():
+    return hashlib.sha1(BUNDLE.read_bytes()).hexdigest()[:10]
+
+
+def stale():
+    """Reasons the committed bundle or a page's ?v= stamp is out of date."""
+    if not BUNDLE.exists():
+        return [f"{BUNDLE} not found"]
+    out = []
+    src, built = asset_version(ENTRY), asset_version(BUNDLE)
+    if src != built:
+        out.append(f"{BUNDLE} has ASSET_VERSION {built!r}, {ENTRY} has {src!r}")
+    stamp = bundle_stamp()
+    for page in PAGES:
+        m = _STAMP.search(page.read_bytes().decode("utf-8"))
+        if m and m.group(1) != stamp:
+            out.append(f"{page} imports {BUNDLE.name}?v={m.group(1)}, bundle hash is {stamp}")
+    return out
+
+
+parser = argparse.ArgumentParser(description="Bundle brain-3d-v3.js and re-stamp the pages")
+parser.add_argument("--check", action="store_true",
+                    help="Report a stale bundle or page stamp and exit 1; build nothing")
+args = parser.parse_args()
+
+if args.check:
+    problems = stale()
+    for p in problems:
+        print(f"  STALE: {p}")
+    print("\nRun: python build_brain_bundle.py" if problems else "  Bundle up to date")
+    sys.exit(1 if problems else 0)
+
+if not pathlib.Path("node_modules/three").exists():
+    print("ERROR: node_modules/three not found — run `npm install` first.")
+    sys.exit(1)
+
+esbuild = ["esbuild"] if shutil.which("esbuild") else ["npx", "--yes", "esbuild"]
+subprocess.run(esbuild + [str(ENTRY), "--bundle", "--format=esm", f"--outfile={BUNDLE}"],
+               check=True, shell=sys.platform == "win32")
+
+if asset_version(BUNDLE) != asset_version(ENTRY):
+    print(f"ERROR: {BUNDLE} does not carry {ENTRY}'s ASSET_VERSION {asset_version(ENTRY)!r}")
+    sys.exit(1)
+
+stamp = bundle_stamp()
+for page in PAGES:
+    html = page.read_bytes().decode("utf-8")
+    new, n = _STAMP.subn(f"{BUNDLE.name}?v={stamp}", html)
+    if n == 0:
+        print(f"  {page}: no {BUNDLE.name}?v= import found")
+    elif new != html:
+        page.write_bytes(new.encode("utf-8"))
+        print(f"  {page}: {BUNDLE.name}?v={stamp}")
+
+print(f"\nWritten {BUNDLE} ({BUNDLE.stat().st_size:,} bytes)")
@@ -12,15 +12,21 @@ Run after any question generation:
 
 import json, pathlib
 
+from content_schema import validate_or_exit
+from data_io import load_json
+
 DATA    = pathlib.Path("data")
 DOMAINS = ["BPSY", "CASS", "CPAT", "LDEV", "PETH", "PMET", "PTHE", "SOCU", "WDEV"]
 
+# Refuse to bundle files that break the tables schema (warnings are reported only)
+validate_or_exit([DATA / f"{code}_tables.json" for code in DOMAINS
+                  if (DATA / f"{code}_tables.json").exists()])
+
 entries = []
 for code in DOMAINS:
     src = DATA / f"{code}_tables.json"
     if src.exists():
-        with open(src, encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json(src)
         entries.append(f'  "{code}": {json.dumps(data, ensure_ascii=False)}')
         print(f"  {code}: {len(data.get('questions', []))} questions")
     else:
@@ -18,11 +18,12 @@ Uses:
   - Subdomain-based adjustments
 """
 
-import json
 import re
 import os
 from collections import Counter
 
+from data_io import RecordWriter, iter_records
+
 DATA_DIR = "C:/Users/Admin/JustinMasteryPage/data"
 DOMAINS = ["BPSY", "CASS", "CPAT", "LDEV", "PETH", "PMET", "PTHE", "SOCU", "WDEV"]
 
@@ -333,19 +334,14 @@ def main():
     print("=" * 70)
 
     # Phase 1: Score all questions to compute global thresholds
-    all_questions = []  # (domain, index, raw_score)
-    domain_data = {}
+    # (streamed — only the scores are kept; files are re-read in phase 3)
+    all_scores = []
 
     for domain in DOMAINS:
         path = os.path.join(DATA_DIR, f"{domain}_basic.json")
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-        domain_data[domain] = data
-        for i, q in enumerate(data["questions"]):
-            raw = score_question(q)
-            all_questions.append((domain, i, raw))
-
-    all_scores = [s for _, _, s in all_questions]
+        for q in iter_records(path, "questions"):
+            all_scores.append(score_question(q))
+
     print(f"\nTotal questions scored: {len(all_scores)}")
     print(f"Score range: [{min(all_scores):.3f}, {max(all_scores):.3f}]")
     print(f"Score mean:  {sum(all_scores)/len(all_scores):.3f}")
@@ -363,25 +359,22 @@ def main():
     print("-" * 75)
 
     for domain in DOMAINS:
-        data = domain_data[domain]
-        counts = Counter()
-
-        for i, q in enumerate(data["questions"]):
-            raw = score_question(q)
-            level = assign_from_thresholds(raw, thresholds)
-            q["difficulty_level"] = level
-            counts[level] += 1
-            grand_counts[level] += 1
-
-        # Update total_questions just in case
-        data["total_questions"] = len(data["questions"])
-
-        # Write back
         path = os.path.join(DATA_DIR, f"{domain}_basic.json")
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        counts = Counter()
 
-        total = len(data["questions"])
+        # Stream back in place; total_questions updated just in case
+        header = {}
+        with RecordWriter(path, header, "questions", mode="compact",
+                          count_keys=["total_questions"]) as out:
+            for q in iter_records(path, "questions", header):
+                raw = score_question(q)
+                level = assign_from_thresholds(raw, thresholds)
+                q["difficulty_level"] = level
+                counts[level] += 1
+                grand_counts[level] += 1
+                out.write(q)
+
+        total = out.count
         pcts = {lv: counts[lv] / total * 100 for lv in [1, 2, 3, 4]}
         print(f"{domain:<8} {total:>6} {counts[1]:>6} {counts[2]:>6} "
               f"{counts[3]:>6} {counts[4]:>6}  "
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+compress_meshes.py — Geometry compression stage for exported brain GLBs
+
+Runs every GLB in data/brain_meshes (or the paths given) through the
+@gltf-transform/cli devDependency from package.json: KHR_draco_mesh_compression,
+edgebreaker, with quantized positions (14 bit), normals (10 bit) and UVs
+(12 bit).  Draco is the one codec the viewer decodes — brain-3d-v3.js wires a
+DRACOLoader into GLTFLoader.
+
+The mesh generators (optimize_cortex.py, generate_parcellated_brain.py,
+generate_brain_meshes.py) call this on every GLB they export; region GLBs go
+through compress_manifest() before their BVH sidecars and the scene pack are
+built, since Draco reorders vertices.
+
+Each file is compressed to a temp file, verified, then swapped into place.
+The round-trip check decodes the Draco bitstream with DracoPy and measures
+the worst vertex displacement against the uncompressed source, relative to
+the mesh's bounding-box diagonal; files over --max-error keep their original
+bytes.  Already-compressed files are skipped.
+
+USAGE:
+  npm install
+  pip install numpy scipy DracoPy
+  python compress_meshes.py                         # every GLB, Draco
+  python compress_meshes.py data/brain_meshes/full_brain_draco.glb
+  python compress_meshes.py --dry-run
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import numpy as np
+from pathlib import Path
+
+from glb_io import read_glb, read_mesh_arrays, is_compressed
+
+MESH_DIR = Path("data/brain_meshes")
+
+# Quantization bits — 14-bit positions keep error < 1e-4 of the brain's extent
+QUANTIZE_POSITION = 14
+QUANTIZE_NORMAL   = 10
+QUANTIZE_TEXCOORD = 12
+
+# Max vertex displacement / bbox diagonal tolerated by the round-trip check
+MAX_REL_ERROR = 1e-3
+
+
+def _npx():
+    """npx is npx.cmd on Windows — resolve it so subprocess finds it without a shell."""
+    return shutil.which("npx") or shutil.which("npx.cmd") or "npx"
+
+
+def gltf_transform(*args):
+    """Run the locally installed gltf-transform CLI; raises on failure."""
+    cmd = [_npx(), "--no-install", "gltf-transform", *map(str, args)]
+    res = subprocess.run(cmd, capture_output=True, text=True)
+    if res.returncode != 0:
+        raise RuntimeError(f"gltf-transform {args[0]} failed:\n{res.stderr.strip() or res.stdout.strip()}")
+    return res.stdout
+
+
+def encode(src, dst):
+    gltf_transform(
+        "draco", src, dst,
+        "--method", "edgebreaker",
+        "--quantize-position", QUANTIZE_POSITION,
+        "--quantize-normal",   QUANTIZE_NORMAL,
+        "--quantize-texcoord", QUANTIZE_TEXCOORD,
+    )
+
+
+def draco_positions(path):
+    """Decode every Draco primitive in a GLB back to float32 positions."""
+    import DracoPy
+    gltf, binary = read_glb(path)
+    out = []
+    for mesh in gltf.get("meshes", []):
+        for prim in mesh.get("primitives", []):
+            ext = prim.get("extensions", {}).get("KHR_draco_mesh_compression")
+            if ext is None:
+                continue
+            bv = gltf["bufferViews"][ext["bufferView"]]
+            start = bv.get("byteOffset", 0)
+            decoded = DracoPy.decode(binary[start:start + bv["byteLength"]])
+            out.append(np.asarray(decoded.points, dtype=np.float32).reshape(-1, 3))
+    return np.vstack(out) if out else np.zeros((0, 3), np.float32)
+
+
+def round_trip_error(src_verts, dst_path):
+    """
+    Worst-case vertex displacement relative to the bbox diagonal, or None
+    when DracoPy is missing.  Draco reorders vertices, so each source vertex
+    is matched to its nearest decoded vertex.
+    """
+    if len(src_verts) == 0:
+        return None
+    try:
+        decoded = draco_positions(dst_path)
+    except ImportError:
+        return None
+    from scipy.spatial import cKDTree
+    if len(decoded) == 0:
+        return float("inf")
+    dists, _ = cKDTree(decoded).query(src_verts, k=1)
+    diag = float(np.linalg.norm(src_verts.max(axis=0) - src_verts.min(axis=0))) or 1.0
+    return float(dists.max()) / diag
+
+
+def compress_file(path, max_error=MAX_REL_ERROR, dry_run=False):
+    """
+    Compress one GLB in place.  Returns a result dict:
+        {"file", "before", "after", "ratio", "error", "status"}
+    status is one of: compressed, skipped, rejected, failed.
+    """
+    path = Path(path)
+    before = path.stat().st_size
+    result = {"file": path.name, "before": before, "after": before,
+              "ratio": 1.0, "error": None, "status": "skipped"}
+
+    gltf, _ = read_glb(path)
+    if is_compressed(gltf):
+        return result
+
+    src_verts, _ = read_mesh_arrays(path)
+    fd, tmp = tempfile.mkstemp(suffix=".glb", dir=path.parent)
+    os.close(fd)
+    tmp = Path(tmp)
+    try:
+        encode(path, tmp)
+        after = tmp.stat().st_size
+        err = round_trip_error(src_verts, tmp)
+        result.update(after=after, ratio=before / max(after, 1), error=err)
+        if err is not None and err > max_error:
+            result["status"] = "rejected"
+            return result
+        if not dry_run:
+            os.replace(tmp, path)
+        result["status"] = "compressed"
+        return result
+    except Exception as e:
+        print(f"  [error] {path.name}: {e}")
+        result["status"] = "failed"
+        return result
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def compress_all(paths, max_error=MAX_REL_ERROR, dry_run=False):
+    results = []
+    print(f"  {'File':38s} {'Before':>9} {'After':>9} {'Ratio':>6}  {'RT err':>9}  Status")
+    print("  " + "-" * 86)
+    for p in paths:
+        r = compress_file(p, max_error, dry_run)
+        err = "n/a" if r["error"] is None else f"{r['error']:.2e}"
+        print(f"  {r['file']:38s} {r['before']/1e3:>7.0f}KB {r['after']/1e3:>7.0f}KB "
+              f"{r['ratio']:>5.1f}x  {err:>9}  {r['status']}")
+        results.append(r)
+
+    done = [r for r in results if r["status"] == "compressed"]
+    before = sum(r["before"] for r in done)
+    after = sum(r["after"] for r in done)
+    print("  " + "-" * 86)
+    if done:
+        print(f"  {len(done)} file(s): {before/1e6:.2f} MB -> {after/1e6:.2f} MB "
+              f"({before / max(after, 1):.1f}x)")
+    if any(r["error"] is None for r in done):
+        print("  [warn] DracoPy not installed — round-trip check skipped (pip install DracoPy)")
+    bad = [r for r in results if r["status"] in ("rejected", "failed")]
+    if bad:
+        print(f"  [warn] {len(bad)} file(s) left uncompressed: "
+              f"{', '.join(r['file'] for r in bad)}")
+    return results
+
+
+def manifest_glbs(manifest):
+    """Every GLB a brain_regions_manifest references (each region's file and LODs)."""
+    paths = set()
+    for entry in manifest.values():
+        paths.add(entry["file"])
+        paths.update(lod["file"] for lod in entry.get("lods", []))
+    return sorted(Path(p) for p in paths if p.endswith(".glb") and Path(p).exists())
+
+
+def compress_manifest(manifest, max_error=MAX_REL_ERROR):
+    """Compress every exported region GLB (already-compressed ones are skipped)."""
+    return compress_all(manifest_glbs(manifest), max_error)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Draco-compress brain GLBs in place")
+    parser.add_argument("paths", nargs="*", help="GLB files (default: every GLB in data/brain_meshes)")
+    parser.add_argument("--max-error", type=float, default=MAX_REL_ERROR,
+                        help="Max round-trip vertex error relative to bbox diagonal")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report sizes and errors without replacing files")
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.paths] or sorted(MESH_DIR.glob("*.glb"))
+    if not paths:
+        print(f"No GLB files found in {MESH_DIR}")
+        sys.exit(1)
+
+    print("=" * 60)
+    print(f"compress_meshes.py — draco ({len(paths)} files)")
+    print("=" * 60)
+    results = compress_all(paths, args.max_error, args.dry_run)
+    if any(r["status"] == "rejected" for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
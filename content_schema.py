@@ -0,0 +1,973 @@
+"""
+content_schema.py
+
+One declarative schema registry for every content family, and a compiled
+validator that checks a whole data file in a single streaming pass.
+
+Each family's record shape lives here once (basic, vignette, presentation,
+spot per mode, table_fill, contrast, passage, brain).  The generators
+validate freshly-parsed model output against the same schema the bundle
+builders check before shipping, and the standalone command sweeps the tree:
+
+USAGE:
+  python content_schema.py validate                      # every data file + brain_data.js
+  python content_schema.py validate --family spot        # one family, all domains
+  python content_schema.py validate data/PMET_spot.json  # specific files
+  python content_schema.py validate --json               # machine-readable report
+  python content_schema.py validate --strict             # warnings fail too
+  python content_schema.py list                          # registered schemas
+
+Every violation is reported with the JSON path of the offending value, e.g.
+  data/PMET_tables.json  $.questions[12].options[3]  longer than 140 chars
+
+Violations are errors unless the rule is wrapped in Warn(): the pages cope
+with those (unknown avatar emotion -> idle, over-long table options are
+filtered out) but generators must not produce them.  Exit status is 1 when
+any file has errors, or any violation at all with --strict.
+
+Schemas are built from a few combinators (Str, Int, Bool, Any, List, Map,
+Record, Switch, Check, plus Warn/All).  compile_schema() turns one into a tree of closures
+once; paths are only formatted when a violation is actually recorded, so
+the clean case costs a handful of isinstance checks per field.
+"""
+
+import argparse, functools, json, re, sys
+from pathlib import Path
+from typing import NamedTuple
+
+from data_io import domain_path, iter_records
+
+DOMAINS = ["PMET", "LDEV", "CPAT", "PTHE", "SOCU", "WDEV", "BPSY", "CASS", "PETH"]
+
+OPTION_KEYS = ("A", "B", "C", "D")
+# table-exercise.html lays the four choices out in a 2x2 grid; longer text overflows
+MAX_TABLE_OPTION = 140
+
+AVATAR_EMOTIONS = [
+    "idle", "speaking", "flat_affect", "distressed",
+    "tearful", "anxious", "agitated", "guarded", "hopeful", "confused",
+]
+
+QUESTION_TYPES = [
+    "primary_diagnosis",
+    "differential_diagnosis",
+    "immediate_intervention",
+    "treatment_planning",
+    "risk_assessment",
+    "dsm_criteria",
+    "cultural_consideration",
+    "assessment_tool",
+]
+
+CHART_CATEGORIES = [
+    "Chief Complaint",
+    "History of Present Illness",
+    "Mental Status Examination",
+    "Psychosocial History",
+    "Collateral / Context",
+    "Labs / Observations",
+]
+
+DIFFICULTY_LABELS = {
+    1: "Easy",
+    2: "Medium",
+    3: "Hard",
+    4: "Extremely Hard",
+    5: "Almost Impossible",
+}
+
+
+# ─── Violations and paths ─────────────────────────────────────────────────────
+
+class Violation(NamedTuple):
+    path: str
+    message: str
+    level: str = "error"    # "warning": the pages cope, but new content should not do it
+
+    def __str__(self):
+        tag = " (warning)" if self.level == "warning" else ""
+        return f"{self.path}  {self.message}{tag}"
+
+
+def format_path(path) -> str:
+    """Render a lazily-built path chain ((parent, key) pairs) as $.a[0].b."""
+    parts = []
+    while isinstance(path, tuple):
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return str(path) + "".join(reversed(parts))
+
+
+def _child(path, key):
+    return (path, key)
+
+
+def _type_name(value) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+# ─── Schema combinators ───────────────────────────────────────────────────────
+# A compiled node is fn(value, path, ctx, out) -> bool (True when the value is
+# valid); violations are appended to out as Violation tuples.
+
+class Node:
+    def compile(self):
+        raise NotImplementedError
+
+
+class Any(Node):
+    def compile(self):
+        return lambda value, path, ctx, out: True
+
+
+class Warn(Node):
+    """Downgrade the wrapped node's violations to warnings.
+
+    For rules the pages tolerate (the avatar falls back to idle for an unknown
+    emotion; table-exercise.html drops over-long options) but generators must
+    still meet.  Never blocks the record's cross-field checks.
+    """
+
+    def __init__(self, node):
+        self.node = node
+
+    def compile(self):
+        inner = self.node.compile()
+
+        def check(value, path, ctx, out):
+            found = []
+            inner(value, path, ctx, found)
+            out.extend(v._replace(level="warning") for v in found)
+            return True
+        return check
+
+
+class All(Node):
+    """Every one of several nodes must accept the value."""
+
+    def __init__(self, *nodes):
+        self.nodes = nodes
+
+    def compile(self):
+        fns = [n.compile() for n in self.nodes]
+
+        def check(value, path, ctx, out):
+            ok = True
+            for fn in fns:
+                ok = fn(value, path, ctx, out) and ok
+            return ok
+        return check
+
+
+class Str(Node):
+    """A string.  pattern may reference {domain_code}; it is filled from ctx."""
+
+    def __init__(self, min_len=1, max_len=None, enum=None, pattern=None):
+        self.min_len, self.max_len = min_len, max_len
+        self.enum = frozenset(enum) if enum is not None else None
+        self.pattern = pattern
+
+    def compile(self):
+        min_len, max_len, enum, pattern = self.min_len, self.max_len, self.enum, self.pattern
+        regex = None
+        if pattern and "{domain_code}" not in pattern:
+            regex = re.compile(pattern)
+
+        @functools.lru_cache(maxsize=None)
+        def domain_regex(code):
+            return re.compile(pattern.replace("{domain_code}", re.escape(code) if code else "[A-Z]{4}"))
+
+        def check(value, path, ctx, out):
+            if not isinstance(value, str):
+                out.append(Violation(format_path(path), f"expected string, got {_type_name(value)}"))
+                return False
+            ok = True
+            if len(value.strip()) < min_len:
+                out.append(Violation(format_path(path), "empty string" if min_len == 1 else f"shorter than {min_len} chars"))
+                ok = False
+            if max_len is not None and len(value) > max_len:
+                out.append(Violation(format_path(path), f"longer than {max_len} chars ({len(value)})"))
+                ok = False
+            if enum is not None and value not in enum:
+                out.append(Violation(format_path(path), f"{value!r} not in allowed values"))
+                ok = False
+            if pattern:
+                rx = regex or domain_regex(ctx.get("domain_code"))
+                if not rx.match(value):
+                    out.append(Violation(format_path(path), f"{value!r} does not match {rx.pattern}"))
+                    ok = False
+            return ok
+        return check
+
+
+class Int(Node):
+    def __init__(self, lo=None, hi=None):
+        self.lo, self.hi = lo, hi
+
+    def compile(self):
+        lo, hi = self.lo, self.hi
+
+        def check(value, path, ctx, out):
+            # bool is an int subclass; True is never a valid index or level
+            if not isinstance(value, int) or isinstance(value, bool):
+                out.append(Violation(format_path(path), f"expected int, got {_type_name(value)}"))
+                return False
+            if (lo is not None and value < lo) or (hi is not None and value > hi):
+                out.append(Violation(format_path(path), f"{value} outside [{lo}, {hi}]"))
+                return False
+            return True
+        return check
+
+
+class Bool(Node):
+    def compile(self):
+        def check(value, path, ctx, out):
+            if not isinstance(value, bool):
+                out.append(Violation(format_path(path), f"expected bool, got {_type_name(value)}"))
+                return False
+            return True
+        return check
+
+
+class List(Node):
+    def __init__(self, item=None, min_len=0, max_len=None, distinct=False):
+        self.item, self.min_len, self.max_len, self.distinct = item, min_len, max_len, distinct
+
+    def compile(self):
+        item = self.item.compile() if self.item else None
+        min_len, max_len, distinct = self.min_len, self.max_len, self.distinct
+
+        def check(value, path, ctx, out):
+            if not isinstance(value, list):
+                out.append(Violation(format_path(path), f"expected list, got {_type_name(value)}"))
+                return False
+            ok = True
+            n = len(value)
+            if n < min_len or (max_len is not None and n > max_len):
+                want = f"exactly {min_len}" if min_len == max_len else \
+                       f"{min_len}–{max_len}" if max_len is not None else f"at least {min_len}"
+                out.append(Violation(format_path(path), f"{n} items, expected {want}"))
+                ok = False
+            if item:
+                for i, v in enumerate(value):
+                    ok = item(v, _child(path, i), ctx, out) and ok
+            if distinct:
+                seen = set()
+                for i, v in enumerate(value):
+                    key = json.dumps(v, sort_keys=True) if isinstance(v, (dict, list)) else v
+                    if key in seen:
+                        out.append(Violation(format_path(_child(path, i)), f"duplicate item {v!r}"))
+                        ok = False
+                    seen.add(key)
+            return ok
+        return check
+
+
+class Map(Node):
+    """A dict, optionally with an exact key set."""
+
+    def __init__(self, value=None, keys=None):
+        self.value, self.keys = value, tuple(keys) if keys else None
+
+    def compile(self):
+        item = self.value.compile() if self.value else None
+        keys = self.keys
+
+        def check(value, path, ctx, out):
+            if not isinstance(value, dict):
+                out.append(Violation(format_path(path), f"expected object, got {_type_name(value)}"))
+                return False
+            ok = True
+            if keys:
+                missing = [k for k in keys if k not in value]
+                extra = [k for k in value if k not in keys]
+                if missing or extra:
+                    detail = "; ".join(filter(None, [
+                        missing and f"missing {', '.join(missing)}",
+                        extra and f"unexpected {', '.join(map(str, extra))}"]))
+                    out.append(Violation(format_path(path), f"keys must be {'/'.join(keys)} ({detail})"))
+                    ok = False
+            if item:
+                for k, v in value.items():
+                    ok = item(v, _child(path, k), ctx, out) and ok
+            return ok
+        return check
+
+
+class Check:
+    """A cross-field rule on a record.
+
+    fn(record, ctx) returns True when the record is fine.  It only runs once
+    every field named in `on` is present and individually valid, so it can
+    index freely.  The violation is reported at `at` (a field name) when given.
+    """
+
+    def __init__(self, message, fn, on=(), at=None):
+        self.message, self.fn, self.on, self.at = message, fn, tuple(on), at
+
+
+class Record(Node):
+    def __init__(self, fields=None, optional=None, checks=()):
+        self.fields = dict(fields or {})
+        self.optional = dict(optional or {})
+        self.checks = list(checks)
+
+    def extend(self, fields=None, optional=None, checks=()):
+        """Return a new Record with extra fields/checks layered on this one."""
+        return Record({**self.fields, **(fields or {})},
+                      {**self.optional, **(optional or {})},
+                      self.checks + list(checks))
+
+    def subset(self, *names):
+        """Return a Record restricted to the named fields (and the checks that
+        only depend on them) — for validating partial generator output."""
+        names = set(names)
+        return Record({k: v for k, v in self.fields.items() if k in names},
+                      {k: v for k, v in self.optional.items() if k in names},
+                      [c for c in self.checks if set(c.on) <= names])
+
+    def compile(self):
+        fields = [(k, n.compile()) for k, n in self.fields.items()]
+        optional = [(k, n.compile()) for k, n in self.optional.items()]
+        checks = self.checks
+
+        def check(value, path, ctx, out):
+            if not isinstance(value, dict):
+                out.append(Violation(format_path(path), f"expected object, got {_type_name(value)}"))
+                return False
+            bad = set()
+            for k, fn in fields:
+                if k not in value:
+                    out.append(Violation(format_path(path), f"missing field {k!r}"))
+                    bad.add(k)
+                elif not fn(value[k], _child(path, k), ctx, out):
+                    bad.add(k)
+            for k, fn in optional:
+                if k in value and not fn(value[k], _child(path, k), ctx, out):
+                    bad.add(k)
+            for c in checks:
+                if any(k in bad or k not in value for k in c.on):
+                    continue
+                if not c.fn(value, ctx):
+                    at = _child(path, c.at) if c.at else path
+                    out.append(Violation(format_path(at), c.message))
+                    bad.add(c.at)
+            return not bad
+        return check
+
+
+class Switch(Node):
+    """Pick a schema by the value of a discriminator field (e.g. spot `mode`)."""
+
+    def __init__(self, key, cases, default=None):
+        self.key, self.cases, self.default = key, cases, default
+
+    def compile(self):
+        key = self.key
+        cases = {k: n.compile() for k, n in self.cases.items()}
+        default = self.default.compile() if self.default else None
+
+        def check(value, path, ctx, out):
+            tag = value.get(key) if isinstance(value, dict) else None
+            fn = cases.get(tag, default)
+            if fn is None:
+                out.append(Violation(format_path(_child(path, key)), f"unknown {key} {tag!r}"))
+                return False
+            return fn(value, path, ctx, out)
+        return check
+
+
+# ─── Shared pieces ────────────────────────────────────────────────────────────
+
+DOMAIN_CODE = Str(pattern=r"^{domain_code}$")
+
+
+def _options_abcd(value=Str()):
+    return Map(value, keys=OPTION_KEYS)
+
+
+def _index_in(list_field, index_field):
+    return Check(f"{index_field} out of range for {list_field}",
+                 lambda r, ctx: r[index_field] < len(r[list_field]),
+                 on=(list_field, index_field), at=index_field)
+
+
+# ─── Family schemas ───────────────────────────────────────────────────────────
+
+BASIC = Record(
+    {
+        "id":               Str(),
+        "domain_code":      DOMAIN_CODE,
+        "domain_name":      Str(),
+        "subdomain":        Str(),
+        "question":         Str(),
+        "options":          _options_abcd(),
+        "correct_answer":   Str(enum=OPTION_KEYS),
+        "explanation":      Str(),
+        "difficulty_level": Int(1, 5),
+    },
+    optional={
+        "angle":                  Str(),
+        "source_question_id":     Str(),
+        "bank_question_id":       Str(),
+        "source_exam":            Str(min_len=0),
+        "source_question_number": Any(),
+        "source_summary":         Str(min_len=0),
+        "legacy_domain_code":     Str(),
+        "legacy_domain_name":     Str(),
+    },
+)
+
+VIGNETTE = Record(
+    {
+        "id":               Str(pattern=r"^.+-vignette-L[1-5]$"),
+        "domain_code":      DOMAIN_CODE,
+        "domain_name":      Str(),
+        "subdomain":        Str(),
+        "difficulty_level": Int(1, 5),
+        "difficulty_label": Str(enum=DIFFICULTY_LABELS.values()),
+        "vignette":         Str(),
+        "question":         Str(),
+        "options":          _options_abcd(),
+        "correct_answer":   Str(enum=OPTION_KEYS),
+    },
+    optional={
+        "source_question_id":  Str(),
+        "bank_question_id":    Str(),
+        "source_summary":      Str(min_len=0),
+        "question_type":       Str(enum=["vignette"]),
+        "hint_words":          List(Str()),
+        "option_explanations": Map(Str()),
+        "legacy_domain_code":  Str(),
+        "legacy_domain_name":  Str(),
+        "review_flag":         Any(),
+    },
+    checks=[
+        Check("difficulty_label does not match difficulty_level",
+              lambda r, ctx: DIFFICULTY_LABELS[r["difficulty_level"]] == r["difficulty_label"],
+              on=("difficulty_level", "difficulty_label"), at="difficulty_label"),
+    ],
+)
+
+# Hand-written encounters (authored/presentations/) use free-form categories and
+# a couple of off-list emotions; the exercise renders them, generators may not.
+CHART_REVEAL = Record({"category": All(Str(), Warn(Str(enum=CHART_CATEGORIES)))})
+
+EMOTION = All(Str(), Warn(Str(enum=AVATAR_EMOTIONS)))
+
+PHASE = Record({
+    "phase_id":       Any(),
+    "phase_label":    Str(),
+    "dialogue":       Any(),
+    "avatar_emotion": EMOTION,
+    "chart_reveals":  List(CHART_REVEAL, min_len=1),
+})
+
+PRESENTATION_QUESTION = Record(
+    {
+        "question_id":    Any(),
+        "type":           Str(enum=QUESTION_TYPES),
+        "prompt":         Str(),
+        "options":        _options_abcd(),
+        "correct_answer": Str(enum=OPTION_KEYS),
+        "explanation":    Str(),
+    },
+    # hand-written encounters keep the correct key with a null rationale
+    optional={"distractor_rationale": Map(Any())},
+    checks=[
+        Check("distractor_rationale must not explain the correct answer",
+              lambda r, ctx: r["distractor_rationale"].get(r["correct_answer"]) is None,
+              on=("correct_answer", "distractor_rationale"), at="distractor_rationale"),
+        Check("distractor_rationale entries must be strings",
+              lambda r, ctx: all(isinstance(v, str) for k, v in r["distractor_rationale"].items()
+                                 if k != r["correct_answer"]),
+              on=("correct_answer", "distractor_rationale"), at="distractor_rationale"),
+    ],
+)
+
+PRESENTATION = Record(
+    {
+        "id":               Str(pattern=r"^CP-{domain_code}-\d{4}$"),
+        "domain_code":      DOMAIN_CODE,
+        "subdomain":        Str(),
+        "difficulty_level": Int(1, 4),
+        "encounter": Record(
+            {
+                "setting": Str(),
+                "patient": Record({"initial_avatar_state": EMOTION},
+                                  optional={"label": Str(), "appearance_tags": List()}),
+                "phases":  List(PHASE, min_len=3, max_len=5),
+            },
+            optional={"referral_context": Str(min_len=0)},
+            checks=[
+                Check("duplicate phase_id",
+                      lambda r, ctx: len({json.dumps(p["phase_id"]) for p in r["phases"]}) == len(r["phases"]),
+                      on=("phases",), at="phases"),
+            ],
+        ),
+        "questions": List(PRESENTATION_QUESTION, min_len=1, max_len=2),
+    },
+)
+
+SPOT_COMMON = Record(
+    {
+        "id":             Str(),
+        "domain_code":    DOMAIN_CODE,
+        "domain_name":    Str(),
+        "chapter_file":   Str(),
+        "chapter_title":  Str(),
+        "section":        Str(min_len=0),
+        "passage_type":   Str(),
+        "error_original": Str(),
+        "error_correct":  Str(),
+        "explanation":    Str(),
+    },
+    optional={
+        "mode":              Str(),
+        "source_passage_id": Str(),
+    },
+)
+
+SPOT_MC = SPOT_COMMON.extend(
+    {
+        "original_passage":     Str(),
+        "modified_passage":     Str(),
+        "options":              List(Str(), min_len=4, max_len=4),
+        "correct_option_index": Int(0, 3),
+    },
+)
+
+SPOT_PASSAGE_CLICK = SPOT_COMMON.extend(
+    {
+        "sentences":             List(Str(), min_len=4),
+        "target_sentence_index": Int(0),
+        "original_sentence":     Str(),
+    },
+    checks=[
+        _index_in("sentences", "target_sentence_index"),
+        Check("error_original not found in the target sentence",
+              lambda r, ctx: r["error_original"] in r["sentences"][r["target_sentence_index"]],
+              on=("error_original", "sentences", "target_sentence_index"), at="error_original"),
+    ],
+)
+
+SPOT_SENTENCE_CLICK = SPOT_COMMON.extend(
+    {
+        "modified_sentence":   Str(),
+        "phrases":             List(Str(), min_len=3),
+        "target_phrase_index": Int(1),
+    },
+    checks=[
+        _index_in("phrases", "target_phrase_index"),
+        Check("error_original not found in the target phrase",
+              lambda r, ctx: r["error_original"] in r["phrases"][r["target_phrase_index"]],
+              on=("error_original", "phrases", "target_phrase_index"), at="error_original"),
+    ],
+)
+
+VOCAB_ENTRY = Record({"term": Str(), "definition": Str(), "is_target": Bool()})
+
+SPOT_VOCAB = SPOT_COMMON.extend(
+    {
+        "entries":            List(VOCAB_ENTRY, min_len=4, max_len=4),
+        "target_entry_index": Int(0, 3),
+    },
+    optional={
+        # hand-corrected items keep the pre-correction values alongside
+        "entries_corrected":     Any(),
+        "target_entry_index_v2": Any(),
+        "error_original_v2":     Any(),
+        "error_correct_v2":      Any(),
+    },
+    checks=[
+        Check("target entry is not flagged is_target (or another entry is)",
+              lambda r, ctx: [e["is_target"] for e in r["entries"]].index(True) == r["target_entry_index"]
+                             if True in [e["is_target"] for e in r["entries"]] else False,
+              on=("entries", "target_entry_index"), at="target_entry_index"),
+        Check("error_original not found in the target definition",
+              lambda r, ctx: r["error_original"] in r["entries"][r["target_entry_index"]]["definition"],
+              on=("error_original", "entries", "target_entry_index"), at="error_original"),
+    ],
+)
+
+SPOT = Switch("mode", {
+    None:             SPOT_MC,
+    "mc":             SPOT_MC,
+    "passage_click":  SPOT_PASSAGE_CLICK,
+    "sentence_click": SPOT_SENTENCE_CLICK,
+    "vocab":          SPOT_VOCAB,
+})
+
+
+BLANK_CELL = "BLANK"   # shipped rows carry this placeholder in the blanked cell
+
+
+def _cell_ok(r):
+    row = r["rows"][r["blank_row"]]
+    if r["blank_col"] >= len(row):
+        return False
+    cell = row[r["blank_col"]].strip()
+    return cell == BLANK_CELL or cell.lower() == r["correct_value"].strip().lower()
+
+
+TABLE_FILL = Record(
+    {
+        "id":                   Str(pattern=r"^{domain_code}-TBL-\d+$"),
+        "mode":                 Str(enum=["table_fill"]),
+        "domain_code":          DOMAIN_CODE,
+        "domain_name":          Str(),
+        "chapter_file":         Str(),
+        "chapter_title":        Str(),
+        "section":              Str(min_len=0),
+        "headers":              List(Str(min_len=0), min_len=2),
+        "rows":                 List(List(Str(min_len=0)), min_len=1),
+        "blank_row":            Int(0),
+        "blank_col":            Int(0),
+        "correct_value":        Str(),
+        "options":              List(All(Str(), Warn(Str(max_len=MAX_TABLE_OPTION))),
+                                     min_len=4, max_len=4, distinct=True),
+        "correct_option_index": Int(0, 3),
+        "explanation":          Str(),
+    },
+    checks=[
+        _index_in("rows", "blank_row"),
+        _index_in("headers", "blank_col"),
+        Check(f"blanked cell is neither {BLANK_CELL!r} nor correct_value",
+              lambda r, ctx: _cell_ok(r),
+              on=("rows", "headers", "blank_row", "blank_col", "correct_value"), at="correct_value"),
+        Check("options[correct_option_index] != correct_value",
+              lambda r, ctx: r["options"][r["correct_option_index"]].strip() == r["correct_value"].strip(),
+              on=("options", "correct_option_index", "correct_value"), at="correct_option_index"),
+    ],
+)
+
+CONTRAST = Record(
+    {
+        "id":                        Str(),
+        "domain_code":               DOMAIN_CODE,
+        "domain_name":               Str(),
+        "subdomain":                 Str(min_len=0),
+        "item_x":                    Str(),
+        "item_y":                    Str(),
+        "question":                  Str(),
+        "answer":                    Str(),
+        # the exercise page splits key_distinction on ';' into two bullets
+        "key_distinction":           Str(pattern=r"^[^;]*;"),
+        "commonly_confused_because": Str(),
+    },
+    optional={
+        "legacy_domain_code": Str(),
+        "legacy_domain_name": Str(),
+    },
+)
+
+PASSAGE = Record({
+    "id":            Str(pattern=r"^{domain_code}-\d+$"),
+    "domain_code":   DOMAIN_CODE,
+    "domain_name":   Str(),
+    "chapter_file":  Str(),
+    "chapter_title": Str(),
+    "section":       Str(min_len=0),
+    "passage_type":  Str(),
+    "passage":       Str(),
+})
+
+BRAIN_COMMON = Record(
+    {
+        "id":          Str(pattern=r"^BRAIN-\d{3,}$"),
+        "type":        Str(),
+        "category":    Str(),
+        "question":    Str(),
+        "explanation": Str(),
+    },
+    optional={
+        "domain_source": Str(),
+        "difficulty":    Str(enum=["hard"]),
+    },
+)
+
+BRAIN_TO_LOCATION = BRAIN_COMMON.extend(
+    {
+        "target_region":      Str(),
+        "distractor_regions": List(Str(), min_len=1, distinct=True),
+    },
+    checks=[
+        Check("target_region listed among distractor_regions",
+              lambda r, ctx: r["target_region"] not in r["distractor_regions"],
+              on=("target_region", "distractor_regions"), at="distractor_regions"),
+    ],
+)
+
+BRAIN = Switch("type", {
+    "case_to_location":    BRAIN_TO_LOCATION,
+    "deficit_to_location": BRAIN_TO_LOCATION,
+    "location_to_deficit": BRAIN_COMMON.extend(
+        {
+            "highlighted_region":   Str(),
+            "options":              List(Str(), min_len=2, distinct=True),
+            "correct_option_index": Int(0),
+        },
+        checks=[_index_in("options", "correct_option_index")],
+    ),
+})
+
+SCHEMAS = {
+    "basic":        BASIC,
+    "vignette":     VIGNETTE,
+    "presentation": PRESENTATION,
+    "spot":         SPOT,
+    "table_fill":   TABLE_FILL,
+    "contrast":     CONTRAST,
+    "passage":      PASSAGE,
+    "brain":        BRAIN,
+}
+
+
+class Family(NamedTuple):
+    schema: str
+    key: str              # record array in the file
+    count_key: str        # header field holding the record count
+    unique_ids: bool      # basic/vignettes/tables still carry legacy duplicate IDs
+
+
+FAMILIES = {
+    "basic":         Family("basic",        "questions",  "total_questions",  False),
+    "vignettes":     Family("vignette",     "questions",  "total",            False),
+    "presentations": Family("presentation", "encounters", "total_encounters", True),
+    "spot":          Family("spot",         "questions",  "total_questions",  True),
+    "tables":        Family("table_fill",   "questions",  "total_questions",  False),
+    "contrast":      Family("contrast",     "questions",  "total",            True),
+    "passages":      Family("passage",      "passages",   "total_passages",   True),
+}
+
+BRAIN_DATA = Path("brain_data.js")
+
+
+# ─── Validation API ───────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=None)
+def compile_schema(name: str):
+    """Compiled validator for a registered schema name (cached)."""
+    return SCHEMAS[name].compile()
+
+
+def _compiled(schema):
+    if isinstance(schema, str):
+        return compile_schema(schema)
+    if "_fn" not in schema.__dict__:
+        schema._fn = schema.compile()
+    return schema._fn
+
+
+def validate_record(schema, record, ctx=None, path="$") -> list[Violation]:
+    """Validate one record.  schema is a registered name or a Node."""
+    fn = _compiled(schema)
+    out = []
+    fn(record, path, ctx or {}, out)
+    return out
+
+
+def record_errors(schema, record, ctx=None) -> list[str]:
+    """validate_record() flattened to 'path  message' strings, the shape the
+    generators' retry loops already log."""
+    return [str(v) for v in validate_record(schema, record, ctx)]
+
+
+class SchemaError(AssertionError):
+    """assert_valid() failure; .violations keeps the individual rule hits."""
+
+    def __init__(self, violations):
+        self.violations = violations
+        super().__init__("; ".join(map(str, violations)))
+
+
+def assert_valid(schema, record, ctx=None):
+    """Raise SchemaError (an AssertionError) listing every violation (for
+    generator retry loops)."""
+    violations = validate_record(schema, record, ctx)
+    if violations:
+        raise SchemaError(violations)
+
+
+_INDEX = re.compile(r"\[\d+\]")
+_LONG_QUOTED = re.compile(r"'[^']{25,}'|\"[^\"]{25,}\"")
+_NUMBER = re.compile(r"\d+")
+
+
+def rule_of(violation) -> str:
+    """The rule a violation (or its 'path  message' string) broke, with the
+    record-specific parts blanked: '$.options[*]  longer than N chars (N)'.
+    Short quoted names (fields, enum values) are kept.  Used to histogram
+    why generated output was rejected."""
+    path, sep, message = str(violation).partition("  ")
+    if not sep:                      # a bare message (e.g. an assert in a generator)
+        path, message = "", path
+    message = _NUMBER.sub("N", _LONG_QUOTED.sub("…", message.removesuffix(" (warning)")))
+    return f"{_INDEX.sub('[*]', path)}  {message}" if path else message
+
+
+def family_of(path: Path) -> str | None:
+    """'data/PMET_spot.json' -> 'spot'."""
+    stem = Path(path).stem
+    code, _, family = stem.partition("_")
+    return family if code in DOMAINS and family in FAMILIES else None
+
+
+def validate_file(path, family: str | None = None) -> list[Violation]:
+    """Stream one {DOMAIN}_{family}.json file and return all its violations."""
+    path = Path(path)
+    family = family or family_of(path)
+    if family is None:
+        return [Violation("$", f"cannot tell the content family of {path.name}")]
+    fam = FAMILIES[family]
+    check = compile_schema(fam.schema)
+    domain = path.stem.split("_")[0]
+    ctx = {"domain_code": domain if domain in DOMAINS else None}
+
+    out, seen, n = [], {}, 0
+    header = {}
+    root = ("$", fam.key)
+    try:
+        for n, rec in enumerate(iter_records(path, fam.key, header), 1):
+            check(rec, (root, n - 1), ctx, out)
+            rid = rec.get("id") if isinstance(rec, dict) else None
+            if fam.unique_ids and isinstance(rid, str):
+                if rid in seen:
+                    out.append(Violation(format_path(((root, n - 1), "id")),
+                                         f"duplicate id {rid!r} (first at [{seen[rid]}])"))
+                else:
+                    seen[rid] = n - 1
+    except (ValueError, KeyError) as e:
+        out.append(Violation("$", f"unreadable: {e}"))
+        return out
+
+    if header.get("domain_code") != ctx["domain_code"]:
+        out.append(Violation("$.domain_code",
+                             f"{header.get('domain_code')!r} does not match file name {path.name}"))
+    if fam.count_key not in header:
+        out.append(Violation("$", f"missing field {fam.count_key!r}"))
+    elif header[fam.count_key] != n:
+        out.append(Violation(f"$.{fam.count_key}",
+                             f"says {header[fam.count_key]} but file holds {n} records"))
+    return out
+
+
+def validate_brain(path=BRAIN_DATA) -> list[Violation]:
+    from question_store import read_brain_questions
+    check = compile_schema("brain")
+    out, seen = [], {}
+    for i, q in enumerate(read_brain_questions(path)):
+        check(q, ("$", i), {}, out)
+        rid = q.get("id")
+        if rid in seen:
+            out.append(Violation(f"$[{i}].id", f"duplicate id {rid!r} (first at [{seen[rid]}])"))
+        seen.setdefault(rid, i)
+    return out
+
+
+def default_targets(families=None) -> list[Path]:
+    families = families or list(FAMILIES) + ["brain"]
+    paths = [domain_path(code, fam) for fam in families if fam in FAMILIES for code in DOMAINS]
+    paths = [p for p in paths if p.exists()]
+    if "brain" in families and BRAIN_DATA.exists():
+        paths.append(BRAIN_DATA)
+    return paths
+
+
+def validate_path(path) -> list[Violation]:
+    path = Path(path)
+    if path.name == BRAIN_DATA.name:
+        return validate_brain(path)
+    return validate_file(path)
+
+
+def errors_only(violations) -> list[Violation]:
+    return [v for v in violations if v.level == "error"]
+
+
+def validate_or_exit(paths):
+    """Bundle-builder guard: print every error and exit 1 if there are any.
+    Warnings are counted but do not block a bundle."""
+    errors = warnings = 0
+    for p in paths:
+        for v in validate_path(p):
+            if v.level == "error":
+                print(f"  {p}  {v}")
+                errors += 1
+            else:
+                warnings += 1
+    if errors:
+        print(f"\nERROR: {errors} schema error(s) — fix the data (python content_schema.py validate).")
+        sys.exit(1)
+    if warnings:
+        print(f"  schema: {warnings} warning(s) (python content_schema.py validate)")
+
+
+# ─── CLI ──────────────────────────────────────────────────────────────────────
+
+def cmd_validate(args) -> int:
+    if args.files:
+        paths = [Path(f) for f in args.files]
+    else:
+        paths = default_targets(args.family)
+    report, errors, warnings = {}, 0, 0
+    for p in paths:
+        vs = validate_path(p)
+        if not args.strict and args.quiet:
+            vs = errors_only(vs)
+        report[str(p)] = [v._asdict() for v in vs]
+        n_err = len(errors_only(vs))
+        errors += n_err
+        warnings += len(vs) - n_err
+        if args.json:
+            continue
+        if vs:
+            print(f"{p}: {n_err} error(s), {len(vs) - n_err} warning(s)")
+            for v in vs[:args.limit] if args.limit else vs:
+                print(f"  {v}")
+            if args.limit and len(vs) > args.limit:
+                print(f"  ... {len(vs) - args.limit} more")
+        elif args.verbose:
+            print(f"{p}: ok")
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(f"\n{len(paths)} file(s) checked, {errors} error(s), {warnings} warning(s)")
+    return 1 if errors or (args.strict and warnings) else 0
+
+
+def cmd_list(args) -> int:
+    for fam, f in FAMILIES.items():
+        print(f"  {fam:<14} schema={f.schema:<13} records=${'.' + f.key:<12} count={f.count_key}"
+              f"{'  unique ids' if f.unique_ids else ''}")
+    print(f"  {'brain':<14} schema={'brain':<13} source={BRAIN_DATA}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate content files against the schema registry")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("validate", help="Check data files (default: everything)")
+    p.add_argument("files", nargs="*", help="Specific files (default: all data/*.json + brain_data.js)")
+    p.add_argument("--family", action="append", choices=list(FAMILIES) + ["brain"],
+                   help="Restrict to one family (repeatable)")
+    p.add_argument("--limit", type=int, default=20, help="Violations shown per file (0 = all)")
+    p.add_argument("--json", action="store_true", help="Emit a JSON report instead of text")
+    p.add_argument("--strict", action="store_true", help="Fail on warnings too (the bar for new content)")
+    p.add_argument("-q", "--quiet", action="store_true", help="Hide warnings")
+    p.add_argument("-v", "--verbose", action="store_true", help="Also list clean files")
+    p.set_defaults(fn=cmd_validate)
+
+    p = sub.add_parser("list", help="Show registered families and schemas")
+    p.set_defaults(fn=cmd_list)
+
+    args = parser.parse_args()
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    sys.exit(args.fn(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -13,13 +13,14 @@ After:  hires_brainstem.glb (~80KB) + hires_cerebellum.glb (~120KB)
         Total: ~200KB  (96% reduction)
 """
 
-import json
 import numpy as np
 from pathlib import Path
 from PIL import Image
 import trimesh
 import trimesh.visual
 
+from data_io import load_json
+
 OUTPUT_DIR = Path("data/brain_meshes")
 
 print("=" * 60)
@@ -31,8 +32,7 @@ def convert_atlas_mesh(region_id, json_path, texture_path, output_path):
     """Load JSON mesh + PNG texture, export as single GLB with embedded texture."""
     print(f"\n  [{region_id}] Loading JSON mesh: {json_path.name} ({json_path.stat().st_size / 1e6:.1f} MB)")
 
-    with open(json_path) as f:
-        data = json.load(f)
+    data = load_json(json_path)
 
     positions = np.array(data['positions'], dtype=np.float32).reshape(-1, 3)
     normals = np.array(data['normals'], dtype=np.float32).reshape(-1, 3)
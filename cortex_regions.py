@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+cortex_regions.py — Per-face region IDs for the cortex GLBs (O(1) picking)
+
+brain-3d-v3.js used to resolve a click on the cortex by scanning every
+region centroid for the nearest one — linear in the number of regions and
+wrong near region borders.  This module bakes the exact Harvard-Oxford
+parcellation generate_parcellated_brain.py already computes per fsaverage7
+vertex into one byte per cortex face, in the face order of each shipped
+GLB, so picking is `regions[ids[hit.faceIndex]]`.
+
+Face order is not stable across the pipeline (optimize_cortex.py decimates,
+Draco's edgebreaker reorders), so each GLB is read back — Draco primitives
+via DracoPy, the same decoder DRACOLoader runs — and every vertex takes the
+region of its nearest fsaverage7 vertex in mesh space.  A face takes the
+majority region of its three vertices (the first vertex on a three-way tie).
+
+HO labels shared by several regions (e.g. IFG → frontal_lobe and
+brocas_area) resolve through LABEL_PRECEDENCE, an explicit per-label
+ranking chosen so every region — the lobes included — keeps a pickable
+share of the surface; Broca's and Wernicke's only exist in the left
+hemisphere, so there the next region in the ranking takes the label.
+bake() warns about any manifest region left with less than MIN_FACE_SHARE
+of a GLB's faces.
+
+Outputs (data/brain_meshes/):
+  {glb stem}.regions.bin   uint8 per face (uint16 past 255 regions), 0 = unlabelled
+  cortex_regions.json      {"regions": [null, "frontal_lobe", ...],
+                            "files": {"full_brain_draco.glb":
+                                        {"bin", "dtype", "faces": [per mesh]}}}
+
+The viewer checks each mesh's face count against "faces" and falls back to
+the centroid search when they disagree (a GLB re-exported without re-baking).
+
+USAGE:
+  pip install nibabel nilearn numpy scipy DracoPy
+  python cortex_regions.py                   # every cortex GLB present
+  python cortex_regions.py data/brain_meshes/full_brain_draco.glb
+
+Re-run after generate_hires_brain.py, optimize_cortex.py or
+compress_meshes.py touch a cortex GLB (generate_parcellated_brain.py runs
+it as its last step).
+"""
+
+import json
+import os
+import sys
+import time
+import numpy as np
+from pathlib import Path
+
+from data_io import load_json, write_atomic
+from glb_io import read_glb, read_accessor
+
+MESH_DIR = Path("data/brain_meshes")
+INDEX_JSON = MESH_DIR / "cortex_regions.json"
+TRANSFORM_JSON = MESH_DIR / "cortex_transform.json"
+MANIFEST_JSON = MESH_DIR.parent / "brain_regions_manifest.json"
+
+# A pickable region should own at least this fraction of a cortex GLB's faces
+MIN_FACE_SHARE = 0.005
+
+# Cortex GLBs brain-3d-v3.js may load, in its fallback order
+CORTEX_GLBS = ["full_brain_draco.glb", "full_brain_optimized.glb",
+               "full_brain_hires_draco.glb", "full_brain_hires.glb"]
+
+# Harvard-Oxford cortical label indices → our EPPP region IDs
+# Each key is our region ID; each value is a list of HO cortical label indices
+HO_TO_REGION = {
+    "frontal_lobe": [
+        1,   # Frontal Pole
+        3,   # Superior Frontal Gyrus
+        4,   # Middle Frontal Gyrus
+        5,   # IFG pars triangularis
+        6,   # IFG pars opercularis
+        7,   # Precentral Gyrus
+        25,  # Frontal Medial Cortex
+        26,  # Juxtapositional Lobule (SMA)
+        33,  # Frontal Orbital Cortex
+        41,  # Frontal Opercular Cortex
+    ],
+    "prefrontal_cortex": [
+        1,   # Frontal Pole
+        3,   # Superior Frontal Gyrus
+        4,   # Middle Frontal Gyrus
+        33,  # Frontal Orbital Cortex
+    ],
+    "brocas_area": [
+        5,   # IFG pars triangularis
+        6,   # IFG pars opercularis
+    ],
+    "motor_cortex": [
+        7,   # Precentral Gyrus
+        26,  # Juxtapositional Lobule (SMA)
+    ],
+    "somatosensory_cortex": [
+        17,  # Postcentral Gyrus
+    ],
+    "parietal_lobe": [
+        17,  # Postcentral Gyrus
+        18,  # Superior Parietal Lobule
+        19,  # Supramarginal Gyrus ant
+        20,  # Supramarginal Gyrus post
+        21,  # Angular Gyrus
+        31,  # Precuneous Cortex
+    ],
+    "temporal_lobe": [
+        8,   # Temporal Pole
+        9,   # STG anterior
+        10,  # STG posterior
+        11,  # MTG anterior
+        12,  # MTG posterior
+        13,  # MTG temporooccipital
+        14,  # ITG anterior
+        15,  # ITG posterior
+        16,  # ITG temporooccipital
+        34,  # Parahippocampal ant
+        35,  # Parahippocampal post
+        37,  # Temporal Fusiform ant
+        38,  # Temporal Fusiform post
+        44,  # Planum Polare
+        45,  # Heschl's Gyrus
+        46,  # Planum Temporale
+    ],
+    "wernickes_area": [
+        10,  # STG posterior
+        46,  # Planum Temporale
+    ],
+    "occipital_lobe": [
+        22,  # Lateral Occipital sup
+        23,  # Lateral Occipital inf
+        24,  # Intracalcarine Cortex
+        32,  # Cuneal Cortex
+        36,  # Lingual Gyrus
+        39,  # Temporal Occipital Fusiform
+        40,  # Occipital Fusiform
+        47,  # Supracalcarine Cortex
+        48,  # Occipital Pole
+    ],
+    "cingulate_gyrus": [
+        28,  # Paracingulate Gyrus
+        29,  # Cingulate ant
+        30,  # Cingulate post
+        27,  # Subcallosal Cortex
+    ],
+    "medial_frontal": [
+        25,  # Frontal Medial Cortex
+        1,   # Frontal Pole
+    ],
+    "insula": [
+        2,   # Insular Cortex
+        42,  # Central Opercular Cortex
+    ],
+}
+
+# Broca's and Wernicke's: left-hemisphere only
+LH_ONLY_REGIONS = {"brocas_area", "wernickes_area"}
+
+# HO labels listed under several regions → the region that owns the face,
+# best first (the first one present in the hemisphere wins).  The specific
+# areas keep their defining gyri; the lobes keep the rest of their surface.
+LABEL_PRECEDENCE = {
+    1:  ["prefrontal_cortex", "medial_frontal", "frontal_lobe"],   # Frontal Pole
+    3:  ["frontal_lobe", "prefrontal_cortex"],                     # Superior Frontal Gyrus
+    4:  ["prefrontal_cortex", "frontal_lobe"],                     # Middle Frontal Gyrus
+    5:  ["brocas_area", "frontal_lobe"],                           # IFG pars triangularis
+    6:  ["brocas_area", "frontal_lobe"],                           # IFG pars opercularis
+    7:  ["motor_cortex", "frontal_lobe"],                          # Precentral Gyrus
+    17: ["somatosensory_cortex", "parietal_lobe"],                 # Postcentral Gyrus
+    25: ["medial_frontal", "frontal_lobe"],                        # Frontal Medial Cortex
+    26: ["frontal_lobe", "motor_cortex"],                          # Juxtapositional Lobule (SMA)
+    33: ["prefrontal_cortex", "frontal_lobe"],                     # Frontal Orbital Cortex
+    10: ["wernickes_area", "temporal_lobe"],                       # STG posterior
+    46: ["wernickes_area", "temporal_lobe"],                       # Planum Temporale
+}
+
+# Index 0 is "no region"
+REGION_IDS = [None] + list(HO_TO_REGION)
+
+
+# ── Label → region tables ────────────────────────────────────────────────────
+
+def region_lookup(hemi):
+    """
+    Array mapping HO cortical label → index into REGION_IDS for one hemisphere.
+    Raises ValueError for a label shared by several regions without a
+    LABEL_PRECEDENCE entry ranking all of them.
+    """
+    n_labels = max(i for idx in HO_TO_REGION.values() for i in idx) + 1
+    lut = np.zeros(n_labels, dtype=np.uint16)
+    for label in range(n_labels):
+        owners = [r for r, idx in HO_TO_REGION.items() if label in idx]
+        if len(owners) > 1:
+            ranked = LABEL_PRECEDENCE.get(label, [])
+            if set(ranked) != set(owners):
+                raise ValueError(f"HO label {label} is shared by {', '.join(owners)} — "
+                                 f"rank all of them in LABEL_PRECEDENCE")
+            owners = ranked
+        owners = [r for r in owners if not (hemi == "rh" and r in LH_ONLY_REGIONS)]
+        if owners:
+            lut[label] = REGION_IDS.index(owners[0])
+    return lut
+
+
+def vertex_regions(lh_labels, rh_labels):
+    """Per-vertex region index for lh + rh (the full_brain_hires.glb vertex order)."""
+    out = []
+    for hemi, labels in (("lh", lh_labels), ("rh", rh_labels)):
+        lut = region_lookup(hemi)
+        labels = np.asarray(labels, dtype=np.int64)
+        valid = (labels > 0) & (labels < len(lut))
+        ids = np.zeros(len(labels), dtype=np.uint16)
+        ids[valid] = lut[labels[valid]]
+        out.append(ids)
+    return np.concatenate(out)
+
+
+def face_regions(src_verts, src_regions, verts, faces):
+    """
+    Region per face of (verts, faces): each vertex takes its nearest source
+    vertex's region, each face the majority of its three.
+    """
+    from scipy.spatial import cKDTree
+    _, nearest = cKDTree(src_verts).query(verts, k=1)
+    per_vertex = np.asarray(src_regions)[nearest]
+    a, b, c = (per_vertex[faces[:, k]] for k in range(3))
+    return np.where((b == c) & (a != b), b, a)
+
+
+# ── GLB access ───────────────────────────────────────────────────────────────
+
+def read_cortex_meshes(path):
+    """
+    [(verts, faces)] per triangle primitive, in GLTFLoader traversal order,
+    decoding Draco primitives when present.
+    """
+    gltf, binary = read_glb(path)
+    out = []
+    for mesh in gltf.get("meshes", []):
+        for prim in mesh.get("primitives", []):
+            if prim.get("mode", 4) != 4:
+                continue
+            draco = prim.get("extensions", {}).get("KHR_draco_mesh_compression")
+            if draco is not None:
+                import DracoPy
+                bv = gltf["bufferViews"][draco["bufferView"]]
+                start = bv.get("byteOffset", 0)
+                decoded = DracoPy.decode(binary[start:start + bv["byteLength"]])
+                v = np.asarray(decoded.points, dtype=np.float32).reshape(-1, 3)
+                f = np.asarray(decoded.faces, dtype=np.int64).reshape(-1, 3)
+            else:
+                v = read_accessor(gltf, binary, prim["attributes"]["POSITION"]).astype(np.float32)
+                if "indices" in prim:
+                    f = read_accessor(gltf, binary, prim["indices"]).astype(np.int64).reshape(-1, 3)
+                else:
+                    f = np.arange(len(v), dtype=np.int64).reshape(-1, 3)
+            out.append((v, f))
+    return out
+
+
+def bake(src_verts, src_regions, glb_paths=None):
+    """
+    Write {stem}.regions.bin for each cortex GLB and update cortex_regions.json.
+    src_verts are in mesh space (the GLB's coordinates).  Returns the index.
+    """
+    if glb_paths is None:
+        glb_paths = [MESH_DIR / name for name in CORTEX_GLBS if (MESH_DIR / name).exists()]
+    dtype = np.uint8 if len(REGION_IDS) <= 256 else np.uint16
+
+    index = {"regions": REGION_IDS, "files": {}}
+    if INDEX_JSON.exists():
+        index["files"] = load_json(INDEX_JSON).get("files", {})
+    expected = manifest_regions()
+
+    for path in map(Path, glb_paths):
+        t0 = time.perf_counter()
+        meshes = read_cortex_meshes(path)
+        ids = [face_regions(src_verts, src_regions, v, f).astype(dtype) for v, f in meshes]
+        out_bin = path.with_name(path.stem + ".regions.bin")
+        tmp = out_bin.with_name(out_bin.name + ".tmp")
+        tmp.write_bytes(b"".join(a.tobytes() for a in ids))
+        os.replace(tmp, out_bin)
+        index["files"][path.name] = {
+            "bin": out_bin.name,
+            "dtype": np.dtype(dtype).name,
+            "faces": [len(a) for a in ids],
+        }
+        total = sum(len(a) for a in ids)
+        labelled = sum(int(np.count_nonzero(a)) for a in ids)
+        print(f"  {path.name}: {total:,} faces, {labelled / max(total, 1):.1%} labelled "
+              f"→ {out_bin.name} ({time.perf_counter() - t0:.1f}s)")
+        counts = np.bincount(np.concatenate(ids), minlength=len(REGION_IDS))
+        sparse = [f"{r} {counts[REGION_IDS.index(r)] / max(total, 1):.2%}" for r in expected
+                  if counts[REGION_IDS.index(r)] < MIN_FACE_SHARE * total]
+        if sparse:
+            print(f"  [warn] {path.name}: regions under {MIN_FACE_SHARE:.1%} of faces "
+                  f"(hard to pick): {', '.join(sparse)}")
+
+    write_atomic(INDEX_JSON, json.dumps(index, indent=2))
+    return index
+
+
+def manifest_regions():
+    """Cortical regions in the brain manifest that the face buffers can name."""
+    if not MANIFEST_JSON.exists():
+        return REGION_IDS[1:]
+    manifest = load_json(MANIFEST_JSON)
+    return [r for r in REGION_IDS[1:] if manifest.get(r, {}).get("type") == "cortical"]
+
+
+def main():
+    import argparse
+    import nibabel as nib
+    from nilearn import datasets
+    from vertex_labels import LabelCache, load_ho_atlas
+
+    parser = argparse.ArgumentParser(description="Bake per-face region IDs for the cortex GLBs")
+    parser.add_argument("glbs", nargs="*", help=f"Cortex GLBs (default: {', '.join(CORTEX_GLBS)})")
+    args = parser.parse_args()
+
+    surf = datasets.fetch_surf_fsaverage("fsaverage7")
+    cache = LabelCache()
+    loader = {"ho_cort": load_ho_atlas("cort-maxprob-thr25-1mm")}
+    verts, labels = [], []
+    for hemi, pial in (("lh", surf.pial_left), ("rh", surf.pial_right)):
+        v = nib.load(pial).darrays[0].data.astype(np.float32)
+        verts.append(v)
+        labels.append(cache.labels(f"fsaverage7_{hemi}", v, loader)["ho_cort"])
+
+    t = load_json(TRANSFORM_JSON)
+    src_verts = (np.vstack(verts) - np.array(t["centre"], dtype=np.float32)) * float(t["scale"])
+    bake(src_verts, vertex_regions(*labels), args.glbs or None)
+
+
+if __name__ == "__main__":
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
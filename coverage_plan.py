@@ -0,0 +1,287 @@
+"""
+coverage_plan.py
+
+Coverage matrix over the content already in data/, and a planner that feeds
+the generators their work thinnest-cell-first instead of by fixed rotation.
+
+Cells per family:
+  presentations  (subdomain, difficulty_level), plus avatar emotions and
+                 question types as separate axes
+  vignettes      (subdomain, difficulty_level)
+  spot           (mode, chapter_file), with chapters taken from the passages
+  tables         (chapter_file, section)
+  contrast       (subdomain,)
+
+Generators use the library API on the records they already hold:
+
+    plan = presentation_coverage(encounters, subdomains=DOMAIN_SUBDOMAINS[code])
+    cells = plan["cells"].take(2, distinct=lambda c: c[0])   # two thinnest subdomains
+    emotions = plan["emotions"].take(2)
+
+    todo = order_by_coverage(passages, lambda p: p["chapter_file"],
+                             spot_coverage(questions, mode))
+
+take() counts the picked cells as planned work straight away, so consecutive
+batches spread over the gaps instead of all landing on the same one.
+
+USAGE:
+  python coverage_plan.py                               # matrix summary per family/domain
+  python coverage_plan.py --family presentations --domain CPAT
+  python coverage_plan.py --queue --limit 40            # prioritized work queue, all families
+  python coverage_plan.py --queue --json > plan.json
+"""
+
+import argparse, heapq, json, random, sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from content_schema import AVATAR_EMOTIONS, FAMILIES, QUESTION_TYPES
+from data_io import domain_path, iter_records
+
+DOMAINS = ["PMET", "LDEV", "CPAT", "PTHE", "SOCU", "WDEV", "BPSY", "CASS", "PETH"]
+PRESENTATION_LEVELS = (1, 2, 3, 4)
+VIGNETTE_LEVELS = (1, 2, 3, 4, 5)
+SPOT_MODES = ("mc", "passage_click", "sentence_click", "vocab")
+
+
+class Coverage:
+    """Counts per cell with thinnest-first picking.
+
+    Ties are broken by a per-cell random key fixed at construction, so equal
+    gaps are visited in a shuffled but stable order.
+    """
+
+    def __init__(self, cells=(), counts=None, seed=None):
+        self.counts = Counter({c: 0 for c in cells})
+        if counts:
+            self.counts.update(counts)
+        rng = random.Random(seed)
+        self._tie = defaultdict(rng.random)
+
+    def add(self, cell, n: int = 1):
+        self.counts[cell] += n
+
+    def _rank(self, cell):
+        return (self.counts[cell], self._tie[cell])
+
+    def gaps(self, where=None) -> list[tuple]:
+        """(cell, count) pairs, thinnest first."""
+        cells = [c for c in self.counts if where is None or where(c)]
+        return [(c, self.counts[c]) for c in sorted(cells, key=self._rank)]
+
+    def peek(self, k: int = 1, where=None, distinct=None) -> list:
+        """The k thinnest cells; with distinct=fn, no two share fn(cell)."""
+        picked, seen = [], set()
+        for c, _ in self.gaps(where):
+            if distinct is not None:
+                if distinct(c) in seen:
+                    continue
+                seen.add(distinct(c))
+            picked.append(c)
+            if len(picked) == k:
+                break
+        return picked
+
+    def take(self, k: int = 1, where=None, distinct=None) -> list:
+        """The k thinnest cells, counted as planned work."""
+        picked = self.peek(k, where, distinct)
+        for c in picked:
+            self.add(c)
+        return picked
+
+
+def order_by_coverage(items, key, coverage: Coverage) -> list:
+    """Reorder items so each next one comes from the thinnest cell that still
+    has candidates (round-robin across equal cells, random within a cell).
+    The coverage is updated as items are placed."""
+    by_cell = defaultdict(list)
+    for item in items:
+        by_cell[key(item)].append(item)
+    rng = random.Random()
+    for bucket in by_cell.values():
+        rng.shuffle(bucket)
+
+    heap = [(*coverage._rank(c), i, c) for i, c in enumerate(by_cell)]
+    heapq.heapify(heap)
+    out = []
+    while heap:
+        _, _, i, cell = heapq.heappop(heap)
+        out.append(by_cell[cell].pop())
+        coverage.add(cell)
+        if by_cell[cell]:
+            heapq.heappush(heap, (*coverage._rank(cell), i, cell))
+    return out
+
+
+def _credit(subdomain: str, universe) -> list[str]:
+    """Configured subdomains an observed label counts toward.  The model
+    sometimes merges two ('Personality Assessment / Behavioral Assessment')."""
+    if not universe or subdomain in universe:
+        return [subdomain]
+    hits = [s for s in universe if s in subdomain]
+    return hits or [subdomain]
+
+
+# ─── Per-family matrices (built from records the caller already has) ─────────
+
+def presentation_coverage(encounters, subdomains=None, levels=PRESENTATION_LEVELS) -> dict:
+    """{'cells': (subdomain, level), 'emotions': emotion, 'qtypes': question type}.
+
+    Only configured subdomains/levels are planned; off-list ones are counted
+    for reporting but never picked."""
+    cells = Coverage([(s, d) for s in subdomains or () for d in levels])
+    emotions = Coverage(AVATAR_EMOTIONS)
+    qtypes = Coverage(QUESTION_TYPES)
+    for enc in encounters:
+        for s in _credit(enc.get("subdomain", ""), subdomains):
+            cells.add((s, enc.get("difficulty_level")))
+        body = enc.get("encounter", {})
+        emotions.add(body.get("patient", {}).get("initial_avatar_state"))
+        for phase in body.get("phases", []):
+            emotions.add(phase.get("avatar_emotion"))
+        for q in enc.get("questions", []):
+            qtypes.add(q.get("type"))
+    if subdomains:
+        planned = {(s, d) for s in subdomains for d in levels}
+        cells.counts = Counter({c: n for c, n in cells.counts.items() if c in planned})
+    for cov, allowed in ((emotions, AVATAR_EMOTIONS), (qtypes, QUESTION_TYPES)):
+        cov.counts = Counter({c: n for c, n in cov.counts.items() if c in allowed})
+    return {"cells": cells, "emotions": emotions, "qtypes": qtypes}
+
+
+def spot_coverage(questions, mode: str, chapters=()) -> Coverage:
+    """Questions of one spot mode per chapter_file."""
+    cov = Coverage(chapters)
+    for q in questions:
+        if q.get("mode", "mc") == mode:
+            cov.add(q.get("chapter_file"))
+    return cov
+
+
+def table_coverage(questions, tables=()) -> Coverage:
+    """Table-fill questions per (chapter_file, section) source table."""
+    cov = Coverage((t["chapter_file"], t.get("section", "")) for t in tables)
+    for q in questions:
+        cov.add((q.get("chapter_file"), q.get("section", "")))
+    return cov
+
+
+def vignette_coverage(questions, levels=VIGNETTE_LEVELS) -> Coverage:
+    cov = Coverage()
+    for q in questions:
+        cov.add((q.get("subdomain"), q.get("difficulty_level")))
+    for s in {s for s, _ in list(cov.counts)}:
+        for d in levels:
+            cov.counts.setdefault((s, d), 0)
+    return cov
+
+
+def contrast_coverage(questions) -> Coverage:
+    cov = Coverage()
+    for q in questions:
+        cov.add((q.get("subdomain"),))
+    return cov
+
+
+# ─── Whole-tree matrix and work queue (CLI) ───────────────────────────────────
+
+def _records(domain, family):
+    path = domain_path(domain, family)
+    return iter_records(path, FAMILIES[family].key) if path.exists() else iter(())
+
+
+def domain_matrix(domain: str, family: str) -> dict[str, Coverage]:
+    """Axis name -> Coverage for one family in one domain, from data/."""
+    if family == "presentations":
+        enc = list(_records(domain, family))
+        observed = sorted({e.get("subdomain", "") for e in enc})
+        return presentation_coverage(enc, subdomains=observed)
+    if family == "spot":
+        chapters = sorted({p.get("chapter_file") for p in _records(domain, "passages")})
+        questions = list(_records(domain, family))
+        return {mode: spot_coverage(questions, mode, chapters) for mode in SPOT_MODES}
+    if family == "tables":
+        return {"cells": table_coverage(_records(domain, family))}
+    if family == "vignettes":
+        return {"cells": vignette_coverage(_records(domain, family))}
+    if family == "contrast":
+        return {"cells": contrast_coverage(_records(domain, family))}
+    raise ValueError(f"no coverage model for {family!r}")
+
+
+PLANNED_FAMILIES = ["presentations", "vignettes", "spot", "tables", "contrast"]
+
+
+def work_queue(families=None, domains=None) -> list[dict]:
+    """Every under-filled cell as a work item, thinnest (relative to its
+    fullest sibling on the same axis) first."""
+    items = []
+    for family in families or PLANNED_FAMILIES:
+        for domain in domains or DOMAINS:
+            for axis, cov in domain_matrix(domain, family).items():
+                if not cov.counts:
+                    continue
+                target = max(cov.counts.values())
+                for cell, have in cov.gaps():
+                    if have < target:
+                        items.append({
+                            "family": family, "domain": domain, "axis": axis,
+                            "cell": list(cell) if isinstance(cell, tuple) else cell,
+                            "have": have, "target": target, "need": target - have,
+                        })
+    items.sort(key=lambda w: (w["have"] / w["target"], -w["need"]))
+    return items
+
+
+def _label(cell) -> str:
+    return " / ".join(map(str, cell)) if isinstance(cell, (tuple, list)) else str(cell)
+
+
+def print_matrix(family, domain):
+    for axis, cov in domain_matrix(domain, family).items():
+        gaps = cov.gaps()
+        if not gaps:
+            continue
+        counts = [n for _, n in gaps]
+        print(f"  {domain} {family} [{axis}]  {len(gaps)} cells, "
+              f"min {counts[0]}  max {counts[-1]}  empty {counts.count(0)}")
+        for cell, n in gaps[:5]:
+            print(f"      {n:>4}  {_label(cell)[:70]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Content coverage matrix and generation work queue")
+    parser.add_argument("--family", action="append", choices=PLANNED_FAMILIES,
+                        help="Restrict to a family (repeatable)")
+    parser.add_argument("--domain", action="append", choices=DOMAINS,
+                        help="Restrict to a domain (repeatable)")
+    parser.add_argument("--queue", action="store_true", help="Print the prioritized work queue")
+    parser.add_argument("--limit", type=int, default=30, help="Queue items shown (0 = all)")
+    parser.add_argument("--json", action="store_true", help="Emit the queue as JSON")
+    args = parser.parse_args()
+
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+
+    if args.queue or args.json:
+        queue = work_queue(args.family, args.domain)
+        shown = queue[:args.limit] if args.limit else queue
+        if args.json:
+            print(json.dumps(shown, indent=2, ensure_ascii=False))
+            return
+        print(f"{'family':<14}{'domain':<7}{'axis':<16}{'have':>5}{'need':>6}  cell")
+        for w in shown:
+            print(f"{w['family']:<14}{w['domain']:<7}{w['axis']:<16}{w['have']:>5}{w['need']:>6}  "
+                  f"{_label(w['cell'])[:60]}")
+        print(f"\n{len(queue)} under-filled cell(s), {sum(w['need'] for w in queue)} item(s) to level")
+        return
+
+    for family in args.family or PLANNED_FAMILIES:
+        print(f"\n=== {family} ===")
+        for domain in args.domain or DOMAINS:
+            print_matrix(family, domain)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+data_io.py — Shared read/write layer for data/*.json
+
+Every content script used to carry its own load_*/save_* pair around
+stdlib json, writing in place with open(path, "w") — a crash or Ctrl-C
+mid-dump left a truncated file — and each picked its own formatting.
+This module is the one way to touch the data files:
+
+  backend   orjson when installed (4–5× faster load + dump over the ~47 MB of
+            data/*.json), else stdlib json.  orjson only writes objects
+            without floats, where both produce byte-identical output for
+            the two canonical modes below; anything holding a float (orjson
+            spells 1e-05 as 0.00001), an int past 64 bits or a non-str key
+            is written by json.  NaN and ±Infinity are rejected with
+            ValueError rather than written as null or as invalid JSON.
+  modes     "pretty"   indent=2, UTF-8 (not \\u-escaped) — the
+                       hand-edited families (tables, vignettes, passages, …)
+            "compact"  no whitespace — large machine-maintained files
+                       ({DOMAIN}_basic.json)
+  writes    temp file in the same directory, flushed and fsynced, then
+            os.replace() — readers see the old file or the new one, never
+            half of either.
+  streaming iter_records() yields one record at a time from a file's
+            questions / encounters / passages array (constant memory, the
+            rest of the top level collected into a header dict);
+            RecordWriter writes records back one at a time, byte-identical
+            to save_json, and atomically.
+  locking   file_lock(path) holds an exclusive OS lock on path + ".lock"
+            for read-modify-write cycles shared between processes.
+  timing    every call is counted (calls, seconds, bytes) per operation;
+            print_timing() summarizes, and DATA_IO_TIMING=1 prints the
+            summary when the script exits.
+
+USAGE (from Python):
+  from data_io import load_json, save_json, domain_path
+  data = load_json(domain_path("PMET", "vignettes"))
+  save_json(domain_path("PMET", "vignettes"), data)             # pretty
+  save_json("data/PMET_basic.json", data, mode="compact")
+
+  header = {}                               # rewrite one record at a time
+  with RecordWriter(path, header, "questions", count_keys=["total"]) as out:
+      for q in iter_records(path, "questions", header):
+          out.write(q)
+
+  python data_io.py                     # round-trip benchmark over data/*.json
+"""
+
+import atexit
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:          # optional speed-up — pip install orjson
+    orjson = None
+
+DATA_DIR = Path("data")
+BACKEND = "orjson" if orjson else "json"
+MODES = ("pretty", "compact")
+
+# op → [calls, seconds, bytes]
+_timing = defaultdict(lambda: [0, 0.0, 0])
+
+
+def _record(op, t0, nbytes):
+    entry = _timing[op]
+    entry[0] += 1
+    entry[1] += time.perf_counter() - t0
+    entry[2] += nbytes
+
+
+# ── Paths ────────────────────────────────────────────────────────────────────
+
+def domain_path(domain, family):
+    """data/{DOMAIN}_{family}.json"""
+    return DATA_DIR / f"{domain}_{family}.json"
+
+
+# ── Serialization ────────────────────────────────────────────────────────────
+
+def loads(text):
+    """Parse JSON from str or bytes."""
+    return orjson.loads(text) if orjson else json.loads(text)
+
+
+def _has_float(obj):
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        if isinstance(o, float):
+            return True
+        if isinstance(o, dict):
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple)):
+            stack.extend(o)
+    return False
+
+
+def dumps(obj, mode="pretty"):
+    """Canonical JSON text for obj (no trailing newline).
+    Raises ValueError on NaN or ±Infinity."""
+    if mode not in MODES:
+        raise ValueError(f"unknown JSON mode {mode!r} (expected one of {MODES})")
+    if orjson and not _has_float(obj):
+        try:
+            opt = orjson.OPT_INDENT_2 if mode == "pretty" else 0
+            return orjson.dumps(obj, option=opt).decode("utf-8")
+        except TypeError:
+            pass             # big ints, non-str keys — stdlib handles them
+    if mode == "pretty":
+        return json.dumps(obj, ensure_ascii=False, indent=2, allow_nan=False)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+
+
+# ── Files ────────────────────────────────────────────────────────────────────
+
+def load_json(path):
+    """Parse a UTF-8 JSON file (a leading BOM is skipped)."""
+    t0 = time.perf_counter()
+    raw = Path(path).read_bytes()
+    body = raw[3:] if raw.startswith(b"\xef\xbb\xbf") else raw
+    obj = loads(body) if orjson else json.loads(body.decode("utf-8"))
+    _record("load", t0, len(raw))
+    return obj
+
+
+def write_atomic(path, text):
+    """Write text (UTF-8, LF) via a same-directory temp file and os.replace()."""
+    t0 = time.perf_counter()
+    path = Path(path)
+    data = text.encode("utf-8") if isinstance(text, str) else text
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    _record("write", t0, len(data))
+
+
+def save_json(path, obj, mode="pretty", newline=False):
+    """Serialize obj in `mode` and write it atomically."""
+    t0 = time.perf_counter()
+    text = dumps(obj, mode) + ("\n" if newline else "")
+    _record("dump", t0, 0)
+    write_atomic(path, text)
+
+
+# ── Locking ──────────────────────────────────────────────────────────────────
+
+@contextmanager
+def file_lock(path):
+    """Hold an exclusive OS lock on path + '.lock' (blocks until acquired)."""
+    path = Path(path)
+    lock_path = path.with_name(path.name + ".lock")
+    with open(lock_path, "a+b") as fh:
+        if os.name == "nt":
+            import msvcrt
+            fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:   # LK_LOCK gives up after ~10 s; keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+# ── Streaming ────────────────────────────────────────────────────────────────
+
+# Top-level arrays iter_records() picks when no key is given
+RECORD_KEYS = ("questions", "encounters", "passages", "vignette_questions")
+
+_DECODER = json.JSONDecoder()
+_WS = " \t\r\n"
+
+
+class _ChunkReader:
+    """Incremental raw_decode over a text file read in fixed-size chunks."""
+
+    def __init__(self, f, chunk_size):
+        self.f, self.chunk_size = f, chunk_size
+        self.buf, self.pos, self.eof = "", 0, False
+
+    def _fill(self):
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character (not consumed)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                raise ValueError(f"{self.f.name}: unexpected end of JSON")
+
+    def expect(self, ch):
+        if self.peek() != ch:
+            raise ValueError(f"{self.f.name}: expected {ch!r}, found {self.buf[self.pos]!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode one complete JSON value, reading more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_records(path, key=None, header=None, chunk_size=1 << 16):
+    """
+    Yield the records of one top-level array one at a time, holding a single
+    record (plus one chunk) in memory.  key defaults to the first of
+    RECORD_KEYS present; a file whose top level is itself an array streams
+    that array.  If `header` is a dict it receives every other top-level
+    field, with header[key] = None marking the array's position — fields
+    after the array arrive once iteration finishes.  Hand it to RecordWriter
+    to rewrite the file in the same layout.
+    """
+    t0 = time.perf_counter()
+    path = Path(path)
+    with open(path, encoding="utf-8-sig") as f:
+        r = _ChunkReader(f, chunk_size)
+        if r.peek() == "[":
+            yield from _iter_array(r)
+            _record("stream", t0, path.stat().st_size)
+            return
+
+        r.expect("{")
+        found = False
+        while r.peek() != "}":
+            name = r.value()
+            r.expect(":")
+            if not found and r.peek() == "[" and (name == key or (key is None and name in RECORD_KEYS)):
+                found = True
+                if header is not None:
+                    header[name] = None
+                yield from _iter_array(r)
+            else:
+                value = r.value()
+                if header is not None:
+                    header[name] = value
+            if r.peek() == ",":
+                r.pos += 1
+    if not found:
+        raise KeyError(f"{path}: no top-level array {key or ' / '.join(RECORD_KEYS)}")
+    _record("stream", t0, path.stat().st_size)
+
+
+def _iter_array(r):
+    r.expect("[")
+    if r.peek() == "]":
+        r.pos += 1
+        return
+    while True:
+        yield r.value()
+        if r.peek() == ",":
+            r.pos += 1
+        else:
+            r.expect("]")
+            return
+
+
+def _indent(text, prefix):
+    return text.replace("\n", "\n" + prefix)
+
+
+class RecordWriter:
+    """
+    Stream records into {header fields..., key: [records]} — byte-identical
+    to save_json(path, {**header, key: records}, mode) without holding the
+    records.  Records are spooled to a temp file; the header is read when the
+    writer closes, so fields like total_questions can be listed in
+    count_keys (set to the record count) or filled in by the caller late.
+    The array goes where header has `key` (appended if absent).
+
+    Atomic like save_json: the target is replaced only when the with-block
+    exits cleanly; on an exception it is left untouched.
+
+        header = {}
+        with RecordWriter(path, header, "questions", count_keys=["total_questions"]) as w:
+            for q in iter_records(path, "questions", header):
+                w.write(fix(q))
+    """
+
+    def __init__(self, path, header, key="questions", mode="pretty", count_keys=()):
+        if mode not in MODES:
+            raise ValueError(f"unknown JSON mode {mode!r} (expected one of {MODES})")
+        self.path, self.header, self.key, self.mode = Path(path), header, key, mode
+        self.count_keys = tuple(count_keys)
+        self.count = 0
+        self._spool = tempfile.TemporaryFile("w+", encoding="utf-8", newline="\n",
+                                             dir=self.path.parent or ".")
+        self._t = 0.0
+
+    def write(self, record):
+        t0 = time.perf_counter()
+        if self.mode == "pretty":
+            text = "    " + _indent(dumps(record, "pretty"), "    ")
+            self._spool.write(",\n" + text if self.count else text)
+        else:
+            text = dumps(record, "compact")
+            self._spool.write("," + text if self.count else text)
+        self.count += 1
+        self._t += time.perf_counter() - t0
+
+    def _parts(self):
+        """(text before the records, text after) for the final file."""
+        fields = dict(self.header)
+        for k in self.count_keys:
+            fields[k] = self.count
+        fields.setdefault(self.key, None)
+        before, after, seen = [], [], False
+        pretty = self.mode == "pretty"
+        for name, value in fields.items():
+            if name == self.key:
+                seen = True
+                continue
+            if pretty:
+                item = f"  {dumps(name)}: {_indent(dumps(value, 'pretty'), '  ')}"
+            else:
+                item = f"{dumps(name)}:{dumps(value, 'compact')}"
+            (after if seen else before).append(item)
+        sep = ",\n" if pretty else ","
+        if pretty:
+            head = "{\n" + "".join(b + sep for b in before) + f"  {dumps(self.key)}: ["
+            head += "\n" if self.count else ""
+            tail = ("\n  ]" if self.count else "]") + "".join(sep + a for a in after) + "\n}"
+        else:
+            head = "{" + "".join(b + sep for b in before) + f"{dumps(self.key)}:["
+            tail = "]" + "".join(sep + a for a in after) + "}"
+        return head, tail
+
+    def close(self):
+        t0 = time.perf_counter()
+        head, tail = self._parts()
+        fd, tmp = tempfile.mkstemp(prefix=f".{self.path.name}.", suffix=".tmp",
+                                   dir=self.path.parent or ".")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                f.write(head)
+                self._spool.seek(0)
+                shutil.copyfileobj(self._spool, f)
+                f.write(tail)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        finally:
+            self._spool.close()
+        _record("stream-write", t0 - self._t, self.path.stat().st_size)   # + time spent in write()
+
+    def abort(self):
+        self._spool.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+
+# ── Timing ───────────────────────────────────────────────────────────────────
+
+def timing():
+    """{op: {"calls", "seconds", "bytes"}} since start (or reset_timing())."""
+    return {op: {"calls": c, "seconds": s, "bytes": b} for op, (c, s, b) in _timing.items()}
+
+
+def reset_timing():
+    _timing.clear()
+
+
+def print_timing(file=sys.stderr):
+    if not _timing:
+        return
+    parts = [f"{op} {c}× {s:.2f}s" + (f" {b / 1e6:.1f} MB" if b else "")
+             for op, (c, s, b) in sorted(_timing.items())]
+    print(f"  [data_io:{BACKEND}] " + ", ".join(parts), file=file)
+
+
+if os.environ.get("DATA_IO_TIMING"):
+    atexit.register(print_timing)
+
+
+def main():
+    paths = sorted(DATA_DIR.glob("*.json"))
+    raws = {p: p.read_bytes() for p in paths}
+    total = sum(len(r) for r in raws.values())
+
+    t0 = time.perf_counter()
+    for raw in raws.values():
+        json.dumps(json.loads(raw.decode("utf-8")), ensure_ascii=False, indent=2)
+    t_std = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for raw in raws.values():
+        dumps(loads(raw), "pretty")
+    t_fast = time.perf_counter() - t0
+
+    changed = []
+    for p, raw in raws.items():
+        obj = loads(raw)
+        if not any(dumps(obj, mode).encode("utf-8") in (raw, raw.rstrip(b"\n")) for mode in MODES):
+            changed.append(p.name)
+
+    print(f"  {len(paths)} files, {total / 1e6:.1f} MB")
+    print(f"  stdlib json: {t_std:.2f}s   {BACKEND}: {t_fast:.2f}s   ({t_std / max(t_fast, 1e-9):.1f}×)")
+    if changed:
+        print(f"  Not in a canonical mode ({len(changed)}): {', '.join(changed)}")
+
+
+if __name__ == "__main__":
+    if not DATA_DIR.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
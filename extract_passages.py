@@ -14,9 +14,11 @@ Passage selection criteria:
   - Skips citations, chapter-action sections
 """
 
-import json, re, pathlib
+import re, pathlib
 from bs4 import BeautifulSoup
 
+from data_io import save_json
+
 SRC  = pathlib.Path("content")
 DST  = pathlib.Path("data")
 DST.mkdir(exist_ok=True)
@@ -187,8 +189,7 @@ for code, passages in buckets.items():
         "passages":        passages,
     }
     path = DST / f"{code}_passages.json"
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    save_json(path, out)
     print(f"  {code}_passages.json  {len(passages)} passages")
     grand_total += len(passages)
 
@@ -18,42 +18,9 @@ import sys
 import numpy as np
 from pathlib import Path
 
-OUTPUT_DIR = Path("data/brain_meshes")
-
-# ── Coordinate transform (must match generate_subcortical.py exactly) ──────────
-COORD_SCALE  = 1.0 / 75.0
-COORD_OFFSET = np.array([0.118, -0.204, 0.438], dtype=np.float64)
-
-
-def to_threejs(coords_fs):
-    """
-    FreeSurfer RAS (x=right, y=anterior, z=superior) in mm
-    → Three.js (x=-right, y=superior, z=anterior) scaled + offset
-    """
-    c = np.asarray(coords_fs, dtype=np.float64)
-    x_out = -c[:, 0]   # negate: left-hemi lateral (−x_fs) → +x_3js
-    y_out =  c[:, 2]   # superior (z_fs) → up (y_3js)
-    z_out =  c[:, 1]   # anterior (y_fs) → depth (z_3js)
-    return (np.column_stack([x_out, y_out, z_out]) * COORD_SCALE + COORD_OFFSET).astype(np.float32)
-
-
-def sphere_to_uv(sph):
-    """Equirectangular projection matching generate_hires_brain.py."""
-    r = np.linalg.norm(sph, axis=1, keepdims=True)
-    n = sph / np.maximum(r, 1e-9)
-    u = (np.arctan2(n[:, 1], n[:, 0]) + np.pi) / (2.0 * np.pi)
-    v = np.arccos(np.clip(n[:, 2], -1.0, 1.0)) / np.pi
-    return np.stack([u, v], axis=1).astype(np.float32)
-
-
-def remove_seam_faces(uv, faces):
-    """Drop triangles straddling the u=0/1 wrap seam."""
-    u0 = uv[faces[:, 0], 0]
-    u1 = uv[faces[:, 1], 0]
-    u2 = uv[faces[:, 2], 0]
-    span = np.maximum(np.maximum(u0, u1), u2) - np.minimum(np.minimum(u0, u1), u2)
-    return faces[span < 0.25]
+from mesh_utils import COORD_OFFSET, to_threejs, sphere_to_uv, remove_seam_faces
 
+OUTPUT_DIR = Path("data/brain_meshes")
 
 print("=" * 60)
 print("fix_hires_coords.py")
@@ -96,8 +63,8 @@ rh_uv_full = sphere_to_uv(rh_sph)
 lh_uv = lh_uv_full.copy();  lh_uv[:, 0] *= 0.5
 rh_uv = rh_uv_full.copy();  rh_uv[:, 0] = 0.5 + rh_uv_full[:, 0] * 0.5
 
-lh_faces = remove_seam_faces(lh_uv, lh_faces)
-rh_faces = remove_seam_faces(rh_uv, rh_faces)
+lh_faces = remove_seam_faces(lh_uv, lh_faces, wrap_threshold=0.25)
+rh_faces = remove_seam_faces(rh_uv, rh_faces, wrap_threshold=0.25)
 print(f"  After seam removal: LH {len(lh_faces):,}  RH {len(rh_faces):,}")
 
 # ── [4] Apply coordinate transform ─────────────────────────────────────────────
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+gen_metrics.py — Per-request telemetry for the generate_* scripts
+
+The generators print OK / FAILED per item and a failure count at the end,
+which says nothing about where the time, tokens and retries go.  Every
+model request now appends one JSON line to data/gen_metrics.jsonl:
+
+  ts, script, family, domain, item     what was being generated
+  model, prompt_version                prompt_version hashes the system prompt
+                                       (plus any template), so edits show up
+  base_url                             only when ANTHROPIC_BASE_URL points the
+                                       run elsewhere (e.g. at llm_stub.py)
+  attempt                              0 = first try, 1+ = retries
+  batch                                items asked for in one request, if > 1
+  input_tokens, output_tokens          from the response's usage block
+  stop_reason                          'max_tokens' means the output was cut off
+  latency_s                            wall time of the request + parsing
+  outcome                              accepted | rejected | error
+  error_class                          exception class name (RateLimitError, …)
+  rules                                validator rules that rejected the output
+                                       (content_schema.rule_of), for histograms
+  accepted                             items kept from this request
+
+A rejection that happens after the generator returned (e.g. the spot
+generator's whole-record check) is logged as its own zero-token line with
+accepted = -n, so totals stay right.
+
+    tel = Telemetry("tables", domain="BPSY", model=MODEL, prompt=SYSTEM_PROMPT)
+    for attempt in range(retries):
+        try:
+            with tel.request(item=table["chapter_file"], attempt=attempt) as req:
+                msg = client.messages.create(...)
+                req.response(msg)
+                result = parse_and_validate(msg)
+                req.accept()
+            return result
+        except ...:                     # the existing retry handling, unchanged
+
+USAGE:
+  python gen_metrics.py summary                        # per script
+  python gen_metrics.py summary --by batch --script generate_presentations
+  python gen_metrics.py summary --by prompt --since 2026-10-01
+  python gen_metrics.py summary --by endpoint          # stub vs real API runs
+  python gen_metrics.py rules --top 20                 # rejection-rule histogram
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+import time
+import traceback
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from content_schema import rule_of
+
+DATA_DIR = Path("data")
+METRICS_PATH = DATA_DIR / "gen_metrics.jsonl"
+
+# USD per million (input, output) tokens — edit when pricing changes, or
+# override per run with `summary --price IN OUT`
+PRICES = {
+    "claude-opus-4-6":   (5.00, 25.00),
+    "claude-sonnet-4-6": (3.00, 15.00),
+}
+
+# Exceptions the generators treat as "the model's output was unusable"
+REJECT_ERRORS = {"JSONDecodeError", "AssertionError", "SchemaError", "KeyError", "ValueError"}
+
+
+def prompt_version(*parts) -> str:
+    """Short stable hash of the prompt text(s) a generator sends."""
+    h = hashlib.sha1()
+    for p in parts:
+        h.update(str(p).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:10]
+
+
+def _usage(resp):
+    """(input, output, stop_reason) from an SDK Message or a raw /v1/messages dict."""
+    if isinstance(resp, dict):
+        usage = resp.get("usage") or {}
+        return usage.get("input_tokens"), usage.get("output_tokens"), resp.get("stop_reason")
+    usage = getattr(resp, "usage", None)
+    return (getattr(usage, "input_tokens", None), getattr(usage, "output_tokens", None),
+            getattr(resp, "stop_reason", None))
+
+
+class Request:
+    """One model request; written to the metrics file when the with-block exits."""
+
+    def __init__(self, tel, fields):
+        self.tel, self.fields = tel, fields
+        self.rules: list[str] = []
+        self.accepted = 0
+
+    def __enter__(self):
+        self._t0 = time.perf_counter()
+        return self
+
+    def response(self, resp):
+        i, o, stop = _usage(resp)
+        self.fields.update(input_tokens=i, output_tokens=o, stop_reason=stop)
+
+    def reject(self, violations):
+        """Record validator hits for output that was (partly) thrown away."""
+        self.rules.extend(rule_of(v) for v in violations)
+
+    def accept(self, n: int = 1):
+        self.accepted += n
+
+    def __exit__(self, exc_type, exc, tb):
+        rec = dict(self.fields, latency_s=round(time.perf_counter() - self._t0, 3))
+        if exc_type is not None:
+            rec["error_class"] = exc_type.__name__
+            if exc_type.__name__ in REJECT_ERRORS:
+                rec["outcome"] = "rejected"
+                if hasattr(exc, "violations"):
+                    self.rules.extend(rule_of(v) for v in exc.violations)
+                else:
+                    # The assert/raise message, or the failing line for a bare assert
+                    text = str(exc) or (traceback.extract_tb(tb)[-1].line or "")
+                    self.rules.append(rule_of(text)[:160])
+            else:
+                rec["outcome"] = "error"
+        else:
+            rec["outcome"] = "accepted" if self.accepted else "rejected"
+        if self.rules:
+            rec["rules"] = self.rules
+        rec["accepted"] = self.accepted if exc_type is None else 0
+        self.tel.write(rec)
+        return False
+
+
+class Telemetry:
+    """Metrics writer for one generator run (script, family, domain, model, prompt)."""
+
+    def __init__(self, family, domain=None, model=None, prompt=(), script=None,
+                 path=METRICS_PATH):
+        self.path = Path(path)
+        prompt = prompt if isinstance(prompt, (list, tuple)) else (prompt,)
+        self.base = {
+            "script": script or Path(sys.argv[0]).stem,
+            "family": family,
+            "domain": domain,
+            "model": model,
+            "prompt_version": prompt_version(*prompt) if prompt else None,
+        }
+        if os.environ.get("ANTHROPIC_BASE_URL"):
+            self.base["base_url"] = os.environ["ANTHROPIC_BASE_URL"]
+
+    def request(self, item=None, attempt=0, batch=None, **fields) -> Request:
+        rec = {"ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+               **self.base, "item": item, "attempt": attempt}
+        if batch and batch > 1:
+            rec["batch"] = batch
+        rec.update(fields)
+        return Request(self, rec)
+
+    def reject(self, item, violations, n: int = 1):
+        """A previously accepted item failed a later check."""
+        self.write({"ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    **self.base, "item": item, "outcome": "rejected", "late": True,
+                    "rules": [rule_of(v) for v in violations], "accepted": -n})
+
+    def write(self, rec):
+        # One short O_APPEND write per line, so concurrent workers don't interleave
+        line = (json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+
+
+# ── Summary ───────────────────────────────────────────────────────────────────
+
+def read_metrics(path=METRICS_PATH, script=None, since=None):
+    if not Path(path).exists():
+        return []
+    out = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError:
+                continue            # a line cut short by a crash
+            if script and rec.get("script") != script:
+                continue
+            if since and rec.get("ts", "") < since:
+                continue
+            out.append(rec)
+    return out
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of an unsorted list (None if empty)."""
+    if not values:
+        return None
+    s = sorted(values)
+    return s[max(0, math.ceil(p / 100 * len(s)) - 1)]
+
+
+def cost(rec, price=None) -> float:
+    pin, pout = price or PRICES.get(rec.get("model"), (0.0, 0.0))
+    return ((rec.get("input_tokens") or 0) * pin + (rec.get("output_tokens") or 0) * pout) / 1e6
+
+
+GROUP_KEYS = {
+    "script": lambda r: r.get("script"),
+    "family": lambda r: (r.get("script"), r.get("family")),
+    "domain": lambda r: (r.get("script"), r.get("domain")),
+    "model":  lambda r: r.get("model"),
+    "endpoint": lambda r: (r.get("script"), r.get("base_url") or "api"),
+    "prompt": lambda r: (r.get("script"), r.get("prompt_version")),
+    "batch":  lambda r: (r.get("script"), r.get("batch", 1)),
+}
+
+
+def summarize(records, by="script", price=None) -> list[dict]:
+    groups = defaultdict(list)
+    for r in records:
+        groups[GROUP_KEYS[by](r)].append(r)
+    rows = []
+    for key, recs in sorted(groups.items(), key=lambda kv: str(kv[0])):
+        calls = [r for r in recs if not r.get("late")]
+        lat = [r["latency_s"] for r in calls if r.get("latency_s") is not None]
+        out_tok = [r["output_tokens"] for r in calls if r.get("output_tokens") is not None]
+        accepted = sum(r.get("accepted", 0) for r in recs)
+        total = sum(cost(r, price) for r in calls)
+        rows.append({
+            "group": key if isinstance(key, str) or key is None else " / ".join(map(str, key)),
+            "requests": len(calls),
+            "retries": sum(1 for r in calls if r.get("attempt", 0) > 0),
+            "outcomes": dict(Counter(r.get("outcome") for r in recs)),
+            "errors": dict(Counter(r["error_class"] for r in calls if r.get("error_class"))),
+            "truncated": sum(1 for r in calls if r.get("stop_reason") == "max_tokens"),
+            "accepted": accepted,
+            "latency_p50": percentile(lat, 50),
+            "latency_p90": percentile(lat, 90),
+            "latency_p99": percentile(lat, 99),
+            "out_tokens_p50": percentile(out_tok, 50),
+            "out_tokens_p90": percentile(out_tok, 90),
+            "cost": round(total, 4),
+            "cost_per_accepted": round(total / accepted, 4) if accepted > 0 else None,
+        })
+    return rows
+
+
+def _fmt(v, spec):
+    return f"{'-':>8}" if v is None else format(v, spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize generation telemetry")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_sum = sub.add_parser("summary", help="Percentiles and cost per accepted item")
+    p_sum.add_argument("--by", choices=list(GROUP_KEYS), default="script")
+    p_sum.add_argument("--json", action="store_true", help="Machine-readable output")
+    p_sum.add_argument("--price", nargs=2, type=float, metavar=("IN", "OUT"),
+                       help="USD per million input/output tokens (overrides PRICES)")
+    p_rules = sub.add_parser("rules", help="Which validator rules reject output most")
+    p_rules.add_argument("--top", type=int, default=15)
+    for p in (p_sum, p_rules):
+        p.add_argument("--script", help="Only this generator, e.g. generate_tables")
+        p.add_argument("--since", help="ISO date/time lower bound, e.g. 2026-10-01")
+    args = parser.parse_args()
+
+    records = read_metrics(script=args.script, since=args.since)
+    if not records:
+        print(f"No telemetry in {METRICS_PATH} (generators write it as they run)")
+        return
+
+    if args.cmd == "rules":
+        hits = Counter(rule for r in records for rule in r.get("rules", ()))
+        for rule, n in hits.most_common(args.top):
+            print(f"  {n:>6}  {rule}")
+        print(f"\n  {sum(hits.values())} rule hit(s) across {len(records)} request(s)")
+        return
+
+    rows = summarize(records, args.by, args.price)
+    if args.json:
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+        return
+    print(f"{args.by:<34}{'req':>6}{'retry':>6}{'ok':>6}{'trunc':>6}"
+          f"{'p50 s':>8}{'p90 s':>8}{'p99 s':>8}{'out p50':>8}{'cost $':>9}{'$/item':>8}")
+    for r in rows:
+        print(f"{str(r['group'])[:33]:<34}{r['requests']:>6}{r['retries']:>6}{r['accepted']:>6}"
+              f"{r['truncated']:>6}{_fmt(r['latency_p50'], '8.1f')}{_fmt(r['latency_p90'], '8.1f')}"
+              f"{_fmt(r['latency_p99'], '8.1f')}{_fmt(r['out_tokens_p50'], '8d')}"
+              f"{r['cost']:>9.2f}{_fmt(r['cost_per_accepted'], '8.3f')}")
+        if r["errors"]:
+            print(f"{'':<34}errors: " + ", ".join(f"{k} {n}" for k, n in r["errors"].items()))
+
+
+if __name__ == "__main__":
+    if not DATA_DIR.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
@@ -11,11 +11,14 @@ Sources:
   Glass brain shell : Full left hemisphere pial (simplified)
 
 Outputs:
-  data/brain_meshes/{region_id}.glb    — binary GLTF per region
+  data/brain_meshes/{region_id}.glb    — binary GLTF per region (LOD 0)
+  data/brain_meshes/{region_id}_lod{N}.glb — coarser LOD levels (mesh_lod.py)
+                                         all Draco-compressed (compress_meshes.py)
   data/brain_regions_manifest.json     — index of all generated meshes
 
 Usage:
-  pip install nilearn nibabel trimesh pygltflib numpy scipy scikit-image
+  npm install                          # gltf-transform, for Draco compression
+  pip install nilearn nibabel trimesh pygltflib numpy scipy scikit-image DracoPy
   python generate_brain_meshes.py
 
 Coordinate transform (FreeSurfer/MNI -> Three.js):
@@ -28,12 +31,16 @@ COORD_SCALE  = 1/75  (places brain in ~2-unit bounding box, matching existing el
 COORD_OFFSET = computed from surface centroid to align with current CAM_TARGET (0.55, 0.05, 0.10)
 """
 
-import json
 import sys
 import traceback
 import numpy as np
 from pathlib import Path
 
+import mesh_utils
+from compress_meshes import compress_manifest
+from data_io import save_json
+from mesh_lod import export_lod_chain
+
 # ─── Output paths ──────────────────────────────────────────────────────────────
 
 OUT_DIR       = Path("data/brain_meshes")
@@ -302,23 +309,10 @@ def to_threejs(coords_fs):
     """
     Transform FreeSurfer RAS (or MNI) mm coordinates to Three.js world units.
 
-    FreeSurfer RAS convention:  x=right, y=anterior, z=superior
-    Three.js convention:        x=right, y=up(superior), z=toward-viewer(anterior)
-
-    For the left hemisphere pial surface, x values are negative (leftward).
-    We negate x so that the lateral surface (most negative x) maps to
-    positive x in Three.js — this matches the camera position in brain-3d.js
-    which views the lateral surface from positive x.
-
-    Scale factor (COORD_SCALE = 1/75) converts mm to Three.js units so the
-    whole brain is ~2 units wide, matching the existing ellipsoid brain.
-    COORD_OFFSET centres the brain at the camera target.
+    Thin wrapper over mesh_utils.to_threejs that picks up the runtime
+    COORD_OFFSET set in main().  See mesh_utils for the axis convention.
     """
-    c = np.asarray(coords_fs, dtype=np.float64)
-    x_out =  -c[:, 0]   # negate: lateral(-x_fs) -> +x_3js
-    y_out =   c[:, 2]   # superior (z_fs) -> up (y_3js)
-    z_out =   c[:, 1]   # anterior (y_fs) -> depth (z_3js)
-    return (np.column_stack([x_out, y_out, z_out]) * COORD_SCALE + COORD_OFFSET).astype(np.float32)
+    return mesh_utils.to_threejs(coords_fs, scale=COORD_SCALE, offset=COORD_OFFSET)
 
 # ─── Parcellation loader ────────────────────────────────────────────────────────
 
@@ -458,6 +452,25 @@ def save_glb(mesh, path):
         return False
 
 
+def save_region_lods(mesh, region_id):
+    """
+    Export the LOD chain for a region (LOD 0 = {region_id}.glb, plus coarser
+    {region_id}_lod1.glb / _lod2.glb).  Returns the manifest "lods" list, or
+    None if LOD 0 could not be written.
+    """
+    import trimesh
+    written = []
+
+    def _export(verts, faces, path):
+        written.append(save_glb(
+            trimesh.Trimesh(vertices=verts, faces=faces, process=False), path))
+
+    lods = export_lod_chain(region_id, mesh.vertices, mesh.faces, OUT_DIR, _export)
+    if not written or not written[0]:
+        return None
+    return lods
+
+
 def mesh_bounds(mesh):
     b = mesh.bounds
     return {"min": b[0].tolist(), "max": b[1].tolist()}
@@ -607,14 +620,15 @@ def main():
         print(f"    mesh: {len(mesh.vertices):,} verts, {len(mesh.faces):,} faces"); sys.stdout.flush()
         mesh = simplify(mesh, MAX_FACES_CORTICAL)
         print(f"    simplified: {len(mesh.faces):,} faces"); sys.stdout.flush()
-        out  = OUT_DIR / f"{region_id}.glb"
-        if save_glb(mesh, out):
+        lods = save_region_lods(mesh, region_id)
+        if lods:
             manifest[region_id] = {
                 "file":        f"data/brain_meshes/{region_id}.glb",
                 "type":        "cortical",
                 "vertexCount": len(mesh.vertices),
                 "faceCount":   len(mesh.faces),
                 "bounds":      mesh_bounds(mesh),
+                "lods":        lods,
             }
             print(f"  OK {region_id}: {len(mesh.vertices):,} verts, {len(mesh.faces):,} faces")
             sys.stdout.flush()
@@ -706,14 +720,15 @@ def main():
             mesh = trimesh.Trimesh(vertices=verts_3d, faces=mc_faces, process=False)
             mesh = simplify(mesh, MAX_FACES_SUBCORTICAL)
 
-            out = OUT_DIR / f"{region_id}.glb"
-            if save_glb(mesh, out):
+            lods = save_region_lods(mesh, region_id)
+            if lods:
                 manifest[region_id] = {
                     "file":        f"data/brain_meshes/{region_id}.glb",
                     "type":        "subcortical",
                     "vertexCount": len(mesh.vertices),
                     "faceCount":   len(mesh.faces),
                     "bounds":      mesh_bounds(mesh),
+                    "lods":        lods,
                 }
                 print(f"  OK {region_id} ('{matched_name}'): "
                       f"{len(mesh.vertices):,} verts, {len(mesh.faces):,} faces")
@@ -754,14 +769,15 @@ def main():
                 verts_3d = to_threejs(verts_mni)
                 mesh = trimesh.Trimesh(vertices=verts_3d, faces=mc_faces, process=False)
                 mesh = simplify(mesh, MAX_FACES_SUBCORTICAL)
-                out = OUT_DIR / f"{seg_id}.glb"
-                if save_glb(mesh, out):
+                lods = save_region_lods(mesh, seg_id)
+                if lods:
                     manifest[seg_id] = {
                         "file":        f"data/brain_meshes/{seg_id}.glb",
                         "type":        "subcortical",
                         "vertexCount": len(mesh.vertices),
                         "faceCount":   len(mesh.faces),
                         "bounds":      mesh_bounds(mesh),
+                        "lods":        lods,
                     }
                     print(f"  OK {seg_id}: {len(mesh.vertices):,} verts, "
                           f"{len(mesh.faces):,} faces")
@@ -819,14 +835,15 @@ def main():
             if mesh is None:
                 print(f"  [skip] {region_id}: empty ellipsoid volume"); continue
             mesh = simplify(mesh, MAX_FACES_SUBCORTICAL)
-            out = OUT_DIR / f"{region_id}.glb"
-            if save_glb(mesh, out):
+            lods = save_region_lods(mesh, region_id)
+            if lods:
                 manifest[region_id] = {
                     "file":        f"data/brain_meshes/{region_id}.glb",
                     "type":        "subcortical",
                     "vertexCount": len(mesh.vertices),
                     "faceCount":   len(mesh.faces),
                     "bounds":      mesh_bounds(mesh),
+                    "lods":        lods,
                 }
                 print(f"  OK {region_id}: {len(mesh.vertices):,} verts, "
                       f"{len(mesh.faces):,} faces")
@@ -881,14 +898,15 @@ def main():
             print("  [skip] corpus_callosum: empty volume")
         else:
             cc_mesh = simplify(cc_mesh, MAX_FACES_SUBCORTICAL)
-            out = OUT_DIR / "corpus_callosum.glb"
-            if save_glb(cc_mesh, out):
+            lods = save_region_lods(cc_mesh, "corpus_callosum")
+            if lods:
                 manifest["corpus_callosum"] = {
                     "file":        "data/brain_meshes/corpus_callosum.glb",
                     "type":        "subcortical",
                     "vertexCount": len(cc_mesh.vertices),
                     "faceCount":   len(cc_mesh.faces),
                     "bounds":      mesh_bounds(cc_mesh),
+                    "lods":        lods,
                 }
                 print(f"  OK corpus_callosum: {len(cc_mesh.vertices):,} verts, "
                       f"{len(cc_mesh.faces):,} faces")
@@ -945,14 +963,15 @@ def main():
             mesh = trimesh.Trimesh(vertices=verts_3d, faces=mc_faces, process=False)
             mesh = simplify(mesh, MAX_FACES_CEREBELLUM)
 
-            out = OUT_DIR / "cerebellum.glb"
-            if save_glb(mesh, out):
+            lods = save_region_lods(mesh, "cerebellum")
+            if lods:
                 manifest["cerebellum"] = {
                     "file":        "data/brain_meshes/cerebellum.glb",
                     "type":        "cortical",
                     "vertexCount": len(mesh.vertices),
                     "faceCount":   len(mesh.faces),
                     "bounds":      mesh_bounds(mesh),
+                    "lods":        lods,
                 }
                 print(f"  OK cerebellum: {len(mesh.vertices):,} verts, "
                       f"{len(mesh.faces):,} faces")
@@ -968,10 +987,13 @@ def main():
     print("Writing manifest")
     print("=" * 60)
 
-    with open(MANIFEST_PATH, "w") as f:
-        json.dump(manifest, f, indent=2)
+    save_json(MANIFEST_PATH, manifest)
     print(f"  {MANIFEST_PATH}  ({len(manifest)} regions)")
 
+    # Draco-compress every region/LOD GLB (run mesh_bvh.py and scene_pack.py after)
+    print("\nCompressing region meshes")
+    compress_manifest(manifest)
+
     # Summary by type
     by_type = {}
     for r, info in manifest.items():
@@ -15,9 +15,16 @@ Usage:
   python generate_brain_questions.py              # generate 20 questions
   python generate_brain_questions.py --count 60   # generate 60 questions
   python generate_brain_questions.py --dry-run    # preview prompt only
+
+API key: --api-key, else ANTHROPIC_API_KEY (environment or .env), else
+JustinQuestionsDatabase/api_key.txt.
 """
 
-import argparse, json, os, random, re, sys
+import argparse, inspect, json, os, random, re, sys
+
+from data_io import load_json, save_json
+from gen_metrics import Telemetry
+from id_alloc import IdAllocator, high_water
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 API_KEY_FILE   = r"C:\Users\mcdan\JustinQuestionsDatabase\api_key.txt"
@@ -27,6 +34,8 @@ DOMAINS_DIR    = r"C:\Users\mcdan\JustinQuestionsDatabase\data\domains"
 ANCHOR_D7      = r"C:\Users\mcdan\Desktop\EPPP_Domain_Design\anchor_points_by_domain\Domain_7_Biopsychology.txt"
 ANCHOR_D3      = r"C:\Users\mcdan\Desktop\EPPP_Domain_Design\anchor_points_by_domain\Domain_3_Clinical_Psychopathology.txt"
 MODEL          = "claude-sonnet-4-6"
+# Same override the anthropic SDK honours, e.g. http://127.0.0.1:8765 for llm_stub.py
+API_BASE_URL   = os.environ.get("ANTHROPIC_BASE_URL", "https://api.anthropic.com").rstrip("/")
 
 # ── Valid brain region keys (must match brain_regions_manifest.json) ──────────
 BRAIN_REGIONS = [
@@ -75,8 +84,24 @@ NEURO_KW = [
 
 # ── Loaders ───────────────────────────────────────────────────────────────────
 
-def load_api_key():
-    return open(API_KEY_FILE).read().strip()
+def load_api_key(args_key=None):
+    """--api-key, then ANTHROPIC_API_KEY (environment or .env), then api_key.txt."""
+    if args_key:
+        return args_key
+    if os.environ.get("ANTHROPIC_API_KEY"):
+        return os.environ["ANTHROPIC_API_KEY"]
+    for p in (".env", os.path.join(os.path.expanduser("~"), ".env")):
+        if os.path.exists(p):
+            for line in open(p, encoding="utf-8").read().splitlines():
+                if line.startswith("ANTHROPIC_API_KEY="):
+                    return line.split("=", 1)[1].strip().strip("\"'")
+    if os.path.exists(API_KEY_FILE):
+        return open(API_KEY_FILE).read().strip()
+    raise RuntimeError(
+        "No API key found.\n"
+        "Set ANTHROPIC_API_KEY in your environment, or create a .env file with\n"
+        "  ANTHROPIC_API_KEY=sk-ant-..."
+    )
 
 def load_anchor_points():
     """Extract brain-pathology relevant anchor points from Domain 7 and 3."""
@@ -100,7 +125,7 @@ def load_domain_sample():
         path = os.path.join(DOMAINS_DIR, fname)
         if not os.path.exists(path):
             continue
-        qs = json.load(open(path, encoding="utf-8")).get("questions", [])
+        qs = load_json(path).get("questions", [])
         relevant = [q for q in qs if any(k in (q.get("question","") + q.get("explanation","")).lower() for k in NEURO_KW)]
         random.shuffle(relevant)
         sample = relevant[:cfg["n"]]
@@ -122,10 +147,6 @@ def get_existing():
     from collections import Counter
     return ids, Counter(targets)
 
-def next_id_num(existing_ids):
-    nums = [int(re.search(r'\d+', i).group()) for i in existing_ids if re.search(r'\d+', i)]
-    return max(nums) + 1 if nums else 106
-
 # ── Prompt builder ────────────────────────────────────────────────────────────
 
 def build_prompt(count, start_num, anchor_points, domain_samples, target_counter):
@@ -211,7 +232,7 @@ def call_claude(api_key, prompt):
         "messages": [{"role": "user", "content": prompt}],
     }).encode()
     req = urllib.request.Request(
-        "https://api.anthropic.com/v1/messages",
+        API_BASE_URL + "/v1/messages",
         data=payload,
         headers={
             "x-api-key": api_key,
@@ -220,7 +241,7 @@ def call_claude(api_key, prompt):
         },
     )
     with urllib.request.urlopen(req, timeout=300) as resp:
-        return json.loads(resp.read())["content"][0]["text"]
+        return json.loads(resp.read())
 
 # ── Output ────────────────────────────────────────────────────────────────────
 
@@ -229,12 +250,11 @@ def save_to_canon(new_qs):
     os.makedirs(os.path.dirname(CANON_OUT), exist_ok=True)
     existing = []
     if os.path.exists(CANON_OUT):
-        existing = json.load(open(CANON_OUT, encoding="utf-8"))
+        existing = load_json(CANON_OUT)
     existing_ids = {q["id"] for q in existing}
     added = [q for q in new_qs if q["id"] not in existing_ids]
     combined = existing + added
-    with open(CANON_OUT, "w", encoding="utf-8") as f:
-        json.dump(combined, f, indent=2, ensure_ascii=False)
+    save_json(CANON_OUT, combined)
     print(f"Canonical store: {CANON_OUT}")
     print(f"  Total questions: {len(combined)} ({len(added)} new added)")
     return combined
@@ -285,13 +305,15 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--count",   type=int, default=20)
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--api-key", help="Anthropic API key (overrides env / .env / api_key.txt)")
     args = parser.parse_args()
 
-    api_key        = load_api_key()
+    api_key        = load_api_key(args.api_key)
     anchor_points  = load_anchor_points()
     domain_samples = load_domain_sample()
     existing_ids, target_counter = get_existing()
-    start_num      = next_id_num(existing_ids)
+    ids            = IdAllocator("brain", "BRAIN-{n:03d}", existing=existing_ids, start=106)
+    start_num      = ids.peek() if args.dry_run else ids.reserve(args.count).start
 
     print(f"Existing questions  : {len(existing_ids)}")
     print(f"Anchor points loaded: {len(anchor_points)}")
@@ -306,35 +328,43 @@ def main():
         return
 
     print("Calling Claude API...")
-    raw = call_claude(api_key, prompt)
-
-    match = re.search(r"\[.*\]", raw, re.DOTALL)
-    if not match:
-        print("ERROR: No JSON array found in response")
-        print(raw[:600])
-        sys.exit(1)
-
+    # The prompt is an f-string template inside build_prompt(); version its source
+    tel = Telemetry("brain", model=MODEL, prompt=inspect.getsource(build_prompt))
+    raw = ""
     try:
-        new_qs = json.loads(match.group())
-    except json.JSONDecodeError as e:
-        print(f"JSON parse error: {e}")
+        with tel.request(item=f"BRAIN-{start_num:03d}", batch=args.count) as req:
+            resp = call_claude(api_key, prompt)
+            req.response(resp)
+            raw = resp["content"][0]["text"]
+
+            match = re.search(r"\[.*\]", raw, re.DOTALL)
+            if not match:
+                raise ValueError("No JSON array found in response")
+            new_qs = json.loads(match.group())
+
+            # Validate
+            valid, skipped = [], []
+            for q in new_qs:
+                if q.get("target_region") not in BRAIN_REGIONS:
+                    skipped.append(f"  SKIP {q.get('id')}: bad target '{q.get('target_region')}'")
+                    req.reject(["$.target_region  not in BRAIN_REGIONS"])
+                    continue
+                bad_d = [d for d in q.get("distractor_regions", []) if d not in BRAIN_REGIONS]
+                if bad_d:
+                    skipped.append(f"  SKIP {q.get('id')}: bad distractor(s) {bad_d}")
+                    req.reject(["$.distractor_regions[*]  not in BRAIN_REGIONS"])
+                    continue
+                valid.append(q)
+            req.accept(len(valid))
+    except ValueError as e:          # incl. json.JSONDecodeError
+        print(f"ERROR: {e}")
         print(raw[:800])
         sys.exit(1)
 
-    # Validate
-    valid, skipped = [], []
-    for q in new_qs:
-        if q.get("target_region") not in BRAIN_REGIONS:
-            skipped.append(f"  SKIP {q.get('id')}: bad target '{q.get('target_region')}'")
-            continue
-        bad_d = [d for d in q.get("distractor_regions", []) if d not in BRAIN_REGIONS]
-        if bad_d:
-            skipped.append(f"  SKIP {q.get('id')}: bad distractor(s) {bad_d}")
-            continue
-        valid.append(q)
-
     for s in skipped: print(s)
     print(f"Valid: {len(valid)}/{len(new_qs)}")
+    # Hand back the unused tail of the reserved block
+    ids.settle(high_water((q.get("id") for q in valid), ids.pattern) or start_num - 1)
     if not valid:
         sys.exit(1)
 
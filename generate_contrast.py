@@ -19,6 +19,12 @@ Options:
 import json, pathlib, argparse, time, sys, os
 import anthropic
 
+from content_schema import SCHEMAS, assert_valid
+from coverage_plan import contrast_coverage, order_by_coverage
+from data_io import load_json, save_json
+from gen_metrics import Telemetry
+from id_alloc import IdAllocator
+
 DATA = pathlib.Path(__file__).parent / "data"
 
 DOMAIN_NAMES = {
@@ -134,6 +140,8 @@ DOMAIN_TOPICS = {
 }
 
 # ---------------------------------------------------------------------------
+MODEL = "claude-opus-4-6"
+
 SYSTEM_PROMPT = """You are an expert EPPP (Examination for Professional Practice in Psychology) content creator specializing in concept discrimination questions.
 
 You will be given two related psychology concepts (item_x and item_y) that EPPP candidates commonly confuse. Your task is to write a high-quality contrast question pair distinguishing them.
@@ -200,8 +208,7 @@ def load_existing(path: pathlib.Path) -> tuple[list, set]:
     existing_pair_set contains frozensets of (item_x.lower(), item_y.lower())."""
     if not path.exists():
         return [], set()
-    with open(path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(path)
     questions = data.get('questions', [])
     pairs = set()
     for q in questions:
@@ -209,22 +216,12 @@ def load_existing(path: pathlib.Path) -> tuple[list, set]:
     return questions, pairs
 
 
-def next_id(domain_code: str, questions: list) -> str:
-    """Generate the next sequential ID for a domain."""
-    prefix = f"{domain_code}_CONT_"
-    existing_nums = []
-    for q in questions:
-        qid = q.get('id', '')
-        if qid.startswith(prefix):
-            try:
-                existing_nums.append(int(qid[len(prefix):]))
-            except ValueError:
-                pass
-    n = max(existing_nums, default=0) + 1
-    return f"{prefix}{n:03d}"
+# Fields the model writes; ids, domain tags and item names are filled in here
+CONTRAST_RESULT = SCHEMAS["contrast"].subset(
+    "question", "answer", "key_distinction", "commonly_confused_because")
 
 
-def generate_one(client: anthropic.Anthropic, domain_code: str, domain_name: str,
+def generate_one(client: anthropic.Anthropic, tel: Telemetry, domain_code: str, domain_name: str,
                  item_x: str, item_y: str, subdomain: str,
                  retries: int = 3) -> dict | None:
     user_msg = (
@@ -236,21 +233,19 @@ def generate_one(client: anthropic.Anthropic, domain_code: str, domain_name: str
     )
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=1500,
-                system=SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": user_msg}],
-            )
-            result = extract_json(msg.content[0].text.strip())
-
-            # Validate required fields
-            for field in ('question', 'answer', 'key_distinction', 'commonly_confused_because'):
-                assert field in result and result[field].strip(), f"Missing or empty field: {field}"
-
-            # Validate key_distinction has semicolon separator (parser requirement)
-            assert ';' in result['key_distinction'], \
-                "key_distinction must contain ';' separator"
+            with tel.request(item=f"{item_x} vs {item_y}", attempt=attempt) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=1500,
+                    system=SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": user_msg}],
+                )
+                req.response(msg)
+                result = extract_json(msg.content[0].text.strip())
+
+                # Required fields, incl. the ';' the exercise splits key_distinction on
+                assert_valid(CONTRAST_RESULT, result)
+                req.accept()
 
             # Normalize item names to exactly what was requested
             result['item_x']    = item_x
@@ -295,6 +290,8 @@ def process_domain(client: anthropic.Anthropic, domain_code: str, target: int):
         if frozenset([x.lower(), y.lower()]) not in existing_pairs
     ]
 
+    # Thinnest subdomains first, so a partial run spreads over the gaps
+    todo = order_by_coverage(todo, lambda t: (t[2],), contrast_coverage(questions))
     needed = target - current
     todo = todo[:needed]
 
@@ -305,12 +302,15 @@ def process_domain(client: anthropic.Anthropic, domain_code: str, target: int):
     print(f"\n  {domain_code}: generating {len(todo)} new pairs "
           f"({current} existing, target {target})...")
 
+    ids = IdAllocator(f"contrast:{domain_code}", f"{domain_code}_CONT_{{n:03d}}",
+                      existing=(q.get('id') for q in questions))
+    tel = Telemetry("contrast", domain_code, MODEL, SYSTEM_PROMPT)
     errors = 0
     for i, (item_x, item_y, subdomain) in enumerate(todo, 1):
         print(f"    [{i}/{len(todo)}] {item_x} vs {item_y}...", end=' ', flush=True)
-        result = generate_one(client, domain_code, domain_name, item_x, item_y, subdomain)
+        result = generate_one(client, tel, domain_code, domain_name, item_x, item_y, subdomain)
         if result:
-            qid = next_id(domain_code, questions)
+            qid = ids.next()
             questions.append({
                 "id":                       qid,
                 "domain_code":              domain_code,
@@ -337,8 +337,7 @@ def process_domain(client: anthropic.Anthropic, domain_code: str, target: int):
         "total":         len(questions),
         "questions":     questions,
     }
-    with open(dst, 'w', encoding='utf-8') as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    save_json(dst, out)
 
     print(f"  -> {dst.name}: {len(questions)} pairs total ({errors} failures)")
 
@@ -26,6 +26,8 @@ from PIL import Image
 import trimesh
 import trimesh.visual
 
+from mesh_utils import sphere_to_uv, remove_seam_faces
+
 OUTPUT_DIR = Path("data/brain_meshes")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -57,14 +59,6 @@ print("[5/7] Computing UV coordinates from sphere surfaces...")
 lh_sph = nib.load(surf.sphere_left).darrays[0].data.astype(np.float32)
 rh_sph = nib.load(surf.sphere_right).darrays[0].data.astype(np.float32)
 
-def sphere_to_uv(sph):
-    """Equirectangular projection: sphere -> [0,1]²"""
-    r = np.linalg.norm(sph, axis=1, keepdims=True)
-    n = sph / np.maximum(r, 1e-9)
-    u = (np.arctan2(n[:, 1], n[:, 0]) + np.pi) / (2.0 * np.pi)
-    v = np.arccos(np.clip(n[:, 2], -1.0, 1.0)) / np.pi
-    return np.stack([u, v], axis=1).astype(np.float32)
-
 lh_uv_full = sphere_to_uv(lh_sph)   # u in [0,1]
 rh_uv_full = sphere_to_uv(rh_sph)   # u in [0,1]
 
@@ -72,16 +66,9 @@ rh_uv_full = sphere_to_uv(rh_sph)   # u in [0,1]
 lh_uv = lh_uv_full.copy();  lh_uv[:, 0] *= 0.5
 rh_uv = rh_uv_full.copy();  rh_uv[:, 0] = 0.5 + rh_uv_full[:, 0] * 0.5
 
-def remove_seam_faces(uv, faces):
-    """Drop triangles that straddle the u=0/1 wrap seam (back of head)."""
-    u0 = uv[faces[:, 0], 0]
-    u1 = uv[faces[:, 1], 0]
-    u2 = uv[faces[:, 2], 0]
-    span = np.maximum(np.maximum(u0, u1), u2) - np.minimum(np.minimum(u0, u1), u2)
-    return faces[span < 0.25]   # 0.25 = half of 0.5 (each hemi occupies 0.5 of total width)
-
-lh_faces_tex = remove_seam_faces(lh_uv, lh_faces)
-rh_faces_tex = remove_seam_faces(rh_uv, rh_faces)
+# 0.25 = half of 0.5 (each hemi occupies 0.5 of total width)
+lh_faces_tex = remove_seam_faces(lh_uv, lh_faces, wrap_threshold=0.25)
+rh_faces_tex = remove_seam_faces(rh_uv, rh_faces, wrap_threshold=0.25)
 print(f"    After seam removal: LH {len(lh_faces_tex):,}  RH {len(rh_faces_tex):,} tex-faces")
 
 # ── 5. Bake sulcal texture ────────────────────────────────────────────────────
@@ -15,14 +15,16 @@ Outputs:
 import sys, gc
 import numpy as np
 from pathlib import Path
-from scipy import ndimage
 import nibabel as nib
 import trimesh
 import trimesh.visual
 from trimesh.visual.material import PBRMaterial
-from skimage import measure
 from PIL import Image
 
+from mesh_utils import (COORD_OFFSET, sphere_to_uv_brainstem,
+                        sphere_to_uv_cerebellum, remove_seam_faces)
+from subcortical_surfaces import extract_surfaces
+
 OUTPUT_DIR = Path("data/brain_meshes")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -37,76 +39,12 @@ GYRI_COL  = np.array([221, 184, 152], dtype=np.float32)  # #DDB898 light gyri
 TEX_W, TEX_H = 1024, 512                                  # texture resolution
 
 
-# ── Coordinate transform (must match fix_hires_coords.py / generate_brain_meshes.py) ──
-# FreeSurfer RAS: x=right, y=anterior, z=superior
-# Three.js:       x=right, y=up(superior), z=toward-viewer(anterior)
-# -> out = [-x_fs, z_fs, y_fs] * COORD_SCALE + COORD_OFFSET
-COORD_SCALE  = 1.0 / 75.0
-COORD_OFFSET = np.array([0.118, -0.204, 0.438], dtype=np.float64)
-
-def to_threejs(coords):
-    """MNI/FreeSurfer RAS mm → Three.js world units (same as cortex + region overlays)."""
-    c = np.asarray(coords, dtype=np.float64)
-    x_out = -c[:, 0]   # negate: lateral(-x) → +x_3js
-    y_out =  c[:, 2]   # superior (z) → up (y_3js)
-    z_out =  c[:, 1]   # anterior (y) → depth (z_3js)
-    return (np.column_stack([x_out, y_out, z_out]) * COORD_SCALE + COORD_OFFSET).astype(np.float32)
-
 print("[1/3] Coordinate transform: [-x, z, y] * 1/75 + COORD_OFFSET")
 print(f"    COORD_OFFSET = {COORD_OFFSET}")
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
-def voxels_to_mesh(mask_3d, affine, step_size, sigma):
-    """Binary 3D mask → smoothed marching-cubes surface in Three.js coordinate space."""
-    smoothed = ndimage.gaussian_filter(mask_3d.astype(np.float32), sigma=sigma)
-    verts_v, faces, _, _ = measure.marching_cubes(smoothed, level=0.5,
-                                                   step_size=step_size)
-    ones     = np.ones((len(verts_v), 1), dtype=np.float32)
-    verts_mm = (affine @ np.hstack([verts_v.astype(np.float32), ones]).T).T[:, :3]
-    verts_3d = to_threejs(verts_mm)
-    faces    = faces.astype(np.int32)
-
-    # Fix face winding: ensure normals point outward (required for FrontSide rendering).
-    # The axis-swap in to_threejs can invert winding from marching cubes output.
-    centroid = verts_3d.mean(axis=0)
-    v0 = verts_3d[faces[:, 0]]
-    v1 = verts_3d[faces[:, 1]]
-    v2 = verts_3d[faces[:, 2]]
-    face_normals = np.cross(v1 - v0, v2 - v0)
-    face_centers = (v0 + v1 + v2) / 3.0
-    dots = np.sum(face_normals * (face_centers - centroid), axis=1)
-    inward = dots < 0
-    if inward.sum() > len(faces) // 2:
-        # Majority inward — flip all faces
-        faces = faces[:, ::-1]
-    elif inward.sum() > 0:
-        # Flip only inward-facing faces
-        faces[inward] = faces[inward][:, ::-1]
-
-    return verts_3d, faces
-
-
-def sphere_to_uv_brainstem(verts):
-    """
-    Spherical UV projection centred on the brainstem centroid.
-
-    u = azimuthal angle — seam placed posteriorly (hidden against spine)
-    v = elevation  0 = inferior (medulla), 1 = superior (midbrain)
-
-    v is used to drive the three-zone anatomical texture.
-    """
-    centroid = verts.mean(axis=0)
-    v_c = verts - centroid
-    r   = np.linalg.norm(v_c, axis=1, keepdims=True)
-    n   = v_c / np.maximum(r, 1e-9)
-    # seam at y < 0 (posterior midline, hidden against spine)
-    u = (np.arctan2(n[:, 0], -n[:, 1]) + np.pi) / (2.0 * np.pi)
-    v = (np.arcsin(np.clip(n[:, 2], -1.0, 1.0)) + np.pi / 2.0) / np.pi
-    return np.stack([u, v], axis=1).astype(np.float32), centroid
-
-
 def generate_brainstem_texture():
     """
     Procedural brainstem texture — three anatomical segments.
@@ -166,36 +104,6 @@ def generate_brainstem_texture():
     return rgb
 
 
-def sphere_to_uv_cerebellum(verts):
-    """
-    Spherical UV projection centred on the cerebellum's own centroid.
-
-    u = azimuthal angle in the x–y plane (circumferential, seam at y≈0, x<0)
-    v = elevation from bottom (z component) → folia run as horizontal bands
-
-    The seam is placed anteriorly so it faces the brainstem and is rarely seen.
-    """
-    centroid = verts.mean(axis=0)
-    v_c = verts - centroid
-    r   = np.linalg.norm(v_c, axis=1, keepdims=True)
-    n   = v_c / np.maximum(r, 1e-9)
-    # u: atan2(x, y) — seam where y < 0, x ≈ 0 (anterior midline)
-    u = (np.arctan2(n[:, 0], n[:, 1]) + np.pi) / (2.0 * np.pi)
-    # v: elevation — z component, z-up = top of cerebellum
-    v = (np.arcsin(np.clip(n[:, 2], -1.0, 1.0)) + np.pi / 2.0) / np.pi
-    return np.stack([u, v], axis=1).astype(np.float32), centroid
-
-
-def remove_seam_faces(uv, faces, wrap_threshold=0.35):
-    """Drop triangles that straddle the u=0/1 wrap seam."""
-    u0 = uv[faces[:, 0], 0]
-    u1 = uv[faces[:, 1], 0]
-    u2 = uv[faces[:, 2], 0]
-    span = (np.maximum(np.maximum(u0, u1), u2)
-            - np.minimum(np.minimum(u0, u1), u2))
-    return faces[span < wrap_threshold]
-
-
 def generate_folia_texture():
     """
     Procedural cerebellar folia texture.
@@ -263,18 +171,18 @@ else:
 
 # Brain-Stem = XML index 7 → atlas value 8 (1-indexed)
 BRAINSTEM_VAL = 8
-bs_mask = (ho_data == BRAINSTEM_VAL)
-print(f"    Brainstem: {bs_mask.sum():,} voxels  (atlas value {BRAINSTEM_VAL})")
+bs = extract_surfaces(ho_data, ho_img.affine, {"brainstem": [BRAINSTEM_VAL]},
+                      default_sigma=0.8)["brainstem"]
+print(f"    Brainstem: {bs['voxels']:,} voxels  (atlas value {BRAINSTEM_VAL})")
 
-if bs_mask.sum() < 100:
+if bs["voxels"] < 100 or bs["verts"] is None:
     print("    ERROR: brainstem mask empty.");  sys.exit(1)
 
-bs_verts, bs_faces = voxels_to_mesh(bs_mask, ho_img.affine,
-                                     step_size=1, sigma=0.8)
+bs_verts, bs_faces = bs["verts"], bs["faces"]
 
 # UV map + procedural texture (medulla / pons / midbrain zones)
 print("    Computing spherical UV map for brainstem...")
-bs_uv, bs_centroid = sphere_to_uv_brainstem(bs_verts)
+bs_uv, bs_centroid = sphere_to_uv_brainstem(bs_verts, up_axis=2, fwd_axis=1)
 print(f"    Centroid: {bs_centroid.round(3)}")
 bs_faces_tex = remove_seam_faces(bs_uv, bs_faces)
 print(f"    After seam removal: {len(bs_faces_tex):,} faces "
@@ -288,7 +196,7 @@ make_textured_glb(bs_verts, bs_faces_tex, bs_uv,
                   bs_rgb,
                   out_path=OUTPUT_DIR / "hires_brainstem.glb")
 
-del ho_data, bs_mask, ho_img, bs_verts, bs_faces, bs_faces_tex, bs_uv, bs_rgb
+del ho_data, bs, ho_img, bs_verts, bs_faces, bs_faces_tex, bs_uv, bs_rgb
 gc.collect()
 
 
@@ -329,23 +237,23 @@ for label, idx in zip(aal.labels, aal.indices):
 print(f"    Found {len(cereb_vals)} cerebellar label values "
       f"(range {min(cereb_vals)}..{max(cereb_vals)})")
 
-cb_mask = np.isin(aal_data.astype(np.int32), sorted(cereb_vals))
-print(f"    Cerebellum: {cb_mask.sum():,} voxels")
+# Low smoothing to preserve surface texture detail
+cb = extract_surfaces(aal_data, aal_img.affine, {"cerebellum": sorted(cereb_vals)},
+                      default_sigma=0.3)["cerebellum"]
+print(f"    Cerebellum: {cb['voxels']:,} voxels")
 
-if cb_mask.sum() < 100:
+if cb["voxels"] < 100 or cb["verts"] is None:
     print("    ERROR: cerebellum mask empty.");  sys.exit(1)
 
-# Low smoothing to preserve surface texture detail
-cb_verts, cb_faces = voxels_to_mesh(cb_mask, aal_img.affine,
-                                     step_size=1, sigma=0.3)
-del aal_data, cb_mask, aal_img
+cb_verts, cb_faces = cb["verts"], cb["faces"]
+del aal_data, cb, aal_img
 gc.collect()
 
 print(f"    Raw mesh: {len(cb_verts):,} verts, {len(cb_faces):,} faces")
 
 # UV mapping
 print("    Computing spherical UV map...")
-cb_uv, cb_centroid = sphere_to_uv_cerebellum(cb_verts)
+cb_uv, cb_centroid = sphere_to_uv_cerebellum(cb_verts, up_axis=2, fwd_axis=1)
 print(f"    Centroid: {cb_centroid.round(3)}")
 
 # Remove seam faces
@@ -13,11 +13,17 @@ Usage:
   python generate_l1_supplemental.py --target 15        # override per-domain target
 """
 
-import json, pathlib, argparse, time, random, sys, os, re
+import json, pathlib, argparse, time, random, sys, os
 from datetime import datetime, timezone
 from collections import defaultdict
 import anthropic
 
+from content_schema import QUESTION_TYPES, record_errors
+from coverage_plan import presentation_coverage
+from data_io import load_json, save_json
+from gen_metrics import Telemetry
+from id_alloc import IdAllocator, high_water
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 
 DATA   = pathlib.Path("data")
@@ -73,17 +79,6 @@ DOMAIN_SUBDOMAINS = {
              "Documentation and Record-Keeping","Telehealth Ethics","Supervision Ethics"],
 }
 
-AVATAR_EMOTIONS = [
-    "idle","speaking","flat_affect","distressed",
-    "tearful","anxious","agitated","guarded","hopeful","confused",
-]
-
-QUESTION_TYPES = [
-    "primary_diagnosis","differential_diagnosis","immediate_intervention",
-    "treatment_planning","risk_assessment","dsm_criteria",
-    "cultural_consideration","assessment_tool",
-]
-
 # Remap model-invented near-miss types to the nearest valid type
 TYPE_ALIASES = {
     "conceptual_knowledge":     "dsm_criteria",
@@ -102,11 +97,6 @@ TYPE_ALIASES = {
     "clinical_intervention":   "immediate_intervention",
 }
 
-CHART_CATEGORIES = [
-    "Chief Complaint","History of Present Illness","Mental Status Examination",
-    "Psychosocial History","Collateral / Context","Labs / Observations",
-]
-
 # ─── JQD Domain Mapping ────────────────────────────────────────────────────────
 # Maps mastery domain codes → JQD domain file codes to source anchor content
 
@@ -165,6 +155,8 @@ or medication mechanism knowledge.""",
 
 # ─── System Prompt ─────────────────────────────────────────────────────────────
 
+MODEL = "claude-opus-4-6"
+
 SYSTEM_PROMPT = """You are an expert EPPP (Examination for Professional Practice in Psychology) \
 content author. You generate Level 1 (Foundational) clinical patient encounter scenarios for an \
 interactive licensure exam preparation tool called "Patient Encounter."
@@ -278,7 +270,7 @@ def load_anchors(mastery_domain: str) -> dict[str, list[str]]:
         if not fpath.exists():
             print(f"  [anchor] WARNING: {fpath} not found — skipping")
             continue
-        data = json.load(open(fpath, encoding="utf-8"))
+        data = load_json(fpath)
         seen = set()
         for q in data.get("questions", []):
             summary = q.get("source_summary", "").strip()
@@ -355,59 +347,14 @@ def extract_json_array(text: str) -> list:
 
 
 def validate_encounter(enc: dict, domain_code: str) -> list[str]:
-    errors = []
-    for field in ("id","domain_code","subdomain","difficulty_level","encounter","questions"):
-        if field not in enc:
-            errors.append(f"Missing: {field}")
-    if errors: return errors
-
-    if not re.match(rf"^CP-{domain_code}-\d{{4}}$", enc.get("id","")):
-        errors.append(f"id format wrong: {enc.get('id')}")
+    # Normalize near-miss type names before validation
+    for q in enc.get("questions", []) if isinstance(enc.get("questions"), list) else []:
+        raw_type = q.get("type", "") if isinstance(q, dict) else ""
+        if raw_type not in QUESTION_TYPES and raw_type in TYPE_ALIASES:
+            q["type"] = TYPE_ALIASES[raw_type]
+    errors = record_errors("presentation", enc, {"domain_code": domain_code})
     if enc.get("difficulty_level") != 1:
         errors.append(f"difficulty_level must be 1, got {enc.get('difficulty_level')}")
-
-    enc_data = enc.get("encounter", {})
-    patient = enc_data.get("patient", {})
-    if patient.get("initial_avatar_state","") not in AVATAR_EMOTIONS:
-        errors.append(f"bad avatar state: {patient.get('initial_avatar_state')}")
-
-    phases = enc_data.get("phases", [])
-    if not isinstance(phases, list) or not (3 <= len(phases) <= 5):
-        errors.append(f"phases count must be 3-5, got {len(phases) if isinstance(phases,list) else '?'}")
-    else:
-        seen_ids = set()
-        for pi, phase in enumerate(phases):
-            pid = phase.get("phase_id","")
-            if pid in seen_ids: errors.append(f"duplicate phase_id {pid}")
-            seen_ids.add(pid)
-            if phase.get("avatar_emotion","") not in AVATAR_EMOTIONS:
-                errors.append(f"phase[{pi}] bad emotion: {phase.get('avatar_emotion')}")
-            reveals = phase.get("chart_reveals",[])
-            if not reveals: errors.append(f"phase[{pi}] empty chart_reveals")
-            for ri, rev in enumerate(reveals):
-                if rev.get("category","") not in CHART_CATEGORIES:
-                    errors.append(f"phase[{pi}].reveals[{ri}] bad category: {rev.get('category')}")
-
-    questions = enc.get("questions", [])
-    if not isinstance(questions, list) or not (1 <= len(questions) <= 2):
-        errors.append(f"questions count must be 1-2, got {len(questions) if isinstance(questions,list) else '?'}")
-    else:
-        for qi, q in enumerate(questions):
-            # Normalize near-miss type names before validation
-            raw_type = q.get("type", "")
-            if raw_type not in QUESTION_TYPES and raw_type in TYPE_ALIASES:
-                q["type"] = TYPE_ALIASES[raw_type]
-            if q.get("type","") not in QUESTION_TYPES:
-                errors.append(f"q[{qi}] bad type: {q.get('type')}")
-            opts = q.get("options",{})
-            if set(opts.keys()) != {"A","B","C","D"}:
-                errors.append(f"q[{qi}] options must have A,B,C,D")
-            ca = q.get("correct_answer","")
-            if ca not in ("A","B","C","D"):
-                errors.append(f"q[{qi}] correct_answer must be A-D, got {ca}")
-            dr = q.get("distractor_rationale",{})
-            if isinstance(dr,dict) and ca in dr:
-                errors.append(f"q[{qi}] distractor_rationale must not include correct answer {ca}")
     return errors
 
 
@@ -467,6 +414,7 @@ Return a JSON array of exactly {batch_size} encounter objects. No extra text."""
 
 def generate_batch(
     client: anthropic.Anthropic,
+    tel: Telemetry,
     domain_code: str,
     subdomains: list[str],
     anchors: dict,
@@ -484,26 +432,31 @@ def generate_batch(
 
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=16000,
-                system=SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            raw = msg.content[0].text.strip()
-            batch = extract_json_array(raw)
-
-            valid = []
-            for i, enc in enumerate(batch):
-                errs = validate_encounter(enc, domain_code)
-                if errs:
-                    print(f"\n    [enc {i+1}] INVALID: {'; '.join(errs[:3])}")
-                else:
-                    valid.append(enc)
-
-            if valid:
-                return valid
-            raise ValueError("No valid encounters after validation")
+            with tel.request(item=f"CP-{domain_code}-{start_id:04d}", attempt=attempt,
+                             batch=batch_size) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=16000,
+                    system=SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                req.response(msg)
+                raw = msg.content[0].text.strip()
+                batch = extract_json_array(raw)
+
+                valid = []
+                for i, enc in enumerate(batch):
+                    errs = validate_encounter(enc, domain_code)
+                    if errs:
+                        req.reject(errs)
+                        print(f"\n    [enc {i+1}] INVALID: {'; '.join(errs[:3])}")
+                    else:
+                        valid.append(enc)
+
+                if not valid:
+                    raise ValueError("No valid encounters after validation")
+                req.accept(len(valid))
+            return valid
 
         except (json.JSONDecodeError, ValueError) as e:
             print(f"\n    Parse error (attempt {attempt+1}): {e}")
@@ -525,7 +478,7 @@ def generate_batch(
 def load_existing(path: pathlib.Path) -> dict:
     if not path.exists():
         return {"encounters": []}
-    return json.load(open(path, encoding="utf-8"))
+    return load_json(path)
 
 
 def write_file(path: pathlib.Path, domain_code: str, encounters: list[dict]) -> None:
@@ -537,8 +490,7 @@ def write_file(path: pathlib.Path, domain_code: str, encounters: list[dict]) ->
         "total_encounters": len(encounters),
         "encounters": encounters,
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    save_json(path, out)
 
 
 def process_domain(
@@ -561,24 +513,20 @@ def process_domain(
 
     print(f"\n  {domain_code}: {len(current_l1)} L1 -> target {l1_target} (+{need} needed)")
 
-    # Next available ID
-    id_nums = [int(m.group(1)) for e in all_encounters
-               if (m := re.search(r"-(\d{4})$", e.get("id","")))]
-    next_id = max(id_nums, default=0) + 1
+    # Shared CP-{domain}-NNNN series (same one generate_presentations.py uses)
+    ids = IdAllocator(f"presentations:{domain_code}", f"CP-{domain_code}-{{n:04d}}",
+                      existing=(e.get("id") for e in all_encounters))
     existing_ids = {e["id"] for e in all_encounters}
 
     # Load anchor summaries from JQD
     anchors = load_anchors(domain_code)
     print(f"    Loaded {len(anchors.get('_all',[]))} unique anchor summaries from JQD")
 
-    subdomains = DOMAIN_SUBDOMAINS[domain_code]
-    subdomain_idx = 0
-    emotion_pool = list(AVATAR_EMOTIONS)
-    qtype_pool = list(QUESTION_TYPES)
-    random.shuffle(emotion_pool)
-    random.shuffle(qtype_pool)
-    emotion_idx = 0; qtype_idx = 0
+    # Level-1 coverage only: the thinnest subdomains at difficulty 1 go first
+    plan = presentation_coverage(all_encounters, subdomains=DOMAIN_SUBDOMAINS[domain_code],
+                                 levels=(1,))
 
+    tel = Telemetry("presentations:L1", domain_code, MODEL, SYSTEM_PROMPT)
     batch_size = 3
     batches_needed = (need + batch_size - 1) // batch_size
     total_new = 0
@@ -588,31 +536,18 @@ def process_domain(
         this_batch = min(batch_size, remaining)
         if this_batch <= 0: break
 
-        batch_subdomains = [
-            subdomains[subdomain_idx % len(subdomains)],
-            subdomains[(subdomain_idx + 1) % len(subdomains)],
-        ]
-        subdomain_idx += 2
-
-        batch_emotions = [
-            emotion_pool[emotion_idx % len(emotion_pool)],
-            emotion_pool[(emotion_idx + 1) % len(emotion_pool)],
-        ]
-        emotion_idx += 2
-
-        batch_qtypes = [
-            qtype_pool[qtype_idx % len(qtype_pool)],
-            qtype_pool[(qtype_idx + 1) % len(qtype_pool)],
-        ]
-        qtype_idx += 2
+        batch_subdomains = [sub for sub, _ in plan["cells"].take(2, distinct=lambda c: c[0])]
+        batch_emotions = plan["emotions"].take(2)
+        batch_qtypes = plan["qtypes"].take(2)
 
+        block = ids.reserve(this_batch)
         print(f"    Batch {batch_num+1}/{batches_needed}: "
-              f"subdomains={batch_subdomains}, id_start={next_id}...",
+              f"subdomains={batch_subdomains}, id_start={block.start}...",
               end=" ", flush=True)
 
         result = generate_batch(
-            client, domain_code, batch_subdomains, anchors,
-            batch_emotions, batch_qtypes, next_id, this_batch,
+            client, tel, domain_code, batch_subdomains, anchors,
+            batch_emotions, batch_qtypes, block.start, this_batch,
         )
 
         if result:
@@ -621,7 +556,8 @@ def process_domain(
                 if enc["id"] not in existing_ids:
                     existing_ids.add(enc["id"])
                     new_encs.append(enc)
-                    next_id = max(next_id, int(enc["id"].split("-")[-1]) + 1)
+            kept = high_water((e["id"] for e in new_encs), ids.pattern)
+            ids.settle(max(kept, block.start - 1) if not preview else block.start - 1)
             all_encounters.extend(new_encs)
             total_new += len(new_encs)
             print(f"OK ({len(new_encs)} valid)")
@@ -634,6 +570,7 @@ def process_domain(
 
             write_file(dst, domain_code, all_encounters)
         else:
+            ids.settle(block.start - 1)
             print("FAILED")
 
         time.sleep(1.0)
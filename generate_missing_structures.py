@@ -17,22 +17,11 @@ import numpy as np
 from pathlib import Path
 import trimesh
 
+from mesh_utils import to_threejs
+
 OUTPUT_DIR = Path("data/brain_meshes")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# ── Coordinate transform (same as generate_hires_subcortical.py) ──
-COORD_SCALE  = 1.0 / 75.0
-COORD_OFFSET = np.array([0.118, -0.204, 0.438], dtype=np.float64)
-
-def to_threejs(coords):
-    """MNI/FreeSurfer RAS mm -> Three.js world units."""
-    c = np.asarray(coords, dtype=np.float64)
-    x_out = -c[:, 0]
-    y_out =  c[:, 2]
-    z_out =  c[:, 1]
-    return (np.column_stack([x_out, y_out, z_out]) * COORD_SCALE + COORD_OFFSET).astype(np.float32)
-
-
 def make_ellipsoid(center_mni, radii_mm, subdivisions=3):
     """Create an ellipsoid mesh at MNI coordinates with given radii.
     Returns a trimesh in Three.js coordinate space."""
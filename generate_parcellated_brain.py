@@ -24,10 +24,23 @@ OUTPUTS (all in data/brain_meshes/):
 
   brainstem + cerebellum: generated separately (JSON meshes)
 
+  Each cortical/subcortical region also gets coarser {region}_lod1.glb and
+  {region}_lod2.glb levels (see mesh_lod.py), listed under "lods" in the manifest.
+  Every region/LOD GLB is Draco-compressed (see compress_meshes.py).
+
   brain_regions_manifest.json — metadata for brain-3d-v3.js
 
+  vertex_labels/ — cached per-vertex atlas labels (see vertex_labels.py);
+  delete to force relabeling
+
+  cortex_regions.json + full_brain_*.regions.bin — per-face region IDs for
+  the cortex GLBs, used for picking (see cortex_regions.py)
+
+  *.bvh.bin — precomputed raycast BVH per GLB (see mesh_bvh.py)
+
 USAGE:
-  pip install nibabel nilearn trimesh numpy scipy scikit-image fast_simplification
+  npm install                       # gltf-transform, for Draco compression
+  pip install nibabel nilearn trimesh numpy scipy scikit-image fast_simplification DracoPy
   python generate_parcellated_brain.py
 """
 
@@ -42,8 +55,6 @@ print("=" * 60)
 
 print("\n[0] Importing libraries...")
 import nibabel as nib
-from scipy import ndimage
-from skimage import measure
 import trimesh
 
 # SSL workaround for Windows
@@ -57,6 +68,9 @@ _req.Session.send = _patched_send
 warnings.filterwarnings('ignore', message='.*Unverified.*')
 
 from nilearn import datasets
+from mesh_lod import export_lod_chain
+from subcortical_surfaces import extract_surfaces
+from vertex_labels import LabelCache, load_ho_atlas
 
 OUTPUT_DIR = Path("data/brain_meshes")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
@@ -77,97 +91,15 @@ TRANSFORM_JSON = OUTPUT_DIR / "cortex_transform.json"
 # HO CORTICAL ATLAS → EPPP REGION MAPPING
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# Harvard-Oxford cortical label indices → our EPPP region IDs
-# Each key is our region ID; each value is a list of HO cortical label indices
-HO_TO_REGION = {
-    "frontal_lobe": [
-        1,   # Frontal Pole
-        3,   # Superior Frontal Gyrus
-        4,   # Middle Frontal Gyrus
-        5,   # IFG pars triangularis
-        6,   # IFG pars opercularis
-        7,   # Precentral Gyrus
-        25,  # Frontal Medial Cortex
-        26,  # Juxtapositional Lobule (SMA)
-        33,  # Frontal Orbital Cortex
-        41,  # Frontal Opercular Cortex
-    ],
-    "prefrontal_cortex": [
-        1,   # Frontal Pole
-        3,   # Superior Frontal Gyrus
-        4,   # Middle Frontal Gyrus
-        33,  # Frontal Orbital Cortex
-    ],
-    "brocas_area": [
-        5,   # IFG pars triangularis
-        6,   # IFG pars opercularis
-    ],
-    "motor_cortex": [
-        7,   # Precentral Gyrus
-        26,  # Juxtapositional Lobule (SMA)
-    ],
-    "somatosensory_cortex": [
-        17,  # Postcentral Gyrus
-    ],
-    "parietal_lobe": [
-        17,  # Postcentral Gyrus
-        18,  # Superior Parietal Lobule
-        19,  # Supramarginal Gyrus ant
-        20,  # Supramarginal Gyrus post
-        21,  # Angular Gyrus
-        31,  # Precuneous Cortex
-    ],
-    "temporal_lobe": [
-        8,   # Temporal Pole
-        9,   # STG anterior
-        10,  # STG posterior
-        11,  # MTG anterior
-        12,  # MTG posterior
-        13,  # MTG temporooccipital
-        14,  # ITG anterior
-        15,  # ITG posterior
-        16,  # ITG temporooccipital
-        34,  # Parahippocampal ant
-        35,  # Parahippocampal post
-        37,  # Temporal Fusiform ant
-        38,  # Temporal Fusiform post
-        44,  # Planum Polare
-        45,  # Heschl's Gyrus
-        46,  # Planum Temporale
-    ],
-    "wernickes_area": [
-        10,  # STG posterior
-        46,  # Planum Temporale
-    ],
-    "occipital_lobe": [
-        22,  # Lateral Occipital sup
-        23,  # Lateral Occipital inf
-        24,  # Intracalcarine Cortex
-        32,  # Cuneal Cortex
-        36,  # Lingual Gyrus
-        39,  # Temporal Occipital Fusiform
-        40,  # Occipital Fusiform
-        47,  # Supracalcarine Cortex
-        48,  # Occipital Pole
-    ],
-    "cingulate_gyrus": [
-        28,  # Paracingulate Gyrus
-        29,  # Cingulate ant
-        30,  # Cingulate post
-        27,  # Subcallosal Cortex
-    ],
-    "medial_frontal": [
-        25,  # Frontal Medial Cortex
-        1,   # Frontal Pole
-    ],
-    "insula": [
-        2,   # Insular Cortex
-        42,  # Central Opercular Cortex
-    ],
-}
-
-# Broca's and Wernicke's: left-hemisphere only
-LH_ONLY_REGIONS = {"brocas_area", "wernickes_area"}
+# Harvard-Oxford cortical label indices → our EPPP region IDs, and the
+# left-hemisphere-only regions (Broca's, Wernicke's) — shared with the
+# per-face picking buffers baked by cortex_regions.py
+from cortex_regions import HO_TO_REGION, LH_ONLY_REGIONS, bake as bake_face_regions, vertex_regions
+from data_io import save_json
+from mesh_bvh import bake_all as bake_bvh_sidecars
+from compress_meshes import compress_manifest
+from scene_pack import build_pack as build_scene_pack
+from mesh_audit import audit as audit_meshes
 
 # Harvard-Oxford subcortical atlas label values for marching cubes
 HO_SUBCORTICAL = {
@@ -210,29 +142,6 @@ def export_region_glb(verts, faces, out_path, color=None):
     return out_path.stat().st_size
 
 
-def voxel_label_for_vertices(verts_mni, atlas_data, atlas_affine):
-    """
-    For each surface vertex (in MNI mm), find the atlas voxel label.
-    Uses nearest-neighbor lookup in the volumetric atlas.
-    """
-    # MNI mm → voxel indices via inverse affine
-    inv_affine = np.linalg.inv(atlas_affine)
-    ones = np.ones((len(verts_mni), 1), dtype=np.float64)
-    coords_h = np.hstack([verts_mni.astype(np.float64), ones])
-    vox_coords = (inv_affine @ coords_h.T).T[:, :3]
-
-    # Round to nearest voxel
-    vox_ijk = np.round(vox_coords).astype(np.int32)
-
-    # Clamp to volume bounds
-    for dim in range(3):
-        vox_ijk[:, dim] = np.clip(vox_ijk[:, dim], 0, atlas_data.shape[dim] - 1)
-
-    # Look up labels
-    labels = atlas_data[vox_ijk[:, 0], vox_ijk[:, 1], vox_ijk[:, 2]]
-    return labels.astype(np.int32)
-
-
 # ═══════════════════════════════════════════════════════════════════════════════
 # STEP 1: Load fsaverage7 surfaces
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -279,18 +188,15 @@ rh_verts_mesh = ((rh_verts_mni - centre) * scale).astype(np.float32)
 # STEP 3: Label surface vertices from HO cortical atlas
 # ═══════════════════════════════════════════════════════════════════════════════
 
-print("\n[3/7] Loading Harvard-Oxford cortical atlas and labeling vertices...")
-ho_cort = datasets.fetch_atlas_harvard_oxford("cort-maxprob-thr25-1mm")
-ho_cort_img = nib.load(ho_cort.maps) if isinstance(ho_cort.maps, (str, bytes)) else ho_cort.maps
-if not hasattr(ho_cort_img, 'get_fdata'):
-    ho_cort_img = nib.load(str(ho_cort.maps))
-ho_cort_data = ho_cort_img.get_fdata(dtype=np.float32)
-
-print(f"  Atlas shape: {ho_cort_data.shape}, {len(ho_cort.labels)} labels")
+print("\n[3/7] Labeling surface vertices from Harvard-Oxford cortical atlas...")
 print(f"  Projecting labels onto {len(lh_verts_mni) + len(rh_verts_mni):,} surface vertices...")
 
-lh_labels = voxel_label_for_vertices(lh_verts_mni, ho_cort_data, ho_cort_img.affine)
-rh_labels = voxel_label_for_vertices(rh_verts_mni, ho_cort_data, ho_cort_img.affine)
+# Nearest-voxel labels, cached as memmapped .npy under data/brain_meshes/vertex_labels/
+# — the NIfTI volume is only loaded when the cache is missing or stale.
+label_cache = LabelCache()
+ho_cort_loader = {"ho_cort": load_ho_atlas("cort-maxprob-thr25-1mm")}
+lh_labels = label_cache.labels("fsaverage7_lh", lh_verts_mni, ho_cort_loader)["ho_cort"]
+rh_labels = label_cache.labels("fsaverage7_rh", rh_verts_mni, ho_cort_loader)["ho_cort"]
 
 # Count labeled vertices
 lh_labeled = np.sum(lh_labels > 0)
@@ -298,9 +204,6 @@ rh_labeled = np.sum(rh_labels > 0)
 print(f"  LH: {lh_labeled:,}/{len(lh_labels):,} vertices labeled ({100*lh_labeled/len(lh_labels):.1f}%)")
 print(f"  RH: {rh_labeled:,}/{len(rh_labels):,} vertices labeled ({100*rh_labeled/len(rh_labels):.1f}%)")
 
-del ho_cort_data, ho_cort_img
-gc.collect()
-
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # STEP 4: Extract cortical regions
@@ -363,7 +266,8 @@ for region_id, ho_indices in HO_TO_REGION.items():
     merged_v, merged_f = decimate_if_needed(merged_v, merged_f, MAX_FACES)
 
     out_path = OUTPUT_DIR / f"{region_id}.glb"
-    sz = export_region_glb(merged_v, merged_f, out_path)
+    lods = export_lod_chain(region_id, merged_v, merged_f, OUTPUT_DIR, export_region_glb)
+    sz = out_path.stat().st_size
 
     # Compute bounds
     bmin = merged_v.min(axis=0).tolist()
@@ -375,6 +279,7 @@ for region_id, ho_indices in HO_TO_REGION.items():
         "vertexCount": len(merged_v),
         "faceCount": len(merged_f),
         "bounds": {"min": bmin, "max": bmax},
+        "lods": lods,
     }
     print(f"  {region_id}: {len(merged_v):,} verts, {len(merged_f):,} faces ({sz/1e3:.0f} KB)")
 
@@ -420,48 +325,36 @@ ho_sub_data = ho_sub_img.get_fdata(dtype=np.float32)
 print(f"  Subcortical atlas: {ho_sub_data.shape}")
 print(f"  Labels: {ho_sub.labels[:10]}...")
 
-for region_id, label_vals in HO_SUBCORTICAL.items():
-    mask = np.zeros_like(ho_sub_data, dtype=bool)
-    for lv in label_vals:
-        mask |= (ho_sub_data == lv)
-    nvox = mask.sum()
+# One bbox pass, then every structure meshed from its own crop in parallel
+sub_meshes = extract_surfaces(ho_sub_data, ho_sub_img.affine, HO_SUBCORTICAL,
+                              default_sigma=0.5,
+                              transform=lambda mm: (mm - centre) * scale)  # Transform B
+
+for region_id, sub in sub_meshes.items():
+    nvox = sub["voxels"]
 
-    if nvox < 50:
+    if nvox < 50 and "error" not in sub:
         print(f"  {region_id}: {nvox} voxels — too few, skipping")
         continue
 
     try:
-        smoothed = ndimage.gaussian_filter(mask.astype(np.float32), sigma=0.5)
-        verts_v, faces_mc, _, _ = measure.marching_cubes(smoothed, level=0.5, step_size=1)
-        ones = np.ones((len(verts_v), 1), dtype=np.float32)
-        verts_mm = (ho_sub_img.affine @ np.hstack([verts_v.astype(np.float32), ones]).T).T[:, :3]
-        # Transform B: same as cortex
-        verts_ms = ((verts_mm - centre) * scale).astype(np.float32)
-        faces_mc = faces_mc.astype(np.int32)
-
-        # Fix face winding
-        centroid = verts_ms.mean(axis=0)
-        v0, v1, v2 = verts_ms[faces_mc[:, 0]], verts_ms[faces_mc[:, 1]], verts_ms[faces_mc[:, 2]]
-        fn = np.cross(v1 - v0, v2 - v0)
-        fc = (v0 + v1 + v2) / 3.0
-        dots = np.sum(fn * (fc - centroid), axis=1)
-        inward = dots < 0
-        if inward.sum() > len(faces_mc) // 2:
-            faces_mc = faces_mc[:, ::-1]
-        elif inward.sum() > 0:
-            faces_mc[inward] = faces_mc[inward][:, ::-1]
+        if "error" in sub:
+            raise RuntimeError(sub["error"])
+        verts_ms, faces_mc = sub["verts"], sub["faces"]
 
         # Decimate
         verts_ms, faces_mc = decimate_if_needed(verts_ms, faces_mc, MAX_FACES)
 
         out_path = OUTPUT_DIR / f"{region_id}.glb"
-        sz = export_region_glb(verts_ms, faces_mc, out_path)
+        lods = export_lod_chain(region_id, verts_ms, faces_mc, OUTPUT_DIR, export_region_glb)
+        sz = out_path.stat().st_size
 
         manifest[region_id] = {
             "file": f"data/brain_meshes/{region_id}.glb",
             "type": "subcortical",
             "vertexCount": len(verts_ms),
             "faceCount": len(faces_mc),
+            "lods": lods,
         }
         print(f"  {region_id}: {len(verts_ms):,} verts, {len(faces_mc):,} faces "
               f"({nvox:,} vox, {sz/1e3:.0f} KB)")
@@ -477,7 +370,7 @@ for region_id, label_vals in HO_SUBCORTICAL.items():
             }
             print(f"    Preserved existing: {region_id}.glb")
 
-del ho_sub_data, ho_sub_img
+del ho_sub_data, ho_sub_img, sub_meshes
 gc.collect()
 
 
@@ -497,9 +390,30 @@ for rid, fname in [("brainstem", "hires_brainstem.glb"), ("cerebellum", "hires_c
         print(f"  {rid}: {p.stat().st_size/1e3:.0f} KB")
 
 manifest_path = OUTPUT_DIR.parent / "brain_regions_manifest.json"
-manifest_path.write_text(json.dumps(manifest, indent=2))
+save_json(manifest_path, manifest)
 print(f"\n  Manifest: {manifest_path} ({len(manifest)} regions)")
 
+# Draco-compress every region/LOD GLB — before the sidecars and the pack read
+# them back, since Draco reorders vertices
+print("\n  Compressing region meshes...")
+compress_manifest(manifest)
+
+# Per-face region IDs for the cortex GLBs → exact O(1) picking in brain-3d-v3.js
+print("\n  Baking cortex face → region buffers...")
+try:
+    bake_face_regions(np.vstack([lh_verts_mesh, rh_verts_mesh]),
+                      vertex_regions(lh_labels, rh_labels))
+except ImportError as e:
+    print(f"    Skipped ({e}) — pip install DracoPy, then run: python cortex_regions.py")
+
+# Raycast BVHs for the cortex + every region/LOD GLB (stale ones only)
+print("\n  Building BVH sidecars...")
+bake_bvh_sidecars()
+
+# Every region overlay in one range-indexed binary (one startup request)
+print("\n  Packing region meshes...")
+build_scene_pack(manifest_path)
+
 # Restore SSL
 ssl._create_default_https_context = ssl._create_default_https_context
 _req.Session.send = _orig_send
@@ -511,3 +425,11 @@ for rid, entry in sorted(manifest.items()):
     f = entry.get("faceCount", "?")
     print(f"  {rid:30s} {entry['type']:12s} {str(v):>6} verts  {str(f):>6} faces")
 print("=" * 60)
+
+# Size / topology budget (data/brain_meshes/mesh_budget.json)
+_, budget_failures = audit_meshes()
+if budget_failures:
+    print(f"\n  MESH BUDGET FAILURES ({len(budget_failures)}) — see python mesh_audit.py:")
+    for f in budget_failures:
+        print(f"    ✗ {f}")
+    sys.exit(1)
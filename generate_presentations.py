@@ -9,12 +9,23 @@ Usage:
   python generate_presentations.py --all --count 30 --resume
   python generate_presentations.py --domain CPAT --preview
   python generate_presentations.py --domain CPAT --count 30 --resume
+  python generate_presentations.py --domain CPAT --count 30 --batch-size 4
+
+Per-request latency, tokens and rejections go to data/gen_metrics.jsonl;
+`python gen_metrics.py summary --by batch --script generate_presentations`
+compares batch sizes.
 """
 
-import json, pathlib, argparse, time, random, sys, os, re
+import json, pathlib, argparse, time, sys, os
 from datetime import datetime, timezone
 import anthropic
 
+from content_schema import AVATAR_EMOTIONS, QUESTION_TYPES, record_errors
+from coverage_plan import presentation_coverage
+from data_io import iter_records, load_json, save_json
+from gen_metrics import Telemetry
+from id_alloc import IdAllocator, high_water
+
 # ─── Paths ────────────────────────────────────────────────────────────────────
 
 DATA = pathlib.Path("data")
@@ -134,30 +145,7 @@ DOMAIN_SUBDOMAINS = {
     ],
 }
 
-AVATAR_EMOTIONS = [
-    "idle", "speaking", "flat_affect", "distressed",
-    "tearful", "anxious", "agitated", "guarded", "hopeful", "confused",
-]
-
-QUESTION_TYPES = [
-    "primary_diagnosis",
-    "differential_diagnosis",
-    "immediate_intervention",
-    "treatment_planning",
-    "risk_assessment",
-    "dsm_criteria",
-    "cultural_consideration",
-    "assessment_tool",
-]
-
-CHART_CATEGORIES = [
-    "Chief Complaint",
-    "History of Present Illness",
-    "Mental Status Examination",
-    "Psychosocial History",
-    "Collateral / Context",
-    "Labs / Observations",
-]
+# AVATAR_EMOTIONS / QUESTION_TYPES / CHART_CATEGORIES live in content_schema.py
 
 ENCOUNTER_SETTINGS = [
     "Outpatient mental health clinic",
@@ -176,6 +164,8 @@ ENCOUNTER_SETTINGS = [
 
 # ─── System Prompt ─────────────────────────────────────────────────────────────
 
+MODEL = "claude-opus-4-6"
+
 SYSTEM_PROMPT = """You are an expert EPPP (Examination for Professional Practice in Psychology) \
 content author. You generate clinical patient encounter scenarios for an interactive \
 licensure exam preparation tool called "Patient Encounter."
@@ -336,106 +326,7 @@ def extract_json_array(text: str) -> list:
 
 def validate_encounter(enc: dict, domain_code: str) -> list[str]:
     """Validate an encounter object. Returns list of error strings (empty = valid)."""
-    errors = []
-
-    # Top-level required fields
-    for field in ("id", "domain_code", "subdomain", "difficulty_level", "encounter", "questions"):
-        if field not in enc:
-            errors.append(f"Missing top-level field: {field}")
-
-    if errors:
-        return errors  # can't validate further without structure
-
-    # ID format
-    id_pattern = rf"^CP-{domain_code}-\d{{4}}$"
-    if not re.match(id_pattern, enc.get("id", "")):
-        errors.append(f"id '{enc.get('id')}' does not match pattern CP-{domain_code}-NNNN")
-
-    # difficulty_level
-    dl = enc.get("difficulty_level")
-    if not isinstance(dl, int) or not (1 <= dl <= 4):
-        errors.append(f"difficulty_level must be int 1–4, got: {dl!r}")
-
-    # encounter structure
-    enc_data = enc.get("encounter", {})
-    if not isinstance(enc_data, dict):
-        errors.append("encounter must be a dict")
-        return errors
-
-    for field in ("setting", "patient", "phases"):
-        if field not in enc_data:
-            errors.append(f"encounter missing field: {field}")
-
-    # patient
-    patient = enc_data.get("patient", {})
-    init_state = patient.get("initial_avatar_state", "")
-    if init_state not in AVATAR_EMOTIONS:
-        errors.append(f"patient.initial_avatar_state '{init_state}' not in allowed list")
-
-    # phases
-    phases = enc_data.get("phases", [])
-    if not isinstance(phases, list) or not (3 <= len(phases) <= 5):
-        errors.append(f"phases must be a list of 3–5 items, got: {len(phases) if isinstance(phases, list) else type(phases)}")
-    else:
-        seen_phase_ids = set()
-        for pi, phase in enumerate(phases):
-            if not isinstance(phase, dict):
-                errors.append(f"phase[{pi}] is not a dict")
-                continue
-            for pf in ("phase_id", "phase_label", "dialogue", "avatar_emotion", "chart_reveals"):
-                if pf not in phase:
-                    errors.append(f"phase[{pi}] missing field: {pf}")
-
-            pid = phase.get("phase_id", "")
-            if pid in seen_phase_ids:
-                errors.append(f"Duplicate phase_id '{pid}'")
-            seen_phase_ids.add(pid)
-
-            emotion = phase.get("avatar_emotion", "")
-            if emotion not in AVATAR_EMOTIONS:
-                errors.append(f"phase[{pi}].avatar_emotion '{emotion}' not in allowed list")
-
-            reveals = phase.get("chart_reveals", [])
-            if not isinstance(reveals, list) or len(reveals) == 0:
-                errors.append(f"phase[{pi}].chart_reveals must be non-empty list")
-            else:
-                for ri, rev in enumerate(reveals):
-                    cat = rev.get("category", "")
-                    if cat not in CHART_CATEGORIES:
-                        errors.append(f"phase[{pi}].chart_reveals[{ri}].category '{cat}' not in allowed list")
-
-    # questions
-    questions = enc.get("questions", [])
-    if not isinstance(questions, list) or not (1 <= len(questions) <= 2):
-        errors.append(f"questions must be list of 1–2 items, got: {len(questions) if isinstance(questions, list) else type(questions)}")
-    else:
-        for qi, q in enumerate(questions):
-            if not isinstance(q, dict):
-                errors.append(f"questions[{qi}] is not a dict")
-                continue
-            for qf in ("question_id", "type", "prompt", "options", "correct_answer", "explanation"):
-                if qf not in q:
-                    errors.append(f"questions[{qi}] missing field: {qf}")
-
-            qtype = q.get("type", "")
-            if qtype not in QUESTION_TYPES:
-                errors.append(f"questions[{qi}].type '{qtype}' not in allowed list")
-
-            opts = q.get("options", {})
-            if not isinstance(opts, dict) or set(opts.keys()) != {"A", "B", "C", "D"}:
-                errors.append(f"questions[{qi}].options must have exactly keys A,B,C,D")
-
-            ca = q.get("correct_answer", "")
-            if ca not in ("A", "B", "C", "D"):
-                errors.append(f"questions[{qi}].correct_answer '{ca}' must be A/B/C/D")
-            elif isinstance(opts, dict) and ca not in opts:
-                errors.append(f"questions[{qi}].correct_answer '{ca}' not in options")
-
-            dr = q.get("distractor_rationale", {})
-            if isinstance(dr, dict) and ca in dr:
-                errors.append(f"questions[{qi}].distractor_rationale must NOT include correct_answer '{ca}'")
-
-    return errors
+    return record_errors("presentation", enc, {"domain_code": domain_code})
 
 
 def build_batch_prompt(
@@ -540,6 +431,7 @@ mechanisms and clinical indications, recognizing adverse effects.""",
 
 def generate_batch(
     client: anthropic.Anthropic,
+    tel: Telemetry,
     domain_code: str,
     subdomains: list[str],
     difficulty_levels: list[int],
@@ -557,32 +449,36 @@ def generate_batch(
 
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=16000,
-                system=SYSTEM_PROMPT,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            raw = msg.content[0].text.strip()
-
-            batch = extract_json_array(raw)
-
-            if not isinstance(batch, list):
-                raise ValueError(f"Expected JSON array, got {type(batch)}")
-
-            # Validate each encounter; keep valid ones
-            valid = []
-            for i, enc in enumerate(batch):
-                errs = validate_encounter(enc, domain_code)
-                if errs:
-                    print(f"    [enc {i+1}] INVALID: {'; '.join(errs[:3])}")
-                else:
-                    valid.append(enc)
-
-            if valid:
-                return valid
-            else:
-                raise ValueError("No valid encounters in batch after validation")
+            with tel.request(item=f"CP-{domain_code}-{start_id:04d}", attempt=attempt,
+                             batch=batch_size) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=16000,
+                    system=SYSTEM_PROMPT,
+                    messages=[{"role": "user", "content": prompt}],
+                )
+                req.response(msg)
+                raw = msg.content[0].text.strip()
+
+                batch = extract_json_array(raw)
+
+                if not isinstance(batch, list):
+                    raise ValueError(f"Expected JSON array, got {type(batch)}")
+
+                # Validate each encounter; keep valid ones
+                valid = []
+                for i, enc in enumerate(batch):
+                    errs = validate_encounter(enc, domain_code)
+                    if errs:
+                        req.reject(errs)
+                        print(f"    [enc {i+1}] INVALID: {'; '.join(errs[:3])}")
+                    else:
+                        valid.append(enc)
+
+                if not valid:
+                    raise ValueError("No valid encounters in batch after validation")
+                req.accept(len(valid))
+            return valid
 
         except (json.JSONDecodeError, ValueError) as e:
             print(f"    Parse/validation error (attempt {attempt+1}): {e}")
@@ -610,8 +506,7 @@ def load_existing_file(path: pathlib.Path) -> dict:
     """Load existing output file. Returns full file dict with encounters list."""
     if not path.exists():
         return {"encounters": []}
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return load_json(path)
 
 
 def write_file(path: pathlib.Path, domain_code: str, encounters: list[dict]) -> None:
@@ -624,18 +519,24 @@ def write_file(path: pathlib.Path, domain_code: str, encounters: list[dict]) ->
         "total_encounters": len(encounters),
         "encounters": encounters,
     }
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    save_json(path, out)
 
 
 # ─── Domain Processing ────────────────────────────────────────────────────────
 
+def presentation_ids(domain_code: str, encounters) -> IdAllocator:
+    """CP-{domain}-NNNN allocator; existing IDs are scanned once."""
+    return IdAllocator(f"presentations:{domain_code}", f"CP-{domain_code}-{{n:04d}}",
+                       existing=(e.get("id") for e in encounters))
+
+
 def process_domain(
     client: anthropic.Anthropic,
     domain_code: str,
     target_count: int,
     resume: bool,
     preview: bool = False,
+    batch_size: int = 3,
 ) -> None:
     dst = DATA / f"{domain_code}_presentations.json"
     existing_data = load_existing_file(dst)
@@ -649,31 +550,19 @@ def process_domain(
         if need == 0:
             print(f"  {domain_code}: already have {already_have}/{target_count} — nothing to do")
             return
-        # Calculate next ID number from existing
-        id_nums = []
-        for e in encounters:
-            m = re.search(r"-(\d{4})$", e.get("id", ""))
-            if m:
-                id_nums.append(int(m.group(1)))
-        next_id = max(id_nums, default=0) + 1
+        ids = presentation_ids(domain_code, encounters)
     else:
         encounters = []
         existing_ids = set()
         need = target_count
-        next_id = 1
+        ids = presentation_ids(domain_code, ())
+        ids.reset()   # fresh run replaces the file; numbering restarts at 1
 
-    subdomains = DOMAIN_SUBDOMAINS[domain_code]
-    subdomain_idx = 0  # cycles through subdomains across batches
+    # Work goes to the thinnest (subdomain, difficulty) cells and the least-used
+    # emotions / question types in what already exists
+    plan = presentation_coverage(encounters, subdomains=DOMAIN_SUBDOMAINS[domain_code])
 
-    # Emotion and question type cycling for variety
-    emotion_pool = list(AVATAR_EMOTIONS)
-    qtype_pool = list(QUESTION_TYPES)
-    random.shuffle(emotion_pool)
-    random.shuffle(qtype_pool)
-    emotion_cycle_idx = 0
-    qtype_cycle_idx = 0
-
-    batch_size = 3
+    tel = Telemetry("presentations", domain_code, MODEL, SYSTEM_PROMPT)
     total_generated = 0
     total_failed = 0
     batches_needed = (need + batch_size - 1) // batch_size
@@ -687,45 +576,30 @@ def process_domain(
         if this_batch <= 0:
             break
 
-        # Pick 2 subdomains for this batch (adjacent in cycle)
-        batch_subdomains = [
-            subdomains[subdomain_idx % len(subdomains)],
-            subdomains[(subdomain_idx + 1) % len(subdomains)],
-        ]
-        subdomain_idx += 2
-
-        # Pick 2–3 emotions to require in this batch
-        batch_emotions = [
-            emotion_pool[emotion_cycle_idx % len(emotion_pool)],
-            emotion_pool[(emotion_cycle_idx + 1) % len(emotion_pool)],
-        ]
-        emotion_cycle_idx += 2
-
-        # Pick 2 question types to require in this batch
-        batch_qtypes = [
-            qtype_pool[qtype_cycle_idx % len(qtype_pool)],
-            qtype_pool[(qtype_cycle_idx + 1) % len(qtype_pool)],
-        ]
-        qtype_cycle_idx += 2
-
-        # Difficulty levels for batch (distribute 1–4 across batches)
-        diff_base = ((batch_num * 2) % 4) + 1
-        batch_difficulties = [diff_base, min(diff_base + 1, 4)]
+        # Two thinnest cells with different subdomains, plus the two least-used
+        # emotions and question types
+        cells = plan["cells"].take(2, distinct=lambda c: c[0])
+        batch_subdomains = [sub for sub, _ in cells]
+        batch_difficulties = sorted({level for _, level in cells})
+        batch_emotions = plan["emotions"].take(2)
+        batch_qtypes = plan["qtypes"].take(2)
 
+        block = ids.reserve(this_batch)
         print(f"    Batch {batch_num+1}/{batches_needed}: "
               f"subdomains={batch_subdomains}, "
               f"diff={batch_difficulties}, "
-              f"id_start={next_id}...",
+              f"id_start={block.start}...",
               end=" ", flush=True)
 
         batch_result = generate_batch(
             client,
+            tel,
             domain_code=domain_code,
             subdomains=batch_subdomains,
             difficulty_levels=batch_difficulties,
             required_emotions=batch_emotions,
             required_q_types=batch_qtypes,
-            start_id=next_id,
+            start_id=block.start,
             batch_size=this_batch,
         )
 
@@ -736,7 +610,9 @@ def process_domain(
                 if enc["id"] not in existing_ids:
                     existing_ids.add(enc["id"])
                     new_encounters.append(enc)
-                    next_id = max(next_id, int(enc["id"].split("-")[-1]) + 1)
+            # Hand back whatever part of the reserved block went unused
+            kept = high_water((e["id"] for e in new_encounters), ids.pattern)
+            ids.settle(max(kept, block.start - 1) if not preview else block.start - 1)
 
             encounters.extend(new_encounters)
             total_generated += len(new_encounters)
@@ -753,6 +629,7 @@ def process_domain(
             # Write incrementally after each successful batch
             write_file(dst, domain_code, encounters)
         else:
+            ids.settle(block.start - 1)
             total_failed += this_batch
             print("FAILED (all invalid)")
 
@@ -772,11 +649,7 @@ def print_summary(domain_code: str) -> None:
         print(f"  {domain_code}: file not found")
         return
 
-    with open(dst, encoding="utf-8") as f:
-        data = json.load(f)
-
-    encounters = data.get("encounters", [])
-    total = len(encounters)
+    total = 0
 
     # Count by subdomain
     subdomain_counts: dict[str, int] = {}
@@ -784,7 +657,8 @@ def print_summary(domain_code: str) -> None:
     qtype_counts: dict[str, int] = {}
     diff_counts: dict[int, int] = {1: 0, 2: 0, 3: 0, 4: 0}
 
-    for enc in encounters:
+    for enc in iter_records(dst, "encounters"):
+        total += 1
         sd = enc.get("subdomain", "Unknown")
         subdomain_counts[sd] = subdomain_counts.get(sd, 0) + 1
 
@@ -829,6 +703,8 @@ def main():
                         help="Skip already-generated encounters")
     parser.add_argument("--preview", action="store_true",
                         help="Generate first batch only, print result, no file write")
+    parser.add_argument("--batch-size", type=int, default=3,
+                        help="Encounters requested per model call (default: 3)")
     parser.add_argument("--summary", action="store_true",
                         help="Print validation summary for existing files (no generation)")
     parser.add_argument("--api-key", default=None,
@@ -859,6 +735,7 @@ def main():
             target_count=args.count,
             resume=args.resume,
             preview=args.preview,
+            batch_size=args.batch_size,
         )
 
     if not args.preview and not args.summary:
@@ -20,13 +20,22 @@ Options:
   --domain CODE   Single domain code (e.g. PMET)
   --all           Process all 9 domains
   --count N       Max passages per domain (default: all)
-  --resume        Skip passages already written to output file
+  --resume        Continue the domain/mode job queue (data/jobs.sqlite): merge
+                  results a killed run left behind and skip done passages.
+                  Start extra --resume workers to share the queue.
   --mode MODE     Question mode: mc | passage_click | sentence_click | vocab
 """
 
-import json, pathlib, argparse, time, random, sys, os
+import json, pathlib, argparse, time, sys, os
 import anthropic
 
+from content_schema import record_errors
+from coverage_plan import order_by_coverage, spot_coverage
+from data_io import load_json, save_json
+from gen_metrics import Telemetry
+from id_alloc import IdAllocator
+from job_queue import JobQueue
+
 def load_api_key(args_key: str | None) -> str:
     """Resolve API key: CLI arg > env var > .env file."""
     if args_key:
@@ -63,6 +72,8 @@ DOMAIN_NAMES = {
     "PETH": "Psychopharmacology & Ethics",
 }
 
+MODEL = "claude-opus-4-6"
+
 SYSTEM_PROMPT = """You are an expert EPPP (Examination for Professional Practice in Psychology) content creator.
 Your task is to create "Spot the Error" questions from psychology study passages.
 
@@ -272,45 +283,48 @@ Original passage:
 Generate a spot-the-error question from this passage."""
 
 
-def generate_question(client: anthropic.Anthropic, passage: dict,
+def generate_question(client: anthropic.Anthropic, tel: Telemetry, passage: dict,
                       retries: int = 3) -> dict | None:
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=1024,
-                messages=[
-                    {"role": "user", "content": build_user_prompt(passage)}
-                ],
-                system=SYSTEM_PROMPT,
-            )
-            raw = msg.content[0].text.strip()
-            result = extract_json(raw)
-
-            # Basic validation
-            assert 'modified_passage' in result
-            assert 'options' in result and len(result['options']) == 4
-            assert 0 <= result.get('correct_option_index', -1) <= 3
-            assert result.get('error_original', '').strip() != result.get('error_correct', '').strip(), \
-                "error_original equals error_correct — model failed to introduce a real error"
-
-            return {
-                "id":                passage['id'],
-                "mode":              "mc",
-                "domain_code":       passage['domain_code'],
-                "domain_name":       passage['domain_name'],
-                "chapter_file":      passage['chapter_file'],
-                "chapter_title":     passage['chapter_title'],
-                "section":           passage.get('section', ''),
-                "passage_type":      passage['passage_type'],
-                "original_passage":  passage['passage'],
-                "modified_passage":  result['modified_passage'],
-                "error_original":    result.get('error_original', ''),
-                "error_correct":     result.get('error_correct', ''),
-                "options":           result['options'],
-                "correct_option_index": result['correct_option_index'],
-                "explanation":       result['explanation'],
-            }
+            with tel.request(item=passage['id'], attempt=attempt) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=1024,
+                    messages=[
+                        {"role": "user", "content": build_user_prompt(passage)}
+                    ],
+                    system=SYSTEM_PROMPT,
+                )
+                req.response(msg)
+                raw = msg.content[0].text.strip()
+                result = extract_json(raw)
+
+                # Basic validation
+                assert 'modified_passage' in result
+                assert 'options' in result and len(result['options']) == 4
+                assert 0 <= result.get('correct_option_index', -1) <= 3
+                assert result.get('error_original', '').strip() != result.get('error_correct', '').strip(), \
+                    "error_original equals error_correct — model failed to introduce a real error"
+
+                req.accept()
+                return {
+                    "id":                passage['id'],
+                    "mode":              "mc",
+                    "domain_code":       passage['domain_code'],
+                    "domain_name":       passage['domain_name'],
+                    "chapter_file":      passage['chapter_file'],
+                    "chapter_title":     passage['chapter_title'],
+                    "section":           passage.get('section', ''),
+                    "passage_type":      passage['passage_type'],
+                    "original_passage":  passage['passage'],
+                    "modified_passage":  result['modified_passage'],
+                    "error_original":    result.get('error_original', ''),
+                    "error_correct":     result.get('error_correct', ''),
+                    "options":           result['options'],
+                    "correct_option_index": result['correct_option_index'],
+                    "explanation":       result['explanation'],
+                }
 
         except (json.JSONDecodeError, AssertionError, KeyError, ValueError) as e:
             print(f"    Parse error (attempt {attempt+1}): {e}")
@@ -328,44 +342,47 @@ def generate_question(client: anthropic.Anthropic, passage: dict,
     return None
 
 
-def generate_passage_click(client: anthropic.Anthropic, passage: dict,
+def generate_passage_click(client: anthropic.Anthropic, tel: Telemetry, passage: dict,
                            retries: int = 3) -> dict | None:
     """Returns mode-specific result dict (no id/metadata) or None on failure."""
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=2048,
-                messages=[{"role": "user", "content": build_user_prompt(passage)}],
-                system=PASSAGE_CLICK_PROMPT,
-            )
-            result = extract_json(msg.content[0].text)
-
-            # Model signals passage too short by returning {}
-            assert result, "model returned empty result (passage too short)"
-            assert 'sentences' in result and isinstance(result['sentences'], list)
-            assert len(result['sentences']) >= 4, \
-                f"only {len(result['sentences'])} sentences, need >= 4"
-            tsi = result.get('target_sentence_index', -1)
-            assert 0 <= tsi < len(result['sentences']), "target_sentence_index out of range"
-            assert 'original_sentence' in result
-            assert 'error_original' in result
-            assert result['error_original'] in result['sentences'][tsi], \
-                f"error_original not found in target sentence"
-            assert 'error_correct' in result
-            assert 'explanation' in result
-
-            # Anti-reveal verbatim check: error_correct must not appear in non-target sentences
-            ec_lower = result['error_correct'].lower()
-            for i, sent in enumerate(result['sentences']):
-                if i == tsi:
-                    continue
-                if ec_lower in sent.lower():
-                    raise ValueError(
-                        f"Anti-reveal: '{result['error_correct']}' found verbatim in sentence {i}"
-                    )
-
-            return result
+            with tel.request(item=passage['id'], attempt=attempt) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=2048,
+                    messages=[{"role": "user", "content": build_user_prompt(passage)}],
+                    system=PASSAGE_CLICK_PROMPT,
+                )
+                req.response(msg)
+                result = extract_json(msg.content[0].text)
+
+                # Model signals passage too short by returning {}
+                assert result, "model returned empty result (passage too short)"
+                assert 'sentences' in result and isinstance(result['sentences'], list)
+                assert len(result['sentences']) >= 4, \
+                    f"only {len(result['sentences'])} sentences, need >= 4"
+                tsi = result.get('target_sentence_index', -1)
+                assert 0 <= tsi < len(result['sentences']), "target_sentence_index out of range"
+                assert 'original_sentence' in result
+                assert 'error_original' in result
+                assert result['error_original'] in result['sentences'][tsi], \
+                    f"error_original not found in target sentence"
+                assert 'error_correct' in result
+                assert 'explanation' in result
+
+                # Anti-reveal verbatim check: error_correct must not appear in non-target sentences
+                ec_lower = result['error_correct'].lower()
+                for i, sent in enumerate(result['sentences']):
+                    if i == tsi:
+                        continue
+                    if ec_lower in sent.lower():
+                        raise ValueError(
+                            f"Anti-reveal: '{result['error_correct']}' found verbatim in sentence {i}"
+                        )
+
+                req.accept()
+                return result
 
         except (json.JSONDecodeError, AssertionError, KeyError, ValueError) as e:
             print(f"    Parse error (attempt {attempt+1}): {e}")
@@ -383,56 +400,59 @@ def generate_passage_click(client: anthropic.Anthropic, passage: dict,
     return None
 
 
-def generate_sentence_click(client: anthropic.Anthropic, passage: dict,
+def generate_sentence_click(client: anthropic.Anthropic, tel: Telemetry, passage: dict,
                             retries: int = 3) -> dict | None:
     """Returns mode-specific result dict (no id/metadata) or None on failure."""
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=2048,
-                messages=[{"role": "user", "content": build_user_prompt(passage)}],
-                system=SENTENCE_CLICK_PROMPT,
-            )
-            result = extract_json(msg.content[0].text)
-
-            assert 'modified_sentence' in result
-            assert 'phrases' in result and isinstance(result['phrases'], list)
-            assert len(result['phrases']) >= 3, \
-                f"too few phrases: {len(result['phrases'])}"
-
-            # ── Post-process 1: merge short tail phrases into predecessor ──
-            # Keeps 4-phrase items as 4; merges only when last phrase is < 5 words.
-            phrases = list(result['phrases'])
-            tpi = result.get('target_phrase_index', -1)
-            while len(phrases) > 2 and len(phrases[-1].split()) < 5:
-                if tpi == len(phrases) - 1:
-                    tpi = len(phrases) - 2
-                phrases[-2] = phrases[-2] + phrases[-1]
-                phrases.pop()
-            result['phrases'] = phrases
-            result['target_phrase_index'] = tpi
-
-            # ── Post-process 2: trust phrases as ground truth for the sentence ──
-            result['modified_sentence'] = ''.join(phrases)
-
-            assert len(result['phrases']) >= 3, "fewer than 3 phrases after merging tails"
-            assert 1 <= tpi <= len(phrases) - 1, \
-                f"target_phrase_index must not be the first phrase, got {tpi}"
-            assert 'error_original' in result
-            assert result['error_original'] in result['phrases'][tpi], \
-                "error_original not found in target phrase"
-            # Every phrase must be at least 4 words
-            for idx, ph in enumerate(result['phrases']):
-                wc = len(ph.split())
-                assert wc >= 4, \
-                    f"phrase {idx} too short ({wc} words): {ph!r}"
-            assert 'error_correct' in result
-            assert result['error_original'].strip() != result['error_correct'].strip(), \
-                "error_original equals error_correct — model failed to introduce a real error"
-            assert 'explanation' in result
-
-            return result
+            with tel.request(item=passage['id'], attempt=attempt) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=2048,
+                    messages=[{"role": "user", "content": build_user_prompt(passage)}],
+                    system=SENTENCE_CLICK_PROMPT,
+                )
+                req.response(msg)
+                result = extract_json(msg.content[0].text)
+
+                assert 'modified_sentence' in result
+                assert 'phrases' in result and isinstance(result['phrases'], list)
+                assert len(result['phrases']) >= 3, \
+                    f"too few phrases: {len(result['phrases'])}"
+
+                # ── Post-process 1: merge short tail phrases into predecessor ──
+                # Keeps 4-phrase items as 4; merges only when last phrase is < 5 words.
+                phrases = list(result['phrases'])
+                tpi = result.get('target_phrase_index', -1)
+                while len(phrases) > 2 and len(phrases[-1].split()) < 5:
+                    if tpi == len(phrases) - 1:
+                        tpi = len(phrases) - 2
+                    phrases[-2] = phrases[-2] + phrases[-1]
+                    phrases.pop()
+                result['phrases'] = phrases
+                result['target_phrase_index'] = tpi
+
+                # ── Post-process 2: trust phrases as ground truth for the sentence ──
+                result['modified_sentence'] = ''.join(phrases)
+
+                assert len(result['phrases']) >= 3, "fewer than 3 phrases after merging tails"
+                assert 1 <= tpi <= len(phrases) - 1, \
+                    f"target_phrase_index must not be the first phrase, got {tpi}"
+                assert 'error_original' in result
+                assert result['error_original'] in result['phrases'][tpi], \
+                    "error_original not found in target phrase"
+                # Every phrase must be at least 4 words
+                for idx, ph in enumerate(result['phrases']):
+                    wc = len(ph.split())
+                    assert wc >= 4, \
+                        f"phrase {idx} too short ({wc} words): {ph!r}"
+                assert 'error_correct' in result
+                assert result['error_original'].strip() != result['error_correct'].strip(), \
+                    "error_original equals error_correct — model failed to introduce a real error"
+                assert 'explanation' in result
+
+                req.accept()
+                return result
 
         except (json.JSONDecodeError, AssertionError, KeyError, ValueError) as e:
             print(f"    Parse error (attempt {attempt+1}): {e}")
@@ -450,33 +470,36 @@ def generate_sentence_click(client: anthropic.Anthropic, passage: dict,
     return None
 
 
-def generate_vocab(client: anthropic.Anthropic, passage: dict,
+def generate_vocab(client: anthropic.Anthropic, tel: Telemetry, passage: dict,
                    retries: int = 3) -> dict | None:
     """Returns mode-specific result dict (no id/metadata) or None on failure."""
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=2048,
-                messages=[{"role": "user", "content": build_user_prompt(passage)}],
-                system=VOCAB_PROMPT,
-            )
-            result = extract_json(msg.content[0].text)
-
-            assert 'entries' in result and isinstance(result['entries'], list)
-            assert len(result['entries']) == 4
-            assert all('term' in e and 'definition' in e and 'is_target' in e
-                       for e in result['entries'])
-            tei = result.get('target_entry_index', -1)
-            assert 0 <= tei < 4, "target_entry_index out of range"
-            assert result['entries'][tei]['is_target'] is True
-            assert 'error_original' in result
-            assert result['error_original'] in result['entries'][tei]['definition'], \
-                "error_original not found in target definition"
-            assert 'error_correct' in result
-            assert 'explanation' in result
-
-            return result
+            with tel.request(item=passage['id'], attempt=attempt) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=2048,
+                    messages=[{"role": "user", "content": build_user_prompt(passage)}],
+                    system=VOCAB_PROMPT,
+                )
+                req.response(msg)
+                result = extract_json(msg.content[0].text)
+
+                assert 'entries' in result and isinstance(result['entries'], list)
+                assert len(result['entries']) == 4
+                assert all('term' in e and 'definition' in e and 'is_target' in e
+                           for e in result['entries'])
+                tei = result.get('target_entry_index', -1)
+                assert 0 <= tei < 4, "target_entry_index out of range"
+                assert result['entries'][tei]['is_target'] is True
+                assert 'error_original' in result
+                assert result['error_original'] in result['entries'][tei]['definition'], \
+                    "error_original not found in target definition"
+                assert 'error_correct' in result
+                assert 'explanation' in result
+
+                req.accept()
+                return result
 
         except (json.JSONDecodeError, AssertionError, KeyError, ValueError) as e:
             print(f"    Parse error (attempt {attempt+1}): {e}")
@@ -505,8 +528,7 @@ def load_existing(path: pathlib.Path) -> dict:
     """Return {id: question} for already-generated questions."""
     if not path.exists():
         return {}
-    with open(path, encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(path)
     return {q['id']: q for q in data.get('questions', [])}
 
 
@@ -522,42 +544,57 @@ def process_domain(client: anthropic.Anthropic, domain_code: str,
         print(f"  SKIP: {src} not found")
         return
 
-    with open(src, encoding='utf-8') as f:
-        data = json.load(f)
+    data = load_json(src)
     passages = data['passages']
 
     dst = DATA / f"{domain_code}_spot.json"
-
-    # Always load all existing questions to preserve them when appending
-    all_existing: list = []
-    if dst.exists():
-        with open(dst, encoding='utf-8') as f:
-            existing_data = json.load(f)
-        all_existing = existing_data.get('questions', [])
+    queue = JobQueue(f"spot:{mode}", domain_code)
+    empty = {
+        "domain_code":     domain_code,
+        "domain_name":     DOMAIN_NAMES[domain_code],
+        "total_questions": 0,
+        "questions":       [],
+    }
 
     if resume:
+        # Fold in results a killed run (or another worker) left in the queue;
+        # the file then holds every question to preserve when appending
+        doc, recovered = queue.merge_into(dst, base=empty, count_keys=['total_questions'],
+                                          dedup=lambda q: q['id'])
+        all_existing = doc['questions']
+        if recovered:
+            print(f"  {domain_code} [{mode}]: recovered {recovered} queued result(s)")
+
         # Determine which passages for this mode are already done
         same_mode = [q for q in all_existing if get_mode(q) == mode]
         questions = list(all_existing)  # start with everything
 
         if mode == 'mc':
             done_ids = {q['id'] for q in same_mode}
-            todo = [p for p in passages if p['id'] not in done_ids]
         else:
-            done_passage_ids = {q['source_passage_id'] for q in same_mode
-                                if 'source_passage_id' in q}
-            todo = [p for p in passages if p['id'] not in done_passage_ids]
+            done_ids = {q['source_passage_id'] for q in same_mode
+                        if 'source_passage_id' in q}
+        # Failed passages wait for `job_queue.py retry`; in-flight ones belong to another worker
+        done_ids |= queue.keys('done', 'failed', 'in_flight')
+        todo = [p for p in passages if p['id'] not in done_ids]
     else:
         # Start fresh for this mode; preserve questions of other modes
+        all_existing = load_json(dst).get('questions', []) if dst.exists() else []
         other_mode_qs = [q for q in all_existing if get_mode(q) != mode]
         questions = list(other_mode_qs)
+        queue.reset()
+        save_json(dst, {**empty, "total_questions": len(questions), "questions": questions})
         todo = list(passages)
 
-    # Sequential ID counter for new modes
-    seq_n = 1
+    # Sequential IDs for the click/vocab modes (mc questions reuse the passage id)
+    ids = None
     if mode != 'mc':
-        existing_mode_count = sum(1 for q in questions if get_mode(q) == mode)
-        seq_n = existing_mode_count + 1
+        prefix = MODE_ID_PREFIXES[mode]
+        ids = IdAllocator(f"spot:{domain_code}:{prefix}", f"{domain_code}-{prefix}-{{n:04d}}",
+                          existing=(q['id'] for q in questions if get_mode(q) == mode),
+                          shared=True)
+        if not resume:
+            ids.reset()   # this mode is being regenerated from scratch
 
     # Skip references / bibliography sections across all modes — not useful for drill
     todo = [p for p in todo
@@ -571,32 +608,41 @@ def process_domain(client: anthropic.Anthropic, domain_code: str,
             return len([p for p in parts if len(p.split()) >= 4])
         todo = [p for p in todo if _sentence_count(p['passage']) >= 4]
 
+    # Chapters with the fewest questions in this mode go first
+    chapters = {p['chapter_file'] for p in passages}
+    todo = order_by_coverage(todo, lambda p: p['chapter_file'],
+                             spot_coverage(questions, mode, chapters))
     if count:
-        random.shuffle(todo)
         todo = todo[:count]
+    queue.plan((p['id'], p) for p in todo)
 
-    if not todo:
+    if not todo and not queue.counts()['pending']:
         print(f"  {domain_code} [{mode}]: nothing to do ({len(all_existing)} total existing)")
+        queue.close()
         return
 
     generate_fn = generate_question if mode == 'mc' else MODE_GENERATORS[mode]
+    prompt = {'mc': SYSTEM_PROMPT, 'passage_click': PASSAGE_CLICK_PROMPT,
+              'sentence_click': SENTENCE_CLICK_PROMPT, 'vocab': VOCAB_PROMPT}[mode]
+    tel = Telemetry(f"spot:{mode}", domain_code, MODEL, prompt)
 
     print(f"\n  {domain_code} [{mode}]: generating {len(todo)} questions "
-          f"(+{len(all_existing)} existing)...")
+          f"(+{len(all_existing)} existing)...  [queue: {queue.summary()}]")
 
     errors = 0
 
-    for i, passage in enumerate(todo, 1):
+    for i, job in enumerate(queue.jobs(limit=count), 1):
+        passage = job.payload
         print(f"    [{i}/{len(todo)}] {passage['chapter_title'][:50]}...", end=' ', flush=True)
-        result = generate_fn(client, passage)
+        result = generate_fn(client, tel, passage)
         if result:
             if mode == 'mc':
                 # generate_question returns a complete question dict with id
-                questions.append(result)
+                q = result
             else:
-                prefix = MODE_ID_PREFIXES[mode]
+                n = ids.next_num()
                 q = {
-                    "id":                f"{domain_code}-{prefix}-{seq_n:04d}",
+                    "id":                ids.format(n),
                     "mode":              mode,
                     "domain_code":       passage['domain_code'],
                     "domain_name":       passage['domain_name'],
@@ -607,26 +653,32 @@ def process_domain(client: anthropic.Anthropic, domain_code: str,
                     "source_passage_id": passage['id'],
                     **result,
                 }
-                questions.append(q)
-                seq_n += 1
+            # Whole-record check against the shared schema (same one the bundle uses)
+            errs = record_errors("spot", q, {"domain_code": domain_code})
+            if errs:
+                if ids:
+                    ids.settle(n - 1)   # hand the number back
+                errors += 1
+                tel.reject(passage['id'], errs)
+                queue.fail(job, "; ".join(errs[:3]))
+                print(f"INVALID: {'; '.join(errs[:3])}")
+                time.sleep(0.3)
+                continue
+            queue.done(job, [q])
             print("OK")
         else:
             errors += 1
+            queue.fail(job, "no result from the model")
             print("FAILED")
         # Brief pause to avoid hammering rate limits
         time.sleep(0.3)
 
-    # Write output
-    out = {
-        "domain_code":     domain_code,
-        "domain_name":     DOMAIN_NAMES[domain_code],
-        "total_questions": len(questions),
-        "questions":       questions,
-    }
-    with open(dst, 'w', encoding='utf-8') as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    # Write output (merged with anything other workers finished meanwhile)
+    doc, _ = queue.merge_into(dst, base=empty, count_keys=['total_questions'],
+                              dedup=lambda q: q['id'])
+    queue.close()
 
-    print(f"  -> {dst.name}: {len(questions)} questions written "
+    print(f"  -> {dst.name}: {len(doc['questions'])} questions written "
           f"({errors} failures)")
 
 
@@ -638,7 +690,7 @@ def main():
     parser.add_argument('--count', type=int, default=None,
                         help='Max passages per domain')
     parser.add_argument('--resume', action='store_true',
-                        help='Skip already-generated questions')
+                        help='Continue the job queue (merge leftovers, skip done passages)')
     parser.add_argument('--mode', default='mc',
                         choices=['mc', 'passage_click', 'sentence_click', 'vocab', 'all'],
                         help='Question mode to generate (default: mc); "all" runs all four modes')
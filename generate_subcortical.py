@@ -6,17 +6,16 @@ on some Windows configurations even when files are already cached).
 Run from mastery-page/ directory.
 """
 
-import json, sys, traceback, xml.etree.ElementTree as ET
+import sys, traceback, xml.etree.ElementTree as ET
 import numpy as np
 from pathlib import Path
 
+from data_io import load_json, save_json
+from mesh_utils import to_threejs
+
 OUT_DIR       = Path("data/brain_meshes")
 MANIFEST_PATH = Path("data/brain_regions_manifest.json")
 
-# Coordinate transform parameters (computed by generate_brain_meshes.py Stage 1)
-COORD_SCALE  = 1.0 / 75.0
-COORD_OFFSET = np.array([0.118, -0.204, 0.438], dtype=np.float64)
-
 MAX_FACES = 4_000
 
 # Harvard-Oxford label candidates (we look up index from the XML)
@@ -44,14 +43,6 @@ _AAL_SEARCH_PATHS = [
 ]
 
 
-def to_threejs(coords):
-    c = np.asarray(coords, dtype=np.float64)
-    x_out = -c[:, 0]
-    y_out =  c[:, 2]
-    z_out =  c[:, 1]
-    return (np.column_stack([x_out, y_out, z_out]) * COORD_SCALE + COORD_OFFSET).astype(np.float32)
-
-
 def save_glb(mesh, path):
     try:
         data = mesh.export(file_type="glb")
@@ -133,8 +124,7 @@ def main():
 
     # Load existing manifest
     if MANIFEST_PATH.exists():
-        with open(MANIFEST_PATH) as f:
-            manifest = json.load(f)
+        manifest = load_json(MANIFEST_PATH)
         print(f"Loaded manifest with {len(manifest)} regions.")
     else:
         manifest = {}
@@ -325,8 +315,7 @@ def main():
     sys.stdout.flush()
 
     # ── Write updated manifest ────────────────────────────────────────────────
-    with open(MANIFEST_PATH, "w") as f:
-        json.dump(manifest, f, indent=2)
+    save_json(MANIFEST_PATH, manifest)
     print(f"\nManifest updated: {len(manifest)} regions")
     by_type = {}
     for r, info in manifest.items():
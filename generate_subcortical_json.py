@@ -18,117 +18,21 @@ Outputs:
   data/brain_meshes/cerebellum_texture.png — 1024x512 folia bands
 """
 
-import sys, gc, json
+import sys, gc
 import numpy as np
 from pathlib import Path
-from scipy import ndimage
 import nibabel as nib
-from skimage import measure
 from PIL import Image
 
+from data_io import save_json
+from mesh_utils import (compute_vertex_normals,
+                        sphere_to_uv_brainstem, sphere_to_uv_cerebellum,
+                        remove_seam_faces)
+from subcortical_surfaces import extract_surfaces
+
 OUTPUT_DIR = Path("data/brain_meshes")
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-# ── Coordinate transform (must match cortex + region overlays) ────────────────
-# FreeSurfer RAS: x=right, y=anterior, z=superior
-# Three.js:       x=right, y=up(superior), z=toward-viewer(anterior)
-# -> out = [-x_fs, z_fs, y_fs] * COORD_SCALE + COORD_OFFSET
-COORD_SCALE  = 1.0 / 75.0
-COORD_OFFSET = np.array([0.118, -0.204, 0.438], dtype=np.float64)
-
-def to_threejs(coords):
-    """MNI/FreeSurfer RAS mm -> Three.js world units."""
-    c = np.asarray(coords, dtype=np.float64)
-    x_out = -c[:, 0]
-    y_out =  c[:, 2]
-    z_out =  c[:, 1]
-    return (np.column_stack([x_out, y_out, z_out]) * COORD_SCALE + COORD_OFFSET).astype(np.float32)
-
-
-# ── Mesh generation ──────────────────────────────────────────────────────────
-
-def voxels_to_mesh(mask_3d, affine, step_size, sigma):
-    """Binary 3D mask -> smoothed marching-cubes surface in Three.js coords."""
-    smoothed = ndimage.gaussian_filter(mask_3d.astype(np.float32), sigma=sigma)
-    verts_v, faces, _, _ = measure.marching_cubes(smoothed, level=0.5,
-                                                   step_size=step_size)
-    ones     = np.ones((len(verts_v), 1), dtype=np.float32)
-    verts_mm = (affine @ np.hstack([verts_v.astype(np.float32), ones]).T).T[:, :3]
-    verts_3d = to_threejs(verts_mm)
-    faces    = faces.astype(np.int32)
-
-    # Fix face winding: ensure normals point outward
-    centroid = verts_3d.mean(axis=0)
-    v0 = verts_3d[faces[:, 0]]
-    v1 = verts_3d[faces[:, 1]]
-    v2 = verts_3d[faces[:, 2]]
-    face_normals = np.cross(v1 - v0, v2 - v0)
-    face_centers = (v0 + v1 + v2) / 3.0
-    dots = np.sum(face_normals * (face_centers - centroid), axis=1)
-    inward = dots < 0
-    if inward.sum() > len(faces) // 2:
-        faces = faces[:, ::-1]
-    elif inward.sum() > 0:
-        faces[inward] = faces[inward][:, ::-1]
-
-    return verts_3d, faces
-
-
-def compute_vertex_normals(verts, faces):
-    """Compute smooth per-vertex normals from face normals."""
-    normals = np.zeros_like(verts)
-    v0 = verts[faces[:, 0]]
-    v1 = verts[faces[:, 1]]
-    v2 = verts[faces[:, 2]]
-    fn = np.cross(v1 - v0, v2 - v0)
-    # Accumulate face normals onto each vertex
-    for i in range(3):
-        np.add.at(normals, faces[:, i], fn)
-    # Normalize
-    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
-    normals = normals / np.maximum(lengths, 1e-9)
-    return normals.astype(np.float32)
-
-
-# ── UV mapping ───────────────────────────────────────────────────────────────
-
-def sphere_to_uv_brainstem(verts):
-    """Spherical UV for brainstem. v=elevation (medulla->midbrain), u=azimuthal."""
-    centroid = verts.mean(axis=0)
-    v_c = verts - centroid
-    r   = np.linalg.norm(v_c, axis=1, keepdims=True)
-    n   = v_c / np.maximum(r, 1e-9)
-    # In Three.js coords: x=right, y=up, z=anterior
-    # u: azimuthal around vertical (y) axis, seam at posterior
-    u = (np.arctan2(n[:, 0], -n[:, 2]) + np.pi) / (2.0 * np.pi)
-    # v: elevation (y component), 0=bottom, 1=top
-    v = (np.arcsin(np.clip(n[:, 1], -1.0, 1.0)) + np.pi / 2.0) / np.pi
-    return np.stack([u, v], axis=1).astype(np.float32), centroid
-
-
-def sphere_to_uv_cerebellum(verts):
-    """Spherical UV for cerebellum. v=elevation for folia bands, u=circumferential."""
-    centroid = verts.mean(axis=0)
-    v_c = verts - centroid
-    r   = np.linalg.norm(v_c, axis=1, keepdims=True)
-    n   = v_c / np.maximum(r, 1e-9)
-    # u: azimuthal, seam anterior (facing brainstem, hidden)
-    u = (np.arctan2(n[:, 0], n[:, 2]) + np.pi) / (2.0 * np.pi)
-    # v: elevation (y component)
-    v = (np.arcsin(np.clip(n[:, 1], -1.0, 1.0)) + np.pi / 2.0) / np.pi
-    return np.stack([u, v], axis=1).astype(np.float32), centroid
-
-
-def remove_seam_faces(uv, faces, wrap_threshold=0.35):
-    """Drop triangles that straddle the u=0/1 wrap seam."""
-    u0 = uv[faces[:, 0], 0]
-    u1 = uv[faces[:, 1], 0]
-    u2 = uv[faces[:, 2], 0]
-    span = (np.maximum(np.maximum(u0, u1), u2)
-            - np.minimum(np.minimum(u0, u1), u2))
-    return faces[span < wrap_threshold]
-
-
 # ── Texture generation ───────────────────────────────────────────────────────
 
 def generate_brainstem_texture():
@@ -216,8 +120,7 @@ def export_mesh_json(verts, faces, normals, uvs, out_path):
         'vertexCount': len(verts),
         'faceCount':   len(faces),
     }
-    with open(out_path, 'w') as f:
-        json.dump(data, f)
+    save_json(out_path, data, mode="compact")
     sz = out_path.stat().st_size
     print(f"    Saved: {out_path.name}  ({sz/1e3:.0f} KB, "
           f"{len(verts):,} verts, {len(faces):,} faces)")
@@ -250,14 +153,14 @@ if __name__ == '__main__':
     ho_data = ho_img.get_fdata(dtype=np.float32)
 
     BRAINSTEM_VAL = 8
-    bs_mask = (ho_data == BRAINSTEM_VAL)
-    print(f"    Brainstem: {bs_mask.sum():,} voxels (atlas value {BRAINSTEM_VAL})")
+    bs = extract_surfaces(ho_data, ho_img.affine, {"brainstem": [BRAINSTEM_VAL]},
+                          default_sigma=0.8)["brainstem"]
+    print(f"    Brainstem: {bs['voxels']:,} voxels (atlas value {BRAINSTEM_VAL})")
 
-    if bs_mask.sum() < 100:
+    if bs["voxels"] < 100 or bs["verts"] is None:
         print("    ERROR: brainstem mask empty."); sys.exit(1)
 
-    bs_verts, bs_faces = voxels_to_mesh(bs_mask, ho_img.affine,
-                                         step_size=1, sigma=0.8)
+    bs_verts, bs_faces = bs["verts"], bs["faces"]
     print(f"    Raw mesh: {len(bs_verts):,} verts, {len(bs_faces):,} faces")
 
     # UV map
@@ -279,7 +182,7 @@ if __name__ == '__main__':
     Image.fromarray(bs_tex, 'RGB').save(str(OUTPUT_DIR / "brainstem_texture.png"))
     print(f"    Saved: brainstem_texture.png ({(OUTPUT_DIR / 'brainstem_texture.png').stat().st_size/1e3:.0f} KB)")
 
-    del ho_data, bs_mask, ho_img, bs_verts, bs_faces, bs_normals, bs_uv
+    del ho_data, bs, ho_img, bs_verts, bs_faces, bs_normals, bs_uv
     gc.collect()
 
     # ── CEREBELLUM ──
@@ -302,17 +205,17 @@ if __name__ == '__main__':
     print(f"    Found {len(cereb_vals)} cerebellar label values "
           f"(range {min(cereb_vals)}..{max(cereb_vals)})")
 
-    cb_mask = np.isin(aal_data.astype(np.int32), sorted(cereb_vals))
-    print(f"    Cerebellum: {cb_mask.sum():,} voxels")
+    cb = extract_surfaces(aal_data, aal_img.affine, {"cerebellum": sorted(cereb_vals)},
+                          default_sigma=0.3)["cerebellum"]
+    print(f"    Cerebellum: {cb['voxels']:,} voxels")
 
-    if cb_mask.sum() < 100:
+    if cb["voxels"] < 100 or cb["verts"] is None:
         print("    ERROR: cerebellum mask empty."); sys.exit(1)
 
-    cb_verts, cb_faces = voxels_to_mesh(cb_mask, aal_img.affine,
-                                         step_size=1, sigma=0.3)
+    cb_verts, cb_faces = cb["verts"], cb["faces"]
     print(f"    Raw mesh: {len(cb_verts):,} verts, {len(cb_faces):,} faces")
 
-    del aal_data, cb_mask, aal_img
+    del aal_data, cb, aal_img
     gc.collect()
 
     # UV map
@@ -334,6 +237,10 @@ if __name__ == '__main__':
     Image.fromarray(cb_tex, 'RGB').save(str(OUTPUT_DIR / "cerebellum_texture.png"))
     print(f"    Saved: cerebellum_texture.png ({(OUTPUT_DIR / 'cerebellum_texture.png').stat().st_size/1e3:.0f} KB)")
 
+    # GPU texture stage — brainstem albedo as mipmapped KTX2 (texture_pack.py)
+    from texture_pack import pack_all
+    pack_all()
+
     # Restore SSL
     ssl._create_default_https_context = _orig_ctx
     _req.Session.send = _orig_send
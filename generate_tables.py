@@ -16,14 +16,23 @@ Options:
   --domain CODE   Single domain (BPSY | LDEV | PETH)
   --all           Run all three domains sequentially
   --count N       Max tables per domain (default 50)
-  --resume        Skip tables already present in output JSON
+  --resume        Continue the domain's job queue (data/jobs.sqlite): merge
+                  results a killed run left behind, retry failed items, skip
+                  done ones.  Start extra --resume workers to share the queue.
   --api-key KEY   Anthropic API key (overrides env / .env)
 """
 
-import json, pathlib, argparse, time, random, sys, os, re
+import json, pathlib, argparse, time, sys, os, re
 import anthropic
 from bs4 import BeautifulSoup
 
+from content_schema import SCHEMAS, assert_valid
+from coverage_plan import order_by_coverage, table_coverage
+from data_io import save_json
+from gen_metrics import Telemetry
+from id_alloc import IdAllocator
+from job_queue import JobQueue
+
 # Ensure stdout handles Unicode on Windows (cp1252 console can't print Greek/special chars)
 if hasattr(sys.stdout, 'reconfigure'):
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -65,6 +74,8 @@ GLOSSARY_HEADERS = {
 }
 
 # ── Claude system prompt ───────────────────────────────────────────────────────
+MODEL = "claude-opus-4-6"
+
 SYSTEM_PROMPT = """You are an expert EPPP (Examination for Professional Practice in Psychology) content creator.
 You receive a comparison table from a psychology study guide. Your task is to turn it into a fill-in-the-blank drill question.
 
@@ -258,48 +269,33 @@ def build_user_prompt(table: dict) -> str:
     )
 
 
-def validate_result(result: dict, table: dict) -> None:
-    """Raise AssertionError if result is invalid."""
-    headers = table['headers']
-    rows    = table['rows']
-
-    br = result.get('blank_row', -1)
-    bc = result.get('blank_col', -1)
-    assert isinstance(br, int) and 0 <= br < len(rows), \
-        f"blank_row {br} out of range [0, {len(rows)-1}]"
-    assert isinstance(bc, int) and 0 <= bc < len(headers), \
-        f"blank_col {bc} out of range [0, {len(headers)-1}]"
+# The model's answer is checked against the un-blanked source table
+TABLE_RESULT = SCHEMAS["table_fill"].subset(
+    "headers", "rows", "blank_row", "blank_col", "correct_value",
+    "options", "correct_option_index", "explanation")
 
-    cv = result.get('correct_value', '').strip()
-    cell = rows[br][bc].strip()
-    assert cv.lower() == cell.lower(), \
-        f"correct_value {cv!r} does not match cell {cell!r}"
 
-    options = result.get('options', [])
-    assert len(options) == 4, f"Expected 4 options, got {len(options)}"
-    assert len(set(options)) == 4, "Options must all be distinct"
-
-    coi = result.get('correct_option_index', -1)
-    assert 0 <= coi <= 3, f"correct_option_index {coi} out of range"
-    assert options[coi].strip() == cv, \
-        f"options[{coi}]={options[coi]!r} != correct_value={cv!r}"
-
-    assert result.get('explanation', '').strip(), "Explanation must not be empty"
+def validate_result(result: dict, table: dict) -> None:
+    """Raise AssertionError if result is invalid."""
+    assert_valid(TABLE_RESULT, {**result, "headers": table['headers'], "rows": table['rows']})
 
 
-def generate_question(client: anthropic.Anthropic, table: dict,
+def generate_question(client: anthropic.Anthropic, tel: Telemetry, table: dict,
                       retries: int = 3) -> dict | None:
     for attempt in range(retries):
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=1024,
-                messages=[{"role": "user", "content": build_user_prompt(table)}],
-                system=SYSTEM_PROMPT,
-            )
-            raw = msg.content[0].text.strip()
-            result = extract_json(raw)
-            validate_result(result, table)
+            with tel.request(item=table['chapter_file'], attempt=attempt) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=1024,
+                    messages=[{"role": "user", "content": build_user_prompt(table)}],
+                    system=SYSTEM_PROMPT,
+                )
+                req.response(msg)
+                raw = msg.content[0].text.strip()
+                result = extract_json(raw)
+                validate_result(result, table)
+                req.accept()
             return result
 
         except (json.JSONDecodeError, AssertionError, KeyError, ValueError) as e:
@@ -342,57 +338,70 @@ def process_domain(client: anthropic.Anthropic, domain_code: str,
         return
 
     dst = DATA / f"{domain_code}_tables.json"
-
-    # Load existing questions
-    existing_questions: list[dict] = []
-    if dst.exists():
-        with open(dst, encoding='utf-8') as f:
-            existing_data = json.load(f)
-        existing_questions = existing_data.get('questions', [])
+    queue = JobQueue("tables", domain_code)
+    empty = {
+        "domain_code":     domain_code,
+        "domain_name":     DOMAIN_NAMES[domain_code],
+        "total_questions": 0,
+        "questions":       [],
+    }
 
     if resume:
-        done_keys = {resume_key(q) for q in existing_questions}
-        questions = list(existing_questions)
+        # Fold in results a killed run (or another worker) left in the queue
+        doc, recovered = queue.merge_into(dst, base=empty, count_keys=['total_questions'],
+                                          dedup=resume_key)
+        questions = doc['questions']
+        if recovered:
+            print(f"  Recovered {recovered} queued result(s) into {dst.name}")
     else:
-        done_keys = set()
+        queue.reset()
+        save_json(dst, empty)
         questions = []
+    done_keys = {resume_key(q) for q in questions}
 
-    # Filter to tables not yet done
-    todo = []
+    # Stable job keys: the table's position within its chapter file
+    per_file: dict[str, int] = {}
+    keyed = []
     for t in all_tables:
-        # We don't know blank_row/bc yet, so check by chapter_file for resume
-        # (a more precise filter happens after generation — this just avoids re-running same file)
-        # Actually we need to match by chapter_file + blank_row + blank_col post-generation.
-        # For now filter by chapter_file only when resuming to avoid duplicates from same file.
-        pass  # collect all, dedup after
+        n = per_file.get(t['chapter_file'], 0)
+        per_file[t['chapter_file']] = n + 1
+        keyed.append((f"{t['chapter_file']}#{n}", t))
 
-    # For resume: track which (file, row, col) combos are done
-    todo = list(all_tables)
+    # Done, failed (see `job_queue.py retry`) and other workers' tables are settled
+    settled = queue.keys('done', 'failed', 'in_flight')
+    keyed = [kt for kt in keyed if kt[0] not in settled]
 
-    # Shuffle for variety
-    random.shuffle(todo)
-
-    # Cap
-    todo = todo[:max(count * 3, 150)]  # over-sample to account for failures + skips
+    # Thinnest source tables first (round-robin across equally-covered ones),
+    # capped to leave room for failures + duplicate skips
+    todo = order_by_coverage(keyed, lambda kt: (kt[1]['chapter_file'], kt[1].get('section', '')),
+                             table_coverage(questions, all_tables))
+    todo = todo[:max(count * 3, 150)]
+    queue.plan(todo)
 
     needed = count - len(questions) if resume else count
 
-    print(f"  Generating up to {needed} new questions...")
-    seq_n = len(existing_questions) + 1 if resume else 1
+    print(f"  Generating up to {needed} new questions...  [queue: {queue.summary()}]")
+    ids = IdAllocator(f"tables:{domain_code}", f"{domain_code}-TBL-{{n:04d}}",
+                      existing=(q.get('id') for q in questions), shared=True)
+    if not resume:
+        ids.reset()   # fresh run replaces the file; numbering restarts at 1
+    tel = Telemetry("tables", domain_code, MODEL, SYSTEM_PROMPT)
     errors = 0
     generated = 0
 
-    for i, table in enumerate(todo, 1):
+    for i, job in enumerate(queue.jobs(), 1):
         if generated >= needed:
             break
+        table = job.payload
 
         section_safe = (table['section'][:40] or 'n/a').encode('ascii', errors='replace').decode('ascii')
-        print(f"    [{i}/{len(todo)}] {table['chapter_file']} / {section_safe}...",
+        print(f"    [{i}] {table['chapter_file']} / {section_safe}...",
               end=' ', flush=True)
 
-        result = generate_question(client, table)
+        result = generate_question(client, tel, table)
         if not result:
             errors += 1
+            queue.fail(job, "no valid result after retries")
             print("FAILED")
             time.sleep(0.3)
             continue
@@ -400,6 +409,7 @@ def process_domain(client: anthropic.Anthropic, domain_code: str,
         # Check for duplicate (same file + blank_row + blank_col)
         rk = table_key(table, result['blank_row'], result['blank_col'])
         if rk in done_keys:
+            queue.done(job)
             print("SKIP (duplicate)")
             continue
         done_keys.add(rk)
@@ -409,7 +419,7 @@ def process_domain(client: anthropic.Anthropic, domain_code: str,
         display_rows[result['blank_row']][result['blank_col']] = 'BLANK'
 
         q = {
-            "id":                   f"{domain_code}-TBL-{seq_n:04d}",
+            "id":                   ids.next(),
             "mode":                 "table_fill",
             "domain_code":          domain_code,
             "domain_name":          DOMAIN_NAMES[domain_code],
@@ -425,23 +435,16 @@ def process_domain(client: anthropic.Anthropic, domain_code: str,
             "correct_option_index": result['correct_option_index'],
             "explanation":          result['explanation'],
         }
-        questions.append(q)
-        seq_n += 1
+        queue.done(job, [q])
         generated += 1
         print("OK")
         time.sleep(0.3)
 
-    # Write output
-    out = {
-        "domain_code":     domain_code,
-        "domain_name":     DOMAIN_NAMES[domain_code],
-        "total_questions": len(questions),
-        "questions":       questions,
-    }
-    with open(dst, 'w', encoding='utf-8') as f:
-        json.dump(out, f, ensure_ascii=False, indent=2)
+    # Write output (merged with anything other workers finished meanwhile)
+    doc, _ = queue.merge_into(dst, base=empty, count_keys=['total_questions'], dedup=resume_key)
+    queue.close()
 
-    print(f"  -> {dst.name}: {len(questions)} questions written ({errors} failures)")
+    print(f"  -> {dst.name}: {len(doc['questions'])} questions written ({errors} failures)")
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
@@ -454,7 +457,7 @@ def main():
     parser.add_argument('--count', type=int, default=50,
                         help='Max questions per domain (default 50)')
     parser.add_argument('--resume', action='store_true',
-                        help='Skip tables already in output JSON')
+                        help='Continue the job queue (merge leftovers, skip done tables)')
     parser.add_argument('--api-key', default=None,
                         help='Anthropic API key (overrides env / .env)')
     args = parser.parse_args()
@@ -16,7 +16,9 @@ Run:
 Options:
   --domain CODE         Domain to generate for (currently: CASS)
   --count N             Max source questions to process (default: all)
-  --resume              Skip source questions already in the output file
+  --resume              Continue the domain's job queue (data/jobs.sqlite): merge
+                        results a killed run left behind and skip done source
+                        questions.  Start extra --resume workers to share the queue.
   --subdomains S [S..]  Only process specific subdomain files (e.g. intelligence neuropsych)
   --api-key KEY         Anthropic API key (overrides env / .env)
 """
@@ -24,6 +26,12 @@ Options:
 import json, pathlib, argparse, time, sys, os, re
 import anthropic
 
+from content_schema import SCHEMAS, SchemaError, validate_record
+from coverage_plan import Coverage, order_by_coverage, vignette_coverage
+from data_io import load_json, save_json
+from gen_metrics import Telemetry
+from job_queue import JobQueue
+
 # ── Paths ─────────────────────────────────────────────────────────────────────
 DATA       = pathlib.Path("data")
 QUESTIONS  = pathlib.Path("../PassEPPP-website/content/questions")
@@ -82,8 +90,7 @@ def load_api_key(args_key):
 def load_vignettes(domain):
     path = DATA / f"{domain}_vignettes.json"
     if path.exists():
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        return load_json(path)
     return {
         "domain_code":  domain,
         "domain_name":  DOMAIN_NAMES.get(domain, domain),
@@ -95,21 +102,20 @@ def load_vignettes(domain):
 def save_vignettes(domain, data):
     data["total"] = len(data["questions"])
     path = DATA / f"{domain}_vignettes.json"
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_json(path, data)
     _update_manifest(domain, data)
 
 def _update_manifest(domain, data):
     """Keep data/vignette_stats.json current after each save."""
     manifest_path = DATA / "vignette_stats.json"
     try:
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+        manifest = load_json(manifest_path) if manifest_path.exists() else {}
     except Exception:
         manifest = {}
     qs = data["questions"]
     anchors = len(set(q.get("source_question_id", "") for q in qs))
     manifest[domain] = {"anchors": anchors, "vignettes": len(qs)}
-    manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    save_json(manifest_path, manifest)
 
 # ── Load source questions ──────────────────────────────────────────────────────
 def load_source_questions(domain, subdomain_filter=None):
@@ -127,8 +133,7 @@ def load_source_questions(domain, subdomain_filter=None):
         if not path.exists():
             print(f"  [WARN] Source file not found: {path}", file=sys.stderr)
             continue
-        with open(path, encoding="utf-8") as f:
-            d = json.load(f)
+        d = load_json(path)
         subdomain = d["subdomain"]
         # Apply subdomain filter if set
         if subdomain_filter:
@@ -146,11 +151,16 @@ def load_source_questions(domain, subdomain_filter=None):
 
 # ── Check already-generated ────────────────────────────────────────────────────
 def already_generated_ids(vignettes_data):
-    """Return set of source_question_ids that already have all 5 levels.
-    Partial sets (< 5 records) are removed from the data to allow clean regeneration."""
+    """Return set of question-bank IDs that already have all 5 levels.
+    Renumbered records (renumber_ids.py) keep the bank ID in bank_question_id.
+    Partial sets (< 5 records) are removed from the data to allow clean regeneration.
+    (Queued runs commit all 5 levels at once; partial sets come from older runs.)"""
+    def bank_id(q):
+        return q.get("bank_question_id", q.get("source_question_id", ""))
+
     counts = {}
     for q in vignettes_data["questions"]:
-        sid = q.get("source_question_id", "")
+        sid = bank_id(q)
         counts[sid] = counts.get(sid, 0) + 1
 
     partial = {sid for sid, n in counts.items() if 0 < n < 5}
@@ -158,26 +168,15 @@ def already_generated_ids(vignettes_data):
         # Strip partial records so the anchor gets regenerated cleanly
         vignettes_data["questions"] = [
             q for q in vignettes_data["questions"]
-            if q.get("source_question_id") not in partial
+            if bank_id(q) not in partial
         ]
         print(f"  [INFO] Removed {len(partial)} partial anchor(s) for clean regeneration: {partial}")
 
     return {sid for sid, n in counts.items() if n >= 5}
 
-# ── Next source ID ─────────────────────────────────────────────────────────────
-def next_source_id(vignettes_data):
-    """Return an integer one higher than the max numeric source_question_id."""
-    max_n = 0
-    for q in vignettes_data["questions"]:
-        sid = q.get("source_question_id", "")
-        # Accept PassEPPP-format IDs as-is (non-numeric); skip for max calc
-        try:
-            max_n = max(max_n, int(sid))
-        except (ValueError, TypeError):
-            pass
-    return max_n + 1
-
 # ── Claude prompt ──────────────────────────────────────────────────────────────
+MODEL = "claude-opus-4-6"
+
 SYSTEM_PROMPT = """\
 You are an expert EPPP exam question writer. You generate clinical vignette \
 multiple-choice questions for psychology licensing exam preparation.
@@ -289,6 +288,10 @@ def build_records(items, source_id, source_q, subdomain, domain_code):
     return records
 
 # ── Validate a parsed set ──────────────────────────────────────────────────────
+# Per-item slice of the vignette schema (ids and domain tags are added later)
+VIGNETTE_ITEM = SCHEMAS["vignette"].subset("difficulty_level", "vignette", "question",
+                                           "options", "correct_answer")
+
 def validate_items(items):
     if not isinstance(items, list) or len(items) != 5:
         raise ValueError(f"Expected 5 items, got {len(items) if isinstance(items, list) else type(items)}")
@@ -296,18 +299,16 @@ def validate_items(items):
     if levels != [1, 2, 3, 4, 5]:
         raise ValueError(f"Expected levels [1,2,3,4,5], got {levels}")
     for item in items:
-        for field in ("vignette", "question", "options", "correct_answer"):
-            if not item.get(field):
-                raise ValueError(f"Missing field '{field}' in level {item.get('difficulty_level')}")
-        if item["correct_answer"] not in item["options"]:
-            raise ValueError(f"correct_answer '{item['correct_answer']}' not in options keys")
+        errs = validate_record(VIGNETTE_ITEM, item, path=f"$.L{item.get('difficulty_level')}")
+        if errs:
+            raise SchemaError(errs)
 
 # ── Main ───────────────────────────────────────────────────────────────────────
 def main():
     parser = argparse.ArgumentParser(description="Generate clinical vignettes from PassEPPP question bank.")
     parser.add_argument("--domain",      required=True, help="Domain code, e.g. CASS")
     parser.add_argument("--count",       type=int, default=None, help="Max source questions to process")
-    parser.add_argument("--resume",      action="store_true", help="Skip questions already in output file")
+    parser.add_argument("--resume",      action="store_true", help="Continue the job queue (merge leftovers, skip done questions)")
     parser.add_argument("--subdomains",  nargs="+", default=None, help="Filter by subdomain keyword(s)")
     parser.add_argument("--api-key",     default=None, help="Anthropic API key")
     args = parser.parse_args()
@@ -319,10 +320,25 @@ def main():
     api_key = load_api_key(args.api_key)
     client  = anthropic.Anthropic(api_key=api_key)
 
-    # Load existing output
-    vdata    = load_vignettes(domain)
-    done_ids = already_generated_ids(vdata) if args.resume else set()
-    next_id  = next_source_id(vdata)
+    queue = JobQueue("vignettes", domain)
+    path = DATA / f"{domain}_vignettes.json"
+
+    # Load existing output (with results a killed run or another worker left in the queue)
+    if args.resume:
+        vdata, recovered = queue.merge_into(path, base=load_vignettes(domain), count_keys=["total"])
+        if recovered:
+            print(f"Recovered {recovered} queued vignette(s)")
+            _update_manifest(domain, vdata)
+        before = len(vdata["questions"])
+        done_ids = already_generated_ids(vdata)
+        if len(vdata["questions"]) != before:
+            save_vignettes(domain, vdata)
+        # Failed anchors wait for `job_queue.py retry`; in-flight ones belong to another worker
+        done_ids |= queue.keys("done", "failed", "in_flight")
+    else:
+        vdata = load_vignettes(domain)
+        queue.reset()
+        done_ids = set()
 
     # Load source questions
     src_qs = load_source_questions(domain, args.subdomains)
@@ -334,42 +350,52 @@ def main():
         (pid, sub, q) for pid, sub, q in src_qs
         if pid not in done_ids
     ]
+    # Thinnest subdomains first — each anchor fills all five levels of its subdomain
+    gaps = Coverage()
+    for (sub, _), n in vignette_coverage(vdata["questions"]).counts.items():
+        gaps.add(sub, n)
+    to_process = order_by_coverage(to_process, lambda t: t[1], gaps)
     if args.count:
         to_process = to_process[:args.count]
-    print(f"To process: {len(to_process)}\n")
+    queue.plan((pid, {"subdomain": sub, "question": q}) for pid, sub, q in to_process)
+    print(f"To process: {len(to_process)}  [queue: {queue.summary()}]\n")
 
+    tel = Telemetry("vignettes", domain, MODEL, SYSTEM_PROMPT)
     generated = 0
     errors    = 0
 
-    for i, (passeppp_id, subdomain, source_q) in enumerate(to_process, 1):
-        source_id = passeppp_id  # Use PassEPPP ID directly as source_question_id
+    for i, job in enumerate(queue.jobs(limit=args.count), 1):
+        source_id = job.key  # Use PassEPPP ID directly as source_question_id
+        subdomain, source_q = job.payload["subdomain"], job.payload["question"]
         print(f"[{i}/{len(to_process)}] {source_id} | {subdomain[:45]}", end=" ... ", flush=True)
 
         try:
-            msg = client.messages.create(
-                model="claude-opus-4-6",
-                max_tokens=4096,
-                system=SYSTEM_PROMPT,
-                messages=[{
-                    "role": "user",
-                    "content": build_user_message(source_q, subdomain, DOMAIN_NAMES.get(domain, domain))
-                }],
-            )
-            raw = msg.content[0].text
-            items = parse_response(raw)
-            validate_items(items)
+            with tel.request(item=source_id, attempt=job.attempts - 1, batch=5) as req:
+                msg = client.messages.create(
+                    model=MODEL,
+                    max_tokens=4096,
+                    system=SYSTEM_PROMPT,
+                    messages=[{
+                        "role": "user",
+                        "content": build_user_message(source_q, subdomain, DOMAIN_NAMES.get(domain, domain))
+                    }],
+                )
+                req.response(msg)
+                raw = msg.content[0].text
+                items = parse_response(raw)
+                validate_items(items)
+                req.accept(len(items))
             # Sort by level
             items.sort(key=lambda x: x["difficulty_level"])
             records = build_records(items, source_id, source_q, subdomain, domain)
-            vdata["questions"].extend(records)
+            # All 5 levels are committed to the queue together — never a partial anchor
+            queue.done(job, records)
             generated += 1
             print(f"OK ({len(records)} records)")
 
-            # Save after every question to preserve progress
-            save_vignettes(domain, vdata)
-
         except Exception as e:
             errors += 1
+            queue.fail(job, e)
             print(f"ERROR: {e}")
             time.sleep(2)
             continue
@@ -377,6 +403,11 @@ def main():
         # Respect rate limits
         time.sleep(0.5)
 
+    # Write output (merged with anything other workers finished meanwhile)
+    vdata, _ = queue.merge_into(path, base=load_vignettes(domain), count_keys=["total"])
+    _update_manifest(domain, vdata)
+    queue.close()
+
     print(f"\nDone. Generated: {generated} anchors ({generated * 5} vignettes). Errors: {errors}")
     print(f"Total {domain} vignettes now: {len(vdata['questions'])}")
 
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+glb_io.py — Minimal binary glTF (GLB) container reader/writer
+
+Just enough of the GLB layout for the mesh tooling to inspect and rewrite
+files without a full glTF library:
+
+  12-byte header   magic 'glTF', version 2, total length
+  JSON chunk       scene description (padded with spaces to 4 bytes)
+  BIN chunk        binary buffer 0 (padded with zeros to 4 bytes)
+
+Accessor reads handle plain (uncompressed) bufferViews only; Draco- and
+meshopt-compressed primitives are detected via extensionsUsed.
+"""
+
+import json
+import struct
+import numpy as np
+from pathlib import Path
+
+GLB_MAGIC  = 0x46546C67   # 'glTF'
+CHUNK_JSON = 0x4E4F534A   # 'JSON'
+CHUNK_BIN  = 0x004E4942   # 'BIN\0'
+
+# glTF componentType → numpy dtype
+COMPONENT_DTYPES = {
+    5120: np.int8,   5121: np.uint8,
+    5122: np.int16,  5123: np.uint16,
+    5125: np.uint32, 5126: np.float32,
+}
+TYPE_SIZES = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT4": 16}
+
+COMPRESSION_EXTENSIONS = ("KHR_draco_mesh_compression", "EXT_meshopt_compression")
+
+
+def read_glb(path):
+    """Return (gltf_json: dict, bin_chunk: bytes) for a .glb file."""
+    data = Path(path).read_bytes()
+    magic, version, length = struct.unpack_from("<III", data, 0)
+    if magic != GLB_MAGIC:
+        raise ValueError(f"{path}: not a GLB file")
+    if version != 2:
+        raise ValueError(f"{path}: unsupported GLB version {version}")
+    gltf, binary = None, b""
+    off = 12
+    while off < length:
+        clen, ctype = struct.unpack_from("<II", data, off)
+        chunk = data[off + 8: off + 8 + clen]
+        if ctype == CHUNK_JSON:
+            gltf = json.loads(chunk.decode("utf-8"))
+        elif ctype == CHUNK_BIN:
+            binary = bytes(chunk)
+        off += 8 + clen
+    if gltf is None:
+        raise ValueError(f"{path}: missing JSON chunk")
+    return gltf, binary
+
+
+def _pad4(b, fill):
+    return b + fill * ((4 - len(b) % 4) % 4)
+
+
+def write_glb(path, gltf, binary=b""):
+    """Write a GLB from a glTF dict and a single binary buffer."""
+    if binary:
+        gltf.setdefault("buffers", [{}])[0]["byteLength"] = len(binary)
+    js = _pad4(json.dumps(gltf, separators=(",", ":")).encode("utf-8"), b" ")
+    bn = _pad4(bytes(binary), b"\x00")
+    parts = [struct.pack("<II", len(js), CHUNK_JSON), js]
+    if bn:
+        parts += [struct.pack("<II", len(bn), CHUNK_BIN), bn]
+    body = b"".join(parts)
+    Path(path).write_bytes(struct.pack("<III", GLB_MAGIC, 2, 12 + len(body)) + body)
+
+
+def is_compressed(gltf):
+    used = set(gltf.get("extensionsUsed", []))
+    return any(ext in used for ext in COMPRESSION_EXTENSIONS)
+
+
+def read_accessor(gltf, binary, index):
+    """Read accessor `index` into a numpy array (shape (count,) or (count, n))."""
+    acc = gltf["accessors"][index]
+    dtype = np.dtype(COMPONENT_DTYPES[acc["componentType"]])
+    ncomp = TYPE_SIZES[acc["type"]]
+    count = acc["count"]
+    if "bufferView" not in acc:
+        raise ValueError(f"accessor {index} has no bufferView (compressed primitive?)")
+    bv = gltf["bufferViews"][acc["bufferView"]]
+    start = bv.get("byteOffset", 0) + acc.get("byteOffset", 0)
+    stride = bv.get("byteStride", 0)
+    elem = dtype.itemsize * ncomp
+    if stride and stride != elem:
+        raw = np.frombuffer(binary, dtype=np.uint8, count=stride * (count - 1) + elem,
+                            offset=start)
+        rows = np.lib.stride_tricks.as_strided(raw, shape=(count, elem), strides=(stride, 1))
+        arr = np.ascontiguousarray(rows).view(dtype).reshape(count, ncomp)
+    else:
+        arr = np.frombuffer(binary, dtype=dtype, count=count * ncomp, offset=start)
+        arr = arr.reshape(count, ncomp) if ncomp > 1 else arr
+    if acc.get("normalized"):
+        info = np.iinfo(dtype)
+        arr = np.maximum(arr.astype(np.float32) / info.max, -1.0)
+    return arr
+
+
+def read_mesh_arrays(path):
+    """
+    Concatenate every triangle primitive in a GLB into (verts, faces).
+    Node transforms are ignored — the pipeline exports geometry in world space.
+    """
+    gltf, binary = read_glb(path)
+    verts_all, faces_all, offset = [], [], 0
+    for mesh in gltf.get("meshes", []):
+        for prim in mesh.get("primitives", []):
+            if prim.get("mode", 4) != 4:
+                continue
+            v = read_accessor(gltf, binary, prim["attributes"]["POSITION"]).astype(np.float32)
+            if "indices" in prim:
+                f = read_accessor(gltf, binary, prim["indices"]).astype(np.int64).reshape(-1, 3)
+            else:
+                f = np.arange(len(v), dtype=np.int64).reshape(-1, 3)
+            verts_all.append(v)
+            faces_all.append(f + offset)
+            offset += len(v)
+    if not verts_all:
+        return np.zeros((0, 3), np.float32), np.zeros((0, 3), np.int64)
+    return np.vstack(verts_all), np.vstack(faces_all)
@@ -0,0 +1,197 @@
+"""
+id_alloc.py
+
+Sequential ID allocation shared by the generators.
+
+Each ID series (e.g. contrast IDs for PMET, "PMET_CONT_017") keeps a
+high-water mark in data/id_counters.json.  An allocator learns the series'
+high-water mark once — from the counter file, or by scanning the existing
+IDs a single time when the counter is missing or behind the data — and then
+hands out IDs in O(1) instead of re-scanning every record per append.
+
+Reservations happen under an exclusive lock on data/id_counters.json.lock,
+so two generator processes can never be handed the same number.  Each
+allocator also remembers where its last reservation ended.  If the counter
+has moved on by the next reservation, another process is appending to the
+same series (and will clobber the same data file on save), and
+IdCollisionError is raised.  Workers that merge through job_queue.py don't
+clobber each other; they pass shared=True, which keeps the numbers unique
+but allows the counter to move between reservations.
+
+    alloc = IdAllocator(f"contrast:{code}", f"{code}_CONT_{{n:03d}}",
+                        existing=(q["id"] for q in questions))
+    qid = alloc.next()                 # "PMET_CONT_043"
+
+    block = alloc.reserve(3)           # range(44, 47) for a model batch
+    ...
+    alloc.settle(45)                   # give back the unused tail
+
+USAGE:
+  python id_alloc.py                   # show every series' high-water mark
+  python id_alloc.py --rebuild         # recompute marks from the data files
+"""
+
+import argparse, re, sys
+from pathlib import Path
+
+from data_io import file_lock, load_json, save_json
+
+COUNTERS = Path("data") / "id_counters.json"
+
+
+class IdCollisionError(RuntimeError):
+    """Another process allocated from the same series mid-run."""
+
+
+def _read_counters(path: Path) -> dict:
+    return load_json(path) if path.exists() else {}
+
+
+def id_pattern(fmt: str) -> re.Pattern:
+    """'PMET_CONT_{n:03d}' -> ^PMET_CONT_(\\d+)$ (the number is the only field)."""
+    head, _, rest = fmt.partition("{n")
+    tail = rest.partition("}")[2]
+    return re.compile(f"^{re.escape(head)}(\\d+){re.escape(tail)}$")
+
+
+def high_water(ids, pattern: re.Pattern) -> int:
+    """Largest number among ids matching pattern (0 if none)."""
+    best = 0
+    for i in ids:
+        m = pattern.match(i) if isinstance(i, str) else None
+        if m:
+            best = max(best, int(m.group(1)))
+    return best
+
+
+class IdAllocator:
+    """Hands out fmt.format(n=...) IDs for one series.
+
+    series   key in the counter file, e.g. "contrast:PMET"
+    fmt      ID template with a single {n...} field, e.g. "CP-PMET-{n:04d}"
+    existing IDs already in the data; scanned once (lazily, on first use)
+    start    first number of an empty series
+    shared   other processes allocate from the series too (job-queue workers)
+    """
+
+    def __init__(self, series: str, fmt: str, existing=(), start: int = 1,
+                 path: Path = COUNTERS, shared: bool = False):
+        self.series, self.fmt, self.path = series, fmt, Path(path)
+        self.shared = shared
+        self.pattern = id_pattern(fmt)
+        self._existing = existing
+        self._floor = start - 1
+        self._end = None          # counter value right after our last reservation
+
+    def format(self, n: int) -> str:
+        return self.fmt.format(n=n)
+
+    def _data_mark(self) -> int:
+        if self._existing is not None:
+            self._floor = max(self._floor, high_water(self._existing, self.pattern))
+            self._existing = None
+        return self._floor
+
+    def reserve(self, count: int = 1) -> range:
+        """Reserve `count` consecutive numbers; returns them as a range."""
+        with file_lock(self.path):
+            counters = _read_counters(self.path)
+            mark = counters.get(self.series, 0)
+            if self._end is not None and mark != self._end and not self.shared:
+                raise IdCollisionError(
+                    f"{self.series}: counter moved from {self._end} to {mark} — another "
+                    f"process is allocating from this series; run one generator per domain")
+            mark = max(mark, self._data_mark())
+            block = range(mark + 1, mark + 1 + count)
+            counters[self.series] = self._end = block.stop - 1
+            save_json(self.path, counters)
+        return block
+
+    def peek(self) -> int:
+        """The number next_num() would return, without reserving it."""
+        with file_lock(self.path):
+            mark = _read_counters(self.path).get(self.series, 0)
+        return max(mark, self._data_mark()) + 1
+
+    def next_num(self) -> int:
+        return self.reserve(1).start
+
+    def next(self) -> str:
+        return self.format(self.next_num())
+
+    def reset(self, mark: int = 0):
+        """Restart the series (a fresh run that replaces the whole file)."""
+        with file_lock(self.path):
+            counters = _read_counters(self.path)
+            counters[self.series] = self._end = mark
+            save_json(self.path, counters)
+        self._existing, self._floor = None, mark
+
+    def settle(self, last_used: int):
+        """Move the mark to last_used after a batch used fewer (or, if the model
+        ran past the block, more) numbers than were reserved.  A shared
+        allocator leaves the mark alone once another worker has moved it."""
+        with file_lock(self.path):
+            counters = _read_counters(self.path)
+            if counters.get(self.series, 0) != self._end:
+                if self.shared:
+                    return
+                raise IdCollisionError(
+                    f"{self.series}: counter changed during the batch — another process "
+                    f"is allocating from this series")
+            counters[self.series] = self._end = max(last_used, self._data_mark())
+            save_json(self.path, counters)
+
+
+# ─── Known series (for the CLI's --rebuild) ───────────────────────────────────
+
+DOMAINS = ["PMET", "LDEV", "CPAT", "PTHE", "SOCU", "WDEV", "BPSY", "CASS", "PETH"]
+
+
+def known_series():
+    """(series, fmt, family, record key) for every allocator the generators use."""
+    for code in DOMAINS:
+        yield f"contrast:{code}",     f"{code}_CONT_{{n:03d}}", "contrast", "questions"
+        yield f"tables:{code}",       f"{code}-TBL-{{n:04d}}",  "tables", "questions"
+        yield f"presentations:{code}", f"CP-{code}-{{n:04d}}",  "presentations", "encounters"
+        yield f"passages:{code}",     f"{code}-{{n:04d}}",      "passages", "passages"
+        for prefix in ("PC", "SC", "VD"):
+            yield f"spot:{code}:{prefix}", f"{code}-{prefix}-{{n:04d}}", "spot", "questions"
+
+
+def rebuild(path: Path = COUNTERS) -> dict:
+    """Recompute every known series' mark from the data files."""
+    from data_io import domain_path, iter_records
+    from question_store import read_brain_questions
+
+    marks = {}
+    for series, fmt, family, key in known_series():
+        src = domain_path(series.split(":")[1], family)
+        if src.exists():
+            marks[series] = high_water((r.get("id") for r in iter_records(src, key)), id_pattern(fmt))
+    marks["brain"] = high_water((q.get("id") for q in read_brain_questions()), id_pattern("BRAIN-{n:03d}"))
+    with file_lock(path):
+        save_json(path, marks)
+    return marks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or rebuild ID high-water marks")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Recompute every mark from the data files")
+    args = parser.parse_args()
+
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+
+    marks = rebuild() if args.rebuild else _read_counters(COUNTERS)
+    if not marks:
+        print(f"{COUNTERS} not found — generators will seed it from the data on first use")
+        return
+    for series in sorted(marks):
+        print(f"  {series:<24} {marks[series]}")
+
+
+if __name__ == "__main__":
+    main()
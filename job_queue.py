@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+job_queue.py — Persistent, resumable work queue for the generators
+
+Every generator used to work out what was left by re-reading its own output
+(generate_tables' resume_key, generate_spot_errors' done_passage_ids,
+generate_vignettes' already_generated_ids), so an item that failed was
+either retried blindly or forgotten, and anything generated before a crash
+was lost with the in-memory list.  This queue keeps one row per planned item
+in data/jobs.sqlite:
+
+  pending     planned, not yet claimed
+  in_flight   claimed by a worker (host:pid) until its lease runs out
+  done        finished; the generated records are stored with the row
+  failed      gave up after max_attempts (the last error is kept)
+
+A generated item's records are committed to the queue the moment it
+finishes.  merge_into() then folds done results into the data file under a
+file lock, so a killed run loses at most the item it was working on, and
+several worker processes can drain the same (family, domain) queue side
+by side.  A worker that dies mid-item leaves its claim to expire; the next
+claim() puts it back to pending (or fails it after max_attempts).
+
+    queue = JobQueue("tables", "BPSY")
+    queue.plan((table_key, table) for table in todo)     # idempotent
+    for job in queue.jobs():
+        records = generate(job.payload)
+        if records:
+            queue.done(job, records)
+        else:
+            queue.fail(job, "no valid result")
+    queue.merge_into(domain_path("BPSY", "tables"), dedup=lambda q: q["id"])
+
+USAGE:
+  python job_queue.py status                          # state counts per queue
+  python job_queue.py failed --family tables          # failed items + last error
+  python job_queue.py retry --family tables --domain BPSY   # failed → pending
+  python job_queue.py clear --family spot:vocab --domain PMET
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from data_io import file_lock, load_json, save_json
+
+DATA_DIR = Path("data")
+DB_PATH = DATA_DIR / "jobs.sqlite"
+
+STATES = ("pending", "in_flight", "done", "failed")
+MAX_ATTEMPTS = 3
+LEASE_SECONDS = 15 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    family      TEXT NOT NULL,       -- generator family, e.g. 'tables', 'spot:vocab'
+    domain      TEXT NOT NULL,
+    key         TEXT NOT NULL,       -- stable item key within (family, domain)
+    priority    INTEGER NOT NULL,    -- claim order (lowest first)
+    payload     TEXT NOT NULL,       -- JSON input for the generator
+    state       TEXT NOT NULL DEFAULT 'pending',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    error       TEXT,
+    worker      TEXT,
+    lease_until REAL,
+    result      TEXT,                -- JSON list of generated records (done only)
+    merged      INTEGER NOT NULL DEFAULT 0,
+    updated     REAL NOT NULL,
+    PRIMARY KEY (family, domain, key)
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs (family, domain, state, priority);
+"""
+
+
+@dataclass
+class Job:
+    key: str
+    payload: object
+    attempts: int
+    finished: bool = False
+
+
+class JobQueue:
+    """The queue for one (family, domain) pair."""
+
+    def __init__(self, family, domain, db_path=DB_PATH,
+                 max_attempts=MAX_ATTEMPTS, lease=LEASE_SECONDS):
+        self.family, self.domain = family, domain
+        self.max_attempts, self.lease = max_attempts, lease
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+        self.db = sqlite3.connect(str(db_path), timeout=60, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def _tx(self):
+        """BEGIN IMMEDIATE … COMMIT: one writer at a time across processes."""
+        return _Transaction(self.db)
+
+    # ── Planning ──────────────────────────────────────────────────────────
+
+    def plan(self, items) -> int:
+        """Queue (key, payload) pairs in priority order; returns how many are new.
+        Re-planning a key that is still pending refreshes its payload and
+        priority; in-flight, done and failed items are left alone."""
+        now = time.time()
+        with self._tx():
+            before = self._count()
+            for priority, (key, payload) in enumerate(items):
+                self.db.execute(
+                    "INSERT INTO jobs (family, domain, key, priority, payload, updated) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (family, domain, key) DO UPDATE SET "
+                    "priority = excluded.priority, payload = excluded.payload, "
+                    "updated = excluded.updated WHERE state = 'pending'",
+                    (self.family, self.domain, str(key), priority,
+                     json.dumps(payload, ensure_ascii=False), now))
+            return self._count() - before
+
+    def _count(self, state=None) -> int:
+        sql = "SELECT count(*) FROM jobs WHERE family = ? AND domain = ?"
+        args = [self.family, self.domain]
+        if state:
+            sql += " AND state = ?"
+            args.append(state)
+        return self.db.execute(sql, args).fetchone()[0]
+
+    def keys(self, *states) -> set[str]:
+        """Keys of the jobs in any of the given states."""
+        marks = ", ".join("?" * len(states))
+        return {k for (k,) in self.db.execute(
+            f"SELECT key FROM jobs WHERE family = ? AND domain = ? AND state IN ({marks})",
+            (self.family, self.domain, *states))}
+
+    def reset(self):
+        """Drop every job for this (family, domain) — a fresh run."""
+        with self._tx():
+            self.db.execute("DELETE FROM jobs WHERE family = ? AND domain = ?",
+                            (self.family, self.domain))
+
+    def retry_failed(self) -> int:
+        with self._tx():
+            return self.db.execute(
+                "UPDATE jobs SET state = 'pending', attempts = 0, updated = ? "
+                "WHERE family = ? AND domain = ? AND state = 'failed'",
+                (time.time(), self.family, self.domain)).rowcount
+
+    # ── Claiming ──────────────────────────────────────────────────────────
+
+    def _expire_leases(self, now):
+        """In-flight items whose worker stopped renewing go back to pending,
+        or to failed once they've used up their attempts."""
+        args = (now, self.family, self.domain, now)
+        where = ("family = ? AND domain = ? AND state = 'in_flight' AND lease_until < ?")
+        self.db.execute(
+            f"UPDATE jobs SET state = 'failed', error = 'lease expired (worker died?)', "
+            f"worker = NULL, updated = ? WHERE {where} AND attempts >= {int(self.max_attempts)}", args)
+        self.db.execute(
+            f"UPDATE jobs SET state = 'pending', worker = NULL, updated = ? WHERE {where}", args)
+
+    def claim(self):
+        """The highest-priority pending job, now in flight for this worker (or None)."""
+        now = time.time()
+        with self._tx():
+            self._expire_leases(now)
+            row = self.db.execute(
+                "SELECT key, payload, attempts FROM jobs "
+                "WHERE family = ? AND domain = ? AND state = 'pending' "
+                "ORDER BY priority LIMIT 1", (self.family, self.domain)).fetchone()
+            if row is None:
+                return None
+            key, payload, attempts = row
+            self.db.execute(
+                "UPDATE jobs SET state = 'in_flight', attempts = attempts + 1, worker = ?, "
+                "lease_until = ?, updated = ? WHERE family = ? AND domain = ? AND key = ?",
+                (self.worker, now + self.lease, now, self.family, self.domain, key))
+        return Job(key, json.loads(payload), attempts + 1)
+
+    def jobs(self, limit=None):
+        """Claim jobs one at a time.  Leaving the loop early (break, Ctrl-C,
+        an exception) hands the unfinished job back to pending."""
+        claimed = 0
+        while limit is None or claimed < limit:
+            job = self.claim()
+            if job is None:
+                return
+            claimed += 1
+            try:
+                yield job
+            finally:
+                if not job.finished:
+                    self.release(job)
+
+    # ── Outcomes ──────────────────────────────────────────────────────────
+
+    def _finish(self, job, sql, args):
+        with self._tx():
+            self.db.execute(
+                f"UPDATE jobs SET {sql}, worker = NULL, lease_until = NULL, updated = ? "
+                f"WHERE family = ? AND domain = ? AND key = ?",
+                (*args, time.time(), self.family, self.domain, job.key))
+        job.finished = True
+
+    def done(self, job, records=()):
+        """Finished; records (possibly none, e.g. a duplicate) await merge_into()."""
+        self._finish(job, "state = 'done', error = NULL, result = ?, merged = 0",
+                     (json.dumps(list(records), ensure_ascii=False),))
+
+    def fail(self, job, error):
+        """Failed this attempt: back to pending, or failed for good after max_attempts."""
+        state = "failed" if job.attempts >= self.max_attempts else "pending"
+        self._finish(job, "state = ?, error = ?", (state, str(error)[:2000]))
+
+    def release(self, job):
+        """Hand a claimed job back untouched (the attempt isn't counted)."""
+        self._finish(job, "state = 'pending', attempts = max(attempts - 1, 0)", ())
+
+    # ── Results ───────────────────────────────────────────────────────────
+
+    def unmerged(self) -> list[tuple[str, list]]:
+        """(key, records) for done jobs not yet written to the data file."""
+        return [(key, json.loads(result)) for key, result in self.db.execute(
+            "SELECT key, result FROM jobs WHERE family = ? AND domain = ? "
+            "AND state = 'done' AND merged = 0 ORDER BY updated",
+            (self.family, self.domain))]
+
+    def merge_into(self, path, list_key="questions", base=None, count_keys=(), dedup=None):
+        """Append every unmerged result to the data file at path and mark it merged.
+
+        The file is re-read under a lock, so workers merging at the same time
+        never drop each other's records.  base is the document to start from
+        when the file doesn't exist yet; count_keys are set to the record
+        count; records whose dedup(record) is already present are dropped.
+        Returns (document, number of records added)."""
+        path = Path(path)
+        with file_lock(path):
+            pending = self.unmerged()
+            doc = load_json(path) if path.exists() else {**(base or {}), list_key: []}
+            if not pending:
+                return doc, 0
+            records = doc.setdefault(list_key, [])
+            seen = {dedup(r) for r in records} if dedup else set()
+            added = 0
+            for _, result in pending:
+                for rec in result:
+                    if dedup:
+                        k = dedup(rec)
+                        if k in seen:
+                            continue
+                        seen.add(k)
+                    records.append(rec)
+                    added += 1
+            for k in count_keys:
+                doc[k] = len(records)
+            save_json(path, doc)
+            with self._tx():
+                self.db.executemany(
+                    "UPDATE jobs SET merged = 1 WHERE family = ? AND domain = ? AND key = ?",
+                    [(self.family, self.domain, key) for key, _ in pending])
+        return doc, added
+
+    # ── Reporting ─────────────────────────────────────────────────────────
+
+    def counts(self) -> dict:
+        out = dict.fromkeys(STATES, 0)
+        for state, n in self.db.execute(
+                "SELECT state, count(*) FROM jobs WHERE family = ? AND domain = ? "
+                "GROUP BY state", (self.family, self.domain)):
+            out[state] = n
+        return out
+
+    def summary(self) -> str:
+        c = self.counts()
+        return "  ".join(f"{s} {c[s]}" for s in STATES)
+
+
+class _Transaction:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        self.db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type, *_):
+        self.db.execute("ROLLBACK" if exc_type else "COMMIT")
+        return False
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────────
+
+def _queues(db, family=None, domain=None):
+    sql, args = "SELECT DISTINCT family, domain FROM jobs WHERE 1", []
+    if family:
+        sql += " AND family = ?"
+        args.append(family)
+    if domain:
+        sql += " AND domain = ?"
+        args.append(domain)
+    return db.execute(sql + " ORDER BY family, domain", args).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and manage the generation job queue")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    for name, help_text in (("status", "State counts per (family, domain)"),
+                            ("failed", "List failed items with their last error"),
+                            ("retry", "Move failed items back to pending"),
+                            ("clear", "Delete a queue (the data files are untouched)")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--family", help="e.g. tables, vignettes, spot:mc")
+        p.add_argument("--domain", help="e.g. PMET")
+    args = parser.parse_args()
+
+    if not DB_PATH.exists():
+        print(f"{DB_PATH} not found — no generator has queued work yet")
+        return
+    db = sqlite3.connect(str(DB_PATH))
+    pairs = _queues(db, args.family, args.domain)
+    db.close()
+    if not pairs:
+        print("  no matching queues")
+        return
+
+    for family, domain in pairs:
+        with JobQueue(family, domain) as queue:
+            if args.cmd == "status":
+                print(f"  {family:<20} {domain:<6} {queue.summary()}")
+            elif args.cmd == "failed":
+                for key, attempts, error in queue.db.execute(
+                        "SELECT key, attempts, error FROM jobs WHERE family = ? AND domain = ? "
+                        "AND state = 'failed' ORDER BY key", (family, domain)):
+                    print(f"  {family} {domain} {key}  ({attempts}×)  {error}")
+            elif args.cmd == "retry":
+                print(f"  {family:<20} {domain:<6} {queue.retry_failed()} item(s) back to pending")
+            elif args.cmd == "clear":
+                queue.reset()
+                print(f"  {family:<20} {domain:<6} cleared")
+
+
+if __name__ == "__main__":
+    if not DATA_DIR.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
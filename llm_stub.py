@@ -0,0 +1,612 @@
+#!/usr/bin/env python3
+"""
+llm_stub.py — Offline stand-in for the Anthropic Messages API
+
+Serves POST /v1/messages on localhost so the generators can be benchmarked,
+load-tested and debugged without network access or API spend.  Three modes:
+
+  synth    (default) answers every request with a schema-valid fake output
+           built from the prompt itself — the table, passage, item pair,
+           encounter IDs, vignette source or brain-region list the generator
+           sent — so the generator's own validators accept it
+  replay   answers from a cassette recorded earlier (--miss synth falls back
+           to synth for requests the cassette doesn't hold)
+  record   forwards each request to the real API (--upstream) with the
+           caller's key and appends request + response to the cassette
+
+Requests are matched by a hash of (model, system, messages); repeated
+identical requests (retries) replay the recorded responses in order.
+
+A latency / fault profile is applied in synth and replay modes:
+
+  instant    no delay, no faults
+  realistic  ~1.5 s + 20 ms per output token (±30 %), 3 % 429 rate limits,
+             2 % 529 overloaded, 2 % malformed JSON, 1 % truncated output
+  flaky      the same delays with 10 % / 8 % / 8 % / 4 % faults
+  slow       realistic faults, 3× the delay
+
+Every choice is drawn from an RNG seeded with --seed and the request's hash
+(plus how many times that request was seen), so a run is reproducible no
+matter how requests interleave across worker processes.
+
+Point a generator at the stub with the SDK's own base-URL setting (the key
+is only checked for presence; generate_brain_questions.py reads the same
+variable):
+
+  ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=stub \\
+      python generate_presentations.py --domain CPAT --count 6
+
+Telemetry (gen_metrics.py) tags these requests with the base URL, so
+`gen_metrics.py summary` keeps stub runs apart from real ones.
+
+USAGE:
+  python llm_stub.py                                   # synth, realistic, port 8765
+  python llm_stub.py --profile instant --port 9000
+  python llm_stub.py --profile flaky --seed 7 --rate-limit-rate 0.2
+  python llm_stub.py --mode record --cassette data/llm_cassettes/tables.jsonl
+  python llm_stub.py --mode replay --cassette data/llm_cassettes/tables.jsonl --miss synth
+  curl http://127.0.0.1:8765/stats                     # counters so far
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from content_schema import AVATAR_EMOTIONS, CHART_CATEGORIES, QUESTION_TYPES
+
+DATA_DIR = Path("data")
+DEFAULT_CASSETTE = DATA_DIR / "llm_cassettes" / "default.jsonl"
+UPSTREAM = "https://api.anthropic.com"
+
+PROFILES = {
+    #             base s, s/out token, jitter, 429,  529,  malformed, truncated
+    "instant":   (0.0,    0.0,         0.0,    0.0,  0.0,  0.0,       0.0),
+    "realistic": (1.5,    0.020,       0.3,    0.03, 0.02, 0.02,      0.01),
+    "flaky":     (1.5,    0.020,       0.3,    0.10, 0.08, 0.08,      0.04),
+    "slow":      (4.5,    0.060,       0.3,    0.03, 0.02, 0.02,      0.01),
+}
+PROFILE_FIELDS = ("latency", "per_token", "jitter", "rate_limit_rate", "overload_rate",
+                  "malformed_rate", "truncate_rate")
+
+
+def request_key(body: dict) -> str:
+    canon = json.dumps({k: body.get(k) for k in ("model", "system", "messages")},
+                       sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canon.encode("utf-8")).hexdigest()[:24]
+
+
+def _text(content) -> str:
+    """A system / message content field (str or list of blocks) as plain text."""
+    if isinstance(content, str):
+        return content
+    return "".join(b.get("text", "") for b in content or () if isinstance(b, dict))
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def message(body: dict, text: str, stop_reason: str = "end_turn") -> dict:
+    prompt = _text(body.get("system")) + "".join(_text(m.get("content")) for m in body.get("messages", []))
+    return {
+        "id": "msg_stub_" + hashlib.sha1(text.encode("utf-8")).hexdigest()[:20],
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": stop_reason,
+        "stop_sequence": None,
+        "usage": {"input_tokens": _tokens(prompt), "output_tokens": _tokens(text)},
+    }
+
+
+def error_body(kind: str, msg: str) -> dict:
+    return {"type": "error", "error": {"type": kind, "message": f"llm_stub: {msg}"}}
+
+
+# ── Synthesizers (one per generator prompt) ───────────────────────────────────
+
+_WORD = re.compile(r"[A-Za-z][A-Za-z'-]{5,}")
+
+
+def _sentences(text: str) -> list[str]:
+    return [s for s in re.split(r"(?<=[.!?])\s+", text.strip()) if s]
+
+
+def _field(text: str, label: str) -> str:
+    m = re.search(rf"^[\s-]*{re.escape(label)}:\s*(.*)$", text, re.M)
+    return m.group(1).strip() if m else ""
+
+
+def _corrupt(word: str) -> str:
+    """A plausible-looking wrong word that can't collide with the original."""
+    return word[:-1] + "ized" if word.endswith("e") else word + "ic"
+
+
+def synth_table(user, system, rng):
+    headers = [h.strip() for h in _field(user, "Table headers").split("|")]
+    block = user.split("Table rows:\n", 1)[1].split("\n\n", 1)[0]
+    rows = [[c.strip() for c in line.split("|")] for line in block.splitlines() if line.strip()]
+    cells = [(r, c) for r, row in enumerate(rows) for c in range(1, min(len(row), len(headers)))
+             if row[c] and len(row[c]) <= 120]
+    if not cells:
+        cells = [(0, 1)]
+        rows[0][1:2] = [rows[0][1] if len(rows[0]) > 1 and rows[0][1] else "n/a"]
+    br, bc = rng.choice(cells)
+    correct = rows[br][bc]
+    pool = [row[c] for row in rows for c in range(1, len(row))
+            if row[c] and row[c] != correct and len(row[c]) <= 120]
+    distractors = list(dict.fromkeys(pool))
+    rng.shuffle(distractors)
+    distractors = distractors[:3]
+    while len(distractors) < 3:
+        distractors.append(f"{correct} (variant {len(distractors) + 1})")
+    options = distractors[:]
+    idx = rng.randrange(4)
+    options.insert(idx, correct)
+    return {
+        "blank_row": br,
+        "blank_col": bc,
+        "correct_value": correct,
+        "options": options,
+        "correct_option_index": idx,
+        "explanation": f"In this table, {headers[0] or 'the row'} '{rows[br][0]}' pairs with "
+                       f"'{correct}' under {headers[bc] if bc < len(headers) else 'this column'}.",
+    }
+
+
+def _passage(user: str) -> str:
+    return user.split("Original passage:\n", 1)[1].rsplit("\n\nGenerate", 1)[0].strip()
+
+
+def _swap_word(sentence: str, rng, avoid=()):
+    """(word, corrupted) for a long word in sentence not appearing in avoid texts."""
+    words = [w for w in _WORD.findall(sentence)
+             if not any(w.lower() in a.lower() for a in avoid)]
+    if not words:
+        words = _WORD.findall(sentence) or ["concept"]
+    word = rng.choice(words)
+    return word, _corrupt(word)
+
+
+def synth_spot_mc(user, system, rng):
+    passage = _passage(user)
+    word, wrong = _swap_word(passage, rng)
+    options = [f"'{wrong}' should be '{word}'"] + [
+        f"'{w}' is used incorrectly" for w in rng.sample(_WORD.findall(passage) or ["term"] * 3, 3)]
+    idx = rng.randrange(4)
+    options.insert(idx, options.pop(0))
+    return {
+        "modified_passage": passage.replace(word, wrong, 1),
+        "error_original": wrong,
+        "error_correct": word,
+        "options": options,
+        "correct_option_index": idx,
+        "explanation": f"The passage says '{wrong}', but the correct term is '{word}'.",
+    }
+
+
+def synth_spot_passage_click(user, system, rng):
+    sents = _sentences(_passage(user))
+    while len(sents) < 4:
+        sents.append("This sentence pads the synthetic passage to the minimum length.")
+    tsi = rng.randrange(len(sents))
+    others = [s for i, s in enumerate(sents) if i != tsi]
+    word, wrong = _swap_word(sents[tsi], rng, avoid=others)
+    if any(word.lower() in s.lower() for s in others):
+        word, wrong = "stubword", "stubwordic"
+        sents[tsi] = sents[tsi].rstrip(".") + " stubword."
+    original = sents[tsi]
+    sents[tsi] = original.replace(word, wrong, 1)
+    return {
+        "sentences": sents,
+        "target_sentence_index": tsi,
+        "original_sentence": original,
+        "error_original": wrong,
+        "error_correct": word,
+        "explanation": f"'{wrong}' should read '{word}'.",
+    }
+
+
+def synth_spot_sentence_click(user, system, rng):
+    words = _passage(user).split()
+    while len(words) < 15:
+        words += ["the", "synthetic", "sentence", "continues", "here"]
+    words = words[:max(15, min(len(words), 24))]
+    cut1, cut2 = len(words) // 3, 2 * len(words) // 3
+    chunks = [words[:cut1], words[cut1:cut2], words[cut2:]]
+    target = 1 + rng.randrange(2)
+    word, wrong = _swap_word(" ".join(chunks[target]), rng)
+    phrases = [" ".join(c) + (" " if i < 2 else "") for i, c in enumerate(chunks)]
+    phrases[target] = phrases[target].replace(word, wrong, 1)
+    return {
+        "modified_sentence": "".join(phrases),
+        "phrases": phrases,
+        "target_phrase_index": target,
+        "error_original": wrong,
+        "error_correct": word,
+        "explanation": f"'{wrong}' should read '{word}'.",
+    }
+
+
+def synth_spot_vocab(user, system, rng):
+    terms = list(dict.fromkeys(_WORD.findall(_passage(user))))
+    rng.shuffle(terms)
+    terms = (terms + ["Construct", "Variable", "Criterion", "Baseline"])[:4]
+    tei = rng.randrange(4)
+    entries = [{"term": t, "definition": f"The passage uses {t.lower()} to describe a core idea "
+                                         f"of this section.", "is_target": i == tei}
+               for i, t in enumerate(terms)]
+    entries[tei]["definition"] = entries[tei]["definition"].replace("core", "peripheral")
+    return {
+        "entries": entries,
+        "target_entry_index": tei,
+        "error_original": "peripheral",
+        "error_correct": "core",
+        "explanation": f"{terms[tei]} names a core idea, not a peripheral one.",
+    }
+
+
+def synth_contrast(user, system, rng):
+    x, y = _field(user, "item_x"), _field(user, "item_y")
+    return {
+        "question": f"A clinician must choose between {x} and {y}. Which fits a case defined "
+                    f"by the first distinguishing feature?",
+        "answer": x,
+        "key_distinction": f"{x} is defined by its first feature; {y} by its second.",
+        "commonly_confused_because": f"{x} and {y} share vocabulary and often co-occur.",
+    }
+
+
+def _options(rng, stem):
+    correct = rng.choice("ABCD")
+    opts = {k: f"{stem} option {k}" for k in "ABCD"}
+    return opts, correct
+
+
+def synth_encounters(user, system, rng):
+    ids = [i.strip() for i in _field(user, "IDs to use (in order)").split(",") if i.strip()]
+    subs = re.findall(r'"([^"]+)"', _field(user, "Subdomains to cover")) or ["General"]
+    levels = [int(n) for n in re.findall(r"\d", _field(
+        user, "Difficulty levels to use in this batch").split("(")[0])] or [1]
+
+    def listed(label, allowed):
+        line = (_field(user, f"{label} (must appear at least once each)")
+                or _field(user, f"{label} (at least once each)"))
+        return [x.strip() for x in line.split(",") if x.strip() in allowed]
+
+    emotions = listed("Avatar emotions to include", AVATAR_EMOTIONS) or ["anxious"]
+    qtypes = listed("Question types to include", QUESTION_TYPES) or ["primary_diagnosis"]
+    out = []
+    for n, enc_id in enumerate(ids):
+        domain = enc_id.split("-")[1]
+        phases = []
+        for p in range(3):
+            phases.append({
+                "phase_id": p + 1,
+                "phase_label": ["Presentation", "History", "Clarification"][p],
+                "dialogue": f"Patient {n + 1}, phase {p + 1}: synthetic dialogue.",
+                "avatar_emotion": emotions[(n + p) % len(emotions)],
+                "chart_reveals": [{"category": CHART_CATEGORIES[(n + p) % len(CHART_CATEGORIES)],
+                                   "label": "Synthetic finding", "value": f"Finding {p + 1}"}],
+            })
+        questions = []
+        for q in range(2):
+            opts, correct = _options(rng, f"Encounter {n + 1} Q{q + 1}")
+            questions.append({
+                "question_id": f"q{q + 1}",
+                "type": qtypes[(n + q) % len(qtypes)],
+                "prompt": f"Synthetic question {q + 1} for encounter {n + 1}?",
+                "options": opts,
+                "correct_answer": correct,
+                "explanation": "Synthetic explanation.",
+                "distractor_rationale": {k: f"Why {k} is wrong." for k in "ABCD" if k != correct},
+            })
+        out.append({
+            "id": enc_id,
+            "domain_code": domain,
+            "subdomain": subs[n % len(subs)],
+            "difficulty_level": levels[n % len(levels)],
+            "encounter": {
+                "setting": f"Synthetic clinic {n + 1}",
+                "referral_context": "Synthetic referral.",
+                "patient": {"label": f"Patient {n + 1}", "initial_avatar_state": emotions[n % len(emotions)]},
+                "phases": phases,
+            },
+            "questions": questions,
+        })
+    return out
+
+
+def synth_vignettes(user, system, rng):
+    stem = _field(user, "Subdomain") or "this topic"
+    out = []
+    for lvl in range(1, 6):
+        opts, correct = _options(rng, f"L{lvl}")
+        out.append({
+            "difficulty_level": lvl,
+            "vignette": f"A synthetic level-{lvl} case about {stem}.",
+            "question": "Which option best fits the case?",
+            "options": opts,
+            "correct_answer": correct,
+            "hint_words": ["synthetic", stem.split()[0].lower()] if lvl <= 3 else [],
+            "option_explanations": {k: f"Why {k}." for k in "ABCD"},
+        })
+    return out
+
+
+def synth_brain(user, system, rng):
+    block = user.split("## Available brain region keys", 1)[1].split("\n", 1)[1].split("\n## ", 1)[0]
+    regions = json.loads(block)
+    regions = list(regions) if isinstance(regions, dict) else regions
+    count = int(re.search(r"exactly (\d+) question objects", user).group(1))
+    start = int(re.search(r"Number IDs sequentially from BRAIN-(\d+)", user).group(1))
+    out = []
+    for i in range(count):
+        target, *distractors = rng.sample(regions, 4)
+        out.append({
+            "id": f"BRAIN-{start + i:03d}",
+            "type": rng.choice(["case_to_location", "deficit_to_location"]),
+            "category": "synthetic",
+            "domain_source": "BPSY",
+            "difficulty": "hard",
+            "question": f"Synthetic case {i + 1}: which region is responsible?",
+            "target_region": target,
+            "distractor_regions": distractors,
+            "explanation": f"Synthetic: {target} rather than {distractors[0]}.",
+        })
+    return out
+
+
+# (predicate on (user, system), synthesizer) — first match wins
+SYNTHESIZERS = [
+    (lambda u, s: "Table headers:" in u,                          synth_table),
+    (lambda u, s: "Original passage:" in u and '"sentences"' in s, synth_spot_passage_click),
+    (lambda u, s: "Original passage:" in u and '"phrases"' in s,   synth_spot_sentence_click),
+    (lambda u, s: "Original passage:" in u and '"entries"' in s,   synth_spot_vocab),
+    (lambda u, s: "Original passage:" in u,                        synth_spot_mc),
+    (lambda u, s: "item_x:" in u and "item_y:" in u,               synth_contrast),
+    (lambda u, s: "IDs to use (in order):" in u,                   synth_encounters),
+    (lambda u, s: "5-level vignette set" in u,                     synth_vignettes),
+    (lambda u, s: "Available brain region keys" in u,              synth_brain),
+]
+
+
+def synthesize(body: dict, rng: random.Random) -> str:
+    system = _text(body.get("system"))
+    user = _text(body["messages"][-1].get("content")) if body.get("messages") else ""
+    for matches, fn in SYNTHESIZERS:
+        if matches(user, system):
+            return json.dumps(fn(user, system, rng), ensure_ascii=False, indent=2)
+    return "{}"
+
+
+# ── Cassettes ─────────────────────────────────────────────────────────────────
+
+class Cassette:
+    """JSONL of {key, model, response, latency_s}; appended to while recording."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.entries: dict[str, list] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        e = json.loads(line)
+                        self.entries.setdefault(e["key"], []).append(e)
+
+    def get(self, key: str, nth: int):
+        hits = self.entries.get(key)
+        return hits[nth % len(hits)] if hits else None
+
+    def add(self, entry: dict):
+        with self._lock:
+            self.entries.setdefault(entry["key"], []).append(entry)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+# ── Server ────────────────────────────────────────────────────────────────────
+
+class StubState:
+    def __init__(self, args):
+        self.mode, self.miss, self.seed = args.mode, args.miss, args.seed
+        self.upstream = args.upstream.rstrip("/")
+        self.profile = dict(zip(PROFILE_FIELDS, PROFILES[args.profile]))
+        for f in PROFILE_FIELDS:
+            if getattr(args, f, None) is not None:
+                self.profile[f] = getattr(args, f)
+        self.recorded_latency = args.recorded_latency
+        self.cassette = Cassette(args.cassette) if args.mode in ("record", "replay") else None
+        self.stats = Counter()
+        self.seen = Counter()
+        self._lock = threading.Lock()
+
+    def count(self, *names):
+        with self._lock:
+            for n in names:
+                self.stats[n] += 1
+
+    def nth(self, key) -> int:
+        with self._lock:
+            n = self.seen[key]
+            self.seen[key] += 1
+            return n
+
+
+class Handler(BaseHTTPRequestHandler):
+    state: StubState = None
+    verbose = False
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, fmt, *args):
+        if self.verbose:
+            super().log_message(fmt, *args)
+
+    def _send(self, status, obj, headers=()):
+        data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        self.send_header("request-id", "req_stub")
+        for k, v in headers:
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            self._send(200, dict(self.state.stats))
+        else:
+            self._send(404, error_body("not_found_error", self.path))
+
+    def do_POST(self):
+        if not self.path.split("?")[0].rstrip("/").endswith("/v1/messages"):
+            self._send(404, error_body("not_found_error", f"no route {self.path}"))
+            return
+        raw = self.rfile.read(int(self.headers.get("content-length") or 0))
+        try:
+            body = json.loads(raw)
+        except json.JSONDecodeError:
+            self._send(400, error_body("invalid_request_error", "body is not JSON"))
+            return
+        st = self.state
+        key = request_key(body)
+        nth = st.nth(key)
+        st.count("requests")
+
+        if st.mode == "record":
+            self._record(body, raw, key)
+            return
+
+        rng = random.Random(f"{st.seed}:{key}:{nth}")
+        p = st.profile
+        roll = rng.random()
+        if roll < p["rate_limit_rate"]:
+            st.count("rate_limited")
+            self._send(429, error_body("rate_limit_error", "rate limited"), [("retry-after", "1")])
+            return
+        if roll < p["rate_limit_rate"] + p["overload_rate"]:
+            st.count("overloaded")
+            time.sleep(p["latency"] * rng.random())
+            self._send(529, error_body("overloaded_error", "overloaded"))
+            return
+
+        resp, latency = None, None
+        if st.mode == "replay":
+            entry = st.cassette.get(key, nth)
+            if entry is not None:
+                st.count("replayed")
+                resp = dict(entry["response"], model=body.get("model"))
+                latency = entry.get("latency_s") if st.recorded_latency else None
+            elif st.miss == "error":
+                st.count("missed")
+                self._send(404, error_body("not_found_error", f"request {key} not in cassette"))
+                return
+            else:
+                st.count("missed")
+        if resp is None:
+            st.count("synthesized")
+            text = synthesize(body, rng)
+            fault = rng.random()
+            if fault < p["malformed_rate"]:
+                st.count("malformed")
+                text = "Here is the JSON you asked for:\n" + text[: len(text) // 2]
+                resp = message(body, text)
+            elif fault < p["malformed_rate"] + p["truncate_rate"]:
+                st.count("truncated")
+                resp = message(body, text[: int(len(text) * 0.6)], stop_reason="max_tokens")
+            else:
+                resp = message(body, text)
+
+        if latency is None:
+            out_tokens = resp.get("usage", {}).get("output_tokens", 0)
+            base = p["latency"] + p["per_token"] * out_tokens
+            latency = base * (1 + p["jitter"] * (2 * rng.random() - 1))
+        time.sleep(max(0.0, latency))
+        st.count("ok")
+        self._send(200, resp)
+
+    def _record(self, body, raw, key):
+        st = self.state
+        headers = {k: v for k, v in self.headers.items()
+                   if k.lower() in ("x-api-key", "authorization", "anthropic-version",
+                                    "anthropic-beta", "content-type")}
+        req = urllib.request.Request(st.upstream + "/v1/messages", data=raw, headers=headers)
+        t0 = time.perf_counter()
+        try:
+            with urllib.request.urlopen(req, timeout=600) as r:
+                status, payload = r.status, json.loads(r.read())
+        except urllib.error.HTTPError as e:
+            status, payload = e.code, json.loads(e.read() or b"{}")
+        latency = round(time.perf_counter() - t0, 3)
+        if status == 200:
+            st.cassette.add({"key": key, "model": body.get("model"),
+                             "response": payload, "latency_s": latency})
+            st.count("recorded")
+        else:
+            st.count(f"upstream_{status}")
+        self._send(status, payload)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline stand-in for the Anthropic Messages API")
+    parser.add_argument("--mode", choices=["synth", "replay", "record"], default="synth")
+    parser.add_argument("--cassette", type=Path, default=DEFAULT_CASSETTE,
+                        help=f"Recorded responses (default: {DEFAULT_CASSETTE})")
+    parser.add_argument("--miss", choices=["synth", "error"], default="error",
+                        help="Replay: what to do with requests not in the cassette")
+    parser.add_argument("--recorded-latency", action="store_true",
+                        help="Replay: sleep for the recorded latency instead of the profile's")
+    parser.add_argument("--upstream", default=UPSTREAM, help="Record: the real API base URL")
+    parser.add_argument("--profile", choices=list(PROFILES), default="realistic")
+    parser.add_argument("--seed", default="0", help="Seed for latency, faults and fake content")
+    parser.add_argument("--latency", type=float, help="Base latency in seconds (overrides profile)")
+    parser.add_argument("--per-token", type=float, help="Seconds per output token")
+    parser.add_argument("--jitter", type=float, help="Latency jitter fraction (0.3 = ±30%%)")
+    parser.add_argument("--rate-limit-rate", type=float, help="Fraction answered 429")
+    parser.add_argument("--overload-rate", type=float, help="Fraction answered 529")
+    parser.add_argument("--malformed-rate", type=float, help="Fraction with broken JSON text")
+    parser.add_argument("--truncate-rate", type=float, help="Fraction cut off at max_tokens")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    if args.mode == "replay" and not args.cassette.exists():
+        print(f"ERROR: cassette {args.cassette} not found (record one with --mode record)")
+        sys.exit(1)
+
+    Handler.state = StubState(args)
+    Handler.verbose = args.verbose
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    url = f"http://{args.host}:{server.server_address[1]}"
+    print(f"llm_stub: {args.mode} mode, profile {args.profile}, listening on {url}")
+    print(f"  ANTHROPIC_BASE_URL={url} ANTHROPIC_API_KEY=stub python generate_<family>.py ...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print("\n  " + "  ".join(f"{k} {v}" for k, v in sorted(Handler.state.stats.items())))
+
+
+if __name__ == "__main__":
+    if not DATA_DIR.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+merge_content.py — Merge hand-authored content from authored/ into data/
+
+Hand-written encounters and tables used to live as Python literals inside
+expand_presentations.py, expand_tables.py and generate_seed_presentations.py,
+each with its own load-append-rewrite cycle over the data files.  They are
+now plain source files, and this one tool merges all of them:
+
+  authored/{family}/{DOMAIN}_{name}.json     (or .yaml / .yml with PyYAML)
+
+    {
+      "domain": "CPAT",
+      "description": "What this batch is and why",
+      "checks": {"min_phases": 4, "min_questions": 2},        optional
+      "target_header": {"domain_code": "CPAT", ...},          optional, used
+                                                              only to create a
+                                                              missing data file
+      "records": [ {...}, ... ]
+    }
+
+A run:
+  1. hashes every source record and skips the ones whose hash matches the
+     manifest from the last merge (data/content_manifest.json) — unchanged
+     records are neither validated nor touched;
+  2. validates only the new or edited records (the family's schema plus the
+     file's checks) and stops before writing if any fail;
+  3. streams each affected data/{DOMAIN}_{family}.json once, replacing
+     records by ID and appending new ones — a file whose records already
+     match is left alone, and several source files feeding one data file
+     still cost a single write.
+
+Validation is strict: warning-level rules (the 140-char table-option
+limit, …) block a merge like errors do, except the free-form chart
+categories and emotions hand-written encounters are allowed.
+
+A record without an "id" gets the next one from the family's ID series
+(id_alloc.py), and the ID is written back into its source file (JSON, or
+YAML re-dumped without its comments) so the next run matches it.  The
+source wins when it changes: edits made to a merged record in data/ are
+overwritten the next time its source is edited.
+
+USAGE:
+  python merge_content.py                     # merge everything that changed
+  python merge_content.py --dry-run           # what would be merged
+  python merge_content.py --family tables --domain PETH
+  python merge_content.py --force             # ignore the manifest, recheck every record
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from content_schema import FAMILIES, validate_record
+from data_io import RecordWriter, domain_path, iter_records, load_json, save_json, write_atomic
+from id_alloc import IdAllocator, known_series
+
+try:
+    import yaml
+except ImportError:          # optional — pip install pyyaml for .yaml sources
+    yaml = None
+
+AUTHORED_DIR = Path("authored")
+MANIFEST = Path("data") / "content_manifest.json"
+DOMAINS = ["PMET", "LDEV", "CPAT", "PTHE", "SOCU", "WDEV", "BPSY", "CASS", "PETH"]
+
+# New or edited records must pass warning-level rules too (e.g. the 140-char
+# table-option limit), as generator output does through assert_valid — except
+# where content_schema relaxes them on purpose: hand-written encounters may use
+# free-form chart categories and emotions.
+WARNINGS_ALLOWED = {"presentations"}
+
+# Extra rules a source file can opt into with "checks": {name: minimum}
+CHECKS = {
+    "min_phases":    lambda r: len(r.get("encounter", {}).get("phases", [])),
+    "min_questions": lambda r: len(r.get("questions", [])),
+}
+
+
+def record_hash(record) -> str:
+    canon = json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(canon.encode("utf-8")).hexdigest()[:16]
+
+
+def id_series(family, domain):
+    """(series, fmt) of the allocator the generators use for this family."""
+    for series, fmt, fam, _ in known_series():
+        if fam == family and series.split(":")[1] == domain and series.count(":") == 1:
+            return series, fmt
+    return None
+
+
+# ── Sources ───────────────────────────────────────────────────────────────────
+
+class Source:
+    """One content file: its records, plus where each one merges."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.family = path.parent.name
+        if path.suffix in (".yaml", ".yml"):
+            if yaml is None:
+                raise SystemExit(f"ERROR: {path} needs PyYAML (pip install pyyaml)")
+            with open(path, encoding="utf-8") as f:
+                self.doc = yaml.safe_load(f)
+        else:
+            self.doc = load_json(path)
+        self.domain = self.doc.get("domain")
+        self.records = self.doc.get("records", [])
+        self.checks = self.doc.get("checks", {})
+        self.stamped = False
+
+    @property
+    def target(self):
+        return self.family, self.domain
+
+    def errors(self) -> list[str]:
+        if self.family not in FAMILIES:
+            return [f"unknown family directory {self.family!r} (one of {', '.join(FAMILIES)})"]
+        if self.domain not in DOMAINS:
+            return [f"'domain' must be one of {', '.join(DOMAINS)}, not {self.domain!r}"]
+        unknown = set(self.checks) - set(CHECKS)
+        if unknown:
+            return [f"unknown check(s) {', '.join(sorted(unknown))} (known: {', '.join(CHECKS)})"]
+        return []
+
+    def validate(self, record, i) -> list[str]:
+        series = id_series(self.family, self.domain)
+        if not record.get("id") and series:
+            record = {**record, "id": series[1].format(n=0)}   # allocated at merge time
+        out = [f"records[{i}]{str(v)[1:]}" for v in validate_record(
+            FAMILIES[self.family].schema, record, {"domain_code": self.domain})
+            if v.level == "error" or self.family not in WARNINGS_ALLOWED]
+        for name, minimum in self.checks.items():
+            if CHECKS[name](record) < minimum:
+                out.append(f"records[{i}]  {name}: {CHECKS[name](record)} < {minimum}")
+        return out
+
+    def save(self):
+        """Write back IDs stamped onto id-less records (YAML comments are not
+        preserved by the rewrite)."""
+        if self.path.suffix == ".json":
+            save_json(self.path, self.doc)
+        else:
+            write_atomic(self.path, yaml.safe_dump(self.doc, sort_keys=False, allow_unicode=True))
+
+
+def find_sources(families=None, domains=None) -> list[Source]:
+    paths = sorted(p for p in AUTHORED_DIR.glob("*/*")
+                   if p.suffix in (".json", ".yaml", ".yml"))
+    sources = [Source(p) for p in paths]
+    return [s for s in sources
+            if (not families or s.family in families) and (not domains or s.domain in domains)]
+
+
+# ── Merge ─────────────────────────────────────────────────────────────────────
+
+def merge_target(family, domain, pending, header_for_new, dry_run=False):
+    """Stream data/{domain}_{family}.json once, replacing pending records by ID
+    and appending the rest.  pending: list of (source, record, hash).
+    Returns (replaced, added, unchanged) record counts."""
+    fam = FAMILIES[family]
+    path = domain_path(domain, family)
+    by_id = {rec["id"]: (src, rec, h) for src, rec, h in pending if rec.get("id")}
+    id_less = [(src, rec) for src, rec, _ in pending if not rec.get("id")]
+    replaced = unchanged = 0
+    seen_ids = set()
+
+    header = {}
+    writer = None if dry_run else RecordWriter(
+        path, header, fam.key, mode="compact" if family == "basic" else "pretty",
+        count_keys=[fam.count_key])
+    try:
+        if path.exists():
+            for rec in iter_records(path, fam.key, header):
+                rid = rec.get("id")
+                hit = by_id.get(rid) if rid not in seen_ids else None   # first copy only
+                seen_ids.add(rid)
+                if hit and record_hash(rec) != hit[2]:
+                    rec = hit[1]
+                    replaced += 1
+                elif hit:
+                    unchanged += 1
+                if writer:
+                    writer.write(rec)
+        else:
+            header.update(header_for_new or {"domain_code": domain})
+
+        new = [rec for rid, (_, rec, _) in by_id.items() if rid not in seen_ids]
+        if id_less:
+            series = id_series(family, domain)
+            if series is None:
+                raise SystemExit(f"ERROR: {family} has no ID series — give its records an 'id'")
+            alloc = IdAllocator(*series, existing=seen_ids | set(by_id))
+            for src, rec in id_less:
+                if dry_run:
+                    rec["id"] = f"(new {series[0]})"
+                else:
+                    rec["id"] = alloc.next()
+                    src.stamped = True
+                new.append(rec)
+        if writer:
+            for rec in new:
+                writer.write(rec)
+            if replaced or new:
+                writer.close()
+            else:
+                writer.abort()
+    except BaseException:
+        if writer:
+            writer.abort()
+        raise
+    return replaced, len(new), unchanged
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge hand-authored content from authored/ into data/")
+    parser.add_argument("--family", action="append", choices=list(FAMILIES),
+                        help="Restrict to a family (repeatable)")
+    parser.add_argument("--domain", action="append", choices=DOMAINS,
+                        help="Restrict to a domain (repeatable)")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would merge; write nothing")
+    parser.add_argument("--force", action="store_true",
+                        help="Ignore the manifest and recheck every source record")
+    args = parser.parse_args()
+
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+
+    sources = find_sources(args.family, args.domain)
+    manifest = {} if args.force or not MANIFEST.exists() else load_json(MANIFEST)
+    total = sum(len(s.records) for s in sources)
+
+    # 1–2. Hash everything, validate only what changed
+    pending, errors = defaultdict(list), []
+    for src in sources:
+        bad = src.errors()
+        if bad:
+            errors += [f"{src.path}  {e}" for e in bad]
+            continue
+        for i, rec in enumerate(src.records):
+            h = record_hash(rec)
+            key = f"{src.family}:{src.domain}:{rec.get('id')}"
+            if rec.get("id") and manifest.get(key) == h:
+                continue
+            errors += [f"{src.path}  {e}" for e in src.validate(rec, i)]
+            pending[src.target].append((src, rec, h))
+    if errors:
+        for e in errors:
+            print(f"  {e}")
+        print(f"\nERROR: {len(errors)} problem(s) in authored/ — nothing merged.")
+        sys.exit(1)
+
+    n_pending = sum(len(v) for v in pending.values())
+    print(f"{len(sources)} source file(s), {total} record(s); "
+          f"{total - n_pending} unchanged since the last merge, {n_pending} to check")
+
+    # 3. One streamed write per affected data file
+    for (family, domain), items in sorted(pending.items()):
+        header_for_new = next((s.doc.get("target_header") for s, _, _ in items
+                               if s.doc.get("target_header")), None)
+        replaced, added, same = merge_target(family, domain, items, header_for_new, args.dry_run)
+        verb = "would write" if args.dry_run else "wrote"
+        if replaced or added:
+            print(f"  {verb} {domain_path(domain, family).name}  "
+                  f"{replaced} replaced, {added} added, {same} already current")
+        else:
+            print(f"  {domain_path(domain, family).name}  {same} already current (not rewritten)")
+        if not args.dry_run:
+            for src, rec, _ in items:
+                manifest[f"{family}:{domain}:{rec['id']}"] = record_hash(rec)
+
+    if args.dry_run:
+        print("\n(dry run — nothing written)")
+        return
+    for src in {s for items in pending.values() for s, _, _ in items if s.stamped}:
+        src.save()
+        print(f"  stamped new IDs into {src.path}")
+    if pending:
+        save_json(MANIFEST, manifest)
+
+
+if __name__ == "__main__":
+    main()
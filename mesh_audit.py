@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+mesh_audit.py — Validate the brain mesh assets against a checked-in budget
+
+Every generator under data/brain_meshes writes geometry nobody measures: a
+re-run with a finer marching-cubes step or a forgotten decimation pass can
+double the download without anyone noticing.  This scans every GLB and JSON
+mesh the viewer loads and checks it against mesh_budget.json:
+
+  bytes            file size on disk (what the browser downloads)
+  verts / faces    after Draco decoding, summed over primitives
+  degenerate       faces with a repeated index or ~zero area
+  non_manifold     edges shared by more than two faces
+  open_edges       edges used by exactly one face — marching-cubes surfaces
+                   are closed, so these are holes, mostly the strip
+                   mesh_utils.remove_seam_faces cuts along the UV wrap
+  seam_edges       open edges touching the u=0/1 wrap band (meshes with UVs)
+  bounds           axis-aligned box in scene units; drift is measured against
+                   the box recorded in the budget, in scene units (the cortex
+                   transform maps the brain's longest axis to 2.0)
+
+The budget also records cortex_transform.json: if the transform changes,
+every overlay generated with the old one is misaligned, so that fails too.
+
+Budget (data/brain_meshes/mesh_budget.json):
+  {"transform": {"centre", "scale"},
+   "max_total_bytes": N,
+   "bounds_tolerance": 0.01,
+   "assets": {"amygdala.glb": {"max_bytes", "max_faces", "max_degenerate",
+                               "max_non_manifold", "max_open_edges",
+                               "bounds": [[minx, miny, minz], [maxx, maxy, maxz]]}}}
+
+Exits 1 on any regression, missing budget entry, transform change or mesh
+that couldn't be measured (a Draco GLB without DracoPy installed).
+
+USAGE:
+  pip install numpy DracoPy
+  python mesh_audit.py                 # audit, fail on regressions
+  python mesh_audit.py --update        # accept the current assets (+10% size headroom)
+  python mesh_audit.py --json report.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import numpy as np
+from pathlib import Path
+
+from glb_io import read_glb, read_accessor
+
+MESH_DIR = Path("data/brain_meshes")
+BUDGET_JSON = MESH_DIR / "mesh_budget.json"
+TRANSFORM_JSON = MESH_DIR / "cortex_transform.json"
+
+# --update headroom on size limits; topology limits are recorded exactly
+HEADROOM = 0.10
+BOUNDS_TOLERANCE = 0.01
+
+# Failure text for an asset audit_file() couldn't decode (no DracoPy) — it
+# fails the audit rather than passing unchecked, and blocks --update
+UNMEASURED = "not measured"
+
+# Faces whose area is below this fraction of diagonal² count as degenerate
+DEGENERATE_AREA = 1e-12
+# u within this distance of 0 or 1 is the wrap seam
+SEAM_BAND = 0.1
+
+
+# ── Loading ──────────────────────────────────────────────────────────────────
+
+def read_glb_mesh(path):
+    """(verts, faces, uv or None) for every triangle primitive in a GLB, Draco decoded."""
+    gltf, binary = read_glb(path)
+    verts, faces, uvs, offset = [], [], [], 0
+    for mesh in gltf.get("meshes", []):
+        for prim in mesh.get("primitives", []):
+            if prim.get("mode", 4) != 4:
+                continue
+            draco = prim.get("extensions", {}).get("KHR_draco_mesh_compression")
+            if draco is not None:
+                import DracoPy
+                bv = gltf["bufferViews"][draco["bufferView"]]
+                start = bv.get("byteOffset", 0)
+                decoded = DracoPy.decode(binary[start:start + bv["byteLength"]])
+                v = np.asarray(decoded.points, dtype=np.float32).reshape(-1, 3)
+                f = np.asarray(decoded.faces, dtype=np.int64).reshape(-1, 3)
+                uv = decoded.tex_coord
+                uv = np.asarray(uv, dtype=np.float32).reshape(-1, 2) if uv is not None and len(uv) else None
+            else:
+                attrs = prim["attributes"]
+                v = read_accessor(gltf, binary, attrs["POSITION"]).astype(np.float32)
+                if "indices" in prim:
+                    f = read_accessor(gltf, binary, prim["indices"]).astype(np.int64).reshape(-1, 3)
+                else:
+                    f = np.arange(len(v), dtype=np.int64).reshape(-1, 3)
+                uv = (read_accessor(gltf, binary, attrs["TEXCOORD_0"]).astype(np.float32)
+                      if "TEXCOORD_0" in attrs else None)
+            verts.append(v)
+            faces.append(f + offset)
+            uvs.append(uv)
+            offset += len(v)
+    if not verts:
+        return np.zeros((0, 3), np.float32), np.zeros((0, 3), np.int64), None
+    uv = np.vstack(uvs) if all(u is not None for u in uvs) else None
+    return np.vstack(verts), np.vstack(faces), uv
+
+
+def read_json_mesh(path):
+    """(verts, faces, uv or None) from a generate_subcortical_json.py mesh."""
+    d = json.loads(Path(path).read_text())
+    verts = np.asarray(d["positions"], dtype=np.float32).reshape(-1, 3)
+    faces = np.asarray(d["indices"], dtype=np.int64).reshape(-1, 3)
+    uv = np.asarray(d["uvs"], dtype=np.float32).reshape(-1, 2) if d.get("uvs") else None
+    return verts, faces, uv
+
+
+def mesh_files(mesh_dir=MESH_DIR):
+    return sorted(mesh_dir.glob("*.glb")) + sorted(mesh_dir.glob("*_mesh.json"))
+
+
+# ── Metrics ──────────────────────────────────────────────────────────────────
+
+def mesh_metrics(verts, faces, uv=None):
+    """Topology and geometry metrics for one triangle mesh (vectorized)."""
+    out = {"verts": int(len(verts)), "faces": int(len(faces))}
+    if len(faces) == 0:
+        out.update(degenerate=0, non_manifold=0, open_edges=0, bounds=None)
+        return out
+
+    a, b, c = (verts[faces[:, k]].astype(np.float64) for k in range(3))
+    area2 = np.linalg.norm(np.cross(b - a, c - a), axis=1)
+    diag = float(np.linalg.norm(verts.max(axis=0) - verts.min(axis=0))) or 1.0
+    repeated = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])
+    out["degenerate"] = int(np.count_nonzero(repeated | (area2 < DEGENERATE_AREA * diag * diag)))
+
+    # Undirected edges as one int64 key each; usage count per unique edge
+    e = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+    e.sort(axis=1)
+    keys, counts = np.unique(e[:, 0] * len(verts) + e[:, 1], return_counts=True)
+    out["non_manifold"] = int(np.count_nonzero(counts > 2))
+    open_keys = keys[counts == 1]
+    out["open_edges"] = int(len(open_keys))
+
+    if uv is not None and len(uv) == len(verts):
+        u = uv[:, 0]
+        ends = np.stack([open_keys // len(verts), open_keys % len(verts)], axis=1)
+        at_wrap = (u[ends] < SEAM_BAND) | (u[ends] > 1.0 - SEAM_BAND)
+        out["seam_edges"] = int(np.count_nonzero(at_wrap.any(axis=1)))
+
+    out["bounds"] = [[round(float(x), 5) for x in verts.min(axis=0)],
+                     [round(float(x), 5) for x in verts.max(axis=0)]]
+    return out
+
+
+def audit_file(path):
+    path = Path(path)
+    verts, faces, uv = (read_json_mesh if path.suffix == ".json" else read_glb_mesh)(path)
+    return dict(mesh_metrics(verts, faces, uv), bytes=path.stat().st_size)
+
+
+# ── Budget ───────────────────────────────────────────────────────────────────
+
+def load_transform():
+    if not TRANSFORM_JSON.exists():
+        return None
+    t = json.loads(TRANSFORM_JSON.read_text())
+    return {"centre": [round(float(x), 6) for x in t["centre"]], "scale": round(float(t["scale"]), 10)}
+
+
+def check(metrics, budget, transform):
+    """List of human-readable failures (empty = within budget)."""
+    failures = []
+    if budget.get("transform") and transform and budget["transform"] != transform:
+        failures.append(f"cortex_transform.json changed: {budget['transform']} → {transform} "
+                        f"(regenerate every overlay, then --update)")
+
+    assets = budget.get("assets", {})
+    tol = budget.get("bounds_tolerance", BOUNDS_TOLERANCE)
+    for name, m in metrics.items():
+        limits = assets.get(name)
+        if limits is None:
+            failures.append(f"{name}: no budget entry (review it, then --update)")
+            continue
+        for key, metric in (("max_bytes", "bytes"), ("max_faces", "faces"),
+                            ("max_degenerate", "degenerate"), ("max_non_manifold", "non_manifold"),
+                            ("max_open_edges", "open_edges")):
+            if key in limits and m[metric] > limits[key]:
+                failures.append(f"{name}: {metric} {m[metric]:,} > budget {limits[key]:,}")
+        if limits.get("bounds") and m["bounds"]:
+            drift = float(np.abs(np.asarray(m["bounds"]) - np.asarray(limits["bounds"])).max())
+            m["bounds_drift"] = round(drift, 5)
+            if drift > tol:
+                failures.append(f"{name}: bounds moved {drift:.4f} scene units (tolerance {tol})")
+
+    total = sum(m["bytes"] for m in metrics.values())
+    if "max_total_bytes" in budget and total > budget["max_total_bytes"]:
+        failures.append(f"total scene bytes {total:,} > budget {budget['max_total_bytes']:,}")
+    return failures
+
+
+def budget_from(metrics, transform, previous=None):
+    """A budget accepting the current assets, with HEADROOM on sizes."""
+    grow = lambda n: int(np.ceil(n * (1.0 + HEADROOM)))
+    previous = previous or {}
+    return {
+        "transform": transform,
+        "max_total_bytes": grow(sum(m["bytes"] for m in metrics.values())),
+        "bounds_tolerance": previous.get("bounds_tolerance", BOUNDS_TOLERANCE),
+        "assets": {
+            name: {
+                "max_bytes": grow(m["bytes"]),
+                "max_faces": grow(m["faces"]),
+                "max_degenerate": m["degenerate"],
+                "max_non_manifold": m["non_manifold"],
+                "max_open_edges": m["open_edges"],
+                "bounds": m["bounds"],
+            }
+            for name, m in metrics.items()
+        },
+    }
+
+
+def audit(paths=None, budget_path=BUDGET_JSON):
+    """Measure every mesh and check it against the budget.  Returns (metrics, failures)."""
+    paths = [Path(p) for p in paths] if paths else mesh_files()
+    metrics, unmeasured = {}, []
+    for path in paths:
+        try:
+            metrics[path.name] = audit_file(path)
+        except ImportError as e:
+            print(f"  {path.name}: skipped ({e}) — pip install DracoPy")
+            unmeasured.append(f"{path.name}: {UNMEASURED} ({e}) — pip install DracoPy")
+    budget = json.loads(Path(budget_path).read_text()) if Path(budget_path).exists() else {}
+    failures = check(metrics, budget, load_transform()) if budget else ["no budget file (run --update)"]
+    return metrics, unmeasured + failures
+
+
+def report(metrics, budget):
+    assets = budget.get("assets", {})
+    print(f"  {'Asset':32s} {'KB':>8} {'Faces':>9} {'Budget':>9} {'Degen':>6} "
+          f"{'NonMan':>7} {'Open':>6} {'Seam':>6} {'Drift':>7}")
+    for name, m in metrics.items():
+        cap = assets.get(name, {}).get("max_faces")
+        print(f"  {name:32s} {m['bytes'] / 1e3:8.0f} {m['faces']:9,} "
+              f"{format(cap, ',') if cap else '—':>9} {m['degenerate']:6,} {m['non_manifold']:7,} "
+              f"{m['open_edges']:6,} {m.get('seam_edges', '—'):>6} {m.get('bounds_drift', '—'):>7}")
+    total = sum(m["bytes"] for m in metrics.values())
+    cap = budget.get("max_total_bytes")
+    print(f"  Total: {total / 1e6:.2f} MB" + (f" of {cap / 1e6:.2f} MB budget" if cap else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Audit brain mesh assets against the size/topology budget")
+    parser.add_argument("files", nargs="*", help="GLB / *_mesh.json files (default: all in data/brain_meshes)")
+    parser.add_argument("--budget", default=str(BUDGET_JSON))
+    parser.add_argument("--update", action="store_true", help="Rewrite the budget from the current assets")
+    parser.add_argument("--json", metavar="PATH", help="Also write the metrics as JSON")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    metrics, failures = audit(args.files or None, args.budget)
+    budget_path = Path(args.budget)
+    budget = json.loads(budget_path.read_text()) if budget_path.exists() else {}
+
+    if args.update:
+        if any(UNMEASURED in f for f in failures):
+            print("ERROR: some meshes could not be measured (pip install DracoPy) — budget not updated.")
+            sys.exit(1)
+        if args.files:
+            # Partial update: keep every other asset's entry
+            fresh = budget_from(metrics, load_transform(), budget)
+            budget.setdefault("assets", {}).update(fresh["assets"])
+            budget["transform"] = fresh["transform"]
+            budget.setdefault("bounds_tolerance", BOUNDS_TOLERANCE)
+        else:
+            budget = budget_from(metrics, load_transform(), budget)
+        budget_path.write_text(json.dumps(budget, indent=2) + "\n")
+        print(f"  Budget written: {budget_path} ({len(budget['assets'])} assets)")
+        failures = check(metrics, budget, load_transform())
+
+    report(metrics, budget)
+    if args.json:
+        Path(args.json).write_text(json.dumps(metrics, indent=2))
+    print(f"  ({time.perf_counter() - t0:.1f}s)")
+
+    if failures:
+        print(f"\n  BUDGET FAILURES ({len(failures)}):")
+        for f in failures:
+            print(f"    ✗ {f}")
+        sys.exit(1)
+    print("\n  ✓ All meshes within budget")
+
+
+if __name__ == "__main__":
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
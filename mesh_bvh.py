@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+mesh_bvh.py — Precomputed BVH sidecars for the brain GLBs
+
+brain-3d-v3.js hover-picks against the 480k–655k-face cortex and every
+visible region overlay on each pointer move; three.js' default raycast
+tests every triangle.  three-mesh-bvh makes that logarithmic, but building
+the cortex BVH in the browser costs about a second at startup.  This module
+builds the same tree offline and writes it next to each GLB, in the node
+layout MeshBVH.deserialize() reads, so the viewer only wraps the buffers.
+
+Node layout (three-mesh-bvh, 32 bytes, depth-first, left child follows its
+parent):
+  float32[0..5]  AABB  minX minY minZ maxX maxY maxZ
+  internal       uint32[6] right child offset (in 4-byte words)
+                 uint32[7] split axis
+  leaf           uint32[6] triangle offset, uint16[14] count, uint16[15] 0xFFFF
+
+Trees are "indirect": leaves index into a triangle permutation instead of
+reordering the geometry's index buffer, so raycast faceIndex keeps the GLB
+face order (cortex_regions.py's per-face region IDs stay valid).  Splits are
+at the centre of the longest centroid axis (three-mesh-bvh's CENTER
+strategy), falling back to the median when one side would be empty.
+
+Sidecar ({glb stem}.bvh.bin, little-endian, 4-byte aligned):
+  char[4] 'BVH1', uint32 mesh count
+  per mesh:  uint32 node bytes, uint32 triangle count
+  per mesh:  node bytes, then uint32[triangle count] triangle permutation
+Meshes are in GLTFLoader traversal order (see cortex_regions.read_cortex_meshes).
+
+USAGE:
+  pip install numpy DracoPy          # DracoPy only for Draco-compressed GLBs
+  python mesh_bvh.py                 # every GLB under data/brain_meshes that
+                                     # is newer than its sidecar
+  python mesh_bvh.py data/brain_meshes/full_brain_draco.glb --force
+"""
+
+import argparse
+import os
+import struct
+import sys
+import time
+import numpy as np
+from pathlib import Path
+
+from cortex_regions import read_cortex_meshes
+
+MESH_DIR = Path("data/brain_meshes")
+MAGIC = b"BVH1"
+
+MAX_LEAF_TRIS = 10
+LEAF_FLAG = 0xFFFF
+
+# AABB padding relative to the mesh diagonal — absorbs float differences
+# between DracoPy and the browser's Draco decoder
+PAD = 1e-6
+
+# scene_pack.py stores region positions as uint16, QUANT_MAX steps across each
+# axis of the GLB's bounding box.  Sidecar nodes are padded by half a step on
+# top of PAD so they also bound the dequantized pack geometry (≈1.2e-5 scene
+# units off for the largest region, well above PAD × diagonal).
+QUANT_MAX = 65535
+
+NODE_DTYPE = np.dtype([("bounds", "<f4", 6), ("w6", "<u4"), ("w7", "<u4")])
+WORDS_PER_NODE = NODE_DTYPE.itemsize // 4
+
+
+def build_bvh(verts, faces, max_leaf=MAX_LEAF_TRIS, pad=0.0):
+    """
+    Build one BVH root over (verts, faces).  Node AABBs grow by PAD × the mesh
+    diagonal plus `pad` (scalar or per-axis).
+    Returns (nodes: structured array in NODE_DTYPE, perm: uint32 triangle order).
+    """
+    tri = verts[faces]                                   # (n, 3, 3)
+    tmin, tmax = tri.min(axis=1), tri.max(axis=1)
+    cent = (tmin + tmax) * 0.5
+    pad = PAD * float(np.linalg.norm(verts.max(axis=0) - verts.min(axis=0)) or 1.0) + np.asarray(pad)
+
+    perm = np.arange(len(faces), dtype=np.uint32)
+    nodes = []                                           # [bounds(6), w6, w7]
+    # (start, end, parent node index or -1) — pop order gives depth-first, left first
+    stack = [(0, len(faces), -1)]
+    while stack:
+        start, end, parent = stack.pop()
+        idx = len(nodes)
+        if parent >= 0:
+            nodes[parent][1] = idx * WORDS_PER_NODE      # only right children carry a parent
+        sel = perm[start:end]
+        bounds = np.concatenate([tmin[sel].min(axis=0) - pad, tmax[sel].max(axis=0) + pad])
+        count = end - start
+        if count <= max_leaf:
+            nodes.append([bounds, start, count | (LEAF_FLAG << 16)])
+            continue
+
+        c = cent[sel]
+        cmin, cmax = c.min(axis=0), c.max(axis=0)
+        axis = int(np.argmax(cmax - cmin))
+        left = c[:, axis] < (cmin[axis] + cmax[axis]) * 0.5
+        n_left = int(left.sum())
+        if n_left == 0 or n_left == count:
+            # Degenerate centre split — median by centroid
+            n_left = count // 2
+            order = np.argpartition(c[:, axis], n_left)
+        else:
+            order = np.concatenate([np.flatnonzero(left), np.flatnonzero(~left)])
+        perm[start:end] = sel[order]
+        nodes.append([bounds, 0, axis])
+        mid = start + n_left
+        stack.append((mid, end, idx))                    # right: patched when emitted
+        stack.append((start, mid, -1))                   # left: directly after its parent
+
+    out = np.zeros(len(nodes), dtype=NODE_DTYPE)
+    out["bounds"] = np.array([n[0] for n in nodes], dtype=np.float32)
+    out["w6"] = [n[1] for n in nodes]
+    out["w7"] = [n[2] for n in nodes]
+    return out, perm
+
+
+def sidecar_path(glb_path):
+    glb_path = Path(glb_path)
+    return glb_path.with_name(glb_path.stem + ".bvh.bin")
+
+
+def quant_pad(meshes):
+    """Half a scene_pack quantization step per axis, over all of a GLB's meshes."""
+    if not meshes:
+        return np.zeros(3)
+    verts = np.vstack([v for v, _ in meshes]).astype(np.float64)
+    return 0.5 * (verts.max(axis=0) - verts.min(axis=0)) / QUANT_MAX
+
+
+def write_sidecar(glb_path, max_leaf=MAX_LEAF_TRIS):
+    """Build a BVH per mesh in the GLB and write the sidecar.  Returns (meshes, tris, bytes)."""
+    meshes = read_cortex_meshes(glb_path)
+    pad = quant_pad(meshes)
+    trees = [build_bvh(v, f.astype(np.int64), max_leaf, pad) for v, f in meshes]
+    parts = [MAGIC, struct.pack("<I", len(trees))]
+    parts += [struct.pack("<II", nodes.nbytes, len(perm)) for nodes, perm in trees]
+    for nodes, perm in trees:
+        parts += [nodes.tobytes(), perm.astype("<u4").tobytes()]
+    data = b"".join(parts)
+    out = sidecar_path(glb_path)
+    tmp = out.with_name(out.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, out)
+    return len(trees), sum(len(p) for _, p in trees), len(data)
+
+
+def read_sidecar(path):
+    """[(nodes, perm)] from a sidecar — for inspection and checks."""
+    data = Path(path).read_bytes()
+    if data[:4] != MAGIC:
+        raise ValueError(f"{path}: not a BVH sidecar")
+    (n,) = struct.unpack_from("<I", data, 4)
+    sizes = [struct.unpack_from("<II", data, 8 + 8 * i) for i in range(n)]
+    off, out = 8 + 8 * n, []
+    for nbytes, ntris in sizes:
+        nodes = np.frombuffer(data, NODE_DTYPE, nbytes // NODE_DTYPE.itemsize, off)
+        perm = np.frombuffer(data, "<u4", ntris, off + nbytes)
+        out.append((nodes, perm))
+        off += nbytes + 4 * ntris
+    return out
+
+
+def bake_all(paths=None, force=False):
+    """Write sidecars for every GLB (default: data/brain_meshes/*.glb) that is stale."""
+    paths = [Path(p) for p in paths] if paths else sorted(MESH_DIR.glob("*.glb"))
+    written = skipped = 0
+    for path in paths:
+        out = sidecar_path(path)
+        if not force and out.exists() and out.stat().st_mtime >= path.stat().st_mtime:
+            skipped += 1
+            continue
+        t0 = time.perf_counter()
+        try:
+            meshes, tris, size = write_sidecar(path)
+        except ImportError as e:
+            print(f"  {path.name}: skipped ({e}) — pip install DracoPy")
+            continue
+        written += 1
+        print(f"  {path.name}: {tris:,} tris in {meshes} mesh(es) → {out.name} "
+              f"({size / 1e3:.0f} KB, {time.perf_counter() - t0:.2f}s)")
+    print(f"  BVH sidecars: {written} written, {skipped} up to date")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute three-mesh-bvh sidecars for GLBs")
+    parser.add_argument("glbs", nargs="*", help="GLB files (default: data/brain_meshes/*.glb)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    args = parser.parse_args()
+    bake_all(args.glbs, args.force)
+
+
+if __name__ == "__main__":
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
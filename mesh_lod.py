@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+mesh_lod.py — Level-of-detail chain builder for brain region meshes
+
+Shared by generate_parcellated_brain.py and generate_brain_meshes.py.
+Every region is exported as a chain of progressively decimated GLBs:
+
+  LOD 0  {region}.glb        100 %  (the existing full-resolution file)
+  LOD 1  {region}_lod1.glb    25 %
+  LOD 2  {region}_lod2.glb     6 %
+
+Each level records its geometric error (world units — the largest distance
+from an original vertex to the decimated surface's nearest vertex) and the
+screen-space error in pixels that error produces at the reference camera
+(PerspectiveCamera fov 40°, cortical camDist 4.2, 1080 px viewport).
+brain-3d-v3.js loads the coarsest level first and refines to LOD 0.
+
+Manifest entry shape (added under "lods", ordered fine → coarse):
+  {"file": "data/brain_meshes/amygdala_lod1.glb", "ratio": 0.25,
+   "vertexCount": 412, "faceCount": 820,
+   "geometricError": 0.0041, "screenSpaceError": 1.4}
+"""
+
+import math
+import numpy as np
+from pathlib import Path
+
+# Fraction of LOD 0 faces kept at each level
+LOD_RATIOS = (1.0, 0.25, 0.06)
+
+# Levels coarser than this are skipped — tiny meshes gain nothing from a LOD
+MIN_LOD_FACES = 64
+
+# Reference view used to express geometric error in pixels
+REFERENCE_FOV_DEG   = 40.0
+REFERENCE_DISTANCE  = 4.2
+REFERENCE_VIEWPORT  = 1080
+
+
+def decimate_to(verts, faces, target_faces):
+    """
+    Quadric-decimate (verts, faces) to ≤ target_faces triangles.
+    Handles both trimesh 4.x signatures (face_count= and target_reduction).
+    Returns the input unchanged if decimation is unavailable or fails.
+    """
+    import trimesh
+    if len(faces) <= target_faces:
+        return verts, faces
+    mesh = trimesh.Trimesh(vertices=verts, faces=faces, process=False)
+    try:
+        out = mesh.simplify_quadric_decimation(face_count=int(target_faces))
+    except TypeError:
+        try:
+            out = mesh.simplify_quadric_decimation(
+                max(0.0, 1.0 - target_faces / len(faces)))
+        except Exception as e:
+            print(f"      [warn] LOD decimation failed: {e}")
+            return verts, faces
+    except Exception as e:
+        print(f"      [warn] LOD decimation failed: {e}")
+        return verts, faces
+    if out is None or len(out.faces) == 0:
+        return verts, faces
+    return out.vertices.astype(np.float32), out.faces.astype(np.int32)
+
+
+def geometric_error(ref_verts, lod_verts):
+    """One-sided vertex Hausdorff distance: max over ref verts of nearest LOD vert."""
+    from scipy.spatial import cKDTree
+    if len(ref_verts) == len(lod_verts):
+        return 0.0
+    dists, _ = cKDTree(lod_verts).query(ref_verts, k=1)
+    return float(dists.max())
+
+
+def screen_space_error(geom_error, distance=REFERENCE_DISTANCE,
+                       fov_deg=REFERENCE_FOV_DEG, viewport_px=REFERENCE_VIEWPORT):
+    """Project a world-space error to pixels for a perspective camera."""
+    half = math.tan(math.radians(fov_deg) * 0.5)
+    return geom_error * viewport_px / (2.0 * distance * half)
+
+
+def build_lod_chain(verts, faces, ratios=LOD_RATIOS, min_faces=MIN_LOD_FACES):
+    """
+    Build the LOD chain for one mesh.
+
+    Returns a list of dicts (fine → coarse):
+        {"level", "ratio", "verts", "faces", "geometricError", "screenSpaceError"}
+    LOD 0 is the input mesh itself.  Each coarser level is decimated from the
+    previous one (cheaper than re-decimating from LOD 0).
+    """
+    verts = np.asarray(verts, dtype=np.float32)
+    faces = np.asarray(faces, dtype=np.int32)
+    chain = [{
+        "level": 0, "ratio": 1.0, "verts": verts, "faces": faces,
+        "geometricError": 0.0, "screenSpaceError": 0.0,
+    }]
+    prev_v, prev_f = verts, faces
+    for level, ratio in enumerate(ratios[1:], start=1):
+        target = int(len(faces) * ratio)
+        if target < min_faces:
+            break
+        lv, lf = decimate_to(prev_v, prev_f, target)
+        if len(lf) >= len(prev_f):
+            break
+        err = geometric_error(verts, lv)
+        chain.append({
+            "level": level, "ratio": ratio, "verts": lv, "faces": lf,
+            "geometricError": err, "screenSpaceError": screen_space_error(err),
+        })
+        prev_v, prev_f = lv, lf
+    return chain
+
+
+def lod_filename(region_id, level):
+    return f"{region_id}.glb" if level == 0 else f"{region_id}_lod{level}.glb"
+
+
+def export_lod_chain(region_id, verts, faces, out_dir, export_fn):
+    """
+    Build and export the LOD chain for one region.
+
+    export_fn(verts, faces, path) writes one GLB; its return value is ignored.
+    Returns the manifest "lods" list (fine → coarse).  LOD 0 is written to the
+    same {region}.glb path the manifest "file" field already points at.
+    """
+    out_dir = Path(out_dir)
+    lods = []
+    for lvl in build_lod_chain(verts, faces):
+        name = lod_filename(region_id, lvl["level"])
+        export_fn(lvl["verts"], lvl["faces"], out_dir / name)
+        lods.append({
+            "file":             f"data/brain_meshes/{name}",
+            "ratio":            lvl["ratio"],
+            "vertexCount":      int(len(lvl["verts"])),
+            "faceCount":        int(len(lvl["faces"])),
+            "geometricError":   round(lvl["geometricError"], 6),
+            "screenSpaceError": round(lvl["screenSpaceError"], 3),
+        })
+    if len(lods) > 1:
+        chain_txt = " → ".join(f"{l['faceCount']:,}" for l in lods)
+        print(f"    LOD chain: {chain_txt} faces "
+              f"(coarsest err {lods[-1]['screenSpaceError']:.1f} px)")
+    return lods
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+mesh_utils.py — Shared mesh kernels for the brain mesh generators
+
+One copy of the helpers that used to be pasted into every generate_*.py:
+
+  to_threejs               MNI/FreeSurfer RAS mm → Three.js world units
+  affine_apply             voxel indices → mm without building (N,4) arrays
+  fix_winding              orient marching-cubes faces outward
+  compute_vertex_normals   area-weighted smooth normals
+  voxels_to_mesh           binary mask → smoothed marching-cubes surface
+  sphere_to_uv             equirectangular UV from a FreeSurfer sphere
+  sphere_to_uv_brainstem   centroid-spherical UV, seam posterior
+  sphere_to_uv_cerebellum  centroid-spherical UV, seam anterior
+  remove_seam_faces        drop triangles straddling the u=0/1 wrap
+
+Everything stays float32 and works on (N,3) column slices rather than
+(F,3,3) corner stacks, so peak memory on 1 mm marching-cubes output is a
+few (F,3) arrays instead of a dozen.  Vertex-normal accumulation uses
+np.bincount (one pass per corner/axis) instead of np.add.at.
+
+Coordinate transform (matches fix_hires_coords.py / brain-3d-v3.js):
+  FreeSurfer RAS: x=right, y=anterior, z=superior
+  Three.js:       x=right, y=up(superior), z=toward-viewer(anterior)
+  -> out = [-x_fs, z_fs, y_fs] * COORD_SCALE + COORD_OFFSET
+"""
+
+import numpy as np
+
+COORD_SCALE  = 1.0 / 75.0
+COORD_OFFSET = np.array([0.118, -0.204, 0.438], dtype=np.float64)
+
+
+# ── Coordinates ──────────────────────────────────────────────────────────────
+
+def to_threejs(coords, scale=COORD_SCALE, offset=COORD_OFFSET):
+    """
+    MNI/FreeSurfer RAS mm → Three.js world units.
+
+    x is negated so the left-hemisphere lateral surface (most negative x)
+    faces the camera at +x; z_fs becomes up and y_fs becomes depth.
+    """
+    c = np.asarray(coords)
+    out = np.empty((len(c), 3), dtype=np.float32)
+    out[:, 0] = c[:, 0]
+    out[:, 1] = c[:, 2]
+    out[:, 2] = c[:, 1]
+    out *= np.array([-scale, scale, scale], dtype=np.float32)
+    out += np.asarray(offset, dtype=np.float32)
+    return out
+
+
+def affine_apply(affine, ijk):
+    """Apply a 4×4 voxel→mm affine to (N,3) indices, float32 out."""
+    a = np.asarray(affine, dtype=np.float32)
+    out = np.asarray(ijk, dtype=np.float32) @ a[:3, :3].T
+    out += a[:3, 3]
+    return out
+
+
+# ── Faces and normals ────────────────────────────────────────────────────────
+
+def _face_normals(verts, faces):
+    """Unnormalised face normals (area-weighted), float32 (F,3)."""
+    v0 = verts[faces[:, 0]]
+    e1 = verts[faces[:, 1]]
+    e1 -= v0
+    e2 = verts[faces[:, 2]]
+    e2 -= v0
+    return np.cross(e1, e2)
+
+
+def fix_winding(verts, faces, centroid=None):
+    """
+    Orient faces so normals point away from the mesh centroid (FrontSide
+    rendering).  The axis swap in to_threejs inverts marching-cubes winding.
+
+    Majority inward → the whole mesh is flipped; otherwise only the inward
+    faces are.  Modifies and returns `faces` (int32).
+    """
+    verts = np.asarray(verts, dtype=np.float32)
+    faces = np.ascontiguousarray(faces, dtype=np.int32)
+    if centroid is None:
+        centroid = verts.mean(axis=0)
+
+    # sign(n · (face_centre − c)) == sign(n · (v0 + v1 + v2 − 3c)) — skip the /3
+    v0 = verts[faces[:, 0]]
+    e1 = verts[faces[:, 1]]
+    e2 = verts[faces[:, 2]]
+    side = e1 + e2
+    side += v0
+    e1 -= v0
+    e2 -= v0
+    fn = np.cross(e1, e2)
+    del e1, e2, v0
+    side -= 3.0 * np.asarray(centroid, dtype=np.float32)
+    inward = np.einsum("ij,ij->i", fn, side) < 0
+    del fn, side
+
+    n_in = int(inward.sum())
+    if n_in > len(faces) // 2:
+        faces[:, [1, 2]] = faces[:, [2, 1]]
+    elif n_in > 0:
+        faces[np.ix_(inward, [1, 2])] = faces[np.ix_(inward, [2, 1])]
+    return faces
+
+
+def compute_vertex_normals(verts, faces):
+    """Smooth per-vertex normals (area-weighted face normals), float32."""
+    verts = np.asarray(verts, dtype=np.float32)
+    fn = _face_normals(verts, faces)
+    n = len(verts)
+    normals = np.zeros((n, 3), dtype=np.float32)
+    for corner in range(3):
+        idx = faces[:, corner]
+        for axis in range(3):
+            normals[:, axis] += np.bincount(idx, weights=fn[:, axis], minlength=n)
+    lengths = np.sqrt(np.einsum("ij,ij->i", normals, normals))
+    np.maximum(lengths, 1e-9, out=lengths)
+    normals /= lengths[:, None]
+    return normals
+
+
+# ── Marching cubes ───────────────────────────────────────────────────────────
+
+def voxels_to_mesh(mask_3d, affine, step_size=1, sigma=0.5, origin=(0, 0, 0),
+                   transform=to_threejs):
+    """
+    Binary 3D mask → smoothed marching-cubes surface in Three.js coordinates.
+
+    origin is the voxel index of mask_3d[0, 0, 0] in the full atlas volume,
+    so a cropped sub-block can be meshed with the atlas affine unchanged.
+    transform maps mm → scene units (default to_threejs).
+    Returns (verts float32 (N,3), faces int32 (F,3)) with outward winding.
+    """
+    from scipy import ndimage
+    from skimage import measure
+    smoothed = ndimage.gaussian_filter(mask_3d.astype(np.float32), sigma=sigma,
+                                       output=np.float32)
+    verts_v, faces, _, _ = measure.marching_cubes(smoothed, level=0.5,
+                                                   step_size=step_size)
+    del smoothed
+    verts_v = verts_v.astype(np.float32, copy=False)
+    if any(origin):
+        verts_v += np.asarray(origin, dtype=np.float32)
+    verts_3d = np.asarray(transform(affine_apply(affine, verts_v)), dtype=np.float32)
+    return verts_3d, fix_winding(verts_3d, faces)
+
+
+# ── UV mapping ───────────────────────────────────────────────────────────────
+
+def _unit_dirs(verts, centroid):
+    n = np.asarray(verts, dtype=np.float32) - centroid
+    r = np.sqrt(np.einsum("ij,ij->i", n, n))
+    np.maximum(r, 1e-9, out=r)
+    n /= r[:, None]
+    return n
+
+
+def _azimuth_elevation_uv(n, fwd_axis, fwd_sign, up_axis):
+    uv = np.empty((len(n), 2), dtype=np.float32)
+    uv[:, 0] = (np.arctan2(n[:, 0], fwd_sign * n[:, fwd_axis]) + np.pi) / (2.0 * np.pi)
+    uv[:, 1] = (np.arcsin(np.clip(n[:, up_axis], -1.0, 1.0)) + np.pi / 2.0) / np.pi
+    return uv
+
+
+def sphere_to_uv(sph):
+    """Equirectangular projection of a FreeSurfer sphere surface → [0,1]²."""
+    n = _unit_dirs(sph, 0.0)
+    uv = np.empty((len(n), 2), dtype=np.float32)
+    uv[:, 0] = (np.arctan2(n[:, 1], n[:, 0]) + np.pi) / (2.0 * np.pi)
+    uv[:, 1] = np.arccos(np.clip(n[:, 2], -1.0, 1.0)) / np.pi
+    return uv
+
+
+def sphere_to_uv_brainstem(verts, up_axis=1, fwd_axis=2):
+    """
+    Spherical UV centred on the brainstem centroid.
+    u = azimuth, seam posterior (hidden against the spine);
+    v = elevation, 0 = inferior (medulla) → 1 = superior (midbrain).
+    Defaults assume Three.js axes (y up, z anterior).
+    Returns (uv, centroid).
+    """
+    centroid = np.asarray(verts, dtype=np.float32).mean(axis=0)
+    n = _unit_dirs(verts, centroid)
+    return _azimuth_elevation_uv(n, fwd_axis, -1.0, up_axis), centroid
+
+
+def sphere_to_uv_cerebellum(verts, up_axis=1, fwd_axis=2):
+    """
+    Spherical UV centred on the cerebellum centroid.
+    u = circumferential, seam anterior (faces the brainstem);
+    v = elevation so folia run as horizontal bands.
+    Returns (uv, centroid).
+    """
+    centroid = np.asarray(verts, dtype=np.float32).mean(axis=0)
+    n = _unit_dirs(verts, centroid)
+    return _azimuth_elevation_uv(n, fwd_axis, 1.0, up_axis), centroid
+
+
+def remove_seam_faces(uv, faces, wrap_threshold=0.35):
+    """Drop triangles whose u-span exceeds wrap_threshold (u=0/1 wrap seam)."""
+    return faces[np.ptp(uv[:, 0][faces], axis=1) < wrap_threshold]
@@ -4,7 +4,7 @@ optimize_cortex.py — Decimate cortex mesh + bake normal map + ambient occlusio
 
 Takes the 655k-face full_brain_hires.glb and produces:
   1. full_brain_optimized.glb — decimated to ~100k faces with baked texture
-  2. full_brain_draco.glb — Draco-compressed version (~4MB)
+  2. full_brain_draco.glb — Draco-compressed version (compress_meshes.py)
   3. cortex_normal_map.png — normal map baked from high-poly to low-poly
   4. Updates the sulcal texture with ambient occlusion darkening
 
@@ -432,23 +432,25 @@ print(f"  Saved: {opt_path.name} ({opt_sz / 1e6:.1f} MB)")
 print(f"  Size reduction: {hires_path.stat().st_size / 1e6:.1f} MB -> {opt_sz / 1e6:.1f} MB "
       f"({(1 - opt_sz / hires_path.stat().st_size) * 100:.0f}% smaller)")
 
-# Draco compression
+# Draco compression — real KHR_draco_mesh_compression via compress_meshes.py
+# (quantized positions/normals/UVs, round-trip error checked before replacing)
+import shutil
+from compress_meshes import compress_file
 draco_path = OUTPUT_DIR / "full_brain_draco.glb"
-try:
-    import DracoPy
-    # Re-export with Draco compression via trimesh's built-in support
-    opt_mesh.export(str(draco_path), file_type='glb')
-    # trimesh uses DracoPy if installed for automatic Draco encoding
-    draco_sz = draco_path.stat().st_size
-    print(f"  Draco compressed: {draco_path.name} ({draco_sz / 1e6:.1f} MB)")
-except ImportError:
-    print("  DracoPy not installed — skipping Draco compression")
-    print("  Install with: pip install DracoPy")
-    # Copy uncompressed as fallback
-    import shutil
-    shutil.copy2(str(opt_path), str(draco_path))
-    draco_sz = opt_sz
-    print(f"  Copied uncompressed GLB as fallback: {draco_path.name}")
+shutil.copy2(str(opt_path), str(draco_path))
+res = compress_file(draco_path)
+draco_sz = draco_path.stat().st_size
+if res["status"] == "compressed":
+    err = "n/a" if res["error"] is None else f"{res['error']:.2e}"
+    print(f"  Draco compressed: {draco_path.name} ({draco_sz / 1e6:.1f} MB, "
+          f"{res['ratio']:.1f}x, round-trip err {err})")
+else:
+    print(f"  Draco compression {res['status']} — {draco_path.name} left uncompressed")
+    print("  Requires: npm install (gltf-transform), pip install DracoPy")
+
+# GPU texture stage — AO + curvature ORM and normal map as mipmapped KTX2
+from texture_pack import pack_all
+pack_all()
 
 print("\n" + "=" * 60)
 print("Done!")
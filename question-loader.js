@@ -0,0 +1,159 @@
+/**
+ * question-loader.js — Shared question loader for the exercise pages
+ *
+ * Replaces the per-page `for (d of domains) { await fetch(...) }` loops:
+ *
+ *   - When the page is served by `python serve.py --api`, one request to
+ *     /api/questions returns only the matching records (see question_api.py).
+ *     A failed probe is remembered for the session, so static hosting pays
+ *     for it once.
+ *   - Otherwise every selected data/{DOMAIN}_{family}.json shard is fetched
+ *     concurrently; each is parsed and filtered as soon as it arrives and
+ *     appended in place (no repeated concat).
+ *   - `ready` resolves once `minReady` matching records are in hand (or every
+ *     shard is done), so endless modes can start early; `done` resolves when
+ *     all shards are in.  With `shuffleIn`, late arrivals are dropped into
+ *     random positions (inside-out Fisher–Yates) so a pop()-driven pool stays
+ *     uniformly shuffled; without it the pool keeps `domains` order (shards
+ *     that finish early wait for the ones before them).
+ *   - `query.n` asks the API for a random sample of that size (random-order
+ *     sessions); `query.ids` fetches exactly those records, in that order
+ *     (the shards are filtered down to them).  Without either, the API
+ *     returns every match — in file order unless `shuffleIn` is set.
+ *
+ * Usage:
+ *   const loader = QuestionLoader.load({
+ *     family:  'vignettes',
+ *     domains: CFG.domains,
+ *     filter:  q => CFG.levels.includes(q.difficulty_level),
+ *     query:   { levels: CFG.levels, n: 20 },       // same filter, for the API
+ *     onProgress: (p) => { fill.style.width = (p.loaded / p.total * 100) + '%'; },
+ *   });
+ *   const pool = await loader.done;                 // or loader.ready
+ */
+(function (global) {
+  'use strict';
+
+  const API_URL = 'api/questions';
+  const API_FLAG = 'question_loader_api';
+
+  function apiAvailable() {
+    try { return sessionStorage.getItem(API_FLAG) !== 'off'; } catch (e) { return true; }
+  }
+
+  function markApi(on) {
+    try { sessionStorage.setItem(API_FLAG, on ? 'on' : 'off'); } catch (e) {}
+  }
+
+  function apiUrl(family, domains, query, shuffleIn) {
+    // Exact set, in the given order — the API ignores every other filter
+    if (query.ids) return API_URL + '?' + new URLSearchParams({ family, ids: query.ids.join(',') });
+    const sp = new URLSearchParams({ family, domains: domains.join(',') });
+    if (query.n) {
+      // Random order: let the server sample the session instead of shipping every match
+      sp.set('n', query.n);
+    } else if (!shuffleIn) {
+      // Sequential / weakest-first orders need the full set in file order
+      sp.set('shuffle', 'off');
+    }
+    if (query.levels) sp.set('levels', query.levels.join(','));
+    if (query.angle && query.angle !== 'all') sp.set('angle', query.angle);
+    // Subdomain names contain commas — the API takes them '|'-separated
+    if (query.subdomains) sp.set('subdomains', query.subdomains.join('|'));
+    return API_URL + '?' + sp.toString();
+  }
+
+  function load(opts) {
+    const family    = opts.family;
+    const domains   = opts.domains;
+    const query     = opts.query || {};
+    const idSet     = query.ids ? new Set(query.ids) : null;
+    const keep      = opts.filter || (() => true);
+    const filter    = idSet ? (q => idSet.has(q.id) && keep(q)) : keep;
+    const minReady  = opts.minReady || Infinity;
+    const shuffleIn = !!opts.shuffleIn;
+    const dataBase  = opts.dataBase || 'data/';
+    const onProgress = opts.onProgress || (() => {});
+
+    const pool = [];
+    const state = { pool, loaded: 0, total: domains.length, raw: 0, failed: [], source: null };
+    let resolveReady;
+    state.ready = new Promise(r => { resolveReady = r; });
+
+    function add(records) {
+      state.raw += records.length;
+      for (const q of records) {
+        if (!filter(q)) continue;
+        if (shuffleIn && pool.length) {
+          const j = Math.floor(Math.random() * (pool.length + 1));
+          pool.push(pool[j]);
+          pool[j] = q;
+        } else {
+          pool.push(q);
+        }
+      }
+      if (pool.length >= minReady) resolveReady(pool);
+    }
+
+    function fromShards() {
+      state.source = 'shards';
+      onProgress({ loaded: 0, total: state.total, domain: null, count: 0 });
+      const arrived = new Array(domains.length);
+      let next = 0;
+      return Promise.all(domains.map((d, i) =>
+        fetch(`${dataBase}${d}_${family}.json`)
+          .then(r => (r.ok ? r.json() : null))
+          .catch(() => null)
+          .then(data => {
+            if (!data) state.failed.push(d);
+            const records = (data && data.questions) || [];
+            if (shuffleIn) {
+              add(records);
+            } else {
+              arrived[i] = records;
+              while (next < domains.length && arrived[next]) {
+                add(arrived[next]);
+                arrived[next++] = null;
+              }
+            }
+            state.loaded++;
+            onProgress({ loaded: state.loaded, total: state.total, domain: d, count: pool.length });
+          })
+      ));
+    }
+
+    function fromApi() {
+      return fetch(apiUrl(family, domains, query, shuffleIn))
+        .then(r => {
+          const type = r.headers.get('Content-Type') || '';
+          if (!r.ok || type.indexOf('application/json') !== 0) throw new Error('no api');
+          return r.json();
+        })
+        .then(data => {
+          markApi(true);
+          state.source = 'api';
+          let records = data.questions || [];
+          if (!shuffleIn && !query.n && !query.ids) {
+            const rank = new Map(domains.map((d, i) => [d, i]));
+            records = records.slice().sort((a, b) => rank.get(a.domain_code) - rank.get(b.domain_code));
+          }
+          add(records);
+          state.loaded = state.total;
+          onProgress({ loaded: state.total, total: state.total, domain: null, count: pool.length });
+        });
+    }
+
+    const run = apiAvailable()
+      ? fromApi().catch(() => { markApi(false); return fromShards(); })
+      : fromShards();
+
+    state.done = run.then(() => {
+      state.finished = true;
+      resolveReady(pool);
+      return pool;
+    });
+    return state;
+  }
+
+  global.QuestionLoader = { load };
+})(window);
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+question_api.py — In-memory question index + query endpoint for the exercise pages
+
+The exercise pages download whole data/{DOMAIN}_{family}.json files (up to
+~2 MB each, nine domains) and then filter by difficulty_level / angle /
+subdomain and shuffle in the browser.  This module loads every family once,
+buckets records by (domain, subdomain, level, angle, mode) and answers
+"N random records matching …" by sampling positions across the matching
+buckets — cost depends on the number of buckets and N, not corpus size.
+
+Served by serve.py when started with --api:
+
+  GET /api/questions?family=basic&domains=PMET,BPSY&levels=2,3&angle=direct_recall&n=40
+  GET /api/questions?family=vignettes&ids=JQ-PMET-...,JQ-BPSY-...      (exact set, in order)
+  GET /api/stats                                                       (bucket counts)
+
+Query parameters (all optional except family; lists are comma-separated):
+  family      basic | vignettes | contrast | spot | tables | passages | presentations
+              (page names streak / clinical / thisorthat / ethics are accepted too)
+  domains     domain codes (default: all)
+  subdomains  exact subdomain names, '|'-separated (names contain commas)
+  levels      difficulty_level values
+  angle       angle values (basic)
+  mode        mode values (spot / tables)
+  n           max records to return (default: every match)
+  shuffle     "off" keeps file order (default: random sample, random order)
+  seed        integer seed for a reproducible sample
+  ids         return exactly these records, in this order (ignores other filters)
+
+Response: {"family", "total", "count", "questions": [...]}, where total is
+the number of matching records and count the number returned.
+
+CLI (prints a query result summary):
+  python question_api.py basic --domains PMET --levels 2 -n 5
+"""
+
+import argparse
+import bisect
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+from data_io import load_json
+
+DATA_DIR = Path("data")
+
+ALL_DOMAINS = ["BPSY", "CASS", "CPAT", "LDEV", "PETH", "PMET", "PTHE", "SOCU", "WDEV"]
+
+# family → key holding the record list in data/{DOMAIN}_{family}.json
+FAMILY_KEYS = {
+    "basic":         "questions",
+    "vignettes":     "questions",
+    "contrast":      "questions",
+    "spot":          "questions",
+    "tables":        "questions",
+    "passages":      "passages",
+    "presentations": "encounters",
+}
+
+# Exercise page names → data family
+FAMILY_ALIASES = {
+    "streak":     "basic",
+    "clinical":   "vignettes",
+    "ethics":     "vignettes",
+    "thisorthat": "contrast",
+}
+
+# Seconds between file mtime checks (edits under data/ are picked up live)
+RELOAD_INTERVAL = 2.0
+
+
+def _bucket_key(rec, domain):
+    return (rec.get("domain_code") or domain, rec.get("subdomain"),
+            rec.get("difficulty_level"), rec.get("angle"), rec.get("mode"))
+
+
+class QuestionIndex:
+    """All families in memory, bucketed for constant-cost filtered sampling."""
+
+    def __init__(self, data_dir=DATA_DIR, families=None):
+        self.data_dir = Path(data_dir)
+        self.families = list(families or FAMILY_KEYS)
+        self._lock = threading.Lock()
+        self._mtimes = {}
+        self._snapshot = {}     # family → {"records", "buckets", "by_id"}
+        self._checked = 0.0
+        self.reload()
+
+    # ── Loading ───────────────────────────────────────────────────────────
+
+    def _paths(self, family):
+        return [(d, self.data_dir / f"{d}_{family}.json") for d in ALL_DOMAINS]
+
+    def _load_family(self, family):
+        key = FAMILY_KEYS[family]
+        records, buckets, by_id = [], {}, {}
+        for domain, path in self._paths(family):
+            if not path.exists():
+                continue
+            data = load_json(path)
+            for rec in data.get(key, []):
+                i = len(records)
+                records.append(rec)
+                buckets.setdefault(_bucket_key(rec, domain), []).append(i)
+                if "id" in rec:
+                    by_id[rec["id"]] = i
+        return {"records": records, "buckets": buckets, "by_id": by_id}
+
+    def _current_mtimes(self):
+        out = {}
+        for family in self.families:
+            for _, path in self._paths(family):
+                try:
+                    out[str(path)] = path.stat().st_mtime_ns
+                except OSError:
+                    pass
+        return out
+
+    def reload(self, force=True):
+        """(Re)load families whose files changed.  Returns the families reloaded."""
+        with self._lock:
+            mtimes = self._current_mtimes()
+            changed = []
+            for family in self.families:
+                paths = [str(p) for _, p in self._paths(family)]
+                if force or family not in self._snapshot or any(
+                        mtimes.get(p) != self._mtimes.get(p) for p in paths):
+                    changed.append(family)
+            if changed:
+                t0 = time.perf_counter()
+                snap = dict(self._snapshot)
+                for family in changed:
+                    snap[family] = self._load_family(family)
+                self._snapshot = snap     # readers see the old or the new index, never a mix
+                n = sum(len(snap[f]["records"]) for f in changed)
+                print(f"  [question_api] indexed {n:,} records in {', '.join(changed)} "
+                      f"({time.perf_counter() - t0:.2f}s)")
+            self._mtimes = mtimes
+            self._checked = time.monotonic()
+            return changed
+
+    def _maybe_reload(self):
+        if time.monotonic() - self._checked >= RELOAD_INTERVAL:
+            self.reload(force=False)
+
+    # ── Queries ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def resolve_family(name):
+        family = FAMILY_ALIASES.get(name, name)
+        if family not in FAMILY_KEYS:
+            raise ValueError(f"unknown family {name!r}")
+        return family
+
+    def query(self, family, domains=None, subdomains=None, levels=None, angles=None,
+              modes=None, n=None, shuffle=True, seed=None, ids=None):
+        """
+        Sample records matching every given filter (None = no filter).
+        Returns {"family", "total", "count", "questions"}.
+        """
+        family = self.resolve_family(family)
+        self._maybe_reload()
+        snap = self._snapshot[family]
+        records = snap["records"]
+
+        if ids is not None:
+            picked = [records[snap["by_id"][i]] for i in ids if i in snap["by_id"]]
+            return {"family": family, "total": len(picked), "count": len(picked),
+                    "questions": picked}
+
+        filters = [set(v) if v is not None else None
+                   for v in (domains, subdomains, levels, angles, modes)]
+        lists = [idx for key, idx in snap["buckets"].items()
+                 if all(f is None or k in f for k, f in zip(key, filters))]
+
+        # Cumulative bucket sizes → sample positions without concatenating
+        cum, total = [], 0
+        for idx in lists:
+            total += len(idx)
+            cum.append(total)
+        k = total if n is None else max(0, min(int(n), total))
+
+        if not shuffle:
+            # File order: the matching index lists are each sorted, so merge them
+            picked = sorted(i for idx in lists for i in idx)[:k]
+        else:
+            picked = []
+            for pos in random.Random(seed).sample(range(total), k):
+                b = bisect.bisect_right(cum, pos)
+                base = cum[b - 1] if b else 0
+                picked.append(lists[b][pos - base])
+        return {"family": family, "total": total, "count": len(picked),
+                "questions": [records[i] for i in picked]}
+
+    def stats(self):
+        self._maybe_reload()
+        out = {}
+        for family, snap in self._snapshot.items():
+            per_domain = {}
+            for key, idx in snap["buckets"].items():
+                per_domain[key[0]] = per_domain.get(key[0], 0) + len(idx)
+            out[family] = {"records": len(snap["records"]),
+                           "buckets": len(snap["buckets"]),
+                           "domains": dict(sorted(per_domain.items()))}
+        return out
+
+
+# ── HTTP glue (used by serve.py) ──────────────────────────────────────────────
+
+def _csv(params, name, cast=str, sep=","):
+    raw = params.get(name)
+    if not raw:
+        return None
+    vals = [v.strip() for v in sep.join(raw).split(sep) if v.strip()]
+    return [cast(v) for v in vals] or None
+
+
+def handle_request(index, path, params):
+    """
+    Route an /api/… GET.  params is a parse_qs dict.
+    Returns (status, payload) where payload is JSON-serialisable.
+    """
+    try:
+        if path == "/api/stats":
+            return 200, index.stats()
+        if path != "/api/questions":
+            return 404, {"error": f"unknown endpoint {path}"}
+        family = (params.get("family") or [""])[0]
+        if not family:
+            return 400, {"error": "family is required"}
+        n = _csv(params, "n", int)
+        seed = _csv(params, "seed", int)
+        result = index.query(
+            family,
+            domains=_csv(params, "domains"),
+            subdomains=_csv(params, "subdomains", sep="|"),
+            levels=_csv(params, "levels", int),
+            angles=_csv(params, "angle"),
+            modes=_csv(params, "mode"),
+            n=n[0] if n else None,
+            shuffle=(params.get("shuffle") or ["on"])[0] != "off",
+            seed=seed[0] if seed else None,
+            ids=_csv(params, "ids"),
+        )
+        return 200, result
+    except ValueError as e:
+        return 400, {"error": str(e)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the in-memory question index")
+    parser.add_argument("family")
+    parser.add_argument("--domains")
+    parser.add_argument("--subdomains", help="'|'-separated")
+    parser.add_argument("--levels")
+    parser.add_argument("--angle")
+    parser.add_argument("--mode")
+    parser.add_argument("-n", type=int)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    index = QuestionIndex()
+    split = lambda s, cast=str, sep=",": [cast(v) for v in s.split(sep)] if s else None
+    t0 = time.perf_counter()
+    res = index.query(args.family, domains=split(args.domains),
+                      subdomains=split(args.subdomains, sep="|"), levels=split(args.levels, int),
+                      angles=split(args.angle), modes=split(args.mode),
+                      n=args.n, seed=args.seed)
+    ms = (time.perf_counter() - t0) * 1e3
+    print(f"{res['family']}: {res['count']} of {res['total']:,} matching ({ms:.2f} ms)")
+    for q in res["questions"][:20]:
+        print(f"  {q.get('id', '?'):40s} L{q.get('difficulty_level', '-')}  {q.get('subdomain', '')}")
+
+
+if __name__ == "__main__":
+    if not DATA_DIR.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
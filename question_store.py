@@ -0,0 +1,567 @@
+#!/usr/bin/env python3
+"""
+question_store.py — Optional SQLite store for the question content families
+
+The content lives in data/{DOMAIN}_{family}.json (9 domains × 7 families),
+the questions array of data/brain_data.js, and the generated bundles
+data/table_data.js / data/spot_data.js.  Every maintenance script loads a
+whole file, edits it in memory and rewrites it.  This store keeps the same
+records in indexed SQLite tables so a single edit, an ID rename or a
+cross-family query touches only the affected rows; the exporter then
+rewrites only the files whose rows changed (tracked by triggers), in the
+exact formatting each file already uses.
+
+Tables (data/questions.sqlite):
+  files       (family, domain) → list key, top-level header, JSON formatting
+  questions   basic / vignettes / contrast / spot / tables / brain records;
+              indexed by id, source_question_id, (family, domain, subdomain,
+              difficulty_level), angle, mode
+  options     one row per answer option (dict letter or list position)
+  passages    {DOMAIN}_passages.json records
+  encounters  {DOMAIN}_presentations.json records (nested questions kept in body)
+  dirty       (family, domain) pairs edited since the last export
+
+IDs are NOT unique in the JSON (basic files reuse source IDs across angles,
+tables files have a few repeats), so rows are keyed by (family, domain,
+position) and `id` is an ordinary index.
+
+USAGE:
+  python question_store.py import                # JSON/JS → data/questions.sqlite
+  python question_store.py export                # rewrite files with pending edits
+  python question_store.py export --all          # rewrite every file (+ bundles);
+                                                 # brain_data.js only if edited
+  python question_store.py stats
+  python question_store.py sql "SELECT family, count(*) FROM questions GROUP BY 1"
+
+From Python:
+  from question_store import QuestionStore
+  with QuestionStore() as qs:
+      qs.update("vignettes", "JQ-PMET-001-vignette-L2", difficulty_level=3)
+      qs.rename_ids("vignettes", {"JQ-PMET-001-vignette-L2": "JQ-PMET-002-vignette-L2"})
+      qs.export()
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from data_io import dumps, write_atomic
+
+DATA_DIR = Path("data")
+DB_PATH = DATA_DIR / "questions.sqlite"
+
+DOMAINS = ["BPSY", "CASS", "CPAT", "LDEV", "PETH", "PMET", "PTHE", "SOCU", "WDEV"]
+
+# family → (table, list key in the JSON file)
+FAMILIES = {
+    "basic":         ("questions",  "questions"),
+    "vignettes":     ("questions",  "questions"),
+    "contrast":      ("questions",  "questions"),
+    "spot":          ("questions",  "questions"),
+    "tables":        ("questions",  "questions"),
+    "passages":      ("passages",   "passages"),
+    "presentations": ("encounters", "encounters"),
+}
+
+# Header count fields recomputed on export
+COUNT_KEYS = ("total_questions", "total", "total_passages", "total_encounters")
+
+# brain_data.js questions live in the "brain" family under this pseudo-domain
+BRAIN_FAMILY, BRAIN_DOMAIN = "brain", "BRAIN"
+BRAIN_DATA_JS = DATA_DIR / "brain_data.js"
+
+# family → (bundle path, window global) regenerated when that family changes
+BUNDLES = {
+    "tables": (DATA_DIR / "table_data.js", "__TABLE_DATA", DOMAINS),
+    "spot":   (DATA_DIR / "spot_data.js",  "__SPOT_DATA",
+               ["PMET", "LDEV", "CPAT", "PTHE", "SOCU", "WDEV", "BPSY", "CASS", "PETH"]),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    family   TEXT NOT NULL,
+    domain   TEXT NOT NULL,
+    list_key TEXT NOT NULL,
+    header   TEXT NOT NULL,          -- JSON object of the non-list top-level keys
+    fmt      TEXT NOT NULL,          -- JSON {"indent", "separators", "newline"}
+    PRIMARY KEY (family, domain)
+);
+CREATE TABLE IF NOT EXISTS questions (
+    rowid              INTEGER PRIMARY KEY,
+    family             TEXT NOT NULL,
+    domain             TEXT NOT NULL,
+    position           INTEGER NOT NULL,
+    id                 TEXT,
+    subdomain          TEXT,
+    difficulty_level   INTEGER,
+    angle              TEXT,
+    mode               TEXT,
+    source_question_id TEXT,
+    options_kind       TEXT,         -- 'dict', 'list' or NULL
+    options_pos        INTEGER,      -- key position of "options" in the record
+    body               TEXT NOT NULL -- record JSON without "options"
+);
+CREATE UNIQUE INDEX IF NOT EXISTS questions_pos    ON questions (family, domain, position);
+CREATE INDEX IF NOT EXISTS questions_id            ON questions (id);
+CREATE INDEX IF NOT EXISTS questions_source        ON questions (source_question_id);
+CREATE INDEX IF NOT EXISTS questions_filter        ON questions (family, domain, subdomain, difficulty_level);
+CREATE INDEX IF NOT EXISTS questions_angle         ON questions (family, angle);
+CREATE INDEX IF NOT EXISTS questions_mode          ON questions (family, mode);
+CREATE TABLE IF NOT EXISTS options (
+    question_rowid INTEGER NOT NULL REFERENCES questions (rowid) ON DELETE CASCADE,
+    position       INTEGER NOT NULL,
+    key            TEXT,             -- option letter for dict options, NULL for lists
+    value          TEXT NOT NULL,    -- JSON-encoded option value
+    PRIMARY KEY (question_rowid, position)
+);
+CREATE TABLE IF NOT EXISTS passages (
+    rowid        INTEGER PRIMARY KEY,
+    family       TEXT NOT NULL DEFAULT 'passages',
+    domain       TEXT NOT NULL,
+    position     INTEGER NOT NULL,
+    id           TEXT,
+    chapter_file TEXT,
+    section      TEXT,
+    passage_type TEXT,
+    body         TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS passages_pos ON passages (domain, position);
+CREATE INDEX IF NOT EXISTS passages_id         ON passages (id);
+CREATE INDEX IF NOT EXISTS passages_chapter    ON passages (chapter_file, section);
+CREATE TABLE IF NOT EXISTS encounters (
+    rowid            INTEGER PRIMARY KEY,
+    family           TEXT NOT NULL DEFAULT 'presentations',
+    domain           TEXT NOT NULL,
+    position         INTEGER NOT NULL,
+    id               TEXT,
+    subdomain        TEXT,
+    difficulty_level INTEGER,
+    body             TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS encounters_pos ON encounters (domain, position);
+CREATE INDEX IF NOT EXISTS encounters_id         ON encounters (id);
+CREATE TABLE IF NOT EXISTS dirty (
+    family TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    PRIMARY KEY (family, domain)
+);
+"""
+
+# Any row change marks its file for export
+_DIRTY_TRIGGERS = "".join(
+    f"""
+CREATE TRIGGER IF NOT EXISTS {table}_{op.lower()}_dirty AFTER {op} ON {table}
+BEGIN
+    INSERT OR IGNORE INTO dirty (family, domain) VALUES ({ref}.family, {ref}.domain);
+END;"""
+    for table in ("questions", "passages", "encounters")
+    for op, ref in (("INSERT", "NEW"), ("UPDATE", "NEW"), ("DELETE", "OLD"))
+) + """
+CREATE TRIGGER IF NOT EXISTS options_dirty AFTER UPDATE ON options
+BEGIN
+    INSERT OR IGNORE INTO dirty (family, domain)
+        SELECT family, domain FROM questions WHERE rowid = NEW.question_rowid;
+END;
+"""
+
+_INDEXED = {
+    "questions":  ("id", "subdomain", "difficulty_level", "angle", "mode", "source_question_id"),
+    "passages":   ("id", "chapter_file", "section", "passage_type"),
+    "encounters": ("id", "subdomain", "difficulty_level"),
+}
+
+
+# ── Formatting ────────────────────────────────────────────────────────────────
+
+_FORMATS = (
+    {"indent": 2,    "separators": None},
+    {"indent": None, "separators": [",", ":"]},
+    {"indent": None, "separators": None},
+    {"indent": 4,    "separators": None},
+)
+
+
+def dump_json(obj, fmt):
+    end = "\n" if fmt.get("newline") else ""
+    seps = tuple(fmt["separators"]) if fmt.get("separators") else None
+    # The two data_io canonical modes cover almost every file — fast path
+    if fmt.get("indent") == 2 and seps is None:
+        return dumps(obj, "pretty") + end
+    if fmt.get("indent") is None and seps == (",", ":"):
+        return dumps(obj, "compact") + end
+    return json.dumps(obj, ensure_ascii=False, indent=fmt.get("indent"), separators=seps) + end
+
+
+def detect_format(raw, obj):
+    """The json.dumps settings that reproduce `raw` exactly (default: indent=2)."""
+    for cand in _FORMATS:
+        for newline in (False, True):
+            fmt = dict(cand, newline=newline)
+            if dump_json(obj, fmt) == raw:
+                return fmt
+    return {"indent": 2, "separators": None, "newline": False}
+
+
+def bundle_text(family, docs):
+    """
+    window.__TABLE_DATA / __SPOT_DATA bundle for {domain: file dict}, in the
+    same layout as build_table_bundle.py / build_spot_bundle.py.
+    """
+    _, var, order = BUNDLES[family]
+    entries = [f'  "{code}": {json.dumps(docs[code], ensure_ascii=False)}'
+               for code in order if code in docs]
+    return f"window.{var} = {{\n" + ",\n".join(entries) + "\n};\n"
+
+
+# ── brain_data.js ─────────────────────────────────────────────────────────────
+
+_BRAIN_QUESTIONS_RE = re.compile(r'"questions":\s*\[.*?\n  \]', re.DOTALL)
+_JS_COMMENT_RE = re.compile(r"^\s*/\*.*?\*/\s*$", re.DOTALL | re.MULTILINE)
+
+
+def read_brain_questions(path=BRAIN_DATA_JS):
+    """The questions array of brain_data.js (section comments stripped)."""
+    content = Path(path).read_text(encoding="utf-8")
+    m = _BRAIN_QUESTIONS_RE.search(content)
+    if not m:
+        raise ValueError(f"{path}: questions array not found")
+    arr = m.group(0).split(":", 1)[1]
+    return json.loads(_JS_COMMENT_RE.sub("", arr))
+
+
+def write_brain_questions(questions, path=BRAIN_DATA_JS):
+    """Replace the questions array in brain_data.js (same layout as generate_brain_questions.py)."""
+    content = Path(path).read_text(encoding="utf-8")
+    new_json = ",\n".join(
+        "    " + json.dumps(q, indent=4).replace("\n", "\n    ") for q in questions)
+    new_content, n = _BRAIN_QUESTIONS_RE.subn(
+        lambda _: f'"questions": [\n{new_json}\n  ]', content, count=1)
+    if n != 1:
+        raise ValueError(f"{path}: questions array not found")
+    write_atomic(path, new_content)
+
+
+# ── Store ─────────────────────────────────────────────────────────────────────
+
+def _family_table(family):
+    if family == BRAIN_FAMILY:
+        return "questions"
+    if family not in FAMILIES:
+        raise ValueError(f"unknown family {family!r}")
+    return FAMILIES[family][0]
+
+
+def _split_record(rec):
+    """Record → (body JSON without options, options_kind, options_pos, option rows)."""
+    opts = rec.get("options")
+    if isinstance(opts, dict):
+        kind, rows = "dict", [(k, json.dumps(v, ensure_ascii=False)) for k, v in opts.items()]
+    elif isinstance(opts, list):
+        kind, rows = "list", [(None, json.dumps(v, ensure_ascii=False)) for v in opts]
+    else:
+        return json.dumps(rec, ensure_ascii=False), None, None, []
+    pos = list(rec).index("options")
+    body = {k: v for k, v in rec.items() if k != "options"}
+    return json.dumps(body, ensure_ascii=False), kind, pos, rows
+
+
+def _join_record(body, kind, pos, opt_rows):
+    rec = json.loads(body)
+    if kind is None:
+        return rec
+    if kind == "dict":
+        opts = {k: json.loads(v) for k, v in opt_rows}
+    else:
+        opts = [json.loads(v) for _, v in opt_rows]
+    items = list(rec.items())
+    items.insert(pos, ("options", opts))
+    return dict(items)
+
+
+class QuestionStore:
+    def __init__(self, db_path=DB_PATH, data_dir=DATA_DIR):
+        self.data_dir = Path(data_dir)
+        self.db = sqlite3.connect(str(db_path))
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.execute("PRAGMA journal_mode = WAL")
+        self.db.executescript(SCHEMA + _DIRTY_TRIGGERS)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *_):
+        if exc_type is None:
+            self.db.commit()
+        self.db.close()
+
+    # ── Import ────────────────────────────────────────────────────────────
+
+    def _insert(self, family, domain, records):
+        table = _family_table(family)
+        cols = _INDEXED[table]
+        for pos, rec in enumerate(records):
+            vals = [rec.get(c) for c in cols]
+            if table == "questions":
+                body, kind, opos, opt_rows = _split_record(rec)
+                cur = self.db.execute(
+                    f"INSERT INTO questions (family, domain, position, {', '.join(cols)}, "
+                    f"options_kind, options_pos, body) VALUES (?, ?, ?, {', '.join('?' * len(cols))}, ?, ?, ?)",
+                    [family, domain, pos, *vals, kind, opos, body])
+                self.db.executemany(
+                    "INSERT INTO options (question_rowid, position, key, value) VALUES (?, ?, ?, ?)",
+                    [(cur.lastrowid, i, k, v) for i, (k, v) in enumerate(opt_rows)])
+            else:
+                self.db.execute(
+                    f"INSERT INTO {table} (family, domain, position, {', '.join(cols)}, body) "
+                    f"VALUES (?, ?, ?, {', '.join('?' * len(cols))}, ?)",
+                    [family, domain, pos, *vals, json.dumps(rec, ensure_ascii=False)])
+
+    def _clear(self, family, domain):
+        table = _family_table(family)
+        if table == "questions":
+            self.db.execute(
+                "DELETE FROM options WHERE question_rowid IN "
+                "(SELECT rowid FROM questions WHERE family = ? AND domain = ?)", (family, domain))
+        self.db.execute(f"DELETE FROM {table} WHERE family = ? AND domain = ?", (family, domain))
+
+    def import_file(self, family, domain, path):
+        raw = Path(path).read_text(encoding="utf-8")
+        data = json.loads(raw)
+        list_key = FAMILIES[family][1]
+        header = {k: v for k, v in data.items() if k != list_key}
+        # Keep the list key's position among the header keys
+        header["__list_pos__"] = list(data).index(list_key)
+        with self.db:
+            self._clear(family, domain)
+            self.db.execute(
+                "INSERT OR REPLACE INTO files (family, domain, list_key, header, fmt) VALUES (?, ?, ?, ?, ?)",
+                (family, domain, list_key, json.dumps(header, ensure_ascii=False),
+                 json.dumps(detect_format(raw, data))))
+            self._insert(family, domain, data.get(list_key, []))
+            self.db.execute("DELETE FROM dirty WHERE family = ? AND domain = ?", (family, domain))
+        return len(data.get(list_key, []))
+
+    def import_brain(self, path=BRAIN_DATA_JS):
+        qs = read_brain_questions(path)
+        with self.db:
+            self._clear(BRAIN_FAMILY, BRAIN_DOMAIN)
+            self.db.execute(
+                "INSERT OR REPLACE INTO files (family, domain, list_key, header, fmt) VALUES (?, ?, ?, ?, ?)",
+                (BRAIN_FAMILY, BRAIN_DOMAIN, "questions", "{}", json.dumps({"brain_js": True})))
+            self._insert(BRAIN_FAMILY, BRAIN_DOMAIN, qs)
+            self.db.execute("DELETE FROM dirty WHERE family = ?", (BRAIN_FAMILY,))
+        return len(qs)
+
+    def import_all(self):
+        t0 = time.perf_counter()
+        total = 0
+        for family in FAMILIES:
+            for domain in DOMAINS:
+                path = self.data_dir / f"{domain}_{family}.json"
+                if path.exists():
+                    total += self.import_file(family, domain, path)
+        brain_js = self.data_dir / BRAIN_DATA_JS.name
+        if brain_js.exists():
+            total += self.import_brain(brain_js)
+        self.db.execute("ANALYZE")
+        print(f"  Imported {total:,} records in {time.perf_counter() - t0:.2f}s")
+        return total
+
+    # ── Reads ─────────────────────────────────────────────────────────────
+
+    def records(self, family, domain):
+        """All records of one file, in file order."""
+        table = _family_table(family)
+        if table != "questions":
+            return [json.loads(b) for (b,) in self.db.execute(
+                f"SELECT body FROM {table} WHERE family = ? AND domain = ? ORDER BY position",
+                (family, domain))]
+        opts = {}
+        for qrow, key, value in self.db.execute(
+                "SELECT o.question_rowid, o.key, o.value FROM options o "
+                "JOIN questions q ON q.rowid = o.question_rowid "
+                "WHERE q.family = ? AND q.domain = ? ORDER BY o.question_rowid, o.position",
+                (family, domain)):
+            opts.setdefault(qrow, []).append((key, value))
+        return [_join_record(body, kind, pos, opts.get(rowid, []))
+                for rowid, body, kind, pos in self.db.execute(
+                    "SELECT rowid, body, options_kind, options_pos FROM questions "
+                    "WHERE family = ? AND domain = ? ORDER BY position", (family, domain))]
+
+    def get(self, family, record_id):
+        """Every record with this id in a family (ids are not unique)."""
+        table = _family_table(family)
+        out = []
+        for rowid, body, kind, pos in self.db.execute(
+                f"SELECT rowid, body, {'options_kind, options_pos' if table == 'questions' else 'NULL, NULL'} "
+                f"FROM {table} WHERE family = ? AND id = ?", (family, record_id)):
+            rows = self.db.execute("SELECT key, value FROM options WHERE question_rowid = ? "
+                                   "ORDER BY position", (rowid,)).fetchall() if kind else []
+            out.append(_join_record(body, kind, pos, rows))
+        return out
+
+    # ── Writes ────────────────────────────────────────────────────────────
+
+    def update(self, family, record_id, **fields):
+        """Set top-level fields on every record with this id.  Returns rows changed."""
+        table = _family_table(family)
+        cols = _INDEXED[table]
+        n = 0
+        with self.db:
+            for rowid, body in self.db.execute(
+                    f"SELECT rowid, body FROM {table} WHERE family = ? AND id = ?",
+                    (family, record_id)).fetchall():
+                rec = json.loads(body)
+                rec.update(fields)
+                sets = {c: rec.get(c) for c in cols if c in fields}
+                sets["body"] = json.dumps(rec, ensure_ascii=False)
+                self.db.execute(
+                    f"UPDATE {table} SET {', '.join(f'{c} = ?' for c in sets)} WHERE rowid = ?",
+                    [*sets.values(), rowid])
+                n += 1
+        return n
+
+    def rename_ids(self, family, mapping, domain=None):
+        """
+        Apply an old → new id map within a family (optionally one domain) in
+        one transaction.  Returns the number of rows renamed.
+        """
+        table = _family_table(family)
+        where = "family = ? AND id = ?" + (" AND domain = ?" if domain else "")
+        rowids = {}
+        with self.db:
+            # Collect rows first so chains like A→B, B→C don't collide mid-way
+            for old in mapping:
+                rowids[old] = [r for (r,) in self.db.execute(
+                    f"SELECT rowid FROM {table} WHERE {where}",
+                    [family, old] + ([domain] if domain else []))]
+            for old, new in mapping.items():
+                for rowid in rowids[old]:
+                    (body,) = self.db.execute(f"SELECT body FROM {table} WHERE rowid = ?",
+                                              (rowid,)).fetchone()
+                    rec = json.loads(body)
+                    rec["id"] = new
+                    self.db.execute(f"UPDATE {table} SET id = ?, body = ? WHERE rowid = ?",
+                                    (new, json.dumps(rec, ensure_ascii=False), rowid))
+        return sum(len(r) for r in rowids.values())
+
+    # ── Export ────────────────────────────────────────────────────────────
+
+    def export_file(self, family, domain, out_dir=None):
+        row = self.db.execute("SELECT list_key, header, fmt FROM files WHERE family = ? AND domain = ?",
+                              (family, domain)).fetchone()
+        if row is None:
+            raise ValueError(f"{family}/{domain} was never imported")
+        list_key, header, fmt = row[0], json.loads(row[1]), json.loads(row[2])
+        records = self.records(family, domain)
+        out_dir = Path(out_dir or self.data_dir)
+
+        if fmt.get("brain_js"):
+            write_brain_questions(records, out_dir / BRAIN_DATA_JS.name)
+            return out_dir / BRAIN_DATA_JS.name
+
+        list_pos = header.pop("__list_pos__", len(header))
+        for k in COUNT_KEYS:
+            if k in header:
+                header[k] = len(records)
+        items = list(header.items())
+        items.insert(list_pos, (list_key, records))
+        path = out_dir / f"{domain}_{family}.json"
+        write_atomic(path, dump_json(dict(items), fmt))
+        return path
+
+    def export_bundle(self, family, out_dir=None):
+        path = BUNDLES[family][0]
+        out_dir = Path(out_dir or self.data_dir)
+        docs = {}
+        for code in BUNDLES[family][2]:
+            src = out_dir / f"{code}_{family}.json"
+            if src.exists():
+                docs[code] = json.loads(src.read_text(encoding="utf-8"))
+        dst = out_dir / path.name
+        write_atomic(dst, bundle_text(family, docs))
+        return dst
+
+    def export(self, all_files=False, out_dir=None):
+        """Rewrite files with pending edits (or all).  Returns the paths written."""
+        if all_files:
+            # brain_data.js is hand-annotated — only rewrite it when its questions changed
+            pairs = self.db.execute(
+                "SELECT family, domain FROM files WHERE family != ? "
+                "OR (family, domain) IN (SELECT family, domain FROM dirty) "
+                "ORDER BY family, domain", (BRAIN_FAMILY,)).fetchall()
+        else:
+            pairs = self.db.execute("SELECT family, domain FROM dirty ORDER BY family, domain").fetchall()
+        written = [self.export_file(f, d, out_dir) for f, d in pairs]
+        for family in sorted({f for f, _ in pairs} & set(BUNDLES)):
+            written.append(self.export_bundle(family, out_dir))
+        with self.db:
+            self.db.executemany("DELETE FROM dirty WHERE family = ? AND domain = ?", pairs)
+        return written
+
+    def stats(self):
+        out = {}
+        for table in ("questions", "passages", "encounters"):
+            for family, n in self.db.execute(
+                    f"SELECT family, count(*) FROM {table} GROUP BY family ORDER BY family"):
+                out[family] = n
+        out["_pending_files"] = self.db.execute("SELECT count(*) FROM dirty").fetchone()[0]
+        return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite store for question content")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("import", help="Load every JSON/JS content file into the store")
+    p_exp = sub.add_parser("export", help="Write edited records back to JSON/JS")
+    p_exp.add_argument("--all", action="store_true", help="Rewrite every file, not only edited ones")
+    p_exp.add_argument("--out", help="Output directory (default: data/)")
+    sub.add_parser("stats", help="Record counts per family")
+    p_sql = sub.add_parser("sql", help="Run a read-only SQL query")
+    p_sql.add_argument("query")
+    args = parser.parse_args()
+
+    if args.cmd == "sql":
+        if not DB_PATH.exists():
+            print(f"ERROR: {DB_PATH} not found — run `python question_store.py import` first.")
+            sys.exit(1)
+        # Opened read-only by SQLite itself, so no statement can change the store
+        db = sqlite3.connect(f"{DB_PATH.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            cur = db.execute(args.query)
+            if cur.description:
+                print("\t".join(d[0] for d in cur.description))
+            for row in cur:
+                print("\t".join("" if v is None else str(v) for v in row))
+        except sqlite3.Error as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+        finally:
+            db.close()
+        return
+
+    if args.cmd == "import" and DB_PATH.exists():
+        DB_PATH.unlink()
+    with QuestionStore() as store:
+        if args.cmd == "import":
+            store.import_all()
+        elif args.cmd == "export":
+            t0 = time.perf_counter()
+            written = store.export(all_files=args.all, out_dir=args.out)
+            for p in written:
+                print(f"  wrote {p}")
+            print(f"  {len(written)} file(s) in {time.perf_counter() - t0:.2f}s")
+        elif args.cmd == "stats":
+            for family, n in store.stats().items():
+                print(f"  {family:16s} {n:>7,}")
+
+
+if __name__ == "__main__":
+    if not DATA_DIR.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
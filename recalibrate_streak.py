@@ -11,11 +11,12 @@ Heuristic approach:
   3. Write back recalibrated difficulty to each file
 """
 
-import json
 import re
 import os
 from collections import Counter
 
+from data_io import RecordWriter, iter_records
+
 QUESTIONS_DIR = "C:/Users/Admin/JustinMasteryPage/content/questions"
 
 # ── Stem complexity patterns ─────────────────────────────────────────────────
@@ -375,8 +376,8 @@ def main():
     print("  Target: ~25% easy, ~40% moderate, ~35% hard")
     print("=" * 70)
 
-    # Phase 1: Load all questions and compute scores
-    file_data = {}  # filename -> (data, [(index, score), ...])
+    # Phase 1: Stream all questions and compute scores
+    file_scores = {}  # filename -> [score, ...] in question order
     all_scores = []
     before_counts = Counter()
 
@@ -385,18 +386,16 @@ def main():
 
     for fname in files:
         path = os.path.join(QUESTIONS_DIR, fname)
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
 
         file_mod = get_file_modifier(fname)
         scored = []
-        for i, q in enumerate(data["questions"]):
+        for q in iter_records(path, "questions"):
             before_counts[q.get("difficulty", "MISSING")] += 1
             score = score_streak_question(q, file_mod)
-            scored.append((i, score))
+            scored.append(score)
             all_scores.append(score)
 
-        file_data[fname] = (data, scored)
+        file_scores[fname] = scored
 
     total = len(all_scores)
     print(f"Total questions: {total}")
@@ -420,7 +419,7 @@ def main():
     per_domain_after = {}
 
     for fname in files:
-        data, scored = file_data[fname]
+        scored = file_scores[fname]
 
         # Extract domain number from filename
         parts = fname.split("-")
@@ -430,22 +429,18 @@ def main():
             per_domain_before[domain_key] = Counter()
             per_domain_after[domain_key] = Counter()
 
-        for i, score in scored:
-            q = data["questions"][i]
-            old_diff = q.get("difficulty", "MISSING")
-            new_diff = assign_difficulty(score, thresholds)
-            q["difficulty"] = new_diff
-            after_counts[new_diff] += 1
-            per_domain_after[domain_key][new_diff] += 1
-            per_domain_before[domain_key][old_diff] += 1
-
-        # Update questionCount if present
-        data["questionCount"] = len(data["questions"])
-
-        # Write back
+        # Stream back in place, with questionCount updated
         path = os.path.join(QUESTIONS_DIR, fname)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        header = {}
+        with RecordWriter(path, header, "questions", count_keys=["questionCount"]) as out:
+            for q, score in zip(iter_records(path, "questions", header), scored):
+                old_diff = q.get("difficulty", "MISSING")
+                new_diff = assign_difficulty(score, thresholds)
+                q["difficulty"] = new_diff
+                after_counts[new_diff] += 1
+                per_domain_after[domain_key][new_diff] += 1
+                per_domain_before[domain_key][old_diff] += 1
+                out.write(q)
 
     # Phase 4: Report
     print(f"\nAFTER distribution:")
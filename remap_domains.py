@@ -0,0 +1,441 @@
+#!/usr/bin/env python3
+"""
+remap_domains.py — Legacy 11-domain → 9-domain remapping engine
+
+Replaces retag_basic.py and retag_questions.py.  The mapping is declared
+once below (SIMPLE, SPLIT, KEYWORDS, SPLIT_DEFAULT) and compiled into a
+single lookup keyed by (legacy code, normalized subdomain); each distinct
+pair is resolved once and memoized, so a streamed pass costs one dict hit
+per record.  Normalizing ("Psychodynamic & Humanistic Therapies" ==
+"psychodynamic and humanistic therapies") folds the spelling variants the
+legacy banks carry.
+
+  import   stream the legacy JustinQuestionsDatabase files into all nine
+           data/{CODE}_{family}.json targets of a family in one pass
+           (basic, vignettes, contrast + contrast_questions.json).  Native
+           records — generated since the import, with no legacy code (or a
+           new one) — are carried over from the current targets, not dropped.
+           Fields derived after the import (basic difficulty_level) come back
+           by rerunning calibrate_difficulty.py.
+  apply    remap the records already in data/ by their legacy_domain_code
+           and subdomain.  Only records whose domain changes are moved, and
+           only the files that lose or gain one are rewritten; after a small
+           mapping edit every other file is left byte-for-byte untouched.
+
+Both print which IDs moved (from → to), were added or removed; --diff
+writes the same as JSON.
+
+USAGE:
+  python remap_domains.py apply --dry-run             # what a mapping edit would move
+  python remap_domains.py apply                       # move just those records
+  python remap_domains.py apply --family contrast --diff remap_diff.json
+  python remap_domains.py import --legacy-root ../JustinQuestionsDatabase/data   # full rebuild
+  python remap_domains.py import --family basic       # root from $JUSTIN_QUESTIONS_DB
+
+import needs the JustinQuestionsDatabase data dir: --legacy-root, or the
+JUSTIN_QUESTIONS_DB environment variable.
+"""
+
+import argparse
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from pathlib import Path
+
+from content_schema import FAMILIES
+from data_io import RecordWriter, domain_path, iter_records, save_json
+
+LEGACY_ROOT_ENV = "JUSTIN_QUESTIONS_DB"
+COMBINED_CONTRAST = Path("data") / "contrast_questions.json"
+
+DOMAIN_NAMES = {
+    "PMET": "Psychometrics & Research Methods",
+    "LDEV": "Lifespan & Developmental Stages",
+    "CPAT": "Clinical Psychopathology",
+    "PTHE": "Psychotherapy Models, Interventions & Prevention",
+    "SOCU": "Social & Cultural Psychology",
+    "WDEV": "Workforce Development & Leadership",
+    "BPSY": "Biopsychology",
+    "CASS": "Clinical Assessment & Interpretation",
+    "PETH": "Psychopharmacology & Ethics",
+}
+# Names for files that don't exist yet; existing files keep their own
+# (current_names).  The basic bank has always used the longer CPAT name.
+FAMILY_DOMAIN_NAMES = {"basic": {"CPAT": "Clinical Psychopathology (DSM-5)"}}
+
+# ── Mapping tables ────────────────────────────────────────────────────────────
+
+# Whole legacy domain → new domain
+SIMPLE = {
+    "ETH": "PETH",   # Ethics, Legal & Professional  → Psychopharmacology & Ethics
+    "LIF": "LDEV",   # Lifespan Development           → Lifespan & Developmental Stages
+    "ORG": "WDEV",   # Industrial/Org Psychology      → Workforce Development & Leadership
+    "PHY": "BPSY",   # Biological Bases of Behavior   → Biopsychology
+    "PPA": "CPAT",   # Psychopathology & Personality  → Clinical Psychopathology
+    "RMS": "PMET",   # Research Methods & Statistics  → Psychometrics & Research Methods
+    "SOC": "SOCU",   # Social Psychology              → Social & Cultural Psychology
+    "PAS": "CASS",   # Psychological Assessment       → Clinical Assessment & Interpretation
+}
+
+# Split legacy domains: known subdomains (matched after normalization) …
+SPLIT = {
+    "CLI": {
+        "Cross-Cultural Issues - Terms and Concepts":          "SOCU",
+        "Cross-Cultural Issues - Identity Development Models": "SOCU",
+        "Prevention, Consultation, and Psychotherapy Research": "PTHE",
+        "Family Therapies and Group Therapies":                "PTHE",
+        "Family and Group Therapies":                          "PTHE",
+        "Cognitive-Behavioral Therapies":                      "PTHE",
+        "Brief Therapies":                                     "PTHE",
+        "Psychodynamic and Humanistic Therapies":              "PTHE",
+    },
+    "LEA": {
+        "Memory and Forgetting":                         "BPSY",
+        "Operant Conditioning":                          "PMET",
+        "Classical Conditioning":                        "PMET",
+        "Interventions Based on Operant Conditioning":   "PTHE",
+        "Interventions Based on Classical Conditioning": "PTHE",
+    },
+    "TES": {
+        "Item Analysis and Test Reliability":             "PMET",
+        "Test Validity - Criterion-Related Validity":     "PMET",
+        "Test Validity - Content and Construct Validity": "PMET",
+        "Test Score Interpretation":                      "CASS",
+    },
+}
+
+# … then keyword rules for subdomains not listed above (first match wins) …
+KEYWORDS = {
+    "CLI": [("cross cultural", "SOCU")],
+    "LEA": [("memory", "BPSY"), ("intervention", "PTHE")],
+    "TES": [("score interpretation", "CASS")],
+}
+
+# … then the split domain's catch-all
+SPLIT_DEFAULT = {"CLI": "PTHE", "LEA": "PMET", "TES": "PMET"}
+
+ANY = "*"
+REMAP_FAMILIES = ["basic", "vignettes", "contrast"]
+
+
+def normalize(subdomain: str) -> str:
+    s = (subdomain or "").lower().replace("&", " and ")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", s).split())
+
+
+class Remapper:
+    """Compiled mapping: (legacy code, normalized subdomain) → new code."""
+
+    def __init__(self, simple=SIMPLE, split=SPLIT, keywords=KEYWORDS, defaults=SPLIT_DEFAULT):
+        self.table = {(code, ANY): new for code, new in simple.items()}
+        for code, subs in split.items():
+            for sub, new in subs.items():
+                self.table[(code, normalize(sub))] = new
+        self.keywords = {code: [(normalize(k), new) for k, new in rules]
+                         for code, rules in keywords.items()}
+        self.defaults = dict(defaults)
+        self.unmapped = Counter()
+
+    def resolve(self, legacy_code, subdomain):
+        """New domain code, or None for a legacy code the tables don't know."""
+        hit = self.table.get((legacy_code, ANY))
+        if hit:
+            return hit
+        key = (legacy_code, normalize(subdomain))
+        if key in self.table:
+            return self.table[key]
+        new = next((n for k, n in self.keywords.get(legacy_code, ()) if k in key[1]),
+                   self.defaults.get(legacy_code))
+        if new is None:
+            self.unmapped[(legacy_code, subdomain)] += 1
+        else:
+            self.table[key] = new
+        return new
+
+
+def is_native(q) -> bool:
+    """Created in the 9-domain structure (some generators stamp the new code
+    into legacy_domain_code), so there is nothing to remap."""
+    return q.get("legacy_domain_code") in (None, "", *DOMAIN_NAMES)
+
+
+def retag(q, new_code, legacy_code, legacy_name, names=DOMAIN_NAMES):
+    """Legacy record → new-domain record; the legacy tags are kept alongside."""
+    q["legacy_domain_code"] = legacy_code
+    q["legacy_domain_name"] = legacy_name
+    q["domain_code"] = new_code
+    q["domain_name"] = names[new_code]
+    return q
+
+
+def current_names(family) -> dict:
+    """Domain display names as the family's files already carry them (they
+    have drifted per family, e.g. PETH vignettes are 'Professional Ethics')."""
+    names = {**DOMAIN_NAMES, **FAMILY_DOMAIN_NAMES.get(family, {})}
+    for code in DOMAIN_NAMES:
+        path = domain_path(code, family)
+        if path.exists():
+            header = {}
+            records = iter_records(path, FAMILIES[family].key, header)
+            next(records, None)         # the name precedes the array
+            records.close()
+            names[code] = header.get("domain_name", names[code])
+    return names
+
+
+# ── Diff ──────────────────────────────────────────────────────────────────────
+
+def locate(family, codes=DOMAIN_NAMES) -> dict:
+    """id → sorted domain codes holding it (legacy banks repeat some IDs)."""
+    where = defaultdict(list)
+    key = FAMILIES[family].key
+    for code in codes:
+        path = domain_path(code, family)
+        if path.exists():
+            for q in iter_records(path, key):
+                where[q.get("id")].append(code)
+    return {i: sorted(c) for i, c in where.items()}
+
+
+def diff(before: dict, after: dict) -> dict:
+    moved, added, removed = [], [], []
+    for i in sorted(before.keys() | after.keys(), key=str):
+        old, new = before.get(i), after.get(i)
+        if old == new:
+            continue
+        if old and new:
+            moved.append({"id": i, "from": "+".join(old), "to": "+".join(new)})
+        elif new:
+            added.append({"id": i, "to": "+".join(new)})
+        else:
+            removed.append({"id": i, "from": "+".join(old)})
+    return {"moved": moved, "added": added, "removed": removed}
+
+
+def print_diff(family, d, show=8):
+    if not any(d.values()):
+        print(f"  {family}: nothing moved")
+        return
+    print(f"  {family}: {len(d['moved'])} moved, {len(d['added'])} added, "
+          f"{len(d['removed'])} removed")
+    routes = defaultdict(list)
+    for m in d["moved"]:
+        routes[(m["from"], m["to"])].append(m["id"])
+    for (src, dst), ids in sorted(routes.items()):
+        more = f" … +{len(ids) - show}" if len(ids) > show else ""
+        print(f"      {src} → {dst}  {len(ids):>5}  {', '.join(map(str, ids[:show]))}{more}")
+
+
+# ── apply: move records already in data/ ─────────────────────────────────────
+
+def _json_mode(path):
+    with open(path, encoding="utf-8-sig") as f:
+        return "pretty" if f.read(2) == "{\n" else "compact"
+
+
+def plan_moves(family, remap: Remapper):
+    """{(source code, index in file): (target code, record)} for records whose
+    domain changes.  Only movers are held in memory."""
+    moves = {}
+    key = FAMILIES[family].key
+    for code in DOMAIN_NAMES:
+        path = domain_path(code, family)
+        if not path.exists():
+            continue
+        for n, q in enumerate(iter_records(path, key)):
+            if is_native(q):
+                continue
+            new = remap.resolve(q["legacy_domain_code"], q.get("subdomain", ""))
+            if new and new != code:
+                moves[(code, n)] = (new, q)
+    return moves
+
+
+def rewrite(path, key, skip=(), append=(), update=None, count_key=None):
+    """Stream path back out without the record indices in skip, with append
+    added at the end and update(record) applied to every kept record."""
+    header = {}
+    with RecordWriter(path, header, key, mode=_json_mode(path),
+                      count_keys=[count_key] if count_key else ()) as out:
+        for n, q in enumerate(iter_records(path, key, header)):
+            if n not in skip:
+                out.write(update(q) if update else q)
+        for q in append:
+            out.write(q)
+    return out.count
+
+
+def apply_family(family, remap: Remapper, dry_run=False) -> dict:
+    fam = FAMILIES[family]
+    moves = plan_moves(family, remap)
+    d = {"moved": [{"id": q.get("id"), "from": src, "to": dst}
+                   for (src, _), (dst, q) in sorted(moves.items())],
+         "added": [], "removed": []}
+    if not moves or dry_run:
+        return d
+
+    names = current_names(family)
+    skip, incoming = defaultdict(set), defaultdict(list)
+    for (src, n), (dst, q) in sorted(moves.items()):
+        skip[src].add(n)
+        q["domain_code"], q["domain_name"] = dst, names[dst]
+        incoming[dst].append(q)
+    for code in sorted(skip.keys() | incoming.keys()):
+        path = domain_path(code, family)
+        if not path.exists():
+            save_json(path, {"domain_code": code, "domain_name": names[code],
+                             fam.count_key: 0, fam.key: []})
+        total = rewrite(path, fam.key, skip[code], incoming[code], count_key=fam.count_key)
+        print(f"    wrote {path.name}  -{len(skip[code])} +{len(incoming[code])}  ({total} total)")
+
+    if family == "contrast" and COMBINED_CONTRAST.exists():
+        # The combined bank holds the same records; retag the movers in place
+        by_id = {q.get("id"): q for _, q in moves.values()}
+
+        def update(q):
+            m = by_id.get(q.get("id"))
+            if m and q.get("legacy_domain_code") == m.get("legacy_domain_code"):
+                q["domain_code"], q["domain_name"] = m["domain_code"], m["domain_name"]
+            return q
+        rewrite(COMBINED_CONTRAST, "questions", update=update)
+        print(f"    wrote {COMBINED_CONTRAST.name}  ({len(by_id)} retagged)")
+    return d
+
+
+# ── import: rebuild from the legacy banks ─────────────────────────────────────
+
+def legacy_basic(root: Path):
+    """(record, legacy code, legacy name) from domains/{CODE}.json."""
+    for fname in sorted((root / "domains").glob("*.json")):
+        header = {}            # domain_name precedes the questions array
+        for q in iter_records(fname, "questions", header):
+            yield q, fname.stem, header.get("domain_name", fname.stem)
+
+
+def legacy_vignettes(root: Path):
+    for fname in sorted((root / "vignettes").glob("*.json")):
+        header = {}            # domain_code / domain_name precede vignette_questions
+        for q in iter_records(fname, "vignette_questions", header):
+            yield q, header["domain_code"], header["domain_name"]
+
+
+def legacy_contrast(root: Path, source_header=None):
+    path = root / "contrast_questions" / "eppp_contrast_questions.json"
+    for q in iter_records(path, "questions", source_header):
+        yield q, q["domain_code"], q["domain_name"]
+
+
+def _target_header(family, code, names):
+    if family == "basic":
+        return {"domain_code": code, "domain_name": names[code], "total_questions": 0,
+                "questions": None}
+    return {"domain_code": code, "domain_name": names[code],
+            "question_type": "vignette" if family == "vignettes" else "contrast",
+            "total": 0, "questions": None}
+
+
+def import_family(family, root: Path, remap: Remapper) -> dict:
+    """Write all nine {CODE}_{family}.json files in one streamed pass."""
+    fam = FAMILIES[family]
+    names = current_names(family)
+    before = locate(family)
+    after = defaultdict(list)
+    source_header = {}
+    sources = {"basic": legacy_basic, "vignettes": legacy_vignettes}
+    records = (legacy_contrast(root, source_header) if family == "contrast"
+               else sources[family](root))
+    counts = Counter()
+
+    with ExitStack() as stack:
+        writers = {
+            code: stack.enter_context(RecordWriter(
+                domain_path(code, family), _target_header(family, code, names), fam.key,
+                mode="compact" if family == "basic" else "pretty", count_keys=[fam.count_key]))
+            for code in DOMAIN_NAMES
+        }
+        combined = combined_header = None
+        if family == "contrast":
+            combined_header = {"metadata": None, "questions": None}
+            combined = stack.enter_context(
+                RecordWriter(COMBINED_CONTRAST, combined_header, "questions"))
+
+        for q, legacy_code, legacy_name in records:
+            new = remap.resolve(legacy_code, q.get("subdomain", ""))
+            if new is None:
+                continue
+            retag(q, new, legacy_code, legacy_name, names)
+            writers[new].write(q)
+            if combined is not None:
+                combined.write(q)
+            after[q.get("id")].append(new)
+            counts[legacy_code] += 1
+        if remap.unmapped:
+            raise ValueError("unmapped legacy codes: " + ", ".join(
+                sorted({c for c, _ in remap.unmapped})) + " — add them to SIMPLE or SPLIT")
+
+        # Keep what the generators added since the last import (read before
+        # the writers replace the files on exit)
+        for code, w in writers.items():
+            path = domain_path(code, family)
+            if path.exists():
+                for q in iter_records(path, fam.key):
+                    if is_native(q):
+                        w.write(q)
+                        after[q.get("id")].append(code)
+                        counts["(native)"] += 1
+
+        if combined is not None:
+            combined_header["metadata"] = {
+                **source_header.get("metadata", {}),
+                "domain_structure": "new_9_domain",
+                "domains": list(DOMAIN_NAMES),
+            }
+
+    print("    in:  " + "  ".join(f"{c} {n}" for c, n in sorted(counts.items())))
+    print("    out: " + "  ".join(f"{c} {w.count}" for c, w in writers.items()))
+    return diff(before, {i: sorted(c) for i, c in after.items()})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remap legacy 11-domain content onto the 9 domains")
+    parser.add_argument("cmd", choices=["apply", "import"])
+    parser.add_argument("--family", action="append", choices=REMAP_FAMILIES,
+                        help="Restrict to a family (repeatable; default all)")
+    parser.add_argument("--dry-run", action="store_true", help="apply: report moves, write nothing")
+    parser.add_argument("--legacy-root", type=Path, default=os.environ.get(LEGACY_ROOT_ENV),
+                        help=f"import: JustinQuestionsDatabase data dir (default ${LEGACY_ROOT_ENV})")
+    parser.add_argument("--diff", type=Path, help="Write the per-family ID diff as JSON")
+    args = parser.parse_args()
+    if args.cmd == "import" and args.legacy_root is None:
+        parser.error(f"import needs --legacy-root or ${LEGACY_ROOT_ENV}")
+    if args.cmd == "import" and not args.legacy_root.is_dir():
+        # An empty source would rebuild every target empty
+        parser.error(f"legacy root not found: {args.legacy_root}")
+
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+
+    remap = Remapper()
+    diffs = {}
+    for family in args.family or REMAP_FAMILIES:
+        print(f"=== {family} ===")
+        if args.cmd == "import":
+            diffs[family] = import_family(family, args.legacy_root, remap)
+        else:
+            diffs[family] = apply_family(family, remap, dry_run=args.dry_run)
+        print_diff(family, diffs[family])
+
+    for (code, sub), n in sorted(remap.unmapped.items()):
+        print(f"  WARNING: no mapping for [{code}] \"{sub}\" — {n} record(s) left in place")
+    if args.diff:
+        save_json(args.diff, diffs, newline=True)
+        print(f"\nDiff written to {args.diff}")
+    if args.dry_run:
+        print("\n(dry run — nothing written)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+renumber_ids.py — Transactional ID renumbering for any domain and content family
+
+Generalises fix_pmet_ids.py (which only handled PMET vignettes and left
+dependent files alone).  For each (family, domain) the old → new IDs are
+computed in one pass, every file that depends on them is rewritten in
+memory, all outputs are staged as temp files, and only then swapped into
+place together — if any swap fails, every file already replaced is
+restored.  Referential integrity is re-checked from the written files.
+
+Rules:
+  anchor      basic, vignettes
+              A vignette set is built from a basic question, and the two are
+              linked by source_question_id — so asking for either family
+              renumbers both, from one map per domain.  Records are grouped by
+              (original source_question_id, source_summary) — the true
+              knowledge-point anchor — basic in file order, then any
+              vignette-only anchors; anchor n gets source_question_id
+              f"{n:03d}" and the ID's anchor field is rewritten:
+              JQ-{legacy}-{sid}-{suffix}.  The question-bank ID is kept in
+              bank_question_id (set on the first renumbering, never
+              overwritten), which generate_vignettes.py --resume matches on.
+  sequential  passages, spot, tables, presentations, contrast
+              IDs keep their prefix (everything before the trailing number)
+              and are numbered 1..n per prefix in file order, keeping the
+              widest zero-padding already in use.
+
+Dependents updated:
+  spot.source_passage_id         when passages are renumbered (same domain)
+  data/vignette_stats.json       anchors / vignettes counts (vignettes)
+  data/streak_manifest.json      question counts (basic)
+  data/table_data.js, spot_data.js   rebuilt when tables / spot change
+
+Not reachable from here: clinical_retry_ids in a browser's sessionStorage
+(a retry started before renumbering falls back to an empty set) and
+data/questions.sqlite (re-run `python question_store.py import`).
+
+USAGE:
+  python renumber_ids.py vignettes PMET --group-size 5      # also renumbers PMET basic
+  python renumber_ids.py passages --all-domains --dry-run
+  python renumber_ids.py spot BPSY CASS
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from question_store import DOMAINS, FAMILIES, BUNDLES, bundle_text, detect_format, dump_json
+
+DATA = Path("data")
+STATS_FILE = DATA / "vignette_stats.json"
+STREAK_MANIFEST = DATA / "streak_manifest.json"
+
+ANCHOR_FAMILIES = ("basic", "vignettes")     # share one anchor map, built in this order
+BANK_FIELD = "bank_question_id"
+SEQUENTIAL_FAMILIES = {"passages", "spot", "tables", "presentations", "contrast"}
+
+# (target family, referencing family, field) — references stay within a domain
+REFERENCES = [
+    ("passages", "spot", "source_passage_id"),
+]
+
+_TRAILING_NUM = re.compile(r"^(.*?)(\d+)$")
+
+
+class RenumberError(Exception):
+    pass
+
+
+# ── ID rules ──────────────────────────────────────────────────────────────────
+
+def anchor_key(rec):
+    """The knowledge-point anchor: (question-bank ID, source_summary)."""
+    return (rec.get(BANK_FIELD, rec.get("source_question_id", "")), rec.get("source_summary", ""))
+
+
+def anchor_map(record_lists):
+    """anchor key → number, in order of first appearance across the lists."""
+    anchors = {}
+    for records in record_lists:
+        for rec in records:
+            anchors.setdefault(anchor_key(rec), len(anchors) + 1)
+    return anchors
+
+
+def anchor_ids(records, anchors=None, group_size=None):
+    """
+    New (source_question_id, id) per record, numbered by `anchors` (default:
+    this file's own anchors).  Raises RenumberError if group_size is set and
+    an anchor has a different number of records.
+    """
+    anchors = anchors or anchor_map([records])
+    if group_size:
+        sizes = Counter(anchor_key(r) for r in records)
+        bad = {k: n for k, n in sizes.items() if n != group_size}
+        if bad:
+            lines = "\n".join(f"    {k}: {n} records" for k, n in list(bad.items())[:20])
+            raise RenumberError(f"{len(bad)} anchors don't have exactly {group_size} records:\n{lines}")
+
+    out = []
+    for rec in records:
+        sid = f"{anchors[anchor_key(rec)]:03d}"
+        parts = rec.get("id", "").split("-", 3)
+        if len(parts) == 4 and parts[0] == "JQ":
+            new_id = f"JQ-{parts[1]}-{sid}-{parts[3]}"
+        else:
+            raise RenumberError(f"unexpected anchor ID format: {rec.get('id')!r}")
+        out.append((sid, new_id))
+    return out
+
+
+def sequential_ids(records):
+    """New id per record: same prefix, renumbered 1..n per prefix in file order."""
+    parsed, width, counters = [], {}, Counter()
+    for rec in records:
+        m = _TRAILING_NUM.match(rec.get("id", ""))
+        if not m:
+            raise RenumberError(f"ID without a trailing number: {rec.get('id')!r}")
+        prefix, digits = m.groups()
+        parsed.append(prefix)
+        width[prefix] = max(width.get(prefix, 0), len(digits))
+    out = []
+    for prefix in parsed:
+        counters[prefix] += 1
+        out.append(f"{prefix}{counters[prefix]:0{width[prefix]}d}")
+    return out
+
+
+# ── Planning ──────────────────────────────────────────────────────────────────
+
+class Plan:
+    """Every file to be written, held in memory until commit()."""
+
+    def __init__(self):
+        self.docs = {}      # path → (obj, fmt)
+        self.texts = {}     # path → str (bundles)
+
+    def load(self, path):
+        path = Path(path)
+        if path not in self.docs:
+            raw = path.read_text(encoding="utf-8")
+            obj = json.loads(raw)
+            self.docs[path] = (obj, detect_format(raw, obj))
+        return self.docs[path][0]
+
+    def rendered(self):
+        """path → new text, for files whose content actually changes."""
+        out = {p: dump_json(obj, fmt) for p, (obj, fmt) in self.docs.items()}
+        out.update(self.texts)
+        return {p: t for p, t in out.items()
+                if not p.exists() or p.read_text(encoding="utf-8") != t}
+
+    def commit(self):
+        """Stage every file, then swap all into place; restore on any failure."""
+        rendered = self.rendered()
+        staged, swapped = {}, []
+        try:
+            for path, text in rendered.items():
+                fd, tmp = tempfile.mkstemp(suffix=".renumber", dir=path.parent)
+                with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                    f.write(text)
+                staged[path] = Path(tmp)
+            for path, tmp in staged.items():
+                backup = path.with_name(path.name + ".renumber-bak")
+                if path.exists():
+                    os.replace(path, backup)
+                swapped.append((path, backup))
+                os.replace(tmp, path)
+        except Exception:
+            for path, backup in reversed(swapped):
+                if backup.exists():
+                    os.replace(backup, path)
+            raise
+        finally:
+            for tmp in staged.values():
+                if tmp.exists():
+                    tmp.unlink()
+        for _, backup in swapped:
+            if backup.exists():
+                backup.unlink()
+        return list(rendered)
+
+
+def _records(doc, family):
+    return doc[FAMILIES[family][1]] if family in FAMILIES else doc["questions"]
+
+
+def shared_anchors(plan, domain):
+    """One anchor map over the domain's basic and vignette files."""
+    paths = [DATA / f"{domain}_{f}.json" for f in ANCHOR_FAMILIES]
+    return anchor_map(_records(plan.load(p), f)
+                      for p, f in zip(paths, ANCHOR_FAMILIES) if p.exists())
+
+
+def plan_family(plan, family, domain, group_size=None, anchors=None):
+    """
+    Renumber one file in the plan (anchor families by `anchors`, see
+    shared_anchors).  Returns {old_id: new_id} for IDs that were unique
+    before renumbering (the only ones other files can reference
+    unambiguously) and the number of IDs that changed.
+    """
+    path = DATA / f"{domain}_{family}.json"
+    if not path.exists():
+        return None, 0
+    doc = plan.load(path)
+    records = _records(doc, family)
+    old_ids = [r.get("id") for r in records]
+
+    if family in ANCHOR_FAMILIES:
+        for rec, (sid, new_id) in zip(records, anchor_ids(records, anchors, group_size)):
+            if "source_question_id" in rec:
+                rec.setdefault(BANK_FIELD, rec["source_question_id"])
+            rec["source_question_id"] = sid
+            rec["id"] = new_id
+    elif family in SEQUENTIAL_FAMILIES:
+        for rec, new_id in zip(records, sequential_ids(records)):
+            rec["id"] = new_id
+    else:
+        raise RenumberError(f"no renumbering rule for family {family!r}")
+
+    old_counts = Counter(old_ids)
+    id_map = {o: r["id"] for o, r in zip(old_ids, records) if old_counts[o] == 1}
+    id_map["__ambiguous__"] = {o for o, n in old_counts.items() if n > 1}
+    changed = sum(o != r["id"] for o, r in zip(old_ids, records))
+    return id_map, changed
+
+
+def plan_references(plan, family, domain, id_map):
+    """Rewrite fields in other files that point at `family` IDs.  Returns refs updated."""
+    n = 0
+    ambiguous = id_map.get("__ambiguous__", set())
+    for target, ref_family, field in REFERENCES:
+        if target != family:
+            continue
+        path = DATA / f"{domain}_{ref_family}.json"
+        if not path.exists():
+            continue
+        for rec in _records(plan.load(path), ref_family):
+            old = rec.get(field)
+            if old is None:
+                continue
+            if old in ambiguous:
+                raise RenumberError(f"{path.name}: {field}={old!r} refers to a duplicated "
+                                    f"{family} ID — cannot remap it unambiguously")
+            if old in id_map and id_map[old] != old:
+                rec[field] = id_map[old]
+                n += 1
+    return n
+
+
+def plan_manifests(plan, family, domains):
+    if family == "vignettes" and STATS_FILE.exists():
+        stats = plan.load(STATS_FILE)
+        for d in domains:
+            path = DATA / f"{d}_vignettes.json"
+            if path in plan.docs:
+                qs = _records(plan.docs[path][0], "vignettes")
+                stats[d] = {"anchors": len({q["source_question_id"] for q in qs}),
+                            "vignettes": len(qs)}
+                plan.docs[path][0]["total"] = len(qs)
+    if family == "basic" and STREAK_MANIFEST.exists():
+        manifest = plan.load(STREAK_MANIFEST)
+        for d in domains:
+            path = DATA / f"{d}_basic.json"
+            if path in plan.docs:
+                manifest.setdefault("domains", {})[d] = len(_records(plan.docs[path][0], "basic"))
+
+
+def plan_bundles(plan, families):
+    for family in families:
+        if family not in BUNDLES:
+            continue
+        bundle_path = DATA / BUNDLES[family][0].name
+        if not bundle_path.exists():
+            continue        # only refresh bundles the site already ships
+        docs = {}
+        for code in BUNDLES[family][2]:
+            path = DATA / f"{code}_{family}.json"
+            if path in plan.docs:
+                docs[code] = plan.docs[path][0]
+            elif path.exists():
+                docs[code] = json.loads(path.read_text(encoding="utf-8"))
+        plan.texts[bundle_path] = bundle_text(family, docs)
+
+
+# ── Integrity ─────────────────────────────────────────────────────────────────
+
+def verify(family, domains):
+    """Re-read the written files and check IDs and references.  Returns problems."""
+    problems = []
+    for d in domains:
+        path = DATA / f"{d}_{family}.json"
+        if not path.exists():
+            continue
+        records = _records(json.loads(path.read_text(encoding="utf-8")), family)
+        ids = [r.get("id") for r in records]
+        dups = [i for i, n in Counter(ids).items() if n > 1]
+        if dups:
+            problems.append(f"{path.name}: {len(dups)} duplicate IDs (e.g. {dups[0]})")
+        if family in ANCHOR_FAMILIES:
+            bad = [r["id"] for r in records if r["id"].split("-")[2] != r["source_question_id"]]
+            if bad:
+                problems.append(f"{path.name}: {len(bad)} IDs disagree with source_question_id")
+        for target, ref_family, field in REFERENCES:
+            if target != family:
+                continue
+            ref_path = DATA / f"{d}_{ref_family}.json"
+            if not ref_path.exists():
+                continue
+            known = set(ids)
+            dangling = {r[field] for r in _records(json.loads(ref_path.read_text(encoding="utf-8")),
+                                                    ref_family)
+                        if r.get(field) is not None and r[field] not in known}
+            if dangling:
+                problems.append(f"{ref_path.name}: {len(dangling)} dangling {field} "
+                                f"(e.g. {sorted(dangling)[0]})")
+    return problems
+
+
+def verify_anchors(domains):
+    """
+    Check that basic and vignettes still agree: a source_question_id used by
+    both must name the same (bank ID, source_summary) anchor.  Returns problems.
+    """
+    problems = []
+    for d in domains:
+        paths = [DATA / f"{d}_{f}.json" for f in ANCHOR_FAMILIES]
+        if not all(p.exists() for p in paths):
+            continue
+        basic, vignettes = (_records(json.loads(p.read_text(encoding="utf-8")), f)
+                            for p, f in zip(paths, ANCHOR_FAMILIES))
+        by_sid = {r.get("source_question_id"): anchor_key(r) for r in basic}
+        bad = {r.get("source_question_id") for r in vignettes
+               if by_sid.get(r.get("source_question_id"), anchor_key(r)) != anchor_key(r)}
+        if bad:
+            problems.append(f"{d}: {len(bad)} vignette source_question_ids name a different "
+                            f"basic anchor (e.g. {sorted(bad)[0]})")
+    return problems
+
+
+# ── Entry point ───────────────────────────────────────────────────────────────
+
+def renumber(family, domains, group_size=None, dry_run=False):
+    t0 = time.perf_counter()
+    plan = Plan()
+    total_changed = total_refs = 0
+    families = list(ANCHOR_FAMILIES) if family in ANCHOR_FAMILIES else [family]
+    for d in domains:
+        anchors = shared_anchors(plan, d) if family in ANCHOR_FAMILIES else None
+        for fam in families:
+            label = f"{d} {fam}" if len(families) > 1 else d
+            id_map, changed = plan_family(plan, fam, d, group_size if fam == family else None,
+                                          anchors)
+            if id_map is None:
+                print(f"  {label}: no {fam} file, skipping")
+                continue
+            refs = plan_references(plan, fam, d, id_map)
+            records = _records(plan.docs[DATA / f"{d}_{fam}.json"][0], fam)
+            print(f"  {label}: {len(records):,} records, {changed:,} IDs changed, "
+                  f"{refs:,} references remapped")
+            total_changed += changed
+            total_refs += refs
+    for fam in families:
+        plan_manifests(plan, fam, domains)
+    plan_bundles(plan, set(families) | {ref for tgt, ref, _ in REFERENCES if tgt in families})
+
+    if dry_run:
+        print(f"\n[DRY RUN] {len(plan.rendered())} file(s) would be written "
+              f"({time.perf_counter() - t0:.2f}s)")
+        return []
+
+    written = plan.commit()
+    problems = [p for fam in families for p in verify(fam, domains)]
+    if family in ANCHOR_FAMILIES:
+        problems += verify_anchors(domains)
+    for p in written:
+        print(f"  wrote {p}")
+    print(f"\n  {total_changed:,} IDs, {total_refs:,} references, {len(written)} file(s) "
+          f"in {time.perf_counter() - t0:.2f}s")
+    if problems:
+        print("  [warn] integrity check:")
+        for p in problems:
+            print(f"    {p}")
+    else:
+        print("  Integrity check passed")
+    if (DATA / "questions.sqlite").exists():
+        print("  [info] data/questions.sqlite is now stale — run: python question_store.py import")
+    return written
+
+
+def main():
+    families = sorted({*ANCHOR_FAMILIES, *SEQUENTIAL_FAMILIES})
+    parser = argparse.ArgumentParser(description="Renumber content IDs and update every reference")
+    parser.add_argument("family", choices=families)
+    parser.add_argument("domains", nargs="*", help="Domain codes (e.g. PMET)")
+    parser.add_argument("--all-domains", action="store_true")
+    parser.add_argument("--group-size", type=int,
+                        help="Require exactly this many records per anchor (vignettes: 5)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    domains = DOMAINS if args.all_domains else [d.upper() for d in args.domains]
+    if not domains:
+        parser.error("give domain codes or --all-domains")
+    try:
+        renumber(args.family, domains, args.group_size, args.dry_run)
+    except RenumberError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    if not DATA.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
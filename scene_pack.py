@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+scene_pack.py — Pack every region overlay into one binary with a byte-range index
+
+brain-3d-v3.js used to fetch brain_regions_manifest.json and then one GLB
+per region (and per LOD level), eight at a time — dozens of requests, each
+with its own GLB/JSON header and GLTFLoader parse.  This packs the geometry
+the viewer actually uses into a single file:
+
+  positions  uint16 × 3, quantized to the mesh's own bounding box
+             (step = extent / 65535 ≈ 3e-5 scene units for the largest region)
+  indices    uint16 when the mesh has ≤ 65,536 vertices, else uint32
+  bvh        the mesh's raycast BVH (mesh_bvh.py node layout, then the
+             uint32 triangle permutation), built from the dequantized
+             positions exactly as the viewer decodes them — so packed regions
+             need no {stem}.bvh.bin requests, at startup or on refine
+  normals    not stored — the viewer recomputes them on load, as before
+
+Vertex and face order are kept exactly as in the GLB.  The GLB sidecars are
+only used when the viewer falls back to loading region GLBs.  Identical
+blobs (e.g. a region whose LOD chain collapsed to one level, or two regions
+sharing a mesh) are stored once.
+
+Layout: every coarsest level first, then the finer levels, each blob
+4-byte aligned — so the viewer needs one request for the whole startup set
+(Range: bytes=0-{coarseBytes-1}) and one more for refinement, or a Range
+request per region on demand.  A server without Range support simply
+returns the whole file, which works too.
+
+Index (data/brain_meshes/scene_pack.json):
+  {"version": 2, "file": "data/brain_meshes/scene_pack.bin",
+   "bytes": N, "coarseBytes": M,
+   "regions": {"amygdala": {"type": "subcortical",
+                            "lods": [{"offset", "length", "vertexCount",
+                                      "faceCount", "indexType", "min", "max",
+                                      "bvhBytes", "source"}, ...]}}}   fine → coarse,
+  matching the manifest's "lods" order (a single entry without LODs).
+
+USAGE:
+  python scene_pack.py              # after generate_parcellated_brain.py /
+                                    # generate_brain_meshes.py / compress_meshes.py
+"""
+
+import hashlib
+import sys
+import time
+import numpy as np
+from pathlib import Path
+
+from cortex_regions import read_cortex_meshes
+from data_io import load_json, save_json, write_atomic
+from mesh_bvh import QUANT_MAX, build_bvh
+
+DATA_DIR = Path("data")
+MESH_DIR = DATA_DIR / "brain_meshes"
+MANIFEST = DATA_DIR / "brain_regions_manifest.json"
+PACK_BIN = MESH_DIR / "scene_pack.bin"
+PACK_JSON = MESH_DIR / "scene_pack.json"
+
+# Loaded from their own JSON meshes by the viewer (PERMANENT_IDS in brain-3d-v3.js)
+SKIP_IDS = {"brainstem", "cerebellum"}
+SKIP_TYPES = {"glass"}
+
+
+def _pad4(b):
+    return b + b"\x00" * ((4 - len(b) % 4) % 4)
+
+
+def dequantize(q, vmin, vmax):
+    """Positions as brain-3d-v3.js decodes them (float64 math, stored float32)."""
+    step = np.where(vmax > vmin, vmax - vmin, 1.0) / QUANT_MAX
+    return (vmin + q.astype(np.float64) * step).astype(np.float32)
+
+
+def encode_mesh(verts, faces):
+    """(blob bytes, meta) for one mesh — quantized positions, indices, BVH."""
+    verts = np.asarray(verts, dtype=np.float64)
+    faces = np.asarray(faces, dtype=np.int64)
+    vmin, vmax = verts.min(axis=0), verts.max(axis=0)
+    extent = np.where(vmax > vmin, vmax - vmin, 1.0)
+    q = np.rint((verts - vmin) / extent * QUANT_MAX).astype("<u2")
+    index_type = "uint16" if len(verts) <= 65536 else "uint32"
+    idx = faces.astype("<u2" if index_type == "uint16" else "<u4")
+    nodes, perm = build_bvh(dequantize(q, vmin, vmax), faces)
+    blob = _pad4(q.tobytes()) + _pad4(idx.tobytes()) + nodes.tobytes() + perm.astype("<u4").tobytes()
+    meta = {
+        "vertexCount": int(len(verts)),
+        "faceCount": int(len(faces)),
+        "indexType": index_type,
+        "min": [float(x) for x in vmin],
+        "max": [float(x) for x in vmax],
+        "bvhBytes": int(nodes.nbytes),
+    }
+    return blob, meta
+
+
+def _load_levels(entry):
+    """[(file, verts, faces)] fine → coarse for a manifest entry."""
+    files = [lod["file"] for lod in entry["lods"]] if entry.get("lods") else [entry["file"]]
+    out = []
+    for f in files:
+        meshes = read_cortex_meshes(Path(f))
+        if not meshes:
+            raise ValueError(f"{f}: no triangle meshes")
+        # Region GLBs hold one mesh; concatenate defensively in traversal order
+        verts, faces, offset = [], [], 0
+        for v, fc in meshes:
+            verts.append(v)
+            faces.append(fc + offset)
+            offset += len(v)
+        out.append((f, np.vstack(verts), np.vstack(faces)))
+    return out
+
+
+def build_pack(manifest_path=MANIFEST, out_bin=PACK_BIN, out_json=PACK_JSON):
+    t0 = time.perf_counter()
+    manifest = load_json(manifest_path)
+
+    regions, blobs = {}, {}          # blobs: sha1 → (bytes, coarse?)
+    for rid, entry in manifest.items():
+        if rid in SKIP_IDS or entry.get("type") in SKIP_TYPES:
+            continue
+        try:
+            levels = _load_levels(entry)
+        except (OSError, ValueError, ImportError) as e:
+            print(f"  {rid}: skipped ({e})")
+            continue
+        lods = []
+        for i, (src, v, f) in enumerate(levels):
+            blob, meta = encode_mesh(v, f)
+            key = hashlib.sha1(blob).hexdigest()
+            coarse = i == len(levels) - 1
+            prev = blobs.get(key)
+            blobs[key] = (blob, coarse or (prev is not None and prev[1]))
+            lods.append(dict(meta, source=src, _key=key))
+        regions[rid] = {"type": entry.get("type"), "lods": lods}
+
+    # Coarse blobs first, then the rest; offsets resolved after ordering
+    order = sorted(blobs, key=lambda k: not blobs[k][1])
+    offsets, parts, pos, coarse_bytes = {}, [], 0, 0
+    for key in order:
+        blob, coarse = blobs[key]
+        offsets[key] = (pos, len(blob))
+        parts.append(blob)
+        pos += len(blob)
+        if coarse:
+            coarse_bytes = pos
+    for entry in regions.values():
+        for lod in entry["lods"]:
+            lod["offset"], lod["length"] = offsets[lod.pop("_key")]
+
+    write_atomic(out_bin, b"".join(parts))
+    index = {
+        "version": 2,
+        "file": f"data/brain_meshes/{out_bin.name}",
+        "bytes": pos,
+        "coarseBytes": coarse_bytes,
+        "regions": regions,
+    }
+    save_json(out_json, index)
+
+    n_lods = sum(len(e["lods"]) for e in regions.values())
+    glb_bytes = sum(Path(l["source"]).stat().st_size for e in regions.values() for l in e["lods"])
+    print(f"  {len(regions)} regions, {n_lods} meshes ({n_lods - len(blobs)} deduplicated) "
+          f"→ {out_bin.name} {pos / 1e6:.2f} MB (GLBs: {glb_bytes / 1e6:.2f} MB), "
+          f"startup range {coarse_bytes / 1e6:.2f} MB  ({time.perf_counter() - t0:.1f}s)")
+    return index
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="Pack region GLBs into one range-indexed binary")
+    parser.add_argument("--manifest", default=str(MANIFEST))
+    args = parser.parse_args()
+    build_pack(Path(args.manifest))
+
+
+if __name__ == "__main__":
+    if not DATA_DIR.exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+serve.py — Static file server for the MasteryPage site
+
+Replaces `python -m http.server` in start-server.bat.  Standard library
+only, Windows/macOS/Linux:
+
+  - ThreadingHTTPServer: one thread per connection, HTTP/1.1 keep-alive,
+    so a classroom of browsers loading GLBs doesn't queue behind one socket
+  - precompressed siblings: foo.json.br / foo.json.gz are served with
+    Content-Encoding when the client accepts them (see --precompress)
+  - ETag + Last-Modified, answering If-None-Match / If-Modified-Since
+    with 304
+  - single byte ranges (Range / If-Range) → 206, for the multi-MB meshes
+    and textures
+  - Cache-Control: requests carrying ?v=… (brain-3d-v3.js appends
+    ASSET_VERSION) are immutable for a year; everything else is
+    revalidated on each load ("no-cache" + ETag)
+  - optional /api/questions query endpoint (--api, see question_api.py)
+
+USAGE:
+  python serve.py                      # http://localhost:8080 (and this machine's
+                                       # LAN address), serves this folder
+  python serve.py --port 9000 --bind 127.0.0.1   # this machine only
+  python serve.py --api                # also answer /api/questions from an in-memory index
+  python serve.py --precompress        # write .gz (and .br if `pip install brotli`)
+                                       # siblings for text/JSON/mesh assets, then exit
+"""
+
+import argparse
+import email.utils
+import gzip
+import json
+import mimetypes
+import os
+import re
+import shutil
+import sys
+from functools import partial
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
+
+ROOT = Path(__file__).resolve().parent
+
+EXTRA_TYPES = {
+    ".glb":  "model/gltf-binary",
+    ".gltf": "model/gltf+json",
+    ".wasm": "application/wasm",
+    ".ktx2": "image/ktx2",
+    ".mjs":  "text/javascript",
+    ".js":   "text/javascript",
+    ".json": "application/json",
+    ".md":   "text/markdown",
+}
+
+# Precompressed sibling suffix → Content-Encoding token, in preference order
+ENCODINGS = ((".br", "br"), (".gz", "gzip"))
+
+# File types worth precompressing (Draco GLBs still shrink ~10-20 %)
+COMPRESSIBLE = {".html", ".js", ".mjs", ".css", ".json", ".svg", ".md", ".txt",
+                ".glb", ".gltf", ".bin", ".wasm"}
+MIN_COMPRESS_BYTES = 1024
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+
+COPY_CHUNK = 256 * 1024
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _accepts(header, token):
+    """True if an Accept-Encoding header allows `token` (q=0 excludes it)."""
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if name.strip().lower() != token:
+            continue
+        m = re.search(r"q\s*=\s*([0-9.]+)", params)
+        return not m or float(m.group(1)) > 0
+    return False
+
+
+def parse_range(header, size):
+    """
+    Parse a single-range 'bytes=' header.
+    Returns (start, end) inclusive, None to ignore the header (malformed or
+    multi-range → full response), or False if unsatisfiable (416).
+    """
+    m = _RANGE_RE.match((header or "").strip())
+    if not m:
+        return None
+    first, last = m.groups()
+    if first == "" and last == "":
+        return None
+    if first == "":
+        n = int(last)
+        if n == 0:
+            return False
+        return max(0, size - n), size - 1
+    start = int(first)
+    end = size - 1 if last == "" else min(int(last), size - 1)
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+class SiteHandler(SimpleHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MasteryPage"
+
+    extensions_map = {**SimpleHTTPRequestHandler.extensions_map, **EXTRA_TYPES}
+
+    def log_message(self, fmt, *args):
+        if not getattr(self.server, "quiet", False):
+            super().log_message(fmt, *args)
+
+    def end_headers(self):
+        self.send_header("X-Content-Type-Options", "nosniff")
+        super().end_headers()
+
+    # ── Query API ─────────────────────────────────────────────────────────
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        index = getattr(self.server, "question_index", None)
+        if index is not None and url.path.startswith("/api/"):
+            from question_api import handle_request
+            status, payload = handle_request(index, url.path, parse_qs(url.query))
+            return self._send_json(status, payload)
+        return super().do_GET()
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        encoding = None
+        if len(body) >= MIN_COMPRESS_BYTES and _accepts(self.headers.get("Accept-Encoding"), "gzip"):
+            body, encoding = gzip.compress(body, compresslevel=5), "gzip"
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    # ── Response selection ────────────────────────────────────────────────
+
+    def _select_variant(self, path):
+        """Pick a precompressed sibling the client accepts → (path, encoding)."""
+        accept = self.headers.get("Accept-Encoding", "")
+        src_mtime = os.path.getmtime(path)
+        for suffix, token in ENCODINGS:
+            alt = path + suffix
+            if _accepts(accept, token) and os.path.isfile(alt) \
+                    and os.path.getmtime(alt) >= src_mtime:
+                return alt, token
+        return path, None
+
+    def _cache_control(self):
+        query = parse_qs(urlsplit(self.path).query)
+        return IMMUTABLE if "v" in query else REVALIDATE
+
+    def _not_modified(self, etag, mtime):
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            tags = [t.strip() for t in inm.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        ims = self.headers.get("If-Modified-Since")
+        if ims:
+            try:
+                since = email.utils.parsedate_to_datetime(ims).timestamp()
+            except (TypeError, ValueError, IndexError, OverflowError):
+                return False
+            return int(mtime) <= int(since)
+        return False
+
+    def send_head(self):
+        self._remaining = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            # Directory redirects and index.html handling stay with the base class
+            return super().send_head()
+        if path.endswith("/") or not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        ctype = self.guess_type(path)
+        range_header = self.headers.get("Range")
+        # Byte ranges address the identity representation only
+        body_path, encoding = (path, None) if range_header else self._select_variant(path)
+
+        try:
+            f = open(body_path, "rb")
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        try:
+            st = os.fstat(f.fileno())
+            size = st.st_size
+            etag = f'"{st.st_mtime_ns:x}-{size:x}{"-" + encoding if encoding else ""}"'
+
+            if self._not_modified(etag, st.st_mtime):
+                f.close()
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", self._cache_control())
+                self.send_header("Vary", "Accept-Encoding")
+                self.end_headers()
+                return None
+
+            rng = None
+            if range_header:
+                if_range = self.headers.get("If-Range")
+                if if_range is None or if_range.strip() == etag:
+                    rng = parse_range(range_header, size)
+                if rng is False:
+                    f.close()
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return None
+
+            if rng:
+                start, end = rng
+                self.send_response(HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+                f.seek(start)
+                self._remaining = end - start + 1
+            else:
+                self.send_response(HTTPStatus.OK)
+                self._remaining = size
+
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(self._remaining))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+            self.send_header("Cache-Control", self._cache_control())
+            self.end_headers()
+            return f
+        except Exception:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        remaining = getattr(self, "_remaining", None)
+        if remaining is None:
+            return shutil.copyfileobj(source, outputfile, COPY_CHUNK)
+        while remaining > 0:
+            buf = source.read(min(COPY_CHUNK, remaining))
+            if not buf:
+                break
+            outputfile.write(buf)
+            remaining -= len(buf)
+        self._remaining = None
+
+
+# ── Precompression ────────────────────────────────────────────────────────────
+
+def precompress(root=ROOT, level=9):
+    """
+    Write .gz (and .br when the brotli module is installed) next to every
+    compressible file that lacks an up-to-date sibling.  Siblings that are
+    not smaller than the source are removed so the server never prefers them.
+    """
+    try:
+        import brotli
+    except ImportError:
+        brotli = None
+        print("  [info] brotli not installed — writing .gz only (pip install brotli)")
+
+    skip_dirs = {".git", "node_modules", "__pycache__"}
+    written = saved = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in skip_dirs]
+        for name in filenames:
+            src = Path(dirpath) / name
+            if src.suffix.lower() not in COMPRESSIBLE:
+                continue
+            st = src.stat()
+            if st.st_size < MIN_COMPRESS_BYTES:
+                continue
+            data = None
+            for suffix, _ in ENCODINGS:
+                if suffix == ".br" and brotli is None:
+                    continue
+                dst = src.with_name(name + suffix)
+                if dst.exists() and dst.stat().st_mtime >= st.st_mtime:
+                    continue
+                if data is None:
+                    data = src.read_bytes()
+                packed = (brotli.compress(data, quality=11) if suffix == ".br"
+                          else gzip.compress(data, compresslevel=level, mtime=0))
+                if len(packed) >= len(data):
+                    if dst.exists():
+                        dst.unlink()
+                    continue
+                tmp = dst.with_name(dst.name + ".tmp")
+                tmp.write_bytes(packed)
+                os.replace(tmp, dst)
+                written += 1
+                saved += len(data) - len(packed)
+    print(f"  Precompressed {written} file(s), {saved / 1e6:.1f} MB saved on the wire")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the MasteryPage site")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--bind", default="0.0.0.0",
+                        help="Address to listen on (default: all interfaces, like "
+                             "`python -m http.server`, so a classroom LAN can connect; "
+                             "127.0.0.1 for this machine only)")
+    parser.add_argument("--root", default=str(ROOT), help="Directory to serve")
+    parser.add_argument("--quiet", action="store_true", help="Suppress per-request logging")
+    parser.add_argument("--precompress", action="store_true",
+                        help="Write .gz/.br siblings for compressible assets and exit")
+    parser.add_argument("--api", action="store_true",
+                        help="Serve /api/questions from an in-memory question index")
+    args = parser.parse_args()
+
+    if args.precompress:
+        precompress(Path(args.root))
+        return
+
+    for ext, ctype in EXTRA_TYPES.items():
+        mimetypes.add_type(ctype, ext)
+    handler = partial(SiteHandler, directory=args.root)
+    ThreadingHTTPServer.daemon_threads = True
+    with ThreadingHTTPServer((args.bind, args.port), handler) as httpd:
+        httpd.quiet = args.quiet
+        if args.api:
+            from question_api import QuestionIndex
+            httpd.question_index = QuestionIndex(Path(args.root) / "data")
+        host = "localhost" if args.bind in ("127.0.0.1", "0.0.0.0") else args.bind
+        print(f"Serving {args.root} at http://{host}:{args.port}  (Ctrl+C to stop)")
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopped.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
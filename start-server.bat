@@ -1,9 +1,9 @@
 @echo off
 echo Starting MasteryPage local server...
 echo.
-echo Open in browser: http://localhost:8080
+echo Open in browser: http://localhost:8080  (students: http://THIS-PC-ADDRESS:8080)
 echo Press Ctrl+C to stop.
 echo.
 cd /d "%~dp0"
-python -m http.server 8080
+python serve.py --port 8080 --bind 0.0.0.0
 pause
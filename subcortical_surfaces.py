@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+subcortical_surfaces.py — Cropped, multi-label marching cubes for atlas structures
+
+The subcortical generators used to Gaussian-smooth and march the whole
+1 mm MNI volume (182×218×182 ≈ 7.2 M voxels) once per structure, although
+each structure fills a box a few centimetres across.  This engine:
+
+  1. finds every label's bounding box in ONE pass (ndimage.find_objects)
+  2. crops each structure to that box plus a margin wide enough that the
+     Gaussian kernel and the marching-cubes zero border are unaffected
+     (ceil(GAUSS_TRUNCATE·sigma) + 2 voxels) — output is identical to the
+     full-volume result
+  3. smooths + marches the crops concurrently (scipy.ndimage and
+     skimage.measure release the GIL in their inner loops, so a thread
+     pool scales without pickling volumes or needing a __main__ guard)
+  4. returns meshes already in scene coordinates (to_threejs by default)
+
+Usage:
+  from subcortical_surfaces import extract_surfaces
+  meshes = extract_surfaces(ho_data, ho_img.affine,
+                            {"thalamus": [4, 15], "brainstem": [8]},
+                            sigma={"brainstem": 0.8}, default_sigma=0.5)
+  verts, faces = meshes["thalamus"]["verts"], meshes["thalamus"]["faces"]
+"""
+
+import math
+import os
+import time
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from scipy import ndimage
+
+from mesh_utils import to_threejs, voxels_to_mesh
+
+# scipy.ndimage.gaussian_filter default kernel radius (in sigmas)
+GAUSS_TRUNCATE = 4.0
+
+# Structures with fewer voxels than this are reported as empty
+MIN_VOXELS = 20
+
+
+def label_bboxes(label_vol, structures):
+    """
+    Bounding boxes for grouped labels in one pass.
+
+    label_vol  : integer atlas volume
+    structures : {name: [label values]}
+    Returns {name: (lo (3,), hi (3,))} voxel index bounds (hi exclusive);
+    structures with no voxels are omitted.
+    """
+    max_label = max((max(v) for v in structures.values() if v), default=0)
+    slices = ndimage.find_objects(label_vol, max_label=max_label)
+    boxes = {}
+    for name, values in structures.items():
+        lo, hi = None, None
+        for val in values:
+            sl = slices[val - 1] if 0 < val <= len(slices) else None
+            if sl is None:
+                continue
+            s_lo = np.array([s.start for s in sl])
+            s_hi = np.array([s.stop for s in sl])
+            lo = s_lo if lo is None else np.minimum(lo, s_lo)
+            hi = s_hi if hi is None else np.maximum(hi, s_hi)
+        if lo is not None:
+            boxes[name] = (lo, hi)
+    return boxes
+
+
+def crop_margin(sigma):
+    """Voxels of padding so the cropped result matches the full-volume one."""
+    return int(math.ceil(GAUSS_TRUNCATE * sigma)) + 2
+
+
+def _extract_one(block, values, origin, affine, sigma, step_size, transform):
+    t0 = time.perf_counter()
+    mask = np.isin(block, values)
+    nvox = int(mask.sum())
+    if nvox < MIN_VOXELS:
+        return {"verts": None, "faces": None, "voxels": nvox, "seconds": 0.0}
+    verts, faces = voxels_to_mesh(mask, affine, step_size=step_size, sigma=sigma,
+                                  origin=origin, transform=transform)
+    return {"verts": verts, "faces": faces, "voxels": nvox,
+            "seconds": time.perf_counter() - t0}
+
+
+def extract_surfaces(label_vol, affine, structures, sigma=None, default_sigma=0.5,
+                     step_size=1, transform=to_threejs, workers=None):
+    """
+    Extract one smoothed surface per structure from an integer label atlas.
+
+    label_vol     : 3D atlas (float atlases are cast to int32 once)
+    affine        : voxel → mm affine of label_vol
+    structures    : {name: [label values]} — values are merged into one mesh
+    sigma         : optional {name: sigma} overrides of default_sigma
+    transform     : mm → scene units (default to_threejs)
+    workers       : thread count (default: min(len(structures), cpu_count))
+
+    Returns {name: {"verts", "faces", "voxels", "seconds"}} for every
+    requested structure; verts/faces are None when the label is empty or
+    below MIN_VOXELS, or when meshing raised (message under "error").
+    """
+    t0 = time.perf_counter()
+    sigma = sigma or {}
+    if not np.issubdtype(label_vol.dtype, np.integer):
+        label_vol = np.rint(label_vol).astype(np.int32)
+    boxes = label_bboxes(label_vol, structures)
+
+    jobs = {}
+    for name, values in structures.items():
+        if name not in boxes:
+            continue
+        s = sigma.get(name, default_sigma)
+        pad = crop_margin(s)
+        lo = np.maximum(boxes[name][0] - pad, 0)
+        hi = np.minimum(boxes[name][1] + pad, label_vol.shape)
+        block = label_vol[lo[0]:hi[0], lo[1]:hi[1], lo[2]:hi[2]]
+        jobs[name] = (block, list(values), tuple(int(x) for x in lo), affine,
+                      s, step_size, transform)
+
+    n_workers = workers or min(len(jobs), os.cpu_count() or 1) or 1
+    results = {name: {"verts": None, "faces": None, "voxels": 0, "seconds": 0.0}
+               for name in structures}
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = {name: pool.submit(_extract_one, *args) for name, args in jobs.items()}
+        for name, fut in futures.items():
+            try:
+                results[name] = fut.result()
+            except Exception as e:
+                results[name] = {"verts": None, "faces": None, "voxels": 0,
+                                 "seconds": 0.0, "error": str(e)}
+
+    print(f"    Extracted {sum(r['verts'] is not None for r in results.values())}"
+          f"/{len(structures)} surfaces in {time.perf_counter() - t0:.2f}s "
+          f"({n_workers} threads)")
+    return results
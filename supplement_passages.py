@@ -21,12 +21,14 @@ Usage:
   python supplement_passages.py --revert      # revert to original counts
 """
 
-import json
 import pathlib
 import argparse
 import re
 from bs4 import BeautifulSoup
 
+from data_io import load_json, save_json
+from id_alloc import IdAllocator
+
 CONTENT_DIR = pathlib.Path("content")
 DATA_DIR    = pathlib.Path("data")
 
@@ -186,15 +188,6 @@ def extract_verbatim_passages(html_path: pathlib.Path,
     return new_passages
 
 
-def next_id_counter(domain_code: str, passages: list) -> int:
-    prefix = f"{domain_code}-"
-    nums = [int(p['id'][len(prefix):])
-            for p in passages
-            if p.get('id', '').startswith(prefix)
-            and p['id'][len(prefix):].isdigit()]
-    return max(nums, default=0) + 1
-
-
 def domain_folder(domain_code: str) -> pathlib.Path | None:
     for folder, code in DOMAIN_MAP.items():
         if code == domain_code:
@@ -216,7 +209,7 @@ def revert_domain(domain_code: str):
         print(f"  SKIP: {json_path} not found")
         return
 
-    data = json.loads(json_path.read_text(encoding='utf-8'))
+    data = load_json(json_path)
     passages = data['passages']
     before = len(passages)
 
@@ -230,8 +223,7 @@ def revert_domain(domain_code: str):
     removed = before - len(kept)
     data['passages'] = kept
     data['total_passages'] = len(kept)
-    json_path.write_text(json.dumps(data, ensure_ascii=False, indent=2),
-                         encoding='utf-8')
+    save_json(json_path, data)
     print(f"  {domain_code}: {before} -> {len(kept)} (removed {removed} non-verbatim passages)")
 
 
@@ -245,7 +237,7 @@ def process_domain(domain_code: str,
         print(f"  SKIP: {json_path} not found")
         return
 
-    data = json.loads(json_path.read_text(encoding='utf-8'))
+    data = load_json(json_path)
     passages = data['passages']
     existing_texts = set(p['passage'] for p in passages)
 
@@ -274,7 +266,8 @@ def process_domain(domain_code: str,
         print(f"  {domain_code}: no chapters to process")
         return
 
-    id_ctr = next_id_counter(domain_code, passages)
+    ids = IdAllocator(f"passages:{domain_code}", f"{domain_code}-{{n:04d}}",
+                      existing=(p.get('id') for p in passages))
     total_added = 0
 
     for hf in to_process:
@@ -282,8 +275,7 @@ def process_domain(domain_code: str,
         new = extract_verbatim_passages(
             hf, domain_code, DOMAIN_NAMES[domain_code], existing_texts)
         for p in new:
-            p['id'] = f"{domain_code}-{id_ctr:04d}"
-            id_ctr += 1
+            p['id'] = ids.next()
             passages.append(p)
         total_added += len(new)
         new_count = old_count + len(new)
@@ -292,8 +284,7 @@ def process_domain(domain_code: str,
     if total_added > 0:
         data['passages'] = passages
         data['total_passages'] = len(passages)
-        json_path.write_text(json.dumps(data, ensure_ascii=False, indent=2),
-                             encoding='utf-8')
+        save_json(json_path, data)
         print(f"  OK {json_path.name}: {len(passages)} total (+{total_added} new)")
     else:
         print(f"  {domain_code}: 0 new passages found")
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+texture_pack.py — Channel-packed, mipmapped, GPU-compressed brain textures
+
+The bake scripts write plain PNGs (Image.fromarray(...).save()), and the
+viewer uploads each as uncompressed RGBA8 plus a driver-built mip chain:
+a 2048×1024 normal map and a separate single-channel AO map cost ~11 MB of
+VRAM each, which is what spikes texture memory on mobile GPUs.  This stage
+turns the source PNGs into what brain-3d-v3.js actually samples:
+
+  cortex_orm        linear  R = ambient occlusion (cortex_ao_map.png)
+                            G = roughness scale from curvature — sulcal depth
+                                (luminance of full_brain_sulcal.png) mapped to
+                                [ROUGH_GYRUS, 1]: sulci matte, crowns glossier
+                            B = 0 (metalness)
+                            three.js reads aoMap from R and roughnessMap from G,
+                            so one texture replaces the AO map
+  cortex_normal     linear  tangent-space normal map (cortex_normal_map.png)
+  brainstem_albedo  sRGB    brainstem_texture.png
+
+Each is written as KTX2 with a full mip chain — UASTC for the linear data
+maps (normals don't survive ETC1S), ETC1S for colour — transcoded on the GPU
+to BC7/ASTC/ETC2 by three's KTX2Loader, plus an optimized PNG fallback.
+Images are flipped vertically before encoding: KTX2 textures are uploaded
+without the flipY the PNGs get from TextureLoader.
+
+Encoders (first found on PATH): toktx (KTX-Software 4.x), basisu.  Without
+either only the PNG fallbacks are written.  The viewer also needs the Basis
+transcoder next to the Draco decoder; it is vendored from three's npm package
+(`npm install`) on the first run:
+  node_modules/three/examples/jsm/libs/basis → vendor/three/examples/jsm/libs/basis
+Without it KTX2 is not written either, since the viewer couldn't decode it.
+
+Outputs (data/brain_meshes/textures/):
+  {name}.ktx2, {name}.png
+  textures.json   {name: {"png", "ktx2", "width", "height", "colorSpace",
+                          "sources", "vram": {"before", "png", "ktx2"}}}
+
+USAGE:
+  python texture_pack.py              # rebuild every texture whose sources changed
+  python texture_pack.py --force
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import numpy as np
+from pathlib import Path
+from PIL import Image
+
+from data_io import load_json, save_json
+
+MESH_DIR = Path("data/brain_meshes")
+OUT_DIR = MESH_DIR / "textures"
+INDEX_JSON = OUT_DIR / "textures.json"
+
+# Roughness multiplier on gyral crowns (sulcal fundi stay at 1.0)
+ROUGH_GYRUS = 0.8
+
+# Bytes per texel once on the GPU: RGBA8 for PNG uploads; UASTC transcodes to
+# BC7 / ASTC 4×4 (8 bpp); opaque ETC1S to BC1 / ETC2 RGB (4 bpp)
+BYTES_PER_TEXEL = {"rgba8": 4.0, "uastc": 1.0, "etc1s": 0.5}
+
+
+def _luminance(img):
+    return np.asarray(img.convert("L"), dtype=np.float32) / 255.0
+
+
+def build_cortex_orm():
+    ao_img = Image.open(MESH_DIR / "cortex_ao_map.png")
+    size = ao_img.size
+    ao = np.asarray(ao_img.convert("L"), dtype=np.uint8)
+    sulcal = _luminance(Image.open(MESH_DIR / "full_brain_sulcal.png").resize(size, Image.LANCZOS))
+    # Darker sulcal map = deeper sulcus = rougher
+    rough = ROUGH_GYRUS + (1.0 - ROUGH_GYRUS) * (1.0 - sulcal)
+    orm = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    orm[..., 0] = ao
+    orm[..., 1] = np.clip(rough * 255.0 + 0.5, 0, 255).astype(np.uint8)
+    return Image.fromarray(orm, "RGB")
+
+
+def _copy_rgb(name):
+    def build():
+        return Image.open(MESH_DIR / name).convert("RGB")
+    return build
+
+
+# name → (builder, sources, colour space, Basis codec)
+TEXTURES = {
+    "cortex_orm":       (build_cortex_orm, ["cortex_ao_map.png", "full_brain_sulcal.png"],
+                         "linear", "uastc"),
+    "cortex_normal":    (_copy_rgb("cortex_normal_map.png"), ["cortex_normal_map.png"],
+                         "linear", "uastc"),
+    "brainstem_albedo": (_copy_rgb("brainstem_texture.png"), ["brainstem_texture.png"],
+                         "srgb", "etc1s"),
+}
+
+# What the viewer uploaded before this stage, per packed texture
+LEGACY_UPLOADS = {
+    "cortex_orm":       ["cortex_ao_map.png"],
+    "cortex_normal":    ["cortex_normal_map.png"],
+    "brainstem_albedo": ["brainstem_texture.png"],
+}
+
+
+# Where brain-3d-v3.js points KTX2Loader.setTranscoderPath, and its npm source
+BASIS_VENDOR = Path("vendor/three/examples/jsm/libs/basis")
+BASIS_NPM = Path("node_modules/three/examples/jsm/libs/basis")
+BASIS_FILES = ("basis_transcoder.js", "basis_transcoder.wasm")
+
+
+# ── Encoding ─────────────────────────────────────────────────────────────────
+
+def vendor_transcoder():
+    """Copy three's Basis transcoder into vendor/ if it isn't there yet.
+    Returns True once the viewer can decode KTX2."""
+    if all((BASIS_VENDOR / f).exists() for f in BASIS_FILES):
+        return True
+    if not all((BASIS_NPM / f).exists() for f in BASIS_FILES):
+        return False
+    BASIS_VENDOR.mkdir(parents=True, exist_ok=True)
+    for f in BASIS_FILES:
+        shutil.copy2(BASIS_NPM / f, BASIS_VENDOR / f)
+    print(f"  vendored the Basis transcoder → {BASIS_VENDOR}")
+    return True
+
+
+def find_encoder():
+    for tool in ("toktx", "basisu"):
+        if shutil.which(tool):
+            return tool
+    return None
+
+
+def encode_ktx2(encoder, src_png, dst, color_space, codec):
+    """Encode a (pre-flipped) PNG to KTX2 with mipmaps; raises on failure."""
+    if encoder == "toktx":
+        cmd = ["toktx", "--t2", "--genmipmap", "--encode", codec,
+               "--assign_oetf", "srgb" if color_space == "srgb" else "linear"]
+        cmd += ["--uastc_quality", "2", "--zcmp", "19"] if codec == "uastc" else ["--clevel", "2", "--qlevel", "128"]
+        cmd += [str(dst), str(src_png)]
+    else:
+        cmd = ["basisu", "-ktx2", "-mipmap", "-file", str(src_png), "-output_file", str(dst)]
+        cmd += ["-uastc", "-uastc_rdo_l", "1.0"] if codec == "uastc" else ["-comp_level", "2"]
+        if color_space == "linear":
+            cmd += ["-linear"]
+    res = subprocess.run(cmd, capture_output=True, text=True)
+    if res.returncode != 0 or not Path(dst).exists():
+        raise RuntimeError(f"{encoder} failed:\n{res.stderr.strip() or res.stdout.strip()}")
+
+
+def mip_bytes(width, height, bytes_per_texel):
+    """GPU bytes for a full mip chain."""
+    total = 0.0
+    while True:
+        total += width * height * bytes_per_texel
+        if width == 1 and height == 1:
+            return int(total)
+        width, height = max(1, width // 2), max(1, height // 2)
+
+
+def _stale(out, sources):
+    if not out.exists():
+        return True
+    mtime = out.stat().st_mtime
+    return any((MESH_DIR / s).stat().st_mtime > mtime for s in sources)
+
+
+def pack_all(force=False, encoder=None):
+    """Build every texture in TEXTURES; returns the textures.json index."""
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    encoder = encoder or find_encoder()
+    if encoder is None:
+        print("  [info] no KTX2 encoder on PATH (toktx or basisu) — writing PNG fallbacks only")
+    elif not vendor_transcoder():
+        print(f"  [warn] no Basis transcoder in {BASIS_VENDOR} or {BASIS_NPM} (run `npm install`) "
+              f"— writing PNG fallbacks only")
+        encoder = None
+
+    index = load_json(INDEX_JSON) if INDEX_JSON.exists() else {}
+    for name, (build, sources, color_space, codec) in TEXTURES.items():
+        if not all((MESH_DIR / s).exists() for s in sources):
+            print(f"  {name}: missing source ({', '.join(sources)}) — skipped")
+            continue
+        png = OUT_DIR / f"{name}.png"
+        ktx2 = OUT_DIR / f"{name}.ktx2"
+        target = ktx2 if encoder else png
+        if (not force and not _stale(target, sources) and name in index
+                and (encoder or not index[name]["ktx2"])):
+            print(f"  {name}: up to date")
+            continue
+
+        img = build()
+        w, h = img.size
+        tmp = png.with_name(png.name + ".tmp")
+        img.save(tmp, format="PNG", optimize=True)
+        os.replace(tmp, png)
+
+        has_ktx2 = False
+        if encoder:
+            with tempfile.TemporaryDirectory() as td:
+                flipped = Path(td) / f"{name}.png"
+                img.transpose(Image.FLIP_TOP_BOTTOM).save(flipped)
+                try:
+                    encode_ktx2(encoder, flipped, Path(td) / "out.ktx2", color_space, codec)
+                    shutil.move(str(Path(td) / "out.ktx2"), str(ktx2))
+                    has_ktx2 = True
+                except RuntimeError as e:
+                    print(f"  {name}: KTX2 encode failed, PNG only\n    {e}")
+        elif ktx2.exists():
+            ktx2.unlink()    # never leave a KTX2 that no longer matches its sources
+
+        before = sum(mip_bytes(*Image.open(MESH_DIR / s).size, BYTES_PER_TEXEL["rgba8"])
+                     for s in LEGACY_UPLOADS[name])
+        index[name] = {
+            "png": f"data/brain_meshes/textures/{png.name}",
+            "ktx2": f"data/brain_meshes/textures/{ktx2.name}" if has_ktx2 else None,
+            "width": w, "height": h,
+            "colorSpace": color_space,
+            "sources": sources,
+            "vram": {
+                "before": before,
+                "png": mip_bytes(w, h, BYTES_PER_TEXEL["rgba8"]),
+                "ktx2": mip_bytes(w, h, BYTES_PER_TEXEL[codec]),
+            },
+        }
+        disk = ktx2.stat().st_size if has_ktx2 else png.stat().st_size
+        print(f"  {name}: {w}×{h} {color_space} → {(ktx2 if has_ktx2 else png).name} "
+              f"({disk / 1e3:.0f} KB)")
+
+    save_json(INDEX_JSON, index)
+    report(index)
+    return index
+
+
+def report(index):
+    mb = lambda b: f"{b / 1048576:6.1f} MB"
+    before = sum(e["vram"]["before"] for e in index.values())
+    after = sum(e["vram"]["ktx2"] if e["ktx2"] else e["vram"]["png"] for e in index.values())
+    print(f"\n  {'Texture':18s} {'Before':>9} {'PNG':>9} {'KTX2':>9}")
+    for name, e in index.items():
+        v = e["vram"]
+        print(f"  {name:18s} {mb(v['before'])} {mb(v['png'])} "
+              f"{mb(v['ktx2']) if e['ktx2'] else '      —  '}")
+    print(f"  GPU memory (with mips): {mb(before).strip()} → {mb(after).strip()} "
+          f"({mb(before - after).strip()} saved)")
+    if not all(e["ktx2"] for e in index.values()):
+        potential = sum(e["vram"]["ktx2"] for e in index.values())
+        print(f"  With KTX2 for every texture: {mb(potential).strip()} "
+              f"(install toktx or basisu and re-run)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack and GPU-compress the brain textures")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    parser.add_argument("--encoder", choices=["toktx", "basisu"], help="Default: first on PATH")
+    args = parser.parse_args()
+    pack_all(args.force, args.encoder)
+
+
+if __name__ == "__main__":
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+vertex_labels.py — Per-vertex atlas labels for surface meshes, cached on disk
+
+generate_parcellated_brain.py used to label each fsaverage7 hemisphere
+(163,842 vertices) by rounding every vertex into one volumetric atlas, and
+every re-run reloaded the NIfTI volumes to do it again.  This module:
+
+  1. maps vertices into voxel space ONCE per distinct atlas grid (atlases
+     sharing a shape + affine share the inverse-affine pass)
+  2. samples any number of atlases from those coordinates in one call:
+       nearest    round to the nearest voxel (the original behaviour)
+       trilinear  label with the largest trilinear weight among the 8
+                  surrounding voxels — labels are never interpolated
+       majority   most frequent non-background label in the 3×3×3
+                  neighbourhood (background only if all 27 are background)
+  3. persists each (surface, atlas, mode) result as an .npy file and hands
+     it back memory-mapped, so later runs and other scripts never touch
+     the NIfTI data again
+
+Cache layout (data/brain_meshes/vertex_labels/):
+  index.json                          {key: {"vertices", "fingerprint", "mode", ...}}
+  fsaverage7_lh__ho_cort__nearest.npy int32 (n_vertices,)
+
+The fingerprint is a SHA-1 of the float32 vertex array, so a different
+surface (or a regenerated one) never picks up stale labels.
+
+Usage:
+  from vertex_labels import LabelCache
+  cache = LabelCache()
+  labels = cache.labels("fsaverage7_lh", lh_verts_mni,
+                        {"ho_cort": load_ho_cort, "aal": load_aal},
+                        mode="nearest")
+  labels["ho_cort"]      # np.memmap int32, one label per vertex
+
+Each atlas loader is a zero-argument callable returning (data, affine); it
+is only called when that atlas is missing from the cache.
+
+  python vertex_labels.py            # precompute fsaverage7 labels for
+                                     # HO cortical, HO subcortical and AAL
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+from pathlib import Path
+
+from data_io import write_atomic
+
+CACHE_DIR = Path("data/brain_meshes/vertex_labels")
+
+SAMPLING_MODES = ("nearest", "trilinear", "majority")
+
+# Vertices per block for the neighbourhood modes (bounds the (N,27,27) compare)
+CHUNK = 1 << 15
+
+
+# ── Sampling ─────────────────────────────────────────────────────────────────
+
+def mni_to_voxel(verts_mni, affine):
+    """(N,3) MNI mm → continuous voxel coordinates (float64) via the inverse affine."""
+    inv = np.linalg.inv(np.asarray(affine, dtype=np.float64))
+    return np.asarray(verts_mni, dtype=np.float64) @ inv[:3, :3].T + inv[:3, 3]
+
+
+def _gather(atlas, ijk):
+    """Look up labels at integer voxel indices, clamped to the volume."""
+    shape = np.array(atlas.shape[:3]) - 1
+    ijk = np.clip(ijk, 0, shape)
+    return atlas[ijk[..., 0], ijk[..., 1], ijk[..., 2]]
+
+
+def _weighted_vote(labels, weights):
+    """
+    Per row, the label whose summed weight is largest.
+    labels/weights: (N, K).  Ties resolve to the first corner.
+    """
+    same = labels[:, :, None] == labels[:, None, :]          # (N, K, K)
+    score = np.einsum("nkj,nj->nk", same, weights)
+    return labels[np.arange(len(labels)), score.argmax(axis=1)]
+
+
+_TRILINEAR_CORNERS = np.array([[i, j, k] for i in (0, 1) for j in (0, 1) for k in (0, 1)],
+                              dtype=np.int64)
+_NEIGHBOURHOOD = np.array([[i, j, k] for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)],
+                          dtype=np.int64)
+
+
+def sample_labels(atlas, vox, mode="nearest"):
+    """
+    Sample an integer label volume at continuous voxel coordinates.
+    Returns int32 (N,).
+    """
+    if mode not in SAMPLING_MODES:
+        raise ValueError(f"unknown sampling mode {mode!r} (expected one of {SAMPLING_MODES})")
+    if mode == "nearest":
+        return _gather(atlas, np.rint(vox).astype(np.int64)).astype(np.int32)
+
+    out = np.empty(len(vox), dtype=np.int32)
+    for s in range(0, len(vox), CHUNK):
+        v = vox[s:s + CHUNK]
+        if mode == "trilinear":
+            base = np.floor(v).astype(np.int64)
+            frac = v - base
+            corners = base[:, None, :] + _TRILINEAR_CORNERS[None]        # (n, 8, 3)
+            w = np.where(_TRILINEAR_CORNERS[None], frac[:, None, :], 1.0 - frac[:, None, :])
+            weights = w.prod(axis=2)
+            out[s:s + CHUNK] = _weighted_vote(_gather(atlas, corners), weights)
+        else:
+            centre = np.rint(v).astype(np.int64)
+            labs = _gather(atlas, centre[:, None, :] + _NEIGHBOURHOOD[None])  # (n, 27)
+            weights = (labs != 0).astype(np.float32)
+            # All-background rows: every weight 0 → argmax picks corner 0 (background)
+            out[s:s + CHUNK] = _weighted_vote(labs, weights)
+    return out
+
+
+def _as_label_volume(data):
+    data = np.asarray(data)
+    if np.issubdtype(data.dtype, np.integer):
+        return data
+    return np.rint(data).astype(np.int32)
+
+
+def label_vertices(verts_mni, atlases, mode="nearest"):
+    """
+    Label vertices from several atlases at once.
+
+    atlases : {name: (data, affine)}
+    mode    : sampling mode, or {name: mode} per atlas
+    Returns {name: int32 (N,)}.  Voxel coordinates are computed once per
+    distinct (shape, affine) grid.
+    """
+    vox_by_grid = {}
+    out = {}
+    for name, (data, affine) in atlases.items():
+        grid = (tuple(np.shape(data)[:3]), np.asarray(affine, dtype=np.float64).tobytes())
+        if grid not in vox_by_grid:
+            vox_by_grid[grid] = mni_to_voxel(verts_mni, affine)
+        m = mode.get(name, "nearest") if isinstance(mode, dict) else mode
+        out[name] = sample_labels(_as_label_volume(data), vox_by_grid[grid], m)
+    return out
+
+
+# ── Persistence ──────────────────────────────────────────────────────────────
+
+def fingerprint(verts):
+    return hashlib.sha1(np.ascontiguousarray(verts, dtype=np.float32).tobytes()).hexdigest()
+
+
+class LabelCache:
+    """Memory-mapped per-vertex label arrays keyed by (surface, atlas, mode)."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.dir = Path(cache_dir)
+        self.index_path = self.dir / "index.json"
+        self.index = (json.loads(self.index_path.read_text())
+                      if self.index_path.exists() else {})
+
+    @staticmethod
+    def key(surface, atlas, mode):
+        return f"{surface}__{atlas}__{mode}"
+
+    def _path(self, key):
+        return self.dir / f"{key}.npy"
+
+    def get(self, surface, atlas, mode, fp, n_vertices):
+        """Cached labels as a read-only memmap, or None if absent/stale."""
+        key = self.key(surface, atlas, mode)
+        meta = self.index.get(key)
+        path = self._path(key)
+        if (meta is None or meta.get("fingerprint") != fp
+                or meta.get("vertices") != n_vertices or not path.exists()):
+            return None
+        return np.load(path, mmap_mode="r")
+
+    def put(self, surface, atlas, mode, fp, labels):
+        """Write one label array atomically and record it in the index."""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        key = self.key(surface, atlas, mode)
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(suffix=".npy", dir=self.dir)
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, np.ascontiguousarray(labels, dtype=np.int32))
+        os.replace(tmp, path)
+        self.index[key] = {
+            "surface": surface, "atlas": atlas, "mode": mode,
+            "vertices": int(len(labels)), "fingerprint": fp,
+            "labelled": int(np.count_nonzero(labels)),
+        }
+        write_atomic(self.index_path, json.dumps(self.index, indent=2, sort_keys=True))
+        return np.load(path, mmap_mode="r")
+
+    def labels(self, surface, verts_mni, loaders, mode="nearest"):
+        """
+        Per-vertex labels for every atlas in `loaders`, computing only the
+        ones not already cached.
+
+        loaders : {atlas_name: callable() -> (data, affine)}
+        mode    : sampling mode, or {atlas_name: mode}
+        Returns {atlas_name: memmap int32 (N,)}.
+        """
+        t0 = time.perf_counter()
+        fp = fingerprint(verts_mni)
+        n = len(verts_mni)
+        modes = {a: (mode.get(a, "nearest") if isinstance(mode, dict) else mode)
+                 for a in loaders}
+
+        out, missing = {}, []
+        for atlas in loaders:
+            hit = self.get(surface, atlas, modes[atlas], fp, n)
+            if hit is None:
+                missing.append(atlas)
+            else:
+                out[atlas] = hit
+
+        if missing:
+            atlases = {a: loaders[a]() for a in missing}
+            fresh = label_vertices(verts_mni, atlases, {a: modes[a] for a in missing})
+            del atlases
+            for atlas, labs in fresh.items():
+                out[atlas] = self.put(surface, atlas, modes[atlas], fp, labs)
+
+        print(f"  Vertex labels [{surface}]: {len(loaders) - len(missing)} cached, "
+              f"{len(missing)} computed ({time.perf_counter() - t0:.2f}s)")
+        return out
+
+
+# ── Atlas loaders ────────────────────────────────────────────────────────────
+
+def _nifti(maps):
+    import nibabel as nib
+    img = nib.load(maps) if isinstance(maps, (str, bytes)) else maps
+    if not hasattr(img, "get_fdata"):
+        img = nib.load(str(maps))
+    return img
+
+
+def load_ho_atlas(name):
+    """Loader for a Harvard-Oxford atlas (e.g. 'cort-maxprob-thr25-1mm')."""
+    def _load():
+        from nilearn import datasets
+        img = _nifti(datasets.fetch_atlas_harvard_oxford(name).maps)
+        return _as_label_volume(img.get_fdata(dtype=np.float32)), img.affine
+    return _load
+
+
+def load_aal_atlas():
+    def _load():
+        from nilearn import datasets
+        try:
+            aal = datasets.fetch_atlas_aal()
+        except Exception:
+            aal = datasets.fetch_atlas_aal(version="SPM5")
+        img = _nifti(aal.maps)
+        return _as_label_volume(img.get_fdata(dtype=np.float32)), img.affine
+    return _load
+
+
+DEFAULT_ATLASES = {
+    "ho_cort": load_ho_atlas("cort-maxprob-thr25-1mm"),
+    "ho_sub":  load_ho_atlas("sub-maxprob-thr0-1mm"),
+    "aal":     load_aal_atlas(),
+}
+
+
+def main():
+    import argparse
+    import nibabel as nib
+    from nilearn import datasets
+
+    parser = argparse.ArgumentParser(description="Precompute per-vertex atlas labels")
+    parser.add_argument("--mesh", default="fsaverage7", help="nilearn fsaverage mesh")
+    parser.add_argument("--mode", choices=SAMPLING_MODES, default="nearest")
+    parser.add_argument("--atlas", action="append", choices=sorted(DEFAULT_ATLASES),
+                        help="Atlas to label (repeatable; default: all)")
+    args = parser.parse_args()
+
+    loaders = {a: DEFAULT_ATLASES[a] for a in (args.atlas or DEFAULT_ATLASES)}
+    surf = datasets.fetch_surf_fsaverage(args.mesh)
+    cache = LabelCache()
+    for hemi, pial in (("lh", surf.pial_left), ("rh", surf.pial_right)):
+        verts = nib.load(pial).darrays[0].data.astype(np.float32)
+        labels = cache.labels(f"{args.mesh}_{hemi}", verts, loaders, mode=args.mode)
+        for atlas, labs in labels.items():
+            print(f"    {hemi} {atlas:8s} {np.count_nonzero(labs):>7,}/{len(labs):,} labelled")
+
+
+if __name__ == "__main__":
+    if not Path("data").exists():
+        print("ERROR: Run this script from the mastery-page/ directory.")
+        sys.exit(1)
+    main()